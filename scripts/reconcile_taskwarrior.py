@@ -148,17 +148,16 @@ def remove_uuids_from_projects(vault_path: Path, uuids: Set[str]):
     """
     Remove UUIDs from all project frontmatter.
 
-    Uses the same remove_task_from_all_projects helper from Sprint 8.5 Item 1.
+    Uses the batched State Sync helper, so the project index is consulted
+    once and each affected project note is rewritten once.
 
     Args:
         vault_path: Path to Obsidian vault
         uuids: Set of UUIDs to remove
     """
-    # Import the State Sync function from Item 1
-    from brainplorp.core.projects import remove_task_from_all_projects
+    from brainplorp.core.projects import remove_tasks_from_all_projects
 
-    for uuid in uuids:
-        remove_task_from_all_projects(vault_path, uuid)
+    remove_tasks_from_all_projects(vault_path, sorted(uuids))
 
 
 # ============================================================================
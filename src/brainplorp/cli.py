@@ -4,19 +4,25 @@ Main CLI entry point for plorp.
 Refactored for v1.1 to use core functions directly.
 """
 
+import itertools
 import json
+import textwrap
 from datetime import date
 from pathlib import Path
 
 import click
 from rich.console import Console
+from rich.markup import escape
 from rich.table import Table
 
 from brainplorp import __version__
 from brainplorp.config import load_config
 from brainplorp.core import (
     start_day,
+    refresh_day,
+    start_days,
     get_review_tasks,
+    get_review_backlog,
     add_review_notes,
     mark_completed,
     defer_task,
@@ -38,8 +44,20 @@ from brainplorp.core import (
     TaskNotFoundError,
     InboxNotFoundError,
 )
-from brainplorp.core.process import process_daily_note_step1, process_daily_note_step2
-from brainplorp.integrations.taskwarrior import get_tasks, TaskWarriorError, TaskWarriorTimeoutError
+from brainplorp.core.note_operations import search_notes
+from brainplorp.core.process import (
+    process_all_daily_notes,
+    process_daily_note_step1,
+    process_daily_note_step2,
+)
+from brainplorp.core.task_table import TaskTable
+from brainplorp.integrations.taskwarrior import (
+    get_tasks,
+    iter_tasks,
+    TaskWarriorError,
+    TaskWarriorTimeoutError,
+)
+from brainplorp.integrations.task_metrics import start_run
 from brainplorp.utils.dates import format_date
 from brainplorp.utils.prompts import confirm, prompt
 from brainplorp.utils.taskwarrior_errors import handle_taskwarrior_error
@@ -73,24 +91,59 @@ def cli(ctx):
       init-claude - Install slash commands for Claude Desktop
     """
     ctx.ensure_object(dict)
+    start_run(ctx.invoked_subcommand)
 
 
 @cli.command()
 @click.option("--date", "date_str", default=None, help="Date for daily note (YYYY-MM-DD, defaults to today)")
+@click.option(
+    "--refresh",
+    is_flag=True,
+    help="Update task sections of an existing note in place (keeps your edits)",
+)
+@click.option(
+    "--range",
+    "range_str",
+    default=None,
+    help="Generate notes for a date range (YYYY-MM-DD..YYYY-MM-DD) from one task export",
+)
 @click.pass_context
-def start(ctx, date_str):
+def start(ctx, date_str, refresh, range_str):
     """Generate daily note for today."""
     config = load_config()
     vault_path = Path(config["vault_path"]).expanduser().resolve()
 
+    if range_str:
+        if date_str:
+            console.print("[red]❌ Use either --date or --range, not both[/red]")
+            ctx.exit(1)
+        try:
+            first, _, last = range_str.partition("..")
+            start_date = date.fromisoformat(first.strip())
+            end_date = date.fromisoformat(last.strip())
+        except ValueError:
+            console.print(f"[red]❌ Invalid range:[/red] {range_str}")
+            console.print("[dim]💡 Expected YYYY-MM-DD..YYYY-MM-DD[/dim]")
+            ctx.exit(1)
+        _start_range(ctx, start_date, end_date, vault_path, refresh)
+        return
+
     # Parse date
     target_date = date.fromisoformat(date_str) if date_str else date.today()
 
     try:
-        result = start_day(target_date, vault_path)
+        if refresh:
+            result = refresh_day(target_date, vault_path)
+            if not result["changed"]:
+                console.print(f"[green]✓ Daily note up to date:[/green] {result['note_path']}")
+                return
+            console.print(f"[green]✅ Refreshed daily note:[/green] {result['note_path']}")
+            console.print(f"  [dim]+{result['added']} / -{result['removed']} task lines[/dim]")
+        else:
+            result = start_day(target_date, vault_path)
+            console.print(f"[green]✅ Created daily note:[/green] {result['note_path']}")
 
         # Display summary
-        console.print(f"[green]✅ Created daily note:[/green] {result['note_path']}")
         console.print()
 
         summary = result["summary"]
@@ -104,7 +157,7 @@ def start(ctx, date_str):
         handle_taskwarrior_error(e, "Generating daily note")
     except DailyNoteExistsError as e:
         console.print(f"[red]❌ Daily note already exists:[/red] {e.note_path}")
-        console.print("[dim]💡 Tip: Open the existing note or delete it first[/dim]")
+        console.print("[dim]💡 Tip: Run 'brainplorp start --refresh' to update its tasks in place[/dim]")
         ctx.exit(1)
     except VaultNotFoundError as e:
         console.print(f"[red]❌ Vault not found:[/red] {e.vault_path}")
@@ -116,16 +169,70 @@ def start(ctx, date_str):
         ctx.exit(1)
 
 
+def _start_range(ctx, start_date, end_date, vault_path, refresh):
+    """Generate (or refresh) daily notes for a date range and print per-day summaries."""
+    try:
+        result = start_days(start_date, end_date, vault_path, refresh=refresh)
+    except (TaskWarriorTimeoutError, TaskWarriorError) as e:
+        handle_taskwarrior_error(e, "Generating daily notes")
+        return
+    except VaultNotFoundError as e:
+        console.print(f"[red]❌ Vault not found:[/red] {e.vault_path}")
+        console.print("[dim]💡 Check vault_path in ~/.config/plorp/config.yaml[/dim]")
+        ctx.exit(1)
+    except ValueError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        ctx.exit(1)
+
+    table = Table(title=f"Daily notes {result['start_date']} .. {result['end_date']}")
+    table.add_column("Date")
+    table.add_column("Note")
+    table.add_column("Overdue", justify="right")
+    table.add_column("Due today", justify="right")
+    table.add_column("Recurring", justify="right")
+    table.add_column("Total", justify="right")
+
+    for day in result["days"]:
+        summary = day["summary"]
+        table.add_row(
+            day["date"],
+            day["status"],
+            str(summary["overdue_count"]),
+            str(summary["due_today_count"]),
+            str(summary["recurring_count"]),
+            str(summary["total_count"]),
+        )
+
+    console.print(table)
+    console.print(
+        f"[green]✅ Created {result['created_count']}[/green], "
+        f"refreshed {result['refreshed_count']}, unchanged {result['unchanged_count']}, "
+        f"skipped {result['skipped_count']}"
+    )
+    if result["skipped_count"] and not refresh:
+        console.print("[dim]💡 Tip: Add --refresh to update existing notes in place[/dim]")
+
+
 @cli.command()
 @click.option("--date", "date_str", default=None, help="Date to review (YYYY-MM-DD, defaults to today)")
+@click.option(
+    "--since",
+    "since_str",
+    default=None,
+    help="Review every daily note from this date (YYYY-MM-DD) through --date as one queue",
+)
 @click.pass_context
-def review(ctx, date_str):
+def review(ctx, date_str, since_str):
     """Interactive end-of-day review."""
     config = load_config()
     vault_path = Path(config["vault_path"]).expanduser().resolve()
 
     target_date = date.fromisoformat(date_str) if date_str else date.today()
 
+    if since_str:
+        _review_backlog(ctx, date.fromisoformat(since_str), target_date, vault_path)
+        return
+
     try:
         # Get uncompleted tasks
         review_data = get_review_tasks(target_date, vault_path)
@@ -138,6 +245,11 @@ def review(ctx, date_str):
         console.print(
             f"[yellow]Found {review_data['uncompleted_count']} uncompleted task(s)[/yellow]"
         )
+        if review_data.get("subprocesses_avoided"):
+            console.print(
+                f"[dim]Loaded with {review_data['lookup_exports']} export(s) "
+                f"({review_data['subprocesses_avoided']} fewer than one per task)[/dim]"
+            )
         console.print()
 
         # Process each uncompleted task
@@ -163,6 +275,41 @@ def review(ctx, date_str):
         ctx.exit(1)
 
 
+def _review_backlog(ctx, since, until, vault_path):
+    """Interactive review of the merged queue across several daily notes."""
+    try:
+        backlog = get_review_backlog(since, vault_path, until)
+    except (TaskWarriorTimeoutError, TaskWarriorError) as e:
+        handle_taskwarrior_error(e, "Loading review backlog")
+        return
+    except (VaultNotFoundError, ValueError) as e:
+        console.print(f"[red]❌ {e}[/red]")
+        ctx.exit(1)
+
+    notes = len(backlog["notes_scanned"])
+    if backlog["task_count"] == 0:
+        console.print(f"[green]🎉 Nothing left to review in {notes} daily note(s)![/green]")
+        return
+
+    console.print(
+        f"[yellow]Found {backlog['task_count']} task(s) to review across {notes} "
+        f"daily note(s)[/yellow]"
+    )
+    if backlog["resolved_count"]:
+        console.print(f"[dim]{backlog['resolved_count']} already completed or deleted[/dim]")
+    console.print()
+
+    try:
+        for task in backlog["tasks"]:
+            console.print(f"[dim]Seen on: {', '.join(task['days'])}[/dim]")
+            _review_task(task, vault_path)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]⚠️  Review interrupted[/yellow]")
+        ctx.exit(0)
+
+    console.print("[green]✅ Review complete![/green]")
+
+
 def _review_task(task, vault_path):
     """Interactive review of a single task."""
     console.print(f"[bold cyan]Task:[/bold cyan] {task['description']}")
@@ -607,8 +754,14 @@ def init_claude(ctx, force):
 
 @cli.command()
 @click.option("--date", "date_str", default=None, help="Date for daily note to process (YYYY-MM-DD, defaults to today)")
+@click.option(
+    "--all",
+    "all_notes",
+    is_flag=True,
+    help="Scan every daily note for informal tasks (Step 1 only; skips unchanged notes)",
+)
 @click.pass_context
-def process(ctx, date_str):
+def process(ctx, date_str, all_notes):
     """
     Process informal tasks in daily note.
 
@@ -617,10 +770,20 @@ def process(ctx, date_str):
 
     Step 2 (TBD section exists): Create TaskWarrior tasks from approved [Y] proposals,
     reorganize note, and remove TBD section (unless errors exist).
+
+    With --all, Step 1 runs across every note in daily/. Notes that already have a
+    TBD section, or haven't changed since the last --all scan, are skipped.
     """
     config = load_config()
     vault_path = Path(config["vault_path"]).expanduser().resolve()
 
+    if all_notes:
+        if date_str:
+            console.print("[red]❌ --all and --date can't be combined[/red]")
+            ctx.exit(1)
+        _process_all(ctx, vault_path)
+        return
+
     # Parse date
     target_date = date.fromisoformat(date_str) if date_str else date.today()
 
@@ -708,6 +871,46 @@ def process(ctx, date_str):
         ctx.exit(1)
 
 
+def _process_all(ctx, vault_path):
+    """Run Step 1 across every daily note and print the notes that got proposals."""
+    try:
+        result = process_all_daily_notes(vault_path)
+    except VaultNotFoundError as e:
+        console.print(f"[red]❌ Vault not found:[/red] {e.vault_path}")
+        console.print("[dim]💡 Check vault_path in ~/.config/plorp/config.yaml[/dim]")
+        ctx.exit(1)
+
+    console.print(
+        f"[green]✅ Scanned {result['notes_scanned']} of {result['notes_total']} daily note(s)[/green] "
+        f"[dim]({result['notes_unchanged']} unchanged, "
+        f"{result['notes_pending_review']} awaiting approval)[/dim]"
+    )
+
+    if not result["updated_notes"]:
+        console.print("[yellow]📋 No new informal tasks found[/yellow]")
+        return
+
+    table = Table(title="New proposals")
+    table.add_column("Note")
+    table.add_column("Proposals", justify="right")
+    table.add_column("Needs review", justify="right")
+    for note in result["updated_notes"]:
+        table.add_row(
+            Path(note["note_path"]).stem,
+            str(note["proposals_count"]),
+            str(note["needs_review_count"]),
+        )
+    console.print(table)
+
+    console.print(
+        f"[bold]✅ Added {result['proposals_count']} proposal(s) to "
+        f"{len(result['updated_notes'])} TBD Processing section(s)[/bold]"
+    )
+    if result["needs_review_count"]:
+        console.print(f"[red]⚠️  {result['needs_review_count']} task(s) need review[/red]")
+    console.print("[dim]💡 Mark [Y]/[N] in each note, then run 'plorp process --date <date>'[/dim]")
+
+
 @cli.command()
 @click.option('--urgent', is_flag=True, help='Show only urgent (priority:H) tasks')
 @click.option('--important', is_flag=True, help='Show important (priority:M) tasks')
@@ -751,36 +954,42 @@ def tasks(ctx, urgent, important, project, due, limit, output_format):
         elif due == 'week':
             filters.append('due.before:eow')
 
-        # Get tasks from TaskWarrior
-        task_list = get_tasks(filters)
+        # JSON: stream from the export (same output as json.dumps(list, indent=2)),
+        # stopping TaskWarrior once the limit is reached
+        if output_format == 'json':
+            first = True
+            for task in itertools.islice(iter_tasks(filters), limit):
+                click.echo("[\n" if first else ",\n", nl=False)
+                click.echo(textwrap.indent(json.dumps(task, indent=2), "  "), nl=False)
+                first = False
+            click.echo("[]" if first else "\n]")
+            return
 
-        # Limit results
-        if len(task_list) > limit:
-            task_list = task_list[:limit]
+        # Get tasks from TaskWarrior; TaskInfo views are only built for shown rows
+        task_table = TaskTable.from_tasks(get_tasks(filters))
+        shown = task_table.infos(range(min(len(task_table), limit)))
 
         # Format output
-        if output_format == 'json':
-            click.echo(json.dumps(task_list, indent=2))
-        elif output_format == 'simple':
-            for task in task_list:
-                pri = task.get('priority', ' ')
-                desc = task.get('description', '')
-                proj = task.get('project', '')
+        if output_format == 'simple':
+            for task in shown:
+                pri = task['priority'] or ' '
+                desc = task['description']
+                proj = task['project'] or ''
                 click.echo(f"[{pri}] {desc} ({proj})")
         else:  # table
-            table = Table(title=f"Tasks ({len(task_list)})")
+            table = Table(title=f"Tasks ({len(shown)})")
 
             table.add_column("Pri", width=6)
             table.add_column("Description", width=40)
             table.add_column("Project", width=15)
             table.add_column("Due", width=12)
 
-            for task in task_list:
-                pri = task.get('priority', '')
+            for task in shown:
+                pri = task['priority'] or ''
                 pri_icon = '🔴' if pri == 'H' else '🟡' if pri == 'M' else '  '
-                desc = task.get('description', '')
-                proj = task.get('project', '')
-                due_date = task.get('due', '')
+                desc = task['description']
+                proj = task['project'] or ''
+                due_date = task['due'] or ''
 
                 # Format due date
                 if due_date:
@@ -797,6 +1006,60 @@ def tasks(ctx, urgent, important, project, due, limit, output_format):
         ctx.exit(1)
 
 
+@cli.command()
+@click.argument("query", nargs=-1, required=True)
+@click.option("--folder", default=None, help="Only search this folder (e.g. notes, projects/work)")
+@click.option("--limit", default=20, show_default=True, help="Maximum number of results")
+@click.option('--format', 'output_format', default='table', type=click.Choice(['table', 'simple', 'json']))
+@click.pass_context
+def search(ctx, query, folder, limit, output_format):
+    """
+    Full-text search across vault notes (best matches first).
+
+    Examples:
+      brainplorp search launch plan        # Notes containing both words
+      brainplorp search "plan*"            # Prefix match
+      brainplorp search seo --folder notes
+    """
+    config = load_config()
+    vault_path = Path(config["vault_path"]).expanduser().resolve()
+    text = " ".join(query)
+
+    try:
+        hits = search_notes(vault_path, text, folder=folder, limit=limit)
+    except PermissionError as e:
+        console.print(f"[red]❌ {e}[/red]")
+        ctx.exit(1)
+    except Exception as e:
+        console.print(f"[red]❌ Error searching notes:[/red] {e}")
+        ctx.exit(1)
+
+    if output_format == 'json':
+        click.echo(json.dumps(hits, indent=2))
+        return
+
+    if not hits:
+        console.print(f"[dim]No notes match '{escape(text)}'[/dim]")
+        return
+
+    if output_format == 'simple':
+        for hit in hits:
+            click.echo(f"{hit['path']}: {hit['snippet']}")
+        return
+
+    table = Table(title=f"Search: {escape(text)} ({len(hits)})")
+    table.add_column("Note", style="cyan", no_wrap=True)
+    table.add_column("Match")
+
+    for hit in hits:
+        # Snippet matches come wrapped in ** - show them bold
+        parts = escape(hit["snippet"]).split("**")
+        snippet = "".join(f"[bold]{p}[/bold]" if i % 2 else p for i, p in enumerate(parts))
+        table.add_row(f"{escape(hit['title'])}\n[dim]{escape(hit['path'])}[/dim]", snippet)
+
+    console.print(table)
+
+
 # ============================================================================
 # Project Management Commands (Sprint 8)
 # ============================================================================
@@ -902,6 +1165,10 @@ def project_sync_all(ctx):
         stats = sync_all_projects(vault_path)
 
         console.print(f"[green]✅ Synced {stats['synced']} project(s)[/green]")
+        console.print(
+            f"[dim]{stats['changed']} updated, {stats['unchanged']} already in sync "
+            f"({stats['timing_ms']['total']:.0f} ms)[/dim]"
+        )
 
         if stats["errors"]:
             console.print(f"[red]❌ {len(stats['errors'])} error(s) occurred:[/red]")
@@ -4,6 +4,7 @@ brainplorp doctor command - System diagnostics and health checks.
 Usage:
     brainplorp doctor
     brainplorp doctor --verbose
+    brainplorp doctor --perf
 
 Checks:
 - TaskWarrior installation and functionality
@@ -11,12 +12,23 @@ Checks:
 - Obsidian vault accessibility
 - Config file validity
 - MCP server configuration
+
+--perf instead reports TaskWarrior command latency (p50/p95/p99), call
+counts and bytes per workflow run, read from the perf log that
+BRAINPLORP_PERF_LOG=1 enables.
 """
 
 import sys
+from datetime import datetime
 
 import click
 
+from brainplorp.integrations.task_metrics import (
+    PERF_LOG_ENV,
+    get_perf_log_path,
+    perf_log_enabled,
+    read_perf_runs,
+)
 from brainplorp.utils.diagnostics import (
     check_taskwarrior,
     check_python_dependencies,
@@ -28,12 +40,17 @@ from brainplorp.utils.diagnostics import (
 
 @click.command()
 @click.option('--verbose', '-v', is_flag=True, help='Show detailed diagnostic information')
-def doctor(verbose: bool):
+@click.option('--perf', is_flag=True, help='Show TaskWarrior command timings per workflow run')
+@click.option('--runs', default=5, show_default=True, help='Number of recent runs for --perf')
+def doctor(verbose: bool, perf: bool, runs: int):
     """
     Diagnose brainplorp installation and configuration issues.
 
     Runs comprehensive health checks and provides actionable fix instructions.
     """
+    if perf:
+        return show_perf_report(runs)
+
     click.echo()
     click.secho("brainplorp System Diagnostics", fg='cyan', bold=True)
     click.echo("=" * 60)
@@ -104,3 +121,47 @@ def doctor(verbose: bool):
         click.echo()
         click.echo("After fixing, run 'brainplorp doctor' again to verify.")
         return 1
+
+
+def show_perf_report(runs: int) -> int:
+    """Print per-run TaskWarrior command stats from the perf log."""
+    click.echo()
+    click.secho("brainplorp TaskWarrior Performance", fg='cyan', bold=True)
+    click.echo("=" * 60)
+
+    log_path = get_perf_log_path()
+    summaries = read_perf_runs(log_path, last=runs)
+
+    if not summaries:
+        click.echo()
+        click.echo(f"No runs recorded in {log_path}")
+        if not perf_log_enabled():
+            click.echo(f"Enable recording with: export {PERF_LOG_ENV}=1")
+            click.echo("Then run a workflow (e.g. 'brainplorp start') and try again.")
+        return 0
+
+    for summary in summaries:
+        started = datetime.fromtimestamp(summary['started'] or 0).strftime('%Y-%m-%d %H:%M:%S')
+        click.echo()
+        click.secho(
+            f"{summary['workflow'] or 'unknown'}  ({started}, run {summary['run']})",
+            bold=True,
+        )
+        click.echo(
+            f"  {summary['calls']} task calls, {summary['total_ms']:.1f} ms in TaskWarrior"
+        )
+        click.echo(
+            f"  {'command':<10} {'calls':>6} {'errors':>6} {'p50 ms':>9} {'p95 ms':>9} "
+            f"{'p99 ms':>9} {'bytes':>10}"
+        )
+        for name, stats in summary['commands'].items():
+            click.echo(
+                f"  {name:<10} {stats['count']:>6} {stats['errors'] + stats['timeouts']:>6} "
+                f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f} "
+                f"{stats['bytes']:>10}"
+            )
+
+    if not perf_log_enabled():
+        click.echo()
+        click.echo(f"Note: {PERF_LOG_ENV} is not set; no new runs are being recorded.")
+    return 0
@@ -9,7 +9,7 @@ Config location: ~/.config/plorp/config.yaml (or $XDG_CONFIG_HOME/plorp/config.y
 import os
 import sys
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 import yaml
 
 
@@ -40,6 +40,10 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 }
 
 
+# get_vault_path() cache: ((config path, mtime_ns, size), vault path)
+_vault_path_cache: Optional[Tuple[Tuple[str, int, int], Path]] = None
+
+
 def get_config_dir() -> Path:
     """
     Get the plorp configuration directory.
@@ -131,9 +135,29 @@ def get_vault_path() -> Path:
     Example:
         >>> vault = get_vault_path()
         >>> daily_dir = vault / "daily"
+
+    The result is cached and reused while config.yaml's mtime and size are
+    unchanged (and the vault directory still exists), so hot paths don't
+    re-read and re-parse the config file on every call.
     """
+    global _vault_path_cache
+
+    config_path = get_config_path()
+    try:
+        stat = config_path.stat()
+        key: Optional[Tuple[str, int, int]] = (str(config_path), stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        key = None
+
+    if key is not None and _vault_path_cache is not None and _vault_path_cache[0] == key:
+        vault_path = _vault_path_cache[1]
+        if vault_path.is_dir():
+            return vault_path
+
     config = load_config()
-    return Path(config["vault_path"])
+    vault_path = Path(config["vault_path"])
+    _vault_path_cache = (key, vault_path) if key is not None else None
+    return vault_path
 
 
 def save_config(config: Dict[str, Any]) -> None:
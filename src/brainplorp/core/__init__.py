@@ -16,8 +16,13 @@ from brainplorp.core.types import (
     TaskInfo,
     TaskSummary,
     DailyStartResult,
+    DailyRefreshResult,
+    DailyRangeDay,
+    DailyRangeResult,
     ReviewData,
     ReviewResult,
+    ReviewBacklog,
+    ReviewBacklogTask,
     InboxItem,
     InboxData,
     InboxProcessResult,
@@ -41,9 +46,18 @@ from brainplorp.core.exceptions import (
 )
 
 # Workflow functions
-from brainplorp.core.daily import start_day
-from brainplorp.core.review import get_review_tasks, add_review_notes
-from brainplorp.core.tasks import mark_completed, defer_task, drop_task, set_priority
+from brainplorp.core.daily import start_day, refresh_day, start_days
+from brainplorp.core.review import get_review_tasks, get_review_backlog, add_review_notes
+from brainplorp.core.tasks import (
+    mark_completed,
+    defer_task,
+    drop_task,
+    set_priority,
+    mark_completed_async,
+    defer_task_async,
+    drop_task_async,
+    set_priority_async,
+)
 from brainplorp.core.inbox import (
     get_inbox_items,
     create_task_from_inbox,
@@ -62,8 +76,13 @@ __all__ = [
     "TaskInfo",
     "TaskSummary",
     "DailyStartResult",
+    "DailyRefreshResult",
+    "DailyRangeDay",
+    "DailyRangeResult",
     "ReviewData",
     "ReviewResult",
+    "ReviewBacklog",
+    "ReviewBacklogTask",
     "InboxItem",
     "InboxData",
     "InboxProcessResult",
@@ -83,12 +102,19 @@ __all__ = [
     "InboxNotFoundError",
     # Functions
     "start_day",
+    "refresh_day",
+    "start_days",
     "get_review_tasks",
+    "get_review_backlog",
     "add_review_notes",
     "mark_completed",
     "defer_task",
     "drop_task",
     "set_priority",
+    "mark_completed_async",
+    "defer_task_async",
+    "drop_task_async",
+    "set_priority_async",
     "get_inbox_items",
     "create_task_from_inbox",
     "create_note_from_inbox",
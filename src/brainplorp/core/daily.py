@@ -5,13 +5,47 @@ Implements pure functions for daily note generation.
 No I/O decisions - returns structured data for callers to format.
 """
 
-from datetime import date, datetime
+import heapq
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import List
-
-from brainplorp.core.types import DailyStartResult, TaskInfo, TaskSummary
+from typing import Dict, List, Optional, Tuple
+
+from brainplorp.core.types import (
+    DailyRangeDay,
+    DailyRangeResult,
+    DailyRefreshResult,
+    DailyStartResult,
+    TaskInfo,
+    TaskSummary,
+)
 from brainplorp.core.exceptions import VaultNotFoundError, DailyNoteExistsError
+from brainplorp.core.task_table import NO_DUE, TaskTable, day_start, parse_due, to_task_info
 from brainplorp.integrations.taskwarrior import get_tasks
+from brainplorp.utils.files import write_file
+
+# Section headers written by _format_daily_note (and matched by refresh_day)
+OVERDUE_HEADER = "## ⚠️  Overdue Tasks"
+DUE_TODAY_HEADER = "## 📅 Due Today"
+RECURRING_HEADER = "## 🔄 Recurring Tasks"
+NO_TASKS_HEADER = "## 📋 Tasks"
+NO_TASKS_MESSAGE = "No tasks scheduled for today."
+NOTES_HEADER = "## 📝 Notes"
+
+# Task sections in note order: (category key, header)
+TASK_SECTIONS = (
+    ("overdue", OVERDUE_HEADER),
+    ("due_today", DUE_TODAY_HEADER),
+    ("recurring", RECURRING_HEADER),
+)
+
+# start_days limits
+MAX_RANGE_DAYS = 366
+MAX_WRITE_WORKERS = 8
+
+# - [ ] Description (project: X, due: Y, uuid: Z)  -> (check mark, uuid)
+_TASK_LINE = re.compile(r"^\s*-\s*\[([ xX])\]\s.*?uuid:\s*([\w-]+)\)\s*$")
 
 
 def start_day(target_date: date, vault_path: Path) -> DailyStartResult:
@@ -44,35 +78,221 @@ def start_day(target_date: date, vault_path: Path) -> DailyStartResult:
     if note_path.exists():
         raise DailyNoteExistsError(str(target_date), str(note_path))
 
-    # Get tasks from TaskWarrior
-    all_tasks = get_tasks(["status:pending"])
+    overdue, due_today, recurring = _categorize_tasks(target_date)
+
+    # Create note content
+    content = _format_daily_note(target_date, overdue, due_today, recurring)
+
+    # Write note
+    write_file(note_path, content)
+
+    return _start_result(note_path, target_date, overdue, due_today, recurring)
+
+
+def refresh_day(target_date: date, vault_path: Path) -> DailyRefreshResult:
+    """
+    Bring an existing daily note's task sections up to date, in place.
 
-    # Categorize tasks
-    overdue = []
-    due_today = []
-    recurring = []
+    Re-categorizes pending tasks (served from the task snapshot when it is
+    valid) and edits only the task lines of the Overdue / Due Today /
+    Recurring sections:
+
+    - Tasks newly in a category are appended to its section (the section is
+      created if missing)
+    - Lines for tasks no longer in their category (completed, deleted,
+      rescheduled) are dropped
+    - Unchecked lines are re-rendered from current task data; checked lines
+      are kept as the user left them
+    - Everything else - notes, user text inside sections - is untouched
+
+    The file is not written at all when nothing changed. If the note does
+    not exist yet it is created, as by start_day().
+
+    Args:
+        target_date: Date of the daily note
+        vault_path: Absolute path to Obsidian vault
+
+    Returns:
+        DailyRefreshResult: DailyStartResult plus changed/added/removed
+
+    Raises:
+        VaultNotFoundError: Vault directory doesn't exist
+    """
+    vault_path = vault_path.expanduser().resolve()
+    if not vault_path.exists():
+        raise VaultNotFoundError(str(vault_path))
+
+    note_path = vault_path / "daily" / f"{target_date}.md"
+    if not note_path.exists():
+        result = start_day(target_date, vault_path)
+        return {
+            **result,
+            "changed": True,
+            "added": result["summary"]["total_count"],
+            "removed": 0,
+        }
+
+    overdue, due_today, recurring = _categorize_tasks(target_date)
+    changed, added, removed = _refresh_note(note_path, overdue, due_today, recurring)
+
+    return {
+        **_start_result(note_path, target_date, overdue, due_today, recurring),
+        "changed": changed,
+        "added": added,
+        "removed": removed,
+    }
+
+
+def start_days(
+    start_date: date, end_date: date, vault_path: Path, refresh: bool = False
+) -> DailyRangeResult:
+    """
+    Generate daily notes for every date from start_date to end_date inclusive.
+
+    Pending tasks are fetched once and bucketed by due date for the whole
+    range in a single scan; each day's overdue list is the previous day's
+    plus everything due on the previous day. Notes are then written in
+    parallel.
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        vault_path: Absolute path to Obsidian vault
+        refresh: Refresh notes that already exist (see refresh_day) instead
+            of skipping them
+
+    Returns:
+        DailyRangeResult with a per-day DailyStartResult plus status
+        ("created", "refreshed", "unchanged" or "skipped")
+
+    Raises:
+        VaultNotFoundError: Vault directory doesn't exist
+        ValueError: If end_date is before start_date or the range exceeds
+            MAX_RANGE_DAYS
+    """
+    vault_path = vault_path.expanduser().resolve()
+    if not vault_path.exists():
+        raise VaultNotFoundError(str(vault_path))
+
+    if end_date < start_date:
+        raise ValueError(f"Invalid date range: {end_date} is before {start_date}")
+    days = (end_date - start_date).days + 1
+    if days > MAX_RANGE_DAYS:
+        raise ValueError(f"Date range too long: {days} days (max {MAX_RANGE_DAYS})")
+
+    daily_dir = vault_path / "daily"
+    daily_dir.mkdir(exist_ok=True)
 
-    for task_data in all_tasks:
+    table = TaskTable.from_tasks(get_tasks(["status:pending"]))
+    overdue_rows, due_by_day = table.due_by_day(start_date, days)
+
+    plans = []
+    for offset, due_rows in enumerate(due_by_day):
         # Only include recurring tasks if they're due today (Q24 decision)
-        if _is_recurring(task_data) and _is_due_today(task_data, target_date):
-            task_info = _normalize_task(task_data)
-            recurring.append(task_info)
-        elif _is_overdue(task_data, target_date):
-            task_info = _normalize_task(task_data)
-            overdue.append(task_info)
-        elif _is_due_today(task_data, target_date):
-            task_info = _normalize_task(task_data)
-            due_today.append(task_info)
+        recurring_rows = table.is_recurring(due_rows)
+        recurring_set = set(recurring_rows)
+        plans.append(
+            (
+                start_date + timedelta(days=offset),
+                table.infos(overdue_rows),
+                table.infos([i for i in due_rows if i not in recurring_set]),
+                table.infos(recurring_rows),
+            )
+        )
+        overdue_rows = list(heapq.merge(overdue_rows, due_rows))
+
+    def write_day(plan) -> DailyRangeDay:
+        target_date, overdue, due_today, recurring = plan
+        note_path = daily_dir / f"{target_date}.md"
+
+        if not note_path.exists():
+            write_file(note_path, _format_daily_note(target_date, overdue, due_today, recurring))
+            status = "created"
+        elif refresh:
+            changed, _, _ = _refresh_note(note_path, overdue, due_today, recurring)
+            status = "refreshed" if changed else "unchanged"
+        else:
+            status = "skipped"
 
-    all_categorized = overdue + due_today + recurring
+        return {
+            **_start_result(note_path, target_date, overdue, due_today, recurring),
+            "status": status,
+        }
 
-    # Create note content
-    content = _format_daily_note(target_date, overdue, due_today, recurring)
+    with ThreadPoolExecutor(max_workers=min(MAX_WRITE_WORKERS, days)) as pool:
+        results = list(pool.map(write_day, plans))
 
-    # Write note
-    note_path.write_text(content)
+    statuses = [r["status"] for r in results]
+    return {
+        "start_date": str(start_date),
+        "end_date": str(end_date),
+        "days": results,
+        "created_count": statuses.count("created"),
+        "refreshed_count": statuses.count("refreshed"),
+        "unchanged_count": statuses.count("unchanged"),
+        "skipped_count": statuses.count("skipped"),
+    }
+
+
+def _refresh_note(
+    note_path: Path,
+    overdue: List[TaskInfo],
+    due_today: List[TaskInfo],
+    recurring: List[TaskInfo],
+) -> Tuple[bool, int, int]:
+    """
+    Rewrite an existing note's task sections; skips the write if unchanged.
+
+    Returns:
+        (changed, lines added, lines removed)
+    """
+    content = note_path.read_text()
+    updated, added, removed = _refresh_note_content(
+        content, {"overdue": overdue, "due_today": due_today, "recurring": recurring}
+    )
+
+    changed = updated != content
+    if changed:
+        write_file(note_path, updated)
+
+    return changed, added, removed
+
+
+def _categorize_tasks(target_date: date) -> Tuple[List[TaskInfo], List[TaskInfo], List[TaskInfo]]:
+    """
+    Fetch pending tasks and split them into overdue, due today and recurring.
+
+    Args:
+        target_date: Date the categories are relative to
+
+    Returns:
+        (overdue, due_today, recurring) TaskInfo lists
+    """
+    table = TaskTable.from_tasks(get_tasks(["status:pending"]))
+
+    # Categorize tasks (one scan per category over the due column)
+    # Only include recurring tasks if they're due today (Q24 decision)
+    due_today_rows = table.due_on(target_date)
+    recurring_rows = table.is_recurring(due_today_rows)
+    recurring_set = set(recurring_rows)
+
+    overdue = table.infos(table.overdue(target_date))
+    due_today = table.infos([i for i in due_today_rows if i not in recurring_set])
+    recurring = table.infos(recurring_rows)
+
+    return overdue, due_today, recurring
+
+
+def _start_result(
+    note_path: Path,
+    target_date: date,
+    overdue: List[TaskInfo],
+    due_today: List[TaskInfo],
+    recurring: List[TaskInfo],
+) -> DailyStartResult:
+    """Build the structured result shared by start_day and refresh_day."""
+    all_categorized = overdue + due_today + recurring
 
-    # Return structured result
     return {
         "note_path": str(note_path),
         "created_at": datetime.now().isoformat(),
@@ -87,6 +307,154 @@ def start_day(target_date: date, vault_path: Path) -> DailyStartResult:
     }
 
 
+def _normalize_header(line: str) -> str:
+    return " ".join(line.split())
+
+
+def _refresh_note_content(
+    content: str, categories: Dict[str, List[TaskInfo]]
+) -> Tuple[str, int, int]:
+    """
+    Reconcile a daily note's task sections with freshly categorized tasks.
+
+    Args:
+        content: Current note content
+        categories: Category key ("overdue", "due_today", "recurring") -> tasks
+
+    Returns:
+        (updated content, lines added, lines removed)
+    """
+    section_keys = {_normalize_header(header): key for key, header in TASK_SECTIONS}
+    wanted: Dict[str, str] = {}
+    tasks_by_uuid: Dict[str, TaskInfo] = {}
+    for key, tasks in categories.items():
+        for task in tasks:
+            wanted.setdefault(task["uuid"], key)
+            tasks_by_uuid.setdefault(task["uuid"], task)
+
+    # Split into [header, body lines] blocks; the preamble has header None
+    blocks: List[List] = [[None, []]]
+    for line in content.split("\n"):
+        if line.startswith("## "):
+            blocks.append([line, []])
+        else:
+            blocks[-1][1].append(line)
+
+    placed = set()
+    checked_moved: Dict[str, str] = {}  # checked lines whose task changed section
+    removed = 0
+
+    # Pass 1: keep/re-render/drop existing task lines in the task sections
+    for block in blocks:
+        key = section_keys.get(_normalize_header(block[0])) if block[0] else None
+        if key is None:
+            continue
+        body = []
+        for line in block[1]:
+            match = _TASK_LINE.match(line)
+            if not match:
+                body.append(line)
+                continue
+            checked = match.group(1) != " "
+            uuid = match.group(2)
+            if wanted.get(uuid) == key and uuid not in placed:
+                placed.add(uuid)
+                body.append(line if checked else _format_task_checkbox(tasks_by_uuid[uuid]))
+            else:
+                if checked and uuid in wanted:
+                    checked_moved.setdefault(uuid, line)
+                else:
+                    removed += 1
+        block[1] = body
+
+    # Pass 2: add tasks that have no line yet
+    added = 0
+    for key, header in TASK_SECTIONS:
+        new_lines = []
+        for task in categories.get(key, []):
+            uuid = task["uuid"]
+            if uuid in placed or wanted[uuid] != key:
+                continue
+            placed.add(uuid)
+            new_lines.append(checked_moved.pop(uuid, None) or _format_task_checkbox(task))
+        if not new_lines:
+            continue
+        added += len(new_lines)
+
+        block = _find_block(blocks, header)
+        if block is None:
+            _insert_block(blocks, [header, [""] + new_lines + [""]], key)
+        else:
+            body = block[1]
+            task_positions = [i for i, line in enumerate(body) if _TASK_LINE.match(line)]
+            if task_positions:
+                position = task_positions[-1] + 1
+            else:
+                position = 0
+                while position < len(body) - 1 and not body[position].strip():
+                    position += 1
+            body[position:position] = new_lines
+
+    # Checked lines whose task moved but couldn't be placed are dropped
+    removed += len(checked_moved)
+
+    # Pass 3: drop task sections left without tasks or user text, and keep
+    # the "no tasks" placeholder in sync
+    has_tasks = bool(placed)
+    kept = []
+    for block in blocks:
+        header = _normalize_header(block[0]) if block[0] else None
+        is_task_section = header in section_keys
+        is_placeholder = header == _normalize_header(NO_TASKS_HEADER)
+        body_text = [line.strip() for line in block[1] if line.strip()]
+        if is_task_section and not body_text:
+            continue
+        if is_placeholder and has_tasks and body_text in ([], [NO_TASKS_MESSAGE]):
+            continue
+        kept.append(block)
+    blocks = kept
+
+    if not has_tasks and not any(
+        block[0]
+        and _normalize_header(block[0])
+        in set(section_keys) | {_normalize_header(NO_TASKS_HEADER)}
+        for block in blocks
+    ):
+        _insert_block(blocks, [NO_TASKS_HEADER, ["", NO_TASKS_MESSAGE, "", ""]], None)
+
+    lines: List[str] = []
+    for header, body in blocks:
+        if header is not None:
+            lines.append(header)
+        lines.extend(body)
+
+    return "\n".join(lines), added, removed
+
+
+def _find_block(blocks: List[List], header: str) -> Optional[List]:
+    target = _normalize_header(header)
+    for block in blocks:
+        if block[0] and _normalize_header(block[0]) == target:
+            return block
+    return None
+
+
+def _insert_block(blocks: List[List], new_block: List, key: Optional[str]) -> None:
+    """Insert a section before the next task section in note order, else before Notes."""
+    keys = [k for k, _ in TASK_SECTIONS]
+    later_headers = [header for k, header in TASK_SECTIONS[keys.index(key) + 1 :]] if key else []
+    for header in later_headers + [NO_TASKS_HEADER, NOTES_HEADER]:
+        block = _find_block(blocks, header)
+        if block is not None:
+            blocks.insert(blocks.index(block), new_block)
+            return
+
+    # No anchor: append, keeping a blank line between sections
+    if blocks[-1][1] and blocks[-1][1][-1].strip():
+        blocks[-1][1].append("")
+    blocks.append(new_block)
+
+
 def _normalize_task(task_data: dict) -> TaskInfo:
     """
     Normalize TaskWarrior task data to TaskInfo format.
@@ -97,21 +465,15 @@ def _normalize_task(task_data: dict) -> TaskInfo:
     Returns:
         TaskInfo TypedDict with normalized fields
     """
-    return {
-        "uuid": task_data.get("uuid", ""),
-        "description": task_data.get("description", ""),
-        "status": task_data.get("status", "pending"),
-        "due": task_data.get("due"),
-        "priority": task_data.get("priority", ""),
-        "project": task_data.get("project"),
-        "tags": task_data.get("tags", []),
-    }
+    return to_task_info(task_data)
 
 
 def _is_overdue(task: dict, reference_date: date) -> bool:
     """
     Check if task is overdue relative to reference date.
 
+    Single-task form of TaskTable.overdue().
+
     Args:
         task: TaskWarrior task data
         reference_date: Date to check against
@@ -119,29 +481,16 @@ def _is_overdue(task: dict, reference_date: date) -> bool:
     Returns:
         True if task is overdue
     """
-    if "due" not in task or task["due"] is None:
-        return False
-
-    # TaskWarrior stores dates as ISO 8601 strings like "20251006T000000Z"
-    due_str = task["due"]
-    try:
-        # Parse date from ISO 8601 format (basic format: YYYYMMDDTHHMMSSZ)
-        if "T" in due_str:
-            # Extract date part before 'T': "20251006T000000Z" -> "20251006"
-            date_part = due_str.split("T")[0]
-            due_date = datetime.strptime(date_part, "%Y%m%d").date()
-        else:
-            due_date = datetime.strptime(due_str[:8], "%Y%m%d").date()
-
-        return due_date < reference_date
-    except (ValueError, IndexError):
-        return False
+    due = parse_due(task.get("due"))
+    return due != NO_DUE and due < day_start(reference_date)
 
 
 def _is_due_today(task: dict, reference_date: date) -> bool:
     """
     Check if task is due on the reference date.
 
+    Single-task form of TaskTable.due_on().
+
     Args:
         task: TaskWarrior task data
         reference_date: Date to check against
@@ -149,23 +498,8 @@ def _is_due_today(task: dict, reference_date: date) -> bool:
     Returns:
         True if task is due today
     """
-    if "due" not in task or task["due"] is None:
-        return False
-
-    # TaskWarrior stores dates as ISO 8601 strings like "20251006T000000Z"
-    due_str = task["due"]
-    try:
-        # Parse date from ISO 8601 format (basic format: YYYYMMDDTHHMMSSZ)
-        if "T" in due_str:
-            # Extract date part before 'T': "20251006T000000Z" -> "20251006"
-            date_part = due_str.split("T")[0]
-            due_date = datetime.strptime(date_part, "%Y%m%d").date()
-        else:
-            due_date = datetime.strptime(due_str[:8], "%Y%m%d").date()
-
-        return due_date == reference_date
-    except (ValueError, IndexError):
-        return False
+    due = parse_due(task.get("due"))
+    return day_start(reference_date) <= due < day_start(reference_date + timedelta(days=1))
 
 
 def _is_recurring(task: dict) -> bool:
@@ -207,33 +541,33 @@ def _format_daily_note(
 
     # Add overdue section
     if overdue:
-        lines.append("## ⚠️  Overdue Tasks\n")
+        lines.append(f"{OVERDUE_HEADER}\n")
         for task in overdue:
             lines.append(_format_task_checkbox(task))
         lines.append("")
 
     # Add due today section
     if due_today:
-        lines.append("## 📅 Due Today\n")
+        lines.append(f"{DUE_TODAY_HEADER}\n")
         for task in due_today:
             lines.append(_format_task_checkbox(task))
         lines.append("")
 
     # Add recurring section
     if recurring:
-        lines.append("## 🔄 Recurring Tasks\n")
+        lines.append(f"{RECURRING_HEADER}\n")
         for task in recurring:
             lines.append(_format_task_checkbox(task))
         lines.append("")
 
     # Add empty sections if no tasks
     if not overdue and not due_today and not recurring:
-        lines.append("## 📋 Tasks\n")
-        lines.append("No tasks scheduled for today.\n")
+        lines.append(f"{NO_TASKS_HEADER}\n")
+        lines.append(f"{NO_TASKS_MESSAGE}\n")
         lines.append("")
 
     # Add notes section
-    lines.append("## 📝 Notes\n")
+    lines.append(f"{NOTES_HEADER}\n")
     lines.append("")
 
     return "\n".join(lines)
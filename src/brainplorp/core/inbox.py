@@ -12,8 +12,9 @@ from typing import Optional
 from brainplorp.core.types import InboxData, InboxProcessResult
 from brainplorp.core.exceptions import VaultNotFoundError, InboxNotFoundError
 from brainplorp.parsers.markdown import parse_inbox_items, mark_item_processed
-from brainplorp.integrations.taskwarrior import create_task
+from brainplorp.integrations.taskwarrior import create_tasks
 from brainplorp.integrations.obsidian import create_note
+from brainplorp.utils.files import write_file
 
 
 def get_inbox_items(vault_path: Path, target_date: Optional[date] = None) -> InboxData:
@@ -88,10 +89,8 @@ def create_task_from_inbox(
     Returns:
         InboxProcessResult with task UUID
     """
-    # Create task in TaskWarrior
-    uuid = create_task(
-        description=description, project=project, due=due, priority=priority
-    )
+    # Create task in TaskWarrior (single 'task import', UUID assigned locally)
+    uuid = _create_inbox_task(description, project, due, priority)
 
     if not uuid:
         raise RuntimeError(f"Failed to create task from inbox item: {item_text}")
@@ -111,6 +110,30 @@ def create_task_from_inbox(
     }
 
 
+def _create_inbox_task(
+    description: str,
+    project: Optional[str],
+    due: Optional[str],
+    priority: Optional[str],
+) -> Optional[str]:
+    """
+    Create a single task via create_tasks() and return its UUID.
+
+    Args:
+        description: Task description
+        project: Project name
+        due: Due date
+        priority: Priority (H, M, L)
+
+    Returns:
+        Task UUID, or None if TaskWarrior rejected the import
+    """
+    created = create_tasks(
+        [{"description": description, "project": project, "due": due, "priority": priority}]
+    )
+    return created[0]["uuid"] if created else None
+
+
 def create_note_from_inbox(
     vault_path: Path,
     item_text: str,
@@ -180,9 +203,7 @@ def create_both_from_inbox(
         InboxProcessResult with both task UUID and note path
     """
     # Create task
-    uuid = create_task(
-        description=task_description, project=project, due=due, priority=priority
-    )
+    uuid = _create_inbox_task(task_description, project, due, priority)
 
     if not uuid:
         raise RuntimeError(f"Failed to create task from inbox item: {item_text}")
@@ -313,7 +334,7 @@ def append_emails_to_inbox(emails: list, vault_path: Path) -> dict:
     )
 
     # Write back
-    inbox_file.write_text(new_content, encoding="utf-8")
+    write_file(inbox_file, new_content)
 
     # Count total unprocessed items (count all bullets in Unprocessed section)
     # Need to recalculate section positions in new_content
@@ -395,6 +416,6 @@ def quick_add_to_inbox(text: str, vault_path: Path, urgent: bool = False) -> dic
     )
 
     # Write back
-    inbox_file.write_text(new_content, encoding="utf-8")
+    write_file(inbox_file, new_content)
 
     return {"added": True, "inbox_path": str(inbox_file), "item": item}
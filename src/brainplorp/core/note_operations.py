@@ -16,7 +16,7 @@ from pathlib import Path
 from typing import List, Dict, Any
 
 from ..config import load_config, get_vault_path
-from ..core.types import NoteContent, NoteInfo, FolderReadResult
+from ..core.types import NoteContent, NoteInfo, NoteSearchHit, FolderReadResult
 from ..core.exceptions import HeaderNotFoundError
 from ..integrations.obsidian_notes import (
     _read_note_file,
@@ -26,6 +26,8 @@ from ..integrations.obsidian_notes import (
     _search_notes_by_metadata_file,
     _create_note_in_folder_file,
 )
+from ..integrations.note_index import search_text
+from ..integrations.note_cache import ParsedNote, get_parsed_note
 
 logger = logging.getLogger(__name__)
 
@@ -148,6 +150,30 @@ def read_note(vault_path: Path, note_path: str, mode: str = "full") -> NoteConte
     return result
 
 
+def load_parsed_note(vault_path: Path, note_path: str) -> ParsedNote:
+    """
+    Parsed note for the structure tools, from the shared note cache.
+
+    Args:
+        vault_path: Vault root path
+        note_path: Relative path to note (e.g., "notes/ideas.md")
+
+    Returns:
+        ParsedNote with memoized headers/section/bullets/projects/tags
+
+    Raises:
+        FileNotFoundError: If note doesn't exist
+        PermissionError: If note outside allowed folders
+    """
+    _validate_note_access(vault_path, note_path)
+
+    file_path = vault_path / note_path
+    if not file_path.is_file():
+        raise FileNotFoundError(f"Note not found: {note_path}")
+
+    return get_parsed_note(file_path)
+
+
 def read_folder(
     vault_path: Path,
     folder_path: str,
@@ -155,9 +181,11 @@ def read_folder(
     exclude: List[str] | None = None,
     limit: int = 10,
     mode: str = "metadata",
+    sort: str = "name",
+    cursor: str | None = None,
 ) -> FolderReadResult:
     """
-    Read all notes in folder with filtering.
+    Read one page of notes in folder with filtering.
 
     Args:
         vault_path: Vault root path
@@ -166,13 +194,17 @@ def read_folder(
         exclude: Folder names to skip (e.g., ["archive", "templates"])
         limit: Max notes to return (default 10, max 50)
         mode: Content mode (default "metadata" to avoid context exhaustion)
+        sort: "name" (default, A-Z by path) or "mtime" (newest first)
+        cursor: next_cursor from the previous page (default: first page)
 
     Returns:
-        FolderReadResult with notes list, total_count, has_more flag
+        FolderReadResult with notes list, total_count, has_more flag and
+        next_cursor
 
     Raises:
         FileNotFoundError: If folder doesn't exist
         PermissionError: If folder outside allowed folders
+        ValueError: If sort is unknown or cursor is invalid
     """
     # 1. Validate permission (check folder itself is allowed)
     if folder_path:  # Empty string means root, skip validation
@@ -190,7 +222,9 @@ def read_folder(
     all_excludes = list(set((exclude or []) + config_excludes))
 
     # 4. Call integration layer
-    result = _read_folder(vault_path, folder_path, recursive, all_excludes, limit, mode)
+    result = _read_folder(
+        vault_path, folder_path, recursive, all_excludes, limit, mode, sort=sort, cursor=cursor
+    )
 
     return result
 
@@ -244,29 +278,77 @@ def update_note_section(
 
 
 def search_notes_by_metadata(
-    vault_path: Path, field: str, value: Any, limit: int = 20
+    vault_path: Path,
+    field: str,
+    value: Any,
+    limit: int = 20,
+    op: str = "eq",
+    sort: str = "path",
+    descending: bool = False,
 ) -> List[NoteInfo]:
     """
-    Find notes where frontmatter[field] == value.
+    Find notes where frontmatter[field] matches value.
 
     Args:
         vault_path: Vault root path
         field: Frontmatter field name (e.g., "tags", "project", "status")
-        value: Value to match (e.g., "SEO", "active", "work")
+        value: Value to match (e.g., "SEO", "active", "work"); a list for op="in"
         limit: Max results (default 20)
+        op: "eq" (default; list fields match any element), "in", "prefix",
+            "gt", "gte", "lt" or "lte"
+        sort: "path" (default), "title", "word_count", "created" or "modified"
+        descending: Reverse the sort order
 
     Returns:
         List of NoteInfo with path, title, metadata preview
+
+    Raises:
+        ValueError: If op or sort is unknown
     """
     # No permission check needed - searches within allowed folders only
     # Integration layer will skip files outside vault
 
-    # Call integration layer
-    results = _search_notes_by_metadata_file(vault_path, field, value, limit)
+    # Call integration layer (served from the SQLite note index)
+    results = _search_notes_by_metadata_file(
+        vault_path, field, value, limit, op=op, sort=sort, descending=descending
+    )
 
     return results
 
 
+def search_notes(
+    vault_path: Path, query: str, folder: str | None = None, limit: int = 20
+) -> List[NoteSearchHit]:
+    """
+    Full-text search of notes in allowed folders, best matches first.
+
+    Searches titles, headers, bodies and frontmatter values through the
+    incrementally maintained FTS5 index (only changed notes are re-read).
+
+    Args:
+        vault_path: Vault root path
+        query: Search terms (all must match; "term*" matches prefixes)
+        folder: Restrict to one allowed folder (optional)
+        limit: Max results (default 20)
+
+    Returns:
+        List of NoteSearchHit with path, title, score, snippet
+
+    Raises:
+        PermissionError: If folder outside allowed folders
+    """
+    config = load_config()
+    allowed = _get_allowed_folders(config)
+    excluded = config.get("note_access", {}).get("excluded_folders", [])
+
+    path_prefix = None
+    if folder:
+        _validate_note_access(vault_path, folder)
+        path_prefix = folder.rstrip("/") + "/"
+
+    return search_text(vault_path, query, allowed, excluded, path_prefix=path_prefix, limit=limit)
+
+
 def create_note_in_folder(
     vault_path: Path,
     folder_path: str,
@@ -6,25 +6,40 @@ Task Processing Core Module (Sprint 7).
 Provides two-step workflow for processing informal tasks:
 1. Scan daily note → generate proposals → create TBD section
 2. Parse approvals → create TaskWarrior tasks → reorganize note
+
+process_all_daily_notes() runs Step 1 across the whole daily/ folder.
 """
+import hashlib
+import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from brainplorp.core.types import (
     InformalTask,
     TaskProposal,
     ProcessStepOneResult,
     ProcessStepTwoResult,
+    ProcessAllNote,
+    ProcessAllResult,
     ProcessError,
     TaskInfo,
 )
-from brainplorp.parsers.nlp import (
-    parse_due_date,
-    parse_priority_keywords,
-    extract_clean_description,
-)
+from brainplorp.core.exceptions import VaultNotFoundError
+from brainplorp.config import get_config_dir
+from brainplorp.parsers.nlp import parse_task_text
+from brainplorp.utils.files import write_file
+
+TBD_HEADER = "## TBD Processing"
+
+# Content hashes of daily notes as of their last vault-wide scan
+SCAN_STATE_FILENAME = "process_scan_state.json"
+
+# Below this many changed notes, a process pool costs more than it saves
+MIN_POOL_NOTES = 8
 
 
 def scan_for_informal_tasks(content: str) -> List[InformalTask]:
@@ -112,44 +127,17 @@ def generate_proposal(informal_task: InformalTask, reference_date: date) -> Task
     """
     text = informal_task["text"]
 
-    # Parse due date
-    due_date, parsing_ok = parse_due_date(text, reference_date)
-    parsed_date_keyword = None
-
-    # Extract which keyword was parsed for description cleaning
-    if due_date:
-        text_lower = text.lower()
-        if "today" in text_lower:
-            parsed_date_keyword = "today"
-        elif "tomorrow" in text_lower:
-            parsed_date_keyword = "tomorrow"
-        else:
-            # Check for weekday names
-            weekdays = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-            for weekday in weekdays:
-                if weekday in text_lower:
-                    parsed_date_keyword = weekday
-                    break
-
-    # Parse priority
-    priority = parse_priority_keywords(text)
+    # Due date, priority and clean description in one scan
+    parsed = parse_task_text(text, reference_date)
+    due_date = parsed["due"]
+    parsing_ok = parsed["due_ok"]
+    priority = parsed["priority"]
+    clean_desc = parsed["description"]
 
     # Determine priority reason
     priority_reason = None
-    if priority == "H":
-        text_lower = text.lower()
-        if "urgent" in text_lower:
-            priority_reason = "detected 'urgent'"
-        elif "critical" in text_lower:
-            priority_reason = "detected 'critical'"
-        elif "asap" in text_lower:
-            priority_reason = "detected 'asap'"
-    elif priority == "M":
-        if "important" in text.lower():
-            priority_reason = "detected 'important'"
-
-    # Extract clean description
-    clean_desc = extract_clean_description(text, parsed_date_keyword)
+    if parsed["priority_keyword"]:
+        priority_reason = f"detected '{parsed['priority_keyword']}'"
 
     # Create proposal
     proposal: TaskProposal = {
@@ -247,21 +235,36 @@ def process_daily_note_step1(note_path: Path, reference_date: date) -> ProcessSt
     # Read note
     content = note_path.read_text(encoding="utf-8")
 
-    # Scan for informal tasks
-    informal_tasks = scan_for_informal_tasks(content)
-
-    # Generate proposals
-    proposals: List[TaskProposal] = []
-    for task in informal_tasks:
-        proposal = generate_proposal(task, reference_date)
-        proposals.append(proposal)
+    # Scan for informal tasks and generate proposals
+    proposals = _propose(content, reference_date)
 
     # Create TBD section
     tbd_section = create_tbd_section(proposals)
 
     # Append TBD section to note (Q11: end of document)
-    # First, remove existing TBD section if it exists
-    if "## TBD Processing" in content:
+    write_file(note_path, _with_tbd_section(content, tbd_section))
+
+    # Count NEEDS_REVIEW items
+    needs_review_count = sum(1 for p in proposals if p["needs_review"])
+
+    # Return result
+    result: ProcessStepOneResult = {
+        "proposals_count": len(proposals),
+        "needs_review_count": needs_review_count,
+        "tbd_section_content": tbd_section,
+    }
+
+    return result
+
+
+def _propose(content: str, reference_date: date) -> List[TaskProposal]:
+    """Scan content for informal tasks and generate a proposal for each."""
+    return [generate_proposal(task, reference_date) for task in scan_for_informal_tasks(content)]
+
+
+def _with_tbd_section(content: str, tbd_section: str) -> str:
+    """Replace any existing TBD section, then append tbd_section at the end."""
+    if TBD_HEADER in content:
         # Remove old TBD section
         content = re.sub(
             r"## TBD Processing\n.*?(?=\n##|\Z)",
@@ -270,23 +273,130 @@ def process_daily_note_step1(note_path: Path, reference_date: date) -> ProcessSt
             flags=re.DOTALL
         )
 
-    # Append new TBD section
-    updated_content = content.rstrip() + "\n\n" + tbd_section + "\n"
-    note_path.write_text(updated_content, encoding="utf-8")
+    return content.rstrip() + "\n\n" + tbd_section + "\n"
 
-    # Count NEEDS_REVIEW items
-    needs_review_count = sum(1 for p in proposals if p["needs_review"])
 
-    # Return result
-    result: ProcessStepOneResult = {
-        "proposals_count": len(proposals),
-        "needs_review_count": needs_review_count,
-        "tbd_section_content": tbd_section,
+def process_all_daily_notes(
+    vault_path: Path, workers: Optional[int] = None, state_path: Optional[Path] = None
+) -> ProcessAllResult:
+    """
+    Step 1 across every daily note: propose informal tasks vault-wide.
+
+    Notes are read once; those whose content hash matches the last scan
+    are skipped, and notes that already have a TBD section are left alone
+    so pending approvals are never overwritten. The rest are scanned and
+    their proposals generated in a process pool (in-process when only a
+    few notes changed). A TBD section is written only to notes with new
+    proposals. Each note's reference date is its own date (from the
+    filename), as when it is processed individually.
+
+    Args:
+        vault_path: Path to Obsidian vault
+        workers: Max worker processes (default: CPU count; 1 disables the pool)
+        state_path: Scan state file (default: <config dir>/process_scan_state.json)
+
+    Returns:
+        ProcessAllResult with per-note counts for the notes that were updated
+
+    Raises:
+        VaultNotFoundError: Vault doesn't exist
+    """
+    if not vault_path.exists():
+        raise VaultNotFoundError(str(vault_path))
+
+    if state_path is None:
+        state_path = get_config_dir() / SCAN_STATE_FILENAME
+    state = _load_scan_state(state_path)
+
+    daily_dir = vault_path / "daily"
+    note_paths = sorted(daily_dir.glob("*.md")) if daily_dir.exists() else []
+
+    result: ProcessAllResult = {
+        "notes_total": len(note_paths),
+        "notes_scanned": 0,
+        "notes_unchanged": 0,
+        "notes_pending_review": 0,
+        "updated_notes": [],
+        "proposals_count": 0,
+        "needs_review_count": 0,
     }
 
+    # Read and hash every note; keep the ones that need scanning
+    pending = []  # (note path, key, content)
+    for note_path in note_paths:
+        content = note_path.read_text(encoding="utf-8")
+        key = str(note_path.resolve())
+        if TBD_HEADER in content:
+            result["notes_pending_review"] += 1
+        elif state.get(key) == _content_hash(content):
+            result["notes_unchanged"] += 1
+        else:
+            pending.append((note_path, key, content))
+
+    contents = [content for _, _, content in pending]
+    dates = [_note_date(note_path) for note_path, _, _ in pending]
+    if len(pending) >= MIN_POOL_NOTES and workers != 1:
+        max_workers = workers or os.cpu_count() or 1
+        chunksize = max(1, len(pending) // (4 * max_workers))
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            all_proposals = list(pool.map(_propose, contents, dates, chunksize=chunksize))
+    else:
+        all_proposals = list(map(_propose, contents, dates))
+
+    result["notes_scanned"] = len(pending)
+
+    for (note_path, key, content), proposals in zip(pending, all_proposals):
+        if proposals:
+            content = _with_tbd_section(content, create_tbd_section(proposals))
+            write_file(note_path, content)
+
+            needs_review_count = sum(1 for p in proposals if p["needs_review"])
+            note: ProcessAllNote = {
+                "note_path": str(note_path),
+                "proposals_count": len(proposals),
+                "needs_review_count": needs_review_count,
+            }
+            result["updated_notes"].append(note)
+            result["proposals_count"] += len(proposals)
+            result["needs_review_count"] += needs_review_count
+
+        state[key] = _content_hash(content)
+
+    _save_scan_state(state_path, state)
+
     return result
 
 
+def _note_date(note_path: Path) -> date:
+    """Date a daily note is for (today if the filename isn't a date)."""
+    try:
+        return date.fromisoformat(note_path.stem)
+    except ValueError:
+        return date.today()
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def _load_scan_state(state_path: Path) -> Dict[str, str]:
+    """Note path → content hash from the last scan ({} if missing or corrupt)."""
+    try:
+        state = json.loads(state_path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_scan_state(state_path: Path, state: Dict[str, str]) -> None:
+    """Persist scan state; a failed write only costs a rescan next time."""
+    try:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        state_path.write_text(json.dumps(state, indent=2, sort_keys=True))
+    except OSError:
+        pass
+
+
 def parse_approvals(content: str) -> tuple[List[TaskProposal], List[TaskProposal]]:
     """
     Parse TBD Processing section for [Y] and [N] approvals.
@@ -403,14 +513,15 @@ def create_tasks_batch(proposals: List[TaskProposal], reference_date: date) -> t
         Tuple of (created_tasks, errors)
 
     Implementation per Q19:
-        - Call create_task() from taskwarrior integration
-        - Handle checked tasks: create + mark complete
+        - Create all valid proposals with one create_tasks() call ('task import')
+        - Handle checked tasks: imported directly as completed
         - Collect errors, continue batch processing
     """
-    from brainplorp.integrations.taskwarrior import create_task, mark_done, get_task_info
+    from brainplorp.integrations.taskwarrior import create_tasks
 
     created_tasks = []
     errors = []
+    to_create: List[TaskProposal] = []
 
     for proposal in proposals:
         # Skip NEEDS_REVIEW items
@@ -423,38 +534,43 @@ def create_tasks_batch(proposals: List[TaskProposal], reference_date: date) -> t
             errors.append(error)
             continue
 
-        try:
-            # Create task in TaskWarrior
-            task_uuid = create_task(
-                description=proposal["proposed_description"],
-                project=proposal["proposed_project"],
-                due=proposal["proposed_due"],
-                priority=proposal["proposed_priority"],
-                tags=proposal["proposed_tags"],
-            )
-
-            if not task_uuid:
-                raise Exception("create_task returned None")
-
-            # Get full task info
-            task_info = get_task_info(task_uuid)
-            if not task_info:
-                raise Exception(f"Could not retrieve task info for {task_uuid}")
-
-            # Handle checked tasks (Q19)
-            if proposal["informal_task"]["checkbox_state"] in ["[x]", "[X]"]:
-                mark_done(task_uuid)
-                task_info["status"] = "completed"
-
-            created_tasks.append(task_info)
+        to_create.append(proposal)
+
+    if not to_create:
+        return (created_tasks, errors)
+
+    # Handle checked tasks (Q19): import them as completed
+    specs = [
+        {
+            "description": proposal["proposed_description"],
+            "project": proposal["proposed_project"],
+            "due": proposal["proposed_due"],
+            "priority": proposal["proposed_priority"],
+            "tags": proposal["proposed_tags"],
+            "status": (
+                "completed"
+                if proposal["informal_task"]["checkbox_state"] in ["[x]", "[X]"]
+                else "pending"
+            ),
+        }
+        for proposal in to_create
+    ]
 
-        except Exception as e:
+    try:
+        imported = create_tasks(specs)
+        if not imported:
+            raise Exception("create_tasks returned no tasks")
+    except Exception as e:
+        for proposal in to_create:
             error: ProcessError = {
                 "proposal": proposal,
                 "error_message": str(e),
                 "needs_review": True,
             }
             errors.append(error)
+        return (created_tasks, errors)
+
+    created_tasks.extend(imported)
 
     return (created_tasks, errors)
 
@@ -482,135 +598,173 @@ def reorganize_note(
         Updated note content
 
     Implementation:
-        - Remove approved informal tasks from original locations (Q21)
+        - Remove approved informal tasks from original locations (Q21),
+          located by the proposal's line number; text matching is only
+          used for lines that moved since step 1
         - Create/update ## Tasks section (Q18)
         - Create ## Created Tasks section
         - Remove/keep ## TBD Processing based on errors
+
+        All removals and insertions are collected as line indexes and
+        applied in one pass over the note, so the cost is linear in
+        note length plus approvals.
     """
     lines = content.split("\n")
+    drop = _locate_approved_lines(lines, approved_proposals)
 
-    # Step 1: Remove approved tasks from original locations (Q21 - string matching)
-    # Build set of descriptions to remove
-    approved_descriptions = {p["proposed_description"] for p in approved_proposals}
-
-    new_lines = []
-    for line in lines:
-        # Check if this line is an informal task that was approved
-        should_remove = False
-        stripped = line.strip()
-
-        for desc in approved_descriptions:
-            # Simple substring match: if line contains "- [ ] description" or similar
-            # and the description matches, remove it
-            if stripped.startswith(('-', '*')) and '[' in stripped and ']' in stripped:
-                # This looks like a checkbox line
-                # Extract text after checkbox
-                checkbox_match = re.match(r'^\s*[-*]\s*\[\s*[ xX]?\s*\]\s+(.+)$', line)
-                if checkbox_match:
-                    task_text = checkbox_match.group(1)
-                    # If task text starts with the description (and no uuid), remove it
-                    if task_text.startswith(desc) and 'uuid:' not in task_text.lower():
-                        should_remove = True
-                        break
-
-        if not should_remove:
-            new_lines.append(line)
-
-    content = "\n".join(new_lines)
-
-    # Step 2: Remove TBD Processing section if no errors
+    # Remove TBD Processing section(s) if no errors: header line through the
+    # line before the next heading
     if not has_errors:
-        content = re.sub(r"\n## TBD Processing\n.*?(?=\n##|\Z)", "", content, flags=re.DOTALL)
+        in_tbd = False
+        for i in range(1, len(lines) - 1):
+            line = lines[i]
+            if line == "## TBD Processing":
+                in_tbd = True
+            elif in_tbd and line.startswith("##"):
+                in_tbd = False
+            if in_tbd:
+                drop.add(i)
+        if in_tbd and not lines[-1].startswith("##"):
+            drop.add(len(lines) - 1)
+
+    # Single pass: keep lines, remembering where the title and the first
+    # ## Tasks heading land in the output
+    out: List[str] = []
+    title_at: Optional[int] = None
+    tasks_header_at: Optional[int] = None
+    for i, line in enumerate(lines):
+        if i in drop:
+            continue
+        if tasks_header_at is None and _TASKS_HEADER.search(line):
+            tasks_header_at = len(out)
+        if title_at is None and _TITLE.match(line):
+            title_at = len(out)
+        out.append(line)
 
-    # Step 3: Create ## Created Tasks section
     if created_tasks:
-        created_section_lines = ["\n## Created Tasks\n"]
-        for task in created_tasks:
-            checkbox = "[x]" if task["status"] == "completed" else "[ ]"
-            task_line = f"- {checkbox} {task['description']}"
-
-            # Add metadata
-            metadata_parts = []
-            if task.get("due"):
-                from brainplorp.utils.dates import format_taskwarrior_date_short
-                metadata_parts.append(f"due: {format_taskwarrior_date_short(task['due'])}")
-            if task.get("priority"):
-                metadata_parts.append(f"priority: {task['priority']}")
-            metadata_parts.append(f"uuid: {task['uuid']}")
-
-            if metadata_parts:
-                task_line += " (" + ", ".join(metadata_parts) + ")"
-
-            created_section_lines.append(task_line)
-
-        # Insert Created Tasks section at end (before TBD if it exists, otherwise at end)
-        content = content.rstrip() + "\n" + "\n".join(created_section_lines) + "\n"
-
-    # Step 4: Update ## Tasks section for TODAY/URGENT items (Q18)
-    today_urgent_tasks = [
-        task for task in created_tasks
+        # Trim trailing whitespace, then append ## Created Tasks at the end
+        while len(out) > 1 and not out[-1].strip():
+            out.pop()
+        if not out:
+            out.append("")
+        out[-1] = out[-1].rstrip()
+        last = len(out) - 1
+        if tasks_header_at is not None and tasks_header_at > last:
+            tasks_header_at = None
+        if tasks_header_at is None and _TASKS_HEADER.search(out[last]):
+            tasks_header_at = last
+        if title_at is not None and title_at > last:
+            title_at = None
+        if title_at is None and _TITLE.match(out[last]):
+            title_at = last
+
+        out.append("")
+        out.append("## Created Tasks")
+        out.append("")
+        out.extend(_format_created_task(task) for task in created_tasks)
+        out.append("")
+
+    # Update ## Tasks section for TODAY/URGENT items (Q18)
+    today_urgent_lines = [
+        _format_created_task(task)
+        for task in created_tasks
         if _is_today_or_urgent(task, reference_date)
     ]
 
-    if today_urgent_tasks:
-        # Find Tasks section
-        tasks_section_match = re.search(r"(## Tasks?)\n", content, re.IGNORECASE)
-        if tasks_section_match:
-            # Insert tasks after ## Tasks header
-            insert_pos = tasks_section_match.end()
-            task_lines = []
-            for task in today_urgent_tasks:
-                checkbox = "[x]" if task["status"] == "completed" else "[ ]"
-                task_line = f"- {checkbox} {task['description']}"
-
-                # Add metadata
-                metadata_parts = []
-                if task.get("due"):
-                    from brainplorp.utils.dates import format_taskwarrior_date_short
-                    metadata_parts.append(f"due: {format_taskwarrior_date_short(task['due'])}")
-                if task.get("priority"):
-                    metadata_parts.append(f"priority: {task['priority']}")
-                metadata_parts.append(f"uuid: {task['uuid']}")
-
-                if metadata_parts:
-                    task_line += " (" + ", ".join(metadata_parts) + ")"
-
-                task_lines.append(task_line)
-
-            # Insert at position
-            content = content[:insert_pos] + "\n".join(task_lines) + "\n" + content[insert_pos:]
+    if today_urgent_lines:
+        if tasks_header_at is not None:
+            # Insert tasks right after the ## Tasks header
+            out[tasks_header_at + 1 : tasks_header_at + 1] = today_urgent_lines
         else:
-            # Create Tasks section (Q18)
-            # Insert after front matter/title
-            title_match = re.search(r"^# .+\n", content, re.MULTILINE)
-            if title_match:
-                insert_pos = title_match.end()
-            else:
-                insert_pos = 0
+            # Create Tasks section after the title (or at the top)
+            insert_at = title_at + 1 if title_at is not None else 0
+            out[insert_at:insert_at] = ["", "## Tasks"] + today_urgent_lines
 
-            tasks_header = "\n## Tasks\n"
-            task_lines = []
-            for task in today_urgent_tasks:
-                checkbox = "[x]" if task["status"] == "completed" else "[ ]"
-                task_line = f"- {checkbox} {task['description']}"
+    return "\n".join(out)
 
-                metadata_parts = []
-                if task.get("due"):
-                    from brainplorp.utils.dates import format_taskwarrior_date_short
-                    metadata_parts.append(f"due: {format_taskwarrior_date_short(task['due'])}")
-                if task.get("priority"):
-                    metadata_parts.append(f"priority: {task['priority']}")
-                metadata_parts.append(f"uuid: {task['uuid']}")
 
-                if metadata_parts:
-                    task_line += " (" + ", ".join(metadata_parts) + ")"
+# Lines reorganize_note treats specially
+_CHECKBOX_TEXT = re.compile(r"^\s*[-*]\s*\[\s*[ xX]?\s*\]\s+(.+)$")
+_TASKS_HEADER = re.compile(r"## Tasks?$", re.IGNORECASE)
+_TITLE = re.compile(r"^# .+")
 
-                task_lines.append(task_line)
 
-            tasks_section = tasks_header + "\n".join(task_lines) + "\n"
-            content = content[:insert_pos] + tasks_section + content[insert_pos:]
+def _informal_text(line: str) -> Optional[str]:
+    """Text after the checkbox for an informal (UUID-less) checkbox line, else None."""
+    match = _CHECKBOX_TEXT.match(line)
+    if not match:
+        return None
+    text = match.group(1)
+    if "uuid:" in text.lower():
+        return None
+    return text
 
-    return content
+
+def _locate_approved_lines(lines: List[str], approved_proposals: List[TaskProposal]) -> set:
+    """
+    Find the line index of each approved informal task.
+
+    Trusts the proposal's line_number when that line is still the task
+    (same original_line, or an informal checkbox starting with the
+    description); otherwise falls back to the first unclaimed informal
+    checkbox whose text starts with the description.
+
+    Returns:
+        Set of line indexes to remove
+    """
+    drop = set()
+    moved: List[str] = []
+
+    for proposal in approved_proposals:
+        informal = proposal["informal_task"]
+        description = proposal["proposed_description"]
+        index = informal.get("line_number", -1)
+
+        if 0 <= index < len(lines) and index not in drop:
+            line = lines[index]
+            text = _informal_text(line)
+            if text is not None and (
+                (informal.get("original_line") and line == informal["original_line"])
+                or text.startswith(description)
+            ):
+                drop.add(index)
+                continue
+
+        moved.append(description)
+
+    if moved:
+        for i, line in enumerate(lines):
+            if i in drop:
+                continue
+            text = _informal_text(line)
+            if text is None:
+                continue
+            for position, description in enumerate(moved):
+                if text.startswith(description):
+                    drop.add(i)
+                    del moved[position]
+                    break
+            if not moved:
+                break
+
+    return drop
+
+
+def _format_created_task(task: TaskInfo) -> str:
+    """Format a created task as a checkbox line with due/priority/uuid metadata."""
+    from brainplorp.utils.dates import format_taskwarrior_date_short
+
+    checkbox = "[x]" if task["status"] == "completed" else "[ ]"
+    task_line = f"- {checkbox} {task['description']}"
+
+    metadata_parts = []
+    if task.get("due"):
+        metadata_parts.append(f"due: {format_taskwarrior_date_short(task['due'])}")
+    if task.get("priority"):
+        metadata_parts.append(f"priority: {task['priority']}")
+    metadata_parts.append(f"uuid: {task['uuid']}")
+
+    return task_line + " (" + ", ".join(metadata_parts) + ")"
 
 
 def _is_today_or_urgent(task: TaskInfo, reference_date: date) -> bool:
@@ -629,6 +783,51 @@ def _is_today_or_urgent(task: TaskInfo, reference_date: date) -> bool:
     return False
 
 
+_CHECKED_FORMAL_TASK = re.compile(r"^\s*-\s*\[[xX]\]\s+.*uuid:\s*([a-zA-Z0-9-]+)", re.MULTILINE)
+
+
+def _sync_checked_tasks(content: str, vault_path: Path) -> List[str]:
+    """
+    Mark formal tasks checked in a daily note as done (Obsidian → TaskWarrior).
+
+    Runs as one batch: every checked UUID is collected first and validated
+    with a single lookup, pending ones are completed with one bulk 'done',
+    and all of them are removed from project frontmatter in one pass over
+    the projects directory.
+
+    Args:
+        content: Daily note content
+        vault_path: Vault path for State Sync
+
+    Returns:
+        UUIDs that exist in TaskWarrior and were synced (note order)
+    """
+    from brainplorp.integrations.taskwarrior import bulk_mark_done, get_tasks_by_uuid
+    from brainplorp.core.projects import remove_tasks_from_all_projects
+
+    # Match: - [x] Description (uuid: abc-123), case-insensitive [x] or [X]
+    checked = list(dict.fromkeys(_CHECKED_FORMAL_TASK.findall(content)))
+    if not checked:
+        return []
+
+    try:
+        tasks, _ = get_tasks_by_uuid(checked)
+        synced = [uuid for uuid in checked if uuid in tasks]
+
+        # Already completed/deleted tasks only need the project cleanup
+        bulk_mark_done(
+            [uuid for uuid in synced if tasks[uuid].get("status") in ("pending", "waiting")]
+        )
+
+        # State Sync: Remove from all project frontmatter
+        remove_tasks_from_all_projects(vault_path, synced)
+    except Exception:
+        # Gracefully handle TaskWarrior/vault errors - processing continues
+        return []
+
+    return synced
+
+
 def process_daily_note_step2(note_path: Path, reference_date: date, vault_path: Optional[Path] = None) -> ProcessStepTwoResult:
     """
     Step 2: Parse approvals, create tasks, reorganize note.
@@ -655,31 +854,7 @@ def process_daily_note_step2(note_path: Path, reference_date: date, vault_path:
 
     # Sprint 8.5: Sync formal task checkbox state (Obsidian → TaskWarrior)
     if vault_path:
-        from brainplorp.integrations.taskwarrior import mark_done, get_task_info
-        from brainplorp.core.projects import remove_task_from_all_projects
-        from brainplorp.core.exceptions import TaskNotFoundError
-
-        lines = content.split("\n")
-        formal_tasks_synced = []
-
-        for line in lines:
-            # Match: - [x] Description (uuid: abc-123)
-            # Case-insensitive [x] or [X]
-            checkbox_match = re.match(r'^\s*-\s*\[([xX])\]\s+.*uuid:\s*([a-zA-Z0-9-]+)', line)
-            if checkbox_match:
-                uuid = checkbox_match.group(2)
-                try:
-                    # Verify task exists first
-                    task = get_task_info(uuid)
-                    if task:
-                        # Mark done in TaskWarrior
-                        mark_done(uuid)
-                        # State Sync: Remove from all project frontmatter
-                        remove_task_from_all_projects(vault_path, uuid)
-                        formal_tasks_synced.append(uuid)
-                except (TaskNotFoundError, Exception):
-                    # Gracefully handle missing tasks
-                    pass
+        _sync_checked_tasks(content, vault_path)
 
     # Parse approvals
     approved_proposals, rejected_proposals = parse_approvals(content)
@@ -699,7 +874,7 @@ def process_daily_note_step2(note_path: Path, reference_date: date, vault_path:
     )
 
     # Write updated note
-    note_path.write_text(updated_content, encoding="utf-8")
+    write_file(note_path, updated_content)
 
     # Return result
     result: ProcessStepTwoResult = {
@@ -19,11 +19,18 @@ from ..integrations.obsidian_bases import (
     add_task_to_project as add_task_to_project_bases,
     get_vault_path,
 )
-from ..integrations.taskwarrior import create_task, add_annotation, get_tasks
+from ..integrations.project_index import find_notes_with_tasks, list_indexed_projects
+from ..integrations.taskwarrior import create_tasks, iter_tasks
+from .task_table import TaskTable
 from ..config import get_config_dir
+from ..utils.files import write_file
 from .types import ProjectInfo, ProjectListResult, TaskInfo
 
 
+# Threads rendering/writing project notes in sync_all_projects
+MAX_SYNC_WORKERS = 8
+
+
 # ============================================================================
 # Workstream Validation (Sprint 8.5 Item 3)
 # ============================================================================
@@ -162,10 +169,10 @@ def create_task_in_project(
     Create task in TaskWarrior and link to project.
 
     Sprint 8.6 State Sync:
-    1. Creates task with project: field (TaskWarrior)
-    2. Annotates task with project note path (TaskWarrior)
-    3. Adds task UUID to project note frontmatter (Obsidian)
-    4. Syncs Tasks section in note body (Obsidian)
+    1. Creates task with project: field and project annotation (TaskWarrior,
+       one 'task import' with a locally generated UUID)
+    2. Adds task UUID to project note frontmatter (Obsidian)
+    3. Syncs Tasks section in note body (Obsidian)
 
     Args:
         description: Task description
@@ -186,21 +193,23 @@ def create_task_in_project(
     if not project:
         raise ValueError(f"Project not found: {project_full_path}")
 
-    # Create task in TaskWarrior
-    task_uuid = create_task(
-        description=description,
-        project=project_full_path,
-        due=due,
-        priority=priority,
-        tags=tags
-    )
+    # Create task in TaskWarrior with annotation (bidirectional link)
+    # Format: plorp-project:work.marketing.website
+    created = create_tasks([
+        {
+            "description": description,
+            "project": project_full_path,
+            "due": due,
+            "priority": priority,
+            "tags": tags,
+            "annotations": [f"plorp-project:{project_full_path}"],
+        }
+    ])
 
-    if not task_uuid:
+    if not created:
         raise RuntimeError("Failed to create task in TaskWarrior")
 
-    # Add annotation to task (bidirectional link)
-    # Format: plorp-project:work.marketing.website
-    add_annotation(task_uuid, f"plorp-project:{project_full_path}")
+    task_uuid = created[0]["uuid"]
 
     # Add task UUID to project note frontmatter
     add_task_to_project_bases(project_full_path, task_uuid)
@@ -231,8 +240,8 @@ def list_project_tasks(project_full_path: str) -> list[TaskInfo]:
     project = get_project_info_bases(project_full_path)
     expected_count = len(project["task_uuids"]) if project else 0
 
-    # Query TaskWarrior
-    tasks = get_tasks([f"project:{project_full_path}"])
+    # Query TaskWarrior (streamed straight into the task table)
+    tasks = TaskTable.from_tasks(iter_tasks([f"project:{project_full_path}"])).infos()
 
     # Warn if mismatch (orphaned UUIDs)
     if expected_count != len(tasks):
@@ -242,20 +251,7 @@ def list_project_tasks(project_full_path: str) -> list[TaskInfo]:
             f"Run 'plorp project sync {project_full_path}' to clean up."
         )
 
-    # Convert to TaskInfo TypedDict
-    return [
-        TaskInfo(
-            uuid=t["uuid"],
-            description=t["description"],
-            status=t["status"],
-            project=t.get("project"),
-            due=t.get("due"),
-            priority=t.get("priority"),
-            tags=t.get("tags", []),
-            urgency=t.get("urgency", 0.0)
-        )
-        for t in tasks
-    ]
+    return tasks
 
 
 def list_tasks_by_domain(domain: str) -> list[TaskInfo]:
@@ -271,21 +267,11 @@ def list_tasks_by_domain(domain: str) -> list[TaskInfo]:
         List of TaskInfo dicts
     """
     # TaskWarrior filter: project.startswith:domain
-    tasks = get_tasks([f"project.startswith:{domain}"])
+    # Streamed: domains can hold large completed histories
+    table = TaskTable.from_tasks(iter_tasks([f"project.startswith:{domain}"]))
 
-    return [
-        TaskInfo(
-            uuid=t["uuid"],
-            description=t["description"],
-            status=t["status"],
-            project=t.get("project"),
-            due=t.get("due"),
-            priority=t.get("priority"),
-            tags=t.get("tags", []),
-            urgency=t.get("urgency", 0.0)
-        )
-        for t in tasks
-    ]
+    # startswith also matches sibling domains ("work" -> "workshop"); keep domain.* only
+    return table.infos(table.in_domain(domain))
 
 
 def list_orphaned_tasks() -> list[TaskInfo]:
@@ -297,21 +283,9 @@ def list_orphaned_tasks() -> list[TaskInfo]:
     Returns:
         List of TaskInfo dicts
     """
-    tasks = get_tasks(["project.none:"])
+    table = TaskTable.from_tasks(iter_tasks(["project.none:"]))
 
-    return [
-        TaskInfo(
-            uuid=t["uuid"],
-            description=t["description"],
-            status=t["status"],
-            project=None,
-            due=t.get("due"),
-            priority=t.get("priority"),
-            tags=t.get("tags", []),
-            urgency=t.get("urgency", 0.0)
-        )
-        for t in tasks
-    ]
+    return table.infos(table.without_project())
 
 
 # ============================================================================
@@ -341,35 +315,75 @@ def remove_task_from_all_projects(vault_path: Path, uuid: str) -> None:
 
     Sprint 8.5 Item 1: Critical State Sync function
     """
-    from ..integrations.obsidian_bases import remove_task_from_project as remove_uuid
+    remove_tasks_from_all_projects(vault_path, [uuid])
 
-    projects_dir = vault_path / "projects"
 
-    # Graceful handling: no projects directory
-    if not projects_dir.exists():
-        return
+def remove_tasks_from_all_projects(vault_path: Path, uuids: list[str]) -> list[str]:
+    """
+    Remove many task UUIDs from all project frontmatter in one pass.
 
-    # Track projects modified for sync
-    modified_projects = []
+    The project index narrows the work to notes that reference any of the
+    UUIDs; each of those is parsed once and gets its frontmatter and
+    ## Tasks section rewritten together in a single write. Task details for the remaining UUIDs of all affected
+    notes come from one batched lookup instead of one export per task.
 
-    # Scan all project files
-    for project_file in projects_dir.rglob("*.md"):
-        # Extract full_path from filename (e.g., "work.marketing.website.md" → "work.marketing.website")
-        full_path = project_file.stem
+    Args:
+        vault_path: Path to Obsidian vault
+        uuids: Task UUIDs to remove
 
-        # Get project info to check if UUID exists
-        project = get_project_info_bases(full_path)
-        if not project:
+    Returns:
+        Full paths of the project notes that were rewritten
+    """
+    import logging
+    from ..parsers.markdown import _split_frontmatter_and_body, _format_with_frontmatter
+    from ..integrations.taskwarrior import get_tasks_by_uuid
+
+    logger = logging.getLogger(__name__)
+
+    projects_dir = vault_path / "projects"
+    removing = set(uuids)
+
+    # Graceful handling: no projects directory or nothing to remove
+    if not removing or not projects_dir.exists():
+        return []
+
+    # Pass 1: parse only the notes the project index says contain a UUID
+    affected = []  # (note path, frontmatter, body, remaining uuids)
+    for project_file in find_notes_with_tasks(projects_dir, removing):
+        frontmatter, body = _split_frontmatter_and_body(project_file.read_text())
+        task_uuids = frontmatter.get("task_uuids")
+        if not isinstance(task_uuids, list) or removing.isdisjoint(task_uuids):
             continue
+        remaining = [u for u in task_uuids if u not in removing]
+        affected.append((project_file, frontmatter, body, remaining))
+
+    if not affected:
+        return []
+
+    # One lookup for every task still listed in an affected note
+    tasks, _ = get_tasks_by_uuid([u for _, _, _, remaining in affected for u in remaining])
 
-        # Remove UUID if present (obsidian_bases handles the frontmatter update)
-        if uuid in project.get("task_uuids", []):
-            remove_uuid(full_path, uuid)
-            modified_projects.append(full_path)
+    # Pass 2: rewrite each affected note once
+    rewritten = []
+    for project_file, frontmatter, body, remaining in affected:
+        pending = []
+        for uuid in remaining:
+            task = tasks.get(uuid)
+            if task is None:
+                # Orphaned UUID - skip (Sprint 8.5 reconciliation will clean)
+                logger.warning(
+                    f"Orphaned UUID '{uuid}' in project '{project_file.stem}' - skipping. "
+                    f"Run 'plorp sync-all' to clean up."
+                )
+            elif task.get("status") == "pending":
+                pending.append(task)
 
-    # Sprint 8.6: Sync all modified project note bodies
-    for full_path in modified_projects:
-        _sync_project_task_section(vault_path, full_path)
+        frontmatter["task_uuids"] = remaining
+        new_body = _render_tasks_section(body, pending)
+        write_file(project_file, _format_with_frontmatter(frontmatter, new_body))
+        rewritten.append(project_file.stem)
+
+    return rewritten
 
 
 # ============================================================================
@@ -391,24 +405,12 @@ def find_orphaned_projects(vault_path: Path) -> list[ProjectInfo]:
     """
     projects_dir = vault_path / "projects"
 
-    if not projects_dir.exists():
-        return []
-
-    orphaned = []
-    for project_file in projects_dir.rglob("*.md"):
-        # Extract full_path from filename
-        full_path = project_file.stem
-
-        # Get project info
-        project = get_project_info_bases(full_path)
-        if not project:
-            continue
-
-        # Check if needs review
-        if project.get("needs_review", False):
-            orphaned.append(project)
-
-    return orphaned
+    # Project metadata comes from the index; only changed notes are re-parsed
+    return [
+        project
+        for project in list_indexed_projects(projects_dir)
+        if project.get("needs_review", False)
+    ]
 
 
 def rename_project(vault_path: Path, old_path: str, new_path: str) -> ProjectInfo:
@@ -434,7 +436,7 @@ def rename_project(vault_path: Path, old_path: str, new_path: str) -> ProjectInf
         ValueError: If old project not found
         RuntimeError: If TaskWarrior update fails
     """
-    from ..integrations.taskwarrior import modify_task
+    from ..integrations.taskwarrior import bulk_modify, bulk_annotate
 
     # 1. Get existing project info
     project = get_project_info_bases(old_path)
@@ -487,23 +489,23 @@ def rename_project(vault_path: Path, old_path: str, new_path: str) -> ProjectInf
         new_content = old_content
 
     # Write to new file
-    new_file.write_text(new_content)
+    write_file(new_file, new_content)
 
     # Delete old file
     old_file.unlink()
 
     # 4. Update TaskWarrior for all tasks in project (State Sync)
-    from ..integrations.taskwarrior import add_annotation
+    # One bulk modify + one bulk annotate instead of two launches per task
+    task_uuids = project.get("task_uuids", [])
 
-    for task_uuid in project.get("task_uuids", []):
-        # Update project field
-        success = modify_task(task_uuid, project=new_path)
+    modified = bulk_modify(task_uuids, project=new_path)
+    for task_uuid, success in modified.items():
         if not success:
             # Warning, but don't fail the whole operation
             print(f"⚠️  Warning: Could not update TaskWarrior project for task {task_uuid}")
 
-        # Add annotation with new project path (bidirectional link)
-        add_annotation(task_uuid, f"plorp-project:{new_path}")
+    # Add annotation with new project path (bidirectional link)
+    bulk_annotate(task_uuids, f"plorp-project:{new_path}")
 
     # 5. Return updated project info
     return get_project_info_bases(new_path)
@@ -617,7 +619,7 @@ def process_project_note(vault_path: Path, project_path: str) -> int:
 
     Workflow:
     1. Parse checked tasks from project note
-    2. Mark each as done in TaskWarrior
+    2. Mark them done in TaskWarrior (single bulk command)
     3. Remove UUIDs from frontmatter (State Sync)
     4. Re-sync note body to reflect changes
 
@@ -632,7 +634,7 @@ def process_project_note(vault_path: Path, project_path: str) -> int:
         ProjectNotFoundError: If project note doesn't exist
     """
     from ..parsers.markdown import parse_checked_tasks
-    from ..integrations.taskwarrior import mark_done
+    from ..integrations.taskwarrior import bulk_mark_done
     from .exceptions import ProjectNotFoundError
 
     # 1. Read project note
@@ -646,18 +648,17 @@ def process_project_note(vault_path: Path, project_path: str) -> int:
     if not checked_uuids:
         return 0  # No checked tasks
 
-    # 3. Mark each task as done in TaskWarrior
-    count = 0
-    for uuid in checked_uuids:
-        try:
-            mark_done(uuid)
-            count += 1
-        except Exception as e:
-            # Log but continue processing other tasks
-            import logging
-            logger = logging.getLogger(__name__)
-            logger.warning(f"Failed to mark task {uuid} as done: {e}")
-            continue
+    # 3. Mark all checked tasks done in TaskWarrior (one bulk 'task done')
+    results = bulk_mark_done(checked_uuids)
+    count = sum(1 for success in results.values() if success)
+
+    failed = [uuid for uuid, success in results.items() if not success]
+    if failed:
+        # Log but continue processing other tasks
+        import logging
+        logger = logging.getLogger(__name__)
+        for uuid in failed:
+            logger.warning(f"Failed to mark task {uuid} as done")
 
     # 4. State Sync: Remove completed task UUIDs from ALL project frontmatter
     # (This handles the case where a task might be in multiple projects)
@@ -682,48 +683,117 @@ def sync_all_projects(vault_path: Path) -> dict:
     - After TaskWarrior sync from other devices
     - Periodic maintenance to ensure state consistency
 
+    Runs as one batch: every project note is read, all pending tasks come
+    from a single 'status:pending' query (served by the task snapshot when
+    it is fresh), Tasks sections are rendered in a thread pool, and only
+    notes whose rendered content differs are written.
+
     Args:
         vault_path: Path to Obsidian vault
 
     Returns:
         Dict with sync statistics:
         {
-            "synced": int,  # Number of projects synced
-            "errors": list  # List of (project_path, error_msg) tuples
+            "synced": int,  # Number of projects synced (changed + unchanged)
+            "changed": int,  # Notes rewritten
+            "unchanged": int,  # Notes already in sync (not written)
+            "errors": list,  # List of (project_path, error_msg) tuples
+            "timing_ms": dict  # read, fetch, render_write, total
         }
     """
     import logging
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from ..parsers.markdown import _split_frontmatter_and_body, _format_with_frontmatter
+    from ..integrations.taskwarrior import get_tasks
+
     logger = logging.getLogger(__name__)
 
+    started = time.perf_counter()
     projects_dir = vault_path / "projects"
     stats = {
         "synced": 0,
-        "errors": []
+        "changed": 0,
+        "unchanged": 0,
+        "errors": [],
+        "timing_ms": {"read": 0.0, "fetch": 0.0, "render_write": 0.0, "total": 0.0},
     }
 
     # Graceful handling: no projects directory
     if not projects_dir.exists():
         return stats
 
-    # Sync all project files
-    for project_file in projects_dir.rglob("*.md"):
-        # Extract full_path from filename
-        full_path = project_file.stem
+    def fail(full_path: str, e: Exception) -> None:
+        # Log error but continue with other projects
+        error_msg = f"{type(e).__name__}: {str(e)}"
+        stats["errors"].append((full_path, error_msg))
+        logger.error(f"Failed to sync project '{full_path}': {error_msg}")
 
+    # 1. Read every project note once
+    notes = []  # (note path, original content, frontmatter, body)
+    for project_file in sorted(projects_dir.rglob("*.md")):
         try:
-            # Sync this project's task section
-            _sync_project_task_section(vault_path, full_path)
-            stats["synced"] += 1
+            content = project_file.read_text()
+            frontmatter, body = _split_frontmatter_and_body(content)
         except Exception as e:
-            # Log error but continue with other projects
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            stats["errors"].append((full_path, error_msg))
-            logger.error(f"Failed to sync project '{full_path}': {error_msg}")
+            fail(project_file.stem, e)
             continue
-
+        notes.append((project_file, content, frontmatter, body))
+    read_done = time.perf_counter()
+
+    # 2. One query for every pending task (only pending tasks are listed, per Q1/Q20)
+    referenced = {u for _, _, fm, _ in notes for u in _task_uuids(fm)}
+    pending = {}
+    if referenced:
+        pending = {
+            task["uuid"]: task
+            for task in get_tasks(["status:pending"])
+            if task.get("status") == "pending"
+        }
+    fetch_done = time.perf_counter()
+
+    # 3. Render in a thread pool; write only notes that changed
+    def render(note) -> bool:
+        project_file, content, frontmatter, body = note
+        tasks = [
+            pending[uuid]
+            for uuid in _task_uuids(frontmatter)
+            if uuid in pending
+        ]
+        new_content = _format_with_frontmatter(frontmatter, _render_tasks_section(body, tasks))
+        if new_content == content:
+            return False
+        write_file(project_file, new_content)
+        return True
+
+    if notes:
+        with ThreadPoolExecutor(max_workers=min(MAX_SYNC_WORKERS, len(notes))) as pool:
+            futures = [pool.submit(render, note) for note in notes]
+            for note, future in zip(notes, futures):
+                try:
+                    changed = future.result()
+                except Exception as e:
+                    fail(note[0].stem, e)
+                    continue
+                stats["synced"] += 1
+                stats["changed" if changed else "unchanged"] += 1
+    finished = time.perf_counter()
+
+    stats["timing_ms"] = {
+        "read": round((read_done - started) * 1000, 2),
+        "fetch": round((fetch_done - read_done) * 1000, 2),
+        "render_write": round((finished - fetch_done) * 1000, 2),
+        "total": round((finished - started) * 1000, 2),
+    }
     return stats
 
 
+def _task_uuids(frontmatter: dict) -> list:
+    """task_uuids from frontmatter ([] if missing or not a list)."""
+    task_uuids = frontmatter.get("task_uuids")
+    return task_uuids if isinstance(task_uuids, list) else []
+
+
 def _sync_project_task_section(vault_path: Path, project_path: str) -> None:
     """
     Update the ## Tasks section in project note to match frontmatter.
@@ -750,8 +820,6 @@ def _sync_project_task_section(vault_path: Path, project_path: str) -> None:
     from ..parsers.markdown import (
         _split_frontmatter_and_body,
         _format_with_frontmatter,
-        _format_date,
-        _remove_section,
     )
     from ..integrations.taskwarrior import get_task_info
     from .exceptions import ProjectNotFoundError, TaskNotFoundError
@@ -785,10 +853,29 @@ def _sync_project_task_section(vault_path: Path, project_path: str) -> None:
             )
             continue
 
-    # 4. Remove existing ## Tasks section from body
+    # 4. Rebuild ## Tasks section from the pending tasks
+    new_body = _render_tasks_section(body, tasks)
+
+    # 5. Write updated note
+    new_content = _format_with_frontmatter(frontmatter, new_body)
+    write_file(note_path, new_content)
+
+
+def _render_tasks_section(body: str, tasks: list) -> str:
+    """
+    Replace the ## Tasks section of a project note body.
+
+    Args:
+        body: Note body (without frontmatter)
+        tasks: Pending task dicts to list, in frontmatter order
+
+    Returns:
+        Body with a fresh "## Tasks (N)" section, or none if tasks is empty
+    """
+    from ..parsers.markdown import _format_date, _remove_section
+
     body_without_tasks = _remove_section(body, "## Tasks")
 
-    # 5. Build new Tasks section
     if tasks:
         task_lines = []
         for task in tasks:
@@ -814,11 +901,7 @@ def _sync_project_task_section(vault_path: Path, project_path: str) -> None:
         tasks_section += "\n"
 
         # Append to body
-        new_body = body_without_tasks.rstrip() + "\n\n" + tasks_section
+        return body_without_tasks.rstrip() + "\n\n" + tasks_section
     else:
         # No tasks - don't add section (per Q1)
-        new_body = body_without_tasks
-
-    # 6. Write updated note
-    new_content = _format_with_frontmatter(frontmatter, new_body)
-    note_path.write_text(new_content)
+        return body_without_tasks
@@ -5,14 +5,27 @@ Implements pure functions for end-of-day task review.
 No I/O decisions - returns structured data for callers to format.
 """
 
-from datetime import date, datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Dict
-
-from brainplorp.core.types import ReviewData, ReviewResult, TaskInfo
+from typing import Dict, List, Optional
+
+from brainplorp.core.types import (
+    ReviewBacklog,
+    ReviewBacklogTask,
+    ReviewData,
+    ReviewResult,
+    TaskInfo,
+)
 from brainplorp.core.exceptions import VaultNotFoundError, DailyNoteNotFoundError
+from brainplorp.core.task_table import to_task_info
 from brainplorp.parsers.markdown import parse_daily_note_tasks
-from brainplorp.integrations.taskwarrior import get_task_info
+from brainplorp.integrations.taskwarrior import get_tasks_by_uuid
+from brainplorp.utils.files import write_file
+
+# get_review_backlog limits
+MAX_BACKLOG_DAYS = 366
+MAX_SCAN_WORKERS = 8
 
 
 def get_review_tasks(target_date: date, vault_path: Path) -> ReviewData:
@@ -44,27 +57,20 @@ def get_review_tasks(target_date: date, vault_path: Path) -> ReviewData:
     # Parse uncompleted tasks from note (returns list of (description, uuid) tuples)
     tasks_data = parse_daily_note_tasks(note_path)
 
-    # Convert to TaskInfo with full data from TaskWarrior
+    # Convert to TaskInfo with full data from TaskWarrior, resolving every
+    # UUID in one batched lookup instead of one export per task
     # Q16: Missing tasks (deleted from TW) returned with status: "missing"
+    found, exports = get_tasks_by_uuid([uuid for _, uuid in tasks_data])
+
     uncompleted_tasks = []
     for description, uuid in tasks_data:
-        task_data = get_task_info(uuid)
+        task_data = found.get(uuid)
         if task_data:
             # Task exists in TaskWarrior - normalize it
             uncompleted_tasks.append(_normalize_task(task_data))
         else:
             # Task deleted from TaskWarrior - mark as missing
-            uncompleted_tasks.append(
-                {
-                    "uuid": uuid,
-                    "description": description,
-                    "status": "missing",
-                    "due": None,
-                    "priority": None,
-                    "project": None,
-                    "tags": [],
-                }
-            )
+            uncompleted_tasks.append(_missing_task(uuid, description))
 
     return {
         "date": str(target_date),
@@ -72,6 +78,105 @@ def get_review_tasks(target_date: date, vault_path: Path) -> ReviewData:
         "uncompleted_tasks": uncompleted_tasks,
         "total_tasks": len(tasks_data),
         "uncompleted_count": len(uncompleted_tasks),
+        "lookup_exports": exports,
+        "subprocesses_avoided": max(len(tasks_data) - exports, 0),
+    }
+
+
+def get_review_backlog(
+    since: date, vault_path: Path, until: Optional[date] = None
+) -> ReviewBacklog:
+    """
+    Build one review queue from every daily note between two dates.
+
+    Notes are scanned concurrently; a task left unchecked on several days
+    appears once, listing each day. All UUIDs are resolved with a single
+    batched lookup. Tasks already completed or deleted in TaskWarrior are
+    counted as resolved and left out of the queue; tasks TaskWarrior no
+    longer knows are kept with status "missing", as in get_review_tasks().
+
+    Args:
+        since: First date to include
+        vault_path: Path to vault
+        until: Last date to include (defaults to today)
+
+    Returns:
+        ReviewBacklog with the merged queue
+
+    Raises:
+        VaultNotFoundError: Vault doesn't exist
+        ValueError: If until is before since, or the range exceeds MAX_BACKLOG_DAYS
+    """
+    vault_path = vault_path.expanduser().resolve()
+    if not vault_path.exists():
+        raise VaultNotFoundError(str(vault_path))
+
+    until = until or date.today()
+    if until < since:
+        raise ValueError(f"Invalid date range: {until} is before {since}")
+    days = (until - since).days + 1
+    if days > MAX_BACKLOG_DAYS:
+        raise ValueError(f"Date range too long: {days} days (max {MAX_BACKLOG_DAYS})")
+
+    daily_dir = vault_path / "daily"
+    dates = [since + timedelta(days=offset) for offset in range(days)]
+    note_paths = [daily_dir / f"{day}.md" for day in dates]
+
+    with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, days)) as pool:
+        scanned = list(pool.map(parse_daily_note_tasks, note_paths))
+
+    # Merge mentions: first appearance decides order and fallback description
+    descriptions: Dict[str, str] = {}
+    seen_on: Dict[str, List[str]] = {}
+    notes_scanned = []
+    mentions = 0
+    for day, path, tasks_data in zip(dates, note_paths, scanned):
+        if tasks_data or path.exists():
+            notes_scanned.append(str(day))
+        for description, uuid in tasks_data:
+            mentions += 1
+            descriptions.setdefault(uuid, description)
+            days_for_task = seen_on.setdefault(uuid, [])
+            if str(day) not in days_for_task:
+                days_for_task.append(str(day))
+
+    found, exports = get_tasks_by_uuid(list(seen_on))
+
+    queue: List[ReviewBacklogTask] = []
+    resolved = 0
+    for uuid, days_seen in seen_on.items():
+        task_data = found.get(uuid)
+        if task_data is None:
+            task = _missing_task(uuid, descriptions[uuid])
+        elif task_data.get("status") in ("completed", "deleted"):
+            resolved += 1
+            continue
+        else:
+            task = _normalize_task(task_data)
+        queue.append({**task, "days": days_seen})
+
+    return {
+        "since": str(since),
+        "until": str(until),
+        "notes_scanned": notes_scanned,
+        "tasks": queue,
+        "task_count": len(queue),
+        "resolved_count": resolved,
+        "lookup_exports": exports,
+        "subprocesses_avoided": max(mentions - exports, 0),
+    }
+
+
+def _missing_task(uuid: str, description: str) -> TaskInfo:
+    """TaskInfo for a note task TaskWarrior no longer knows about (Q16)."""
+    return {
+        "uuid": uuid,
+        "description": description,
+        "status": "missing",
+        "due": None,
+        "priority": None,
+        "project": None,
+        "tags": [],
     }
 
 
@@ -117,7 +222,7 @@ def add_review_notes(
 
     # Append to file
     content += review_section
-    note_path.write_text(content)
+    write_file(note_path, content)
 
     return {
         "daily_note_path": str(note_path),
@@ -136,12 +241,4 @@ def _normalize_task(task_data: dict) -> TaskInfo:
     Returns:
         TaskInfo TypedDict with normalized fields
     """
-    return {
-        "uuid": task_data.get("uuid", ""),
-        "description": task_data.get("description", ""),
-        "status": task_data.get("status", "pending"),
-        "due": task_data.get("due"),
-        "priority": task_data.get("priority", ""),
-        "project": task_data.get("project"),
-        "tags": task_data.get("tags", []),
-    }
+    return to_task_info(task_data)
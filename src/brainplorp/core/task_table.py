@@ -0,0 +1,254 @@
+"""
+Columnar task table.
+
+Holds a batch of TaskWarrior export dicts as compact, array-backed columns
+so that the common categorization questions (overdue? due on a date? in a
+domain? priority at least M?) are answered by one scan over an int array
+instead of re-parsing due strings per task per call.
+
+Columns:
+- due: epoch seconds (UTC) in an array('q'), NO_DUE when unset/unparseable
+- priority: small int codes (0 none, 1 L, 2 M, 3 H) in an array('b')
+- project: index into an interned project pool in an array('i'), -1 for none
+- status: index into STATUSES in an array('b')
+- recurring: 0/1 flags in a bytearray
+
+Predicates return row index lists (in table order) and accept an optional
+`rows` argument to narrow an earlier selection. TaskInfo dicts are built
+lazily, only for rows that are actually returned.
+
+Example:
+    table = TaskTable.from_tasks(get_tasks(["status:pending"]))
+    overdue = table.infos(table.overdue(date.today()))
+"""
+
+import sys
+from array import array
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from brainplorp.core.types import TaskInfo
+
+NO_DUE = -(2**63)
+
+STATUSES = ("pending", "completed", "deleted", "waiting", "recurring", "missing")
+
+PRIORITY_CODES = {"": 0, "L": 1, "M": 2, "H": 3}
+
+
+def parse_due(value: Optional[str]) -> int:
+    """
+    Parse a TaskWarrior date string to epoch seconds (UTC).
+
+    Accepts the export format "20251006T000000Z" and bare "20251006"
+    (treated as midnight UTC), matching how the daily note has always read
+    due dates.
+
+    Args:
+        value: Date string from a task's 'due' field
+
+    Returns:
+        Epoch seconds, or NO_DUE if value is missing or unparseable
+    """
+    if not value:
+        return NO_DUE
+    try:
+        if "T" in value:
+            dt = datetime.strptime(value[:15], "%Y%m%dT%H%M%S")
+        else:
+            dt = datetime.strptime(value[:8], "%Y%m%d")
+    except ValueError:
+        return NO_DUE
+    return int(dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def day_start(day: date) -> int:
+    """Epoch seconds of midnight UTC on the given date."""
+    return int(datetime.combine(day, time.min, tzinfo=timezone.utc).timestamp())
+
+
+def to_task_info(task: Dict[str, Any]) -> TaskInfo:
+    """
+    Normalize a TaskWarrior export dict to TaskInfo.
+
+    Args:
+        task: Raw task data from TaskWarrior
+
+    Returns:
+        TaskInfo TypedDict with normalized fields
+    """
+    return {
+        "uuid": task.get("uuid", ""),
+        "description": task.get("description", ""),
+        "status": task.get("status", "pending"),
+        "due": task.get("due"),
+        "priority": task.get("priority", ""),
+        "project": task.get("project"),
+        "tags": task.get("tags", []),
+        "urgency": task.get("urgency", 0.0),
+    }
+
+
+class TaskTable:
+    """Array-backed columns over a batch of exported tasks."""
+
+    def __init__(self) -> None:
+        self._raw: List[Dict[str, Any]] = []
+        self._infos: Dict[int, TaskInfo] = {}
+        self.due = array("q")
+        self.priority = array("b")
+        self.project = array("i")
+        self.status = array("b")
+        self.recurring = bytearray()
+        self.projects: List[str] = []
+        self._project_ids: Dict[str, int] = {}
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Dict[str, Any]]) -> "TaskTable":
+        """
+        Build a table from export dicts (any iterable, including iter_tasks()).
+
+        Args:
+            tasks: TaskWarrior task dicts
+
+        Returns:
+            TaskTable with one row per task, in input order
+        """
+        table = cls()
+        for task in tasks:
+            table.append(task)
+        return table
+
+    def append(self, task: Dict[str, Any]) -> None:
+        """Add one task as a new row."""
+        self._raw.append(task)
+        self.due.append(parse_due(task.get("due")))
+        self.priority.append(PRIORITY_CODES.get(task.get("priority") or "", 0))
+        self.status.append(self._status_code(task.get("status") or "pending"))
+        self.recurring.append(1 if task.get("recur") else 0)
+
+        project = task.get("project")
+        if project:
+            project_id = self._project_ids.get(project)
+            if project_id is None:
+                project_id = len(self.projects)
+                self.projects.append(sys.intern(project))
+                self._project_ids[project] = project_id
+            self.project.append(project_id)
+        else:
+            self.project.append(-1)
+
+    @staticmethod
+    def _status_code(status: str) -> int:
+        try:
+            return STATUSES.index(status)
+        except ValueError:
+            return 0
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def _rows(self, rows: Optional[Sequence[int]]) -> Iterable[int]:
+        return range(len(self._raw)) if rows is None else rows
+
+    # ------------------------------------------------------------------
+    # Predicates
+    # ------------------------------------------------------------------
+
+    def overdue(self, reference_date: date, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows due before the reference date."""
+        cutoff = day_start(reference_date)
+        due = self.due
+        return [i for i in self._rows(rows) if NO_DUE < due[i] < cutoff]
+
+    def due_on(self, day: date, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows due on the given date."""
+        start = day_start(day)
+        end = day_start(day + timedelta(days=1))
+        due = self.due
+        return [i for i in self._rows(rows) if start <= due[i] < end]
+
+    def due_by_day(
+        self, first_day: date, days: int, rows: Optional[Sequence[int]] = None
+    ) -> Tuple[List[int], List[List[int]]]:
+        """
+        Bucket rows by due date across a run of consecutive days, in one scan.
+
+        Args:
+            first_day: First date of the run
+            days: Number of consecutive dates
+            rows: Optional selection to bucket
+
+        Returns:
+            (rows due before first_day, [rows due on first_day + k for k in range(days)]);
+            rows due after the run or without a due date are omitted
+        """
+        start = day_start(first_day)
+        end = day_start(first_day + timedelta(days=days))
+        before: List[int] = []
+        buckets: List[List[int]] = [[] for _ in range(days)]
+        due = self.due
+        for i in self._rows(rows):
+            value = due[i]
+            if value == NO_DUE or value >= end:
+                continue
+            if value < start:
+                before.append(i)
+            else:
+                buckets[(value - start) // 86400].append(i)
+        return before, buckets
+
+    def is_recurring(self, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows with a recurrence."""
+        flags = self.recurring
+        return [i for i in self._rows(rows) if flags[i]]
+
+    def in_domain(self, domain: str, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows whose project is the domain or below it (domain.*)."""
+        prefix = domain + "."
+        matching = {
+            project_id
+            for project_id, name in enumerate(self.projects)
+            if name == domain or name.startswith(prefix)
+        }
+        project = self.project
+        return [i for i in self._rows(rows) if project[i] in matching]
+
+    def without_project(self, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows with no project."""
+        project = self.project
+        return [i for i in self._rows(rows) if project[i] < 0]
+
+    def priority_at_least(
+        self, priority: str, rows: Optional[Sequence[int]] = None
+    ) -> List[int]:
+        """Rows with priority >= the given level (H > M > L)."""
+        threshold = PRIORITY_CODES[priority]
+        codes = self.priority
+        return [i for i in self._rows(rows) if codes[i] >= threshold]
+
+    def with_status(self, status: str, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """Rows with the given status."""
+        code = self._status_code(status)
+        codes = self.status
+        return [i for i in self._rows(rows) if codes[i] == code]
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def raw(self, row: int) -> Dict[str, Any]:
+        """Original export dict for a row."""
+        return self._raw[row]
+
+    def info(self, row: int) -> TaskInfo:
+        """TaskInfo for a row, built on first access."""
+        info = self._infos.get(row)
+        if info is None:
+            info = to_task_info(self._raw[row])
+            self._infos[row] = info
+        return info
+
+    def infos(self, rows: Optional[Sequence[int]] = None) -> List[TaskInfo]:
+        """TaskInfo list for the given rows (all rows by default)."""
+        return [self.info(i) for i in self._rows(rows)]
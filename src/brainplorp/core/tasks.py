@@ -5,6 +5,7 @@ Implements pure functions for task manipulation (complete, defer, drop, priority
 No I/O decisions - returns structured data for callers to format.
 """
 
+import asyncio
 from datetime import date, datetime
 from pathlib import Path
 from typing import Dict, Optional
@@ -18,6 +19,13 @@ from brainplorp.integrations.taskwarrior import (
     delete_task,
     set_priority as tw_set_priority,
 )
+from brainplorp.integrations.taskwarrior_async import (
+    get_task_info_async,
+    mark_done_async,
+    defer_task_async as tw_defer_task_async,
+    delete_task_async,
+    set_priority_async as tw_set_priority_async,
+)
 
 
 def mark_completed(uuid: str, vault_path: Optional[Path] = None) -> TaskCompleteResult:
@@ -170,3 +178,88 @@ def set_priority(uuid: str, priority: str) -> TaskPriorityResult:
         "description": task["description"],
         "priority": priority if priority else None,
     }
+
+
+# ============================================================================
+# Async variants (MCP server)
+# ============================================================================
+#
+# Same behavior and return values as the functions above, but TaskWarrior is
+# awaited through taskwarrior_async so the MCP event loop keeps serving other
+# tool calls. Vault State Sync (file I/O) runs in a worker thread.
+
+
+async def mark_completed_async(uuid: str, vault_path: Optional[Path] = None) -> TaskCompleteResult:
+    """Async version of mark_completed()."""
+    task = await get_task_info_async(uuid)
+    if not task:
+        raise TaskNotFoundError(uuid)
+
+    if not await mark_done_async(uuid):
+        raise RuntimeError(f"Failed to mark task done: {uuid}")
+
+    if vault_path:
+        from brainplorp.core.projects import remove_task_from_all_projects
+        await asyncio.to_thread(remove_task_from_all_projects, vault_path, uuid)
+
+    return {
+        "uuid": uuid,
+        "description": task["description"],
+        "completed_at": datetime.now().isoformat(),
+    }
+
+
+async def defer_task_async(uuid: str, new_due: date) -> TaskDeferResult:
+    """Async version of defer_task()."""
+    task = await get_task_info_async(uuid)
+    if not task:
+        raise TaskNotFoundError(uuid)
+
+    if not await tw_defer_task_async(uuid, str(new_due)):
+        raise RuntimeError(f"Failed to defer task: {uuid}")
+
+    return {
+        "uuid": uuid,
+        "description": task["description"],
+        "old_due": task.get("due"),
+        "new_due": str(new_due),
+    }
+
+
+async def drop_task_async(uuid: str, vault_path: Optional[Path] = None) -> TaskDropResult:
+    """Async version of drop_task()."""
+    task = await get_task_info_async(uuid)
+    if not task:
+        raise TaskNotFoundError(uuid)
+
+    if not await delete_task_async(uuid):
+        raise RuntimeError(f"Failed to delete task: {uuid}")
+
+    if vault_path:
+        from brainplorp.core.projects import remove_task_from_all_projects
+        await asyncio.to_thread(remove_task_from_all_projects, vault_path, uuid)
+
+    return {
+        "uuid": uuid,
+        "description": task["description"],
+        "deleted_at": datetime.now().isoformat(),
+    }
+
+
+async def set_priority_async(uuid: str, priority: str) -> TaskPriorityResult:
+    """Async version of set_priority()."""
+    if priority not in ["H", "M", "L", ""]:
+        raise ValueError(f"Invalid priority: {priority}. Must be H, M, L, or empty string.")
+
+    task = await get_task_info_async(uuid)
+    if not task:
+        raise TaskNotFoundError(uuid)
+
+    if not await tw_set_priority_async(uuid, priority if priority else ""):
+        raise RuntimeError(f"Failed to set priority for task: {uuid}")
+
+    return {
+        "uuid": uuid,
+        "description": task["description"],
+        "priority": priority if priority else None,
+    }
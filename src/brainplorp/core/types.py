@@ -85,6 +85,32 @@ class DailyStartResult(TypedDict):
     tasks: list[TaskInfo]
 
 
+class DailyRefreshResult(DailyStartResult):
+    """Result of refreshing an existing daily note in place."""
+
+    changed: bool  # False when the note already matched and was not rewritten
+    added: int  # Task lines added
+    removed: int  # Task lines dropped (completed, deleted or no longer due)
+
+
+class DailyRangeDay(DailyStartResult):
+    """One day of a multi-day daily note run."""
+
+    status: str  # "created", "refreshed", "unchanged" or "skipped"
+
+
+class DailyRangeResult(TypedDict):
+    """Result of generating daily notes for a range of dates."""
+
+    start_date: str
+    end_date: str
+    days: list[DailyRangeDay]
+    created_count: int
+    refreshed_count: int
+    unchanged_count: int
+    skipped_count: int
+
+
 # ============================================================================
 # Review Workflow Types
 # ============================================================================
@@ -98,6 +124,27 @@ class ReviewData(TypedDict):
     uncompleted_tasks: list[TaskInfo]
     total_tasks: int
     uncompleted_count: int
+    lookup_exports: int  # 'task export' runs needed to resolve the UUIDs
+    subprocesses_avoided: int  # vs. one export per task
+
+
+class ReviewBacklogTask(TaskInfo):
+    """A task in the multi-day review queue."""
+
+    days: list[str]  # Daily note dates (YYYY-MM-DD) the unchecked task appeared on
+
+
+class ReviewBacklog(TypedDict):
+    """Merged review queue across a range of daily notes."""
+
+    since: str
+    until: str
+    notes_scanned: list[str]  # Dates that had a daily note
+    tasks: list[ReviewBacklogTask]  # Still pending (or missing), first appearance first
+    task_count: int
+    resolved_count: int  # Unchecked in a note but already completed/deleted in TaskWarrior
+    lookup_exports: int
+    subprocesses_avoided: int  # vs. one export per note mention
 
 
 class ReviewResult(TypedDict):
@@ -204,6 +251,26 @@ class ProcessStepOneResult(TypedDict):
     tbd_section_content: str
 
 
+class ProcessAllNote(TypedDict):
+    """One daily note that received new proposals during a vault-wide scan."""
+
+    note_path: str
+    proposals_count: int
+    needs_review_count: int
+
+
+class ProcessAllResult(TypedDict):
+    """Result of scanning every daily note for informal tasks."""
+
+    notes_total: int  # Files in daily/
+    notes_scanned: int  # Changed since the last scan, so parsed
+    notes_unchanged: int  # Content hash matched the last scan, skipped
+    notes_pending_review: int  # Already have a TBD section, left alone
+    updated_notes: list[ProcessAllNote]  # Notes a TBD section was written to
+    proposals_count: int
+    needs_review_count: int
+
+
 class ProcessStepTwoResult(TypedDict):
     """Result of Step 2: task creation and note reorganization."""
 
@@ -271,6 +338,17 @@ class NoteInfo(TypedDict):
     modified: str  # ISO timestamp
 
 
+class NoteSearchHit(TypedDict):
+    """One full-text search result."""
+
+    path: str
+    title: str
+    score: float  # BM25 rank, lower is better
+    snippet: str  # Matching excerpt, matches wrapped in **
+    word_count: int
+    modified: str  # ISO timestamp
+
+
 class FolderReadResult(TypedDict):
     """Result from read_folder operation."""
 
@@ -279,6 +357,7 @@ class FolderReadResult(TypedDict):
     total_count: int
     returned_count: int
     has_more: bool
+    next_cursor: str | None  # Pass back as cursor for the next page
     excluded_folders: list[str]
 
 
@@ -0,0 +1,205 @@
+# ABOUTME: Process-wide LRU cache of parsed vault notes shared by the note-reading MCP tools
+# ABOUTME: Keyed by (path, mtime_ns, size), bounded by total bytes, with hit-rate statistics
+"""
+Parsed Note Cache
+
+read_note and the pattern-matching tools (headers, sections, bullets,
+project headers, tags) are often called on the same note several times in
+one conversation turn. Each call used to re-read the file and re-run its
+regex passes. This module keeps one ParsedNote per note file:
+
+- Entries are keyed by (resolved path, mtime_ns, size); a stat() per lookup
+  detects edits, and an edited note is simply re-read
+- ParsedNote memoizes every structure query (headers per level, section per
+  header, bullets per section, project headers, tags), so repeated tool
+  calls on the same note cost a dict lookup
+- The cache is bounded by the total size of cached notes (MAX_CACHE_BYTES)
+  with least-recently-used eviction
+
+Key functions:
+- get_parsed_note(): ParsedNote for a note file, from cache or disk
+- get_note_cache_stats(), reset_note_cache_stats(): Hit/miss/eviction counters
+- clear_note_cache(): Drop all entries
+"""
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..parsers.note_structure import (
+    detect_project_headers,
+    extract_bullet_points,
+    extract_headers,
+    extract_tags,
+    find_header_content,
+)
+from .obsidian_notes import _extract_header_list, _extract_title, _split_frontmatter_and_body
+
+# Total size of note files kept in memory
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+
+
+class ParsedNote:
+    """One note's content with memoized structure queries."""
+
+    def __init__(self, path: Path, content: str, size: int) -> None:
+        self.path = path
+        self.content = content
+        self.size = size
+        frontmatter, self.body = _split_frontmatter_and_body(content)
+        self.frontmatter: Dict[str, Any] = frontmatter or {}
+        self.title = _extract_title(frontmatter, self.body)
+        self.header_list = _extract_header_list(self.body)
+        self.word_count = len(self.body.split())
+        self._memo: Dict[Tuple[str, Any], Any] = {}
+        self._memo_lock = threading.RLock()
+
+    def _get(self, key: Tuple[str, Any], compute) -> Any:
+        with self._memo_lock:
+            if key not in self._memo:
+                self._memo[key] = compute()
+            return self._memo[key]
+
+    def headers(self, level: Optional[int] = None) -> List[Dict[str, Any]]:
+        """extract_headers() over the whole note (copies, safe to modify)."""
+        headers = self._get(("headers", level), lambda: extract_headers(self.content, level))
+        return [dict(h) for h in headers]
+
+    def section(self, header: str) -> str:
+        """find_header_content() for one header."""
+        return self._get(("section", header), lambda: find_header_content(self.content, header))
+
+    def bullets(self, section: Optional[str] = None) -> List[str]:
+        """extract_bullet_points(), optionally limited to a section."""
+        if section is None:
+            bullets = self._get(("bullets", None), lambda: extract_bullet_points(self.content))
+        else:
+            bullets = self._get(
+                ("bullets", section), lambda: extract_bullet_points(self.section(section))
+            )
+        return list(bullets)
+
+    def projects(self) -> List[str]:
+        """detect_project_headers()."""
+        return list(self._get(("projects", None), lambda: detect_project_headers(self.content)))
+
+    def tags(self) -> List[str]:
+        """extract_tags()."""
+        return list(self._get(("tags", None), lambda: extract_tags(self.content)))
+
+
+class NoteCache:
+    """Byte-bounded LRU of ParsedNote keyed by (path, mtime_ns, size)."""
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], ParsedNote]]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, path: Path) -> ParsedNote:
+        """
+        Parsed note for a file, re-read only if its mtime or size changed.
+
+        Raises:
+            FileNotFoundError: If the note doesn't exist
+            UnicodeDecodeError: If the note is not UTF-8
+        """
+        key = str(path.resolve())
+        stat = os.stat(key)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        with open(key, "rb") as f:
+            stat = os.fstat(f.fileno())
+            raw = f.read()
+        # Same newline handling as Path.read_text()
+        content = raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+        note = ParsedNote(path, content, len(raw))
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1].size
+            if note.size <= self.max_bytes:
+                self._entries[key] = ((stat.st_mtime_ns, stat.st_size), note)
+                self._bytes += note.size
+                while self._bytes > self.max_bytes:
+                    _, (_, evicted) = self._entries.popitem(last=False)
+                    self._bytes -= evicted.size
+                    self.evictions += 1
+
+        return note
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_cache = NoteCache()
+
+
+def get_parsed_note(path: Path) -> ParsedNote:
+    """
+    Get a parsed note from the shared cache (read from disk on a miss).
+
+    Args:
+        path: Absolute path to the note file
+
+    Returns:
+        ParsedNote; treat its attributes as read-only
+
+    Raises:
+        FileNotFoundError: If the note doesn't exist
+        UnicodeDecodeError: If the note is not UTF-8
+    """
+    return _cache.get(path)
+
+
+def get_note_cache_stats() -> Dict[str, Any]:
+    """
+    Get parsed-note cache counters for this process.
+
+    Returns:
+        Dict with hits, misses, evictions, hit_rate, entries, bytes, max_bytes
+    """
+    return _cache.stats()
+
+
+def reset_note_cache_stats() -> None:
+    """Clear hit/miss/eviction counters (cached notes are kept)."""
+    _cache.reset_stats()
+
+
+def clear_note_cache() -> None:
+    """Drop every cached note."""
+    _cache.clear()
@@ -0,0 +1,543 @@
+# ABOUTME: Persistent SQLite index of vault notes - frontmatter fields and FTS5 full text
+# ABOUTME: Refreshed incrementally by mtime/size so metadata and content queries don't read note files
+"""
+Note Index
+
+Answers frontmatter queries ("notes with tags containing SEO", "status
+starts with 'act'", "due before 2025-11-01") and full-text searches from a
+SQLite database instead of opening every note in the vault.
+
+Schema:
+- notes: one row per .md file - path (relative), title, word_count,
+  mtime_ns, size, ctime, mtime and the frontmatter as JSON
+- fields: flattened frontmatter, one row per (note, key, value). List values
+  get one row per element, nested mappings use dotted keys ("author.name").
+  Each value is stored as text plus a kind (str, num, bool, date, null) and,
+  for numbers, a numeric column for range queries.
+- notes_fts: FTS5 table (rowid = notes.rowid) over title, headers, body
+  and frontmatter values, ranked with BM25; kept in step with notes by a
+  delete trigger.
+
+Before each query the vault is walked with os.scandir (symlinks and
+dot-directories such as .obsidian/.trash skipped) and only notes whose
+mtime_ns/size differ from their row are read and re-indexed; deleted
+notes are dropped.
+The database lives at <config dir>/note_index/<hash of vault path>.sqlite.
+
+Key functions:
+- refresh_index(): Bring the index up to date with the vault
+- get_note_infos(): Title/metadata/word count for given notes, reading only stale ones
+- query_notes(): Field queries (eq, in, prefix, gt/gte/lt/lte) with sort and limit
+- search_text(): Ranked full-text search with snippets, filtered by folder
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ..config import get_config_dir
+from .obsidian_notes import _extract_header_list, _extract_title, _split_frontmatter_and_body
+
+SCHEMA_VERSION = 2
+
+# BM25 column weights: title, headers, body, frontmatter
+BM25_WEIGHTS = (10.0, 5.0, 1.0, 2.0)
+
+# Tokens per snippet
+SNIPPET_TOKENS = 12
+
+OPERATORS = ("eq", "in", "prefix", "gt", "gte", "lt", "lte")
+
+SORT_COLUMNS = {
+    "path": "n.path",
+    "title": "n.title",
+    "word_count": "n.word_count",
+    "created": "n.ctime",
+    "modified": "n.mtime",
+}
+
+_RANGE_SQL = {"gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS notes (
+    path TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    word_count INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    ctime REAL NOT NULL,
+    mtime REAL NOT NULL,
+    metadata TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fields (
+    path TEXT NOT NULL REFERENCES notes(path) ON DELETE CASCADE,
+    key TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    text TEXT,
+    num REAL
+);
+CREATE INDEX IF NOT EXISTS fields_text ON fields (key, text);
+CREATE INDEX IF NOT EXISTS fields_num ON fields (key, num);
+CREATE INDEX IF NOT EXISTS fields_path ON fields (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS notes_fts USING fts5 (
+    title, headers, body, metadata, tokenize = 'unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS notes_fts_delete AFTER DELETE ON notes BEGIN
+    DELETE FROM notes_fts WHERE rowid = old.rowid;
+END;
+"""
+
+_lock = threading.Lock()
+
+
+def get_index_dir() -> Path:
+    """Directory holding the note index databases."""
+    return get_config_dir() / "note_index"
+
+
+def get_index_path(vault_path: Path) -> Path:
+    """Index database for one vault."""
+    key = hashlib.sha1(str(vault_path.resolve()).encode()).hexdigest()[:16]
+    return get_index_dir() / f"{key}.sqlite"
+
+
+def connect(vault_path: Path) -> sqlite3.Connection:
+    """
+    Open (creating or rebuilding if the schema is outdated) a vault's index.
+
+    Args:
+        vault_path: Vault root path
+
+    Returns:
+        sqlite3 connection; the caller closes it
+    """
+    path = get_index_path(vault_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    conn = sqlite3.connect(path, timeout=10)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript(
+            "DROP TABLE IF EXISTS fields; DROP TABLE IF EXISTS notes;"
+            "DROP TABLE IF EXISTS notes_fts;"
+        )
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        conn.commit()
+
+    return conn
+
+
+# ============================================================================
+# Flattening
+# ============================================================================
+
+
+def encode_value(value: Any) -> Tuple[str, Optional[str], Optional[float]]:
+    """
+    Encode a scalar frontmatter value as (kind, text, num).
+
+    Dates are kept as ISO text so prefix and range queries work on them.
+    """
+    if value is None:
+        return "null", None, None
+    if isinstance(value, bool):
+        return "bool", "true" if value else "false", None
+    if isinstance(value, (int, float)):
+        return "num", repr(value), float(value)
+    if isinstance(value, (date, datetime)):
+        return "date", value.isoformat(), None
+    if isinstance(value, str):
+        return "str", value, None
+    return "str", json.dumps(value, default=str, sort_keys=True), None
+
+
+def flatten_frontmatter(
+    frontmatter: Dict[str, Any], prefix: str = ""
+) -> Iterator[Tuple[str, str, Optional[str], Optional[float]]]:
+    """
+    Yield (key, kind, text, num) rows for a frontmatter mapping.
+
+    Lists yield one row per element; nested mappings use dotted keys.
+    """
+    for key, value in frontmatter.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten_frontmatter(value, f"{name}.")
+        elif isinstance(value, list):
+            for item in value:
+                yield name, *encode_value(item)
+        else:
+            yield name, *encode_value(value)
+
+
+# ============================================================================
+# Refresh
+# ============================================================================
+
+
+def _walk(folder: Path) -> Iterator[os.DirEntry]:
+    """Yield .md file entries below folder, skipping symlinks and dot-directories."""
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_symlink():
+            continue
+        if entry.is_dir():
+            if not entry.name.startswith("."):
+                yield from _walk(Path(entry.path))
+        elif entry.name.endswith(".md") and entry.is_file():
+            yield entry
+
+
+def _index_note(
+    conn: sqlite3.Connection, vault_path: Path, rel_path: str, stat: os.stat_result
+) -> None:
+    """Read one note and replace its rows."""
+    try:
+        content = (vault_path / rel_path).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        content = ""  # Indexed without metadata; re-read once it changes
+
+    frontmatter, body = _split_frontmatter_and_body(content)
+    frontmatter = frontmatter or {}
+
+    fields = list(flatten_frontmatter(frontmatter))
+
+    conn.execute("DELETE FROM notes WHERE path = ?", (rel_path,))
+    cursor = conn.execute(
+        "INSERT INTO notes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            rel_path,
+            _extract_title(frontmatter, body),
+            len(body.split()),
+            stat.st_mtime_ns,
+            stat.st_size,
+            stat.st_ctime,
+            stat.st_mtime,
+            json.dumps(frontmatter, default=str),
+        ),
+    )
+    conn.executemany(
+        "INSERT INTO fields VALUES (?, ?, ?, ?, ?)",
+        [(rel_path, *row) for row in fields],
+    )
+    conn.execute(
+        "INSERT INTO notes_fts (rowid, title, headers, body, metadata) VALUES (?, ?, ?, ?, ?)",
+        (
+            cursor.lastrowid,
+            _extract_title(frontmatter, body),
+            "\n".join(_extract_header_list(body)),
+            body,
+            "\n".join(text for _, kind, text, _ in fields if kind in ("str", "date")),
+        ),
+    )
+
+
+def refresh_index(vault_path: Path, conn: Optional[sqlite3.Connection] = None) -> Dict[str, int]:
+    """
+    Bring the index up to date with the vault.
+
+    Only notes whose mtime_ns or size changed (or are new) are read.
+
+    Args:
+        vault_path: Vault root path
+        conn: Open index connection (opened and closed here if omitted)
+
+    Returns:
+        Dict with total, indexed (re-read) and removed note counts
+    """
+    if conn is None:
+        with closing(connect(vault_path)) as own:
+            return refresh_index(vault_path, own)
+
+    with _lock:
+        known = {
+            path: (mtime_ns, size)
+            for path, mtime_ns, size in conn.execute("SELECT path, mtime_ns, size FROM notes")
+        }
+        seen = set()
+        indexed = 0
+
+        root = len(os.path.join(str(vault_path), ""))
+
+        with conn:
+            for entry in _walk(vault_path):
+                rel_path = entry.path[root:]
+                seen.add(rel_path)
+                stat = entry.stat()
+                if known.get(rel_path) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                _index_note(conn, vault_path, rel_path, stat)
+                indexed += 1
+
+            removed = [path for path in known if path not in seen]
+            conn.executemany("DELETE FROM notes WHERE path = ?", [(p,) for p in removed])
+
+    return {"total": len(seen), "indexed": indexed, "removed": len(removed)}
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+
+def get_note_infos(
+    vault_path: Path, notes: List[Tuple[str, os.stat_result]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Title, metadata and word count for specific notes, without a vault walk.
+
+    Notes whose index row matches their mtime_ns/size are served from the
+    index without opening them; the rest are read once and (re)indexed.
+
+    Args:
+        vault_path: Vault root path
+        notes: (relative path, stat result) pairs
+
+    Returns:
+        Dict of relative path -> {title, metadata, word_count}
+    """
+    if not notes:
+        return {}
+
+    paths = [rel_path for rel_path, _ in notes]
+    placeholders = ", ".join("?" for _ in paths)
+    select = (
+        "SELECT path, title, metadata, word_count, mtime_ns, size "
+        f"FROM notes WHERE path IN ({placeholders})"
+    )
+
+    with closing(connect(vault_path)) as conn:
+        rows = {row[0]: row for row in conn.execute(select, paths)}
+
+        stale = [
+            (rel_path, stat)
+            for rel_path, stat in notes
+            if rel_path not in rows
+            or rows[rel_path][4:] != (stat.st_mtime_ns, stat.st_size)
+        ]
+        if stale:
+            with _lock, conn:
+                for rel_path, stat in stale:
+                    _index_note(conn, vault_path, rel_path, stat)
+            rows = {row[0]: row for row in conn.execute(select, paths)}
+
+    return {
+        path: {"title": title, "metadata": json.loads(metadata), "word_count": word_count}
+        for path, title, metadata, word_count, _, _ in rows.values()
+    }
+
+
+
+def _condition(op: str, value: Any) -> Tuple[str, List[Any]]:
+    """SQL condition on the fields table (alias f) for one operator."""
+    if op == "in":
+        values = list(value) if isinstance(value, (list, tuple, set)) else [value]
+        parts, params = [], []
+        for item in values:
+            sql, item_params = _condition("eq", item)
+            parts.append(f"({sql})")
+            params.extend(item_params)
+        return (" OR ".join(parts) or "0"), params
+
+    if op == "prefix":
+        text = str(value)
+        escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        return "f.kind IN ('str', 'date') AND f.text LIKE ? ESCAPE '\\'", [escaped + "%"]
+
+    kind, text, num = encode_value(value)
+
+    if op == "eq":
+        if kind == "num":
+            return "f.kind = 'num' AND f.num = ?", [num]
+        if kind in ("str", "date"):
+            # Date frontmatter matches its ISO text, e.g. "2025-10-06"
+            return "f.kind IN ('str', 'date') AND f.text = ?", [text]
+        if kind == "null":
+            return "f.kind = 'null'", []
+        return "f.kind = ? AND f.text = ?", [kind, text]
+
+    if op in _RANGE_SQL:
+        sql_op = _RANGE_SQL[op]
+        if kind == "num":
+            return f"f.kind = 'num' AND f.num {sql_op} ?", [num]
+        return f"f.kind IN ('str', 'date') AND f.text {sql_op} ?", [text]
+
+    raise ValueError(f"Unknown operator: {op} (expected one of {', '.join(OPERATORS)})")
+
+
+def query_notes(
+    vault_path: Path,
+    field: str,
+    value: Any,
+    op: str = "eq",
+    sort: str = "path",
+    descending: bool = False,
+    limit: int = 20,
+    refresh: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Find notes whose frontmatter field matches a condition.
+
+    List fields match if any element matches (tags: [a, b] matches eq "a").
+
+    Args:
+        vault_path: Vault root path
+        field: Frontmatter field name (dotted for nested mappings)
+        value: Value to compare against (a list of values for "in")
+        op: eq, in, prefix, gt, gte, lt or lte
+        sort: path, title, word_count, created or modified
+        descending: Reverse the sort order
+        limit: Max results
+        refresh: Refresh the index from the vault first
+
+    Returns:
+        List of NoteInfo dicts (path, title, metadata, word_count, created, modified)
+
+    Raises:
+        ValueError: If op or sort is unknown
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort: {sort} (expected one of {', '.join(SORT_COLUMNS)})")
+    condition, params = _condition(op, value)
+    order = "DESC" if descending else "ASC"
+
+    with closing(connect(vault_path)) as conn:
+        if refresh:
+            refresh_index(vault_path, conn)
+
+        rows = conn.execute(
+            f"""
+            SELECT n.path, n.title, n.metadata, n.word_count, n.ctime, n.mtime
+            FROM notes n
+            WHERE n.path IN (SELECT f.path FROM fields f WHERE f.key = ? AND ({condition}))
+            ORDER BY {SORT_COLUMNS[sort]} {order}, n.path {order}
+            LIMIT ?
+            """,
+            [field, *params, limit],
+        ).fetchall()
+
+    return [
+        {
+            "path": path,
+            "title": title,
+            "metadata": json.loads(metadata),
+            "word_count": word_count,
+            "created": datetime.fromtimestamp(ctime).isoformat(),
+            "modified": datetime.fromtimestamp(mtime).isoformat(),
+        }
+        for path, title, metadata, word_count, ctime, mtime in rows
+    ]
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn free text into a safe FTS5 query.
+
+    Every whitespace-separated term is quoted, so punctuation (C++, don't,
+    foo-bar) is matched literally instead of being parsed as FTS5 syntax;
+    all terms must match. A trailing * keeps prefix matching ("plan*").
+
+    Args:
+        text: User search text
+
+    Returns:
+        FTS5 MATCH expression ('' if text has no terms)
+    """
+    terms = []
+    for term in text.split():
+        prefix = term.endswith("*") and len(term) > 1
+        word = term.rstrip("*") if prefix else term
+        quoted = '"' + word.replace('"', '""') + '"'
+        terms.append(quoted + "*" if prefix else quoted)
+    return " ".join(terms)
+
+
+def search_text(
+    vault_path: Path,
+    query: str,
+    allowed_folders: Optional[List[str]] = None,
+    excluded_folders: Optional[List[str]] = None,
+    path_prefix: Optional[str] = None,
+    limit: int = 20,
+    refresh: bool = True,
+) -> List[Dict[str, Any]]:
+    """
+    Full-text search over note titles, headers, bodies and frontmatter.
+
+    Args:
+        vault_path: Vault root path
+        query: Search text (all terms must match; "term*" for prefixes)
+        allowed_folders: Only notes whose top-level folder is listed (None = all)
+        excluded_folders: Skip notes with any of these folder names in their path
+        path_prefix: Only notes whose relative path starts with this (e.g. "notes/work/")
+        limit: Max results
+        refresh: Refresh the index from the vault first
+
+    Returns:
+        Best matches first: dicts with path, title, score (BM25, lower is
+        better), snippet (matches wrapped in **), word_count and modified
+    """
+    match = fts_query(query)
+    if not match:
+        return []
+
+    conditions = ["notes_fts MATCH ?"]
+    params: List[Any] = [match]
+
+    if allowed_folders is not None:
+        placeholders = ", ".join("?" for _ in allowed_folders) or "NULL"
+        conditions.append(
+            f"instr(n.path, '/') > 0 "
+            f"AND substr(n.path, 1, instr(n.path, '/') - 1) IN ({placeholders})"
+        )
+        params.extend(allowed_folders)
+
+    for folder in excluded_folders or []:
+        conditions.append("instr('/' || n.path, ?) = 0")
+        params.append(f"/{folder}/")
+
+    if path_prefix:
+        conditions.append("substr(n.path, 1, ?) = ?")
+        params.extend([len(path_prefix), path_prefix])
+
+    weights = ", ".join(str(w) for w in BM25_WEIGHTS)
+
+    with closing(connect(vault_path)) as conn:
+        if refresh:
+            refresh_index(vault_path, conn)
+
+        rows = conn.execute(
+            f"""
+            SELECT n.path, n.title, bm25(notes_fts, {weights}) AS score,
+                   snippet(notes_fts, -1, '**', '**', '…', {SNIPPET_TOKENS}),
+                   n.word_count, n.mtime
+            FROM notes_fts JOIN notes n ON n.rowid = notes_fts.rowid
+            WHERE {" AND ".join(conditions)}
+            ORDER BY score, n.path
+            LIMIT ?
+            """,
+            [*params, limit],
+        ).fetchall()
+
+    return [
+        {
+            "path": path,
+            "title": title,
+            "score": round(score, 4),
+            "snippet": snippet,
+            "word_count": word_count,
+            "modified": datetime.fromtimestamp(mtime).isoformat(),
+        }
+        for path, title, score, snippet, word_count, mtime in rows
+    ]
@@ -14,6 +14,8 @@ import yaml
 from typing import Optional
 from ..core.types import ProjectInfo, ProjectListResult
 from ..config import get_vault_path
+from ..utils.files import write_file
+from .project_index import forget_note, get_catalog, record_note
 
 
 def get_projects_dir() -> Path:
@@ -139,7 +141,8 @@ def create_project_note(
 <!-- Project documentation, meeting notes, research -->
 """
 
-    note_path.write_text(content)
+    write_file(note_path, content)
+    record_note(note_path, frontmatter)
 
     return ProjectInfo(**frontmatter, note_path=str(note_path))
 
@@ -165,25 +168,12 @@ def list_projects(
     if not projects_dir.exists():
         return ProjectListResult(projects=[], grouped_by_domain={})
 
-    projects = []
+    # Frontmatter-only, mtime-validated catalog: unchanged notes aren't re-read
+    catalog = get_catalog(projects_dir)
+    for name, error in catalog.invalid:
+        print(f"⚠️  Skipping invalid project note: {name} ({error})")
 
-    for note_path in projects_dir.glob("*.md"):
-        try:
-            project = parse_project_note(note_path)
-
-            # Apply filters
-            if domain and project["domain"] != domain:
-                continue
-            if state and project["state"] != state:
-                continue
-            if needs_review is not None and project["needs_review"] != needs_review:
-                continue
-
-            projects.append(project)
-        except Exception as e:
-            # Skip invalid project notes
-            print(f"⚠️  Skipping invalid project note: {note_path.name} ({e})")
-            continue
+    projects = catalog.select(domain=domain or None, state=state or None, needs_review=needs_review)
 
     # Group by domain
     grouped = {}
@@ -255,7 +245,8 @@ def update_project_state(full_path: str, state: str) -> ProjectInfo:
     updated_content = f"""---
 {yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)}---{body}"""
 
-    note_path.write_text(updated_content)
+    write_file(note_path, updated_content)
+    record_note(note_path, frontmatter)
 
     return ProjectInfo(**frontmatter, note_path=str(note_path))
 
@@ -296,7 +287,8 @@ def add_task_to_project(full_path: str, task_uuid: str) -> ProjectInfo:
     updated_content = f"""---
 {yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)}---{body}"""
 
-    note_path.write_text(updated_content)
+    write_file(note_path, updated_content)
+    record_note(note_path, frontmatter)
 
     return ProjectInfo(**frontmatter, note_path=str(note_path))
 
@@ -342,7 +334,8 @@ def remove_task_from_project(full_path: str, task_uuid: str) -> ProjectInfo:
         updated_content = f"""---
 {yaml.dump(frontmatter, default_flow_style=False, sort_keys=False)}---{body}"""
 
-        note_path.write_text(updated_content)
+        write_file(note_path, updated_content)
+    record_note(note_path, frontmatter)
 
     return ProjectInfo(**frontmatter, note_path=str(note_path))
 
@@ -364,4 +357,5 @@ def delete_project(full_path: str) -> bool:
         return False
 
     note_path.unlink()
+    forget_note(note_path)
     return True
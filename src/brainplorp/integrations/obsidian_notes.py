@@ -11,6 +11,9 @@ This module provides low-level file I/O operations. It does NOT:
 All functions are internal (_prefixed) and should only be called by core layer.
 """
 
+import base64
+import bisect
+import json
 import os
 import re
 import yaml
@@ -18,6 +21,11 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, List
 
+from brainplorp.utils.files import write_file
+
+# libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def _read_note_file(vault_path: Path, note_path: str, mode: str) -> Dict[str, Any]:
     """
@@ -40,20 +48,16 @@ def _read_note_file(vault_path: Path, note_path: str, mode: str) -> Dict[str, An
     if not file_path.exists():
         raise FileNotFoundError(f"Note not found: {note_path}")
 
-    # Read full content (UTF-8 only, per Q16)
-    content = file_path.read_text(encoding="utf-8")
-
-    # Split frontmatter and body
-    frontmatter, body = _split_frontmatter_and_body(content)
-
-    # Extract title (from frontmatter or first # header)
-    title = _extract_title(frontmatter, body)
+    # Read and parse (UTF-8 only, per Q16) through the shared cache, so
+    # repeated reads of an unchanged note don't touch the file again
+    from .note_cache import get_parsed_note
 
-    # Extract headers
-    headers = _extract_header_list(body)
-
-    # Calculate word count
-    word_count = len(body.split())
+    note = get_parsed_note(file_path)
+    content = note.content
+    frontmatter = note.frontmatter
+    title = note.title
+    headers = list(note.header_list)
+    word_count = note.word_count
 
     # Apply mode (full/preview/metadata/structure)
     if mode == "preview":
@@ -67,7 +71,7 @@ def _read_note_file(vault_path: Path, note_path: str, mode: str) -> Dict[str, An
         "path": str(note_path),
         "title": title,
         "content": content,
-        "metadata": frontmatter if frontmatter else {},
+        "metadata": dict(frontmatter),
         "word_count": word_count,
         "headers": headers,
         "mode": mode,
@@ -75,6 +79,49 @@ def _read_note_file(vault_path: Path, note_path: str, mode: str) -> Dict[str, An
     }
 
 
+def _encode_cursor(sort: str, key: List[Any]) -> str:
+    """Opaque cursor pointing just past key in the given sort order."""
+    raw = json.dumps({"sort": sort, "after": key}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """Sort key a cursor points past; ValueError if malformed or for another sort."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        key = data["after"]
+        valid = data["sort"] == sort and isinstance(key, list)
+    except (ValueError, TypeError, KeyError):
+        valid = False
+    if not valid:
+        raise ValueError(f"Invalid cursor for sort '{sort}'")
+    return key
+
+
+def _scan_folder(
+    folder: Path, vault_path: Path, recursive: bool, exclude: List[str]
+) -> List[tuple[str, os.stat_result]]:
+    """(relative path, stat) for .md files, from scandir - no file is opened."""
+    found = []
+    try:
+        entries = list(os.scandir(folder))
+    except OSError:
+        return found
+
+    root = len(os.path.join(str(vault_path), ""))
+    for entry in entries:
+        # Skip symlinks (per Q20) and excluded folders/files
+        if entry.is_symlink() or entry.name in exclude:
+            continue
+        if entry.is_dir():
+            if recursive:
+                found.extend(_scan_folder(Path(entry.path), vault_path, recursive, exclude))
+        elif entry.name.endswith(".md") and entry.is_file():
+            found.append((entry.path[root:], entry.stat()))
+
+    return found
+
+
 def _read_folder(
     vault_path: Path,
     folder_path: str,
@@ -82,9 +129,15 @@ def _read_folder(
     exclude: List[str],
     limit: int,
     mode: str,
+    sort: str = "name",
+    cursor: str | None = None,
 ) -> Dict[str, Any]:
     """
-    Read all notes in folder (pure I/O).
+    Read one page of notes in folder (pure I/O).
+
+    The folder is listed with os.scandir and sorted from stat data; only
+    the returned page is looked up, through the note index, so notes that
+    haven't changed since they were last indexed aren't opened at all.
 
     Args:
         vault_path: Vault root path
@@ -93,13 +146,19 @@ def _read_folder(
         exclude: Folder names to skip
         limit: Max notes to return
         mode: Content mode for each note
+        sort: "name" (relative path, A-Z) or "mtime" (newest first)
+        cursor: next_cursor from the previous page (None for the first page)
 
     Returns:
-        Dict with folder_path, notes, total_count, returned_count, has_more
+        Dict with folder_path, notes, total_count, returned_count, has_more,
+        next_cursor
 
     Raises:
         FileNotFoundError: If folder doesn't exist
+        ValueError: If sort is unknown or cursor is invalid
     """
+    from .note_index import get_note_infos
+
     folder = vault_path / folder_path
 
     if not folder.exists():
@@ -108,43 +167,39 @@ def _read_folder(
     if not folder.is_dir():
         raise NotADirectoryError(f"Not a directory: {folder_path}")
 
-    # Find all markdown files
-    pattern = "**/*.md" if recursive else "*.md"
-    all_paths = []
+    if sort == "name":
+        sort_key = lambda item: [item[0]]
+    elif sort == "mtime":
+        sort_key = lambda item: [-item[1].st_mtime_ns, item[0]]
+    else:
+        raise ValueError(f"Unknown sort: {sort} (expected 'name' or 'mtime')")
 
-    for path in folder.glob(pattern):
-        # Skip symlinks (per Q20)
-        if path.is_symlink():
-            continue
+    # List and sort from stat data only
+    all_paths = _scan_folder(folder, vault_path, recursive, exclude or [])
+    all_paths.sort(key=sort_key)
+    total_count = len(all_paths)
 
-        # Skip excluded folders
-        if exclude:
-            rel_path = path.relative_to(vault_path)
-            if any(excluded in rel_path.parts for excluded in exclude):
-                continue
+    # Keyset pagination: resume just after the cursor's sort key
+    start = 0
+    if cursor:
+        after = _decode_cursor(cursor, sort)
+        start = bisect.bisect_right(all_paths, after, key=sort_key)
 
-        all_paths.append(path)
+    page = all_paths[start : start + limit]
+    has_more = start + len(page) < total_count
 
-    total_count = len(all_paths)
+    # Title/metadata/word count from the note index; only stale notes are read
+    infos = get_note_infos(vault_path, page)
 
-    # Limit results
-    paths_to_read = all_paths[:limit]
-    has_more = total_count > limit
-
-    # Read each note
     notes = []
-    for path in paths_to_read:
-        rel_path = path.relative_to(vault_path)
-        note_data = _read_note_file(vault_path, str(rel_path), mode)
-
-        # Convert to NoteInfo format (metadata only)
-        stat = path.stat()
+    for rel_path, stat in page:
+        info = infos[rel_path]
         notes.append(
             {
-                "path": str(rel_path),
-                "title": note_data["title"],
-                "metadata": note_data["metadata"],
-                "word_count": note_data["word_count"],
+                "path": rel_path,
+                "title": info["title"],
+                "metadata": info["metadata"],
+                "word_count": info["word_count"],
                 "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
             }
@@ -156,6 +211,7 @@ def _read_folder(
         "total_count": total_count,
         "returned_count": len(notes),
         "has_more": has_more,
+        "next_cursor": _encode_cursor(sort, sort_key(page[-1])) if has_more else None,
         "excluded_folders": exclude if exclude else [],
     }
 
@@ -182,7 +238,7 @@ def _append_to_note_file(vault_path: Path, note_path: str, content: str) -> None
     # Always add two newlines (blank line separator, per Q23)
     new_content = current.rstrip() + "\n\n" + content
 
-    file_path.write_text(new_content, encoding="utf-8")
+    write_file(file_path, new_content)
 
 
 def _update_note_section_file(
@@ -238,96 +294,39 @@ def _update_note_section_file(
         + lines[next_header:]  # Keep rest
     )
 
-    file_path.write_text("\n".join(new_lines), encoding="utf-8")
+    write_file(file_path, "\n".join(new_lines))
 
 
 def _search_notes_by_metadata_file(
-    vault_path: Path, field: str, value: Any, limit: int
+    vault_path: Path,
+    field: str,
+    value: Any,
+    limit: int,
+    op: str = "eq",
+    sort: str = "path",
+    descending: bool = False,
 ) -> List[Dict[str, Any]]:
     """
-    Find notes where frontmatter[field] == value (pure I/O).
+    Find notes whose frontmatter field matches value (pure I/O).
+
+    Answered from the SQLite note index, which re-reads only notes changed
+    since the last query.
 
     Args:
         vault_path: Vault root path
         field: Frontmatter field name
         value: Value to match
         limit: Max results
+        op: eq (list fields match any element, per Q14), in, prefix, gt, gte, lt, lte
+        sort: path, title, word_count, created or modified
+        descending: Reverse the sort order
 
     Returns:
         List of NoteInfo dicts
     """
-    results = []
-
-    for md_file in vault_path.rglob("*.md"):
-        # Skip symlinks (per Q20)
-        if md_file.is_symlink():
-            continue
-
-        # Read only frontmatter (per Q9 - performance optimization)
-        try:
-            with open(md_file, "r", encoding="utf-8") as f:
-                lines = []
-                in_frontmatter = False
-                found_opening = False
-
-                for line in f:
-                    if line.strip() == "---":
-                        if not found_opening:
-                            found_opening = True
-                            in_frontmatter = True
-                            continue
-                        else:
-                            # End of frontmatter, stop reading
-                            break
-
-                    if in_frontmatter:
-                        lines.append(line)
-
-            # Parse YAML from collected lines
-            if lines:
-                frontmatter = yaml.safe_load("".join(lines))
-                if frontmatter and isinstance(frontmatter, dict):
-                    fm_value = frontmatter.get(field)
-
-                    # Smart matching (per Q14)
-                    if isinstance(fm_value, list):
-                        match = value in fm_value
-                    else:
-                        match = fm_value == value
-
-                    if match:
-                        # Get title and word count
-                        content = md_file.read_text(encoding="utf-8")
-                        _, body = _split_frontmatter_and_body(content)
-                        title = _extract_title(frontmatter, body)
-                        word_count = len(body.split())
-
-                        rel_path = md_file.relative_to(vault_path)
-                        stat = md_file.stat()
-
-                        results.append(
-                            {
-                                "path": str(rel_path),
-                                "title": title,
-                                "metadata": frontmatter,
-                                "word_count": word_count,
-                                "created": datetime.fromtimestamp(
-                                    stat.st_ctime
-                                ).isoformat(),
-                                "modified": datetime.fromtimestamp(
-                                    stat.st_mtime
-                                ).isoformat(),
-                            }
-                        )
-
-                        if len(results) >= limit:
-                            return results
-
-        except (UnicodeDecodeError, yaml.YAMLError):
-            # Skip files with encoding or YAML errors (per Q5 - lenient)
-            continue
+    from .note_index import query_notes
 
-    return results
+    return query_notes(vault_path, field, value, op=op, sort=sort, descending=descending, limit=limit)
 
 
 def _create_note_in_folder_file(
@@ -373,7 +372,7 @@ def _create_note_in_folder_file(
 
     note_content += content
 
-    note_path.write_text(note_content, encoding="utf-8")
+    write_file(note_path, note_content)
 
     return note_path.relative_to(vault_path)
 
@@ -411,7 +410,7 @@ def _split_frontmatter_and_body(content: str) -> tuple[Dict[str, Any] | None, st
     body_lines = lines[end_idx + 1 :]
 
     try:
-        frontmatter = yaml.safe_load("\n".join(fm_lines))
+        frontmatter = yaml.load("\n".join(fm_lines), Loader=_Loader)
         if not isinstance(frontmatter, dict):
             frontmatter = None
     except yaml.YAMLError:
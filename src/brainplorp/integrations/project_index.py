@@ -0,0 +1,394 @@
+# ABOUTME: Persistent task-UUID → project reverse index over vault/projects/ notes
+# ABOUTME: Validated per note by mtime/size, updated incrementally when project notes are written
+"""
+Project Index
+
+Answers "which project notes list this task UUID?" and "which projects
+are in this domain/state?" without parsing every project note. For each
+note in vault/projects/ the index keeps its mtime_ns, size, task_uuids and
+project metadata; entries are re-parsed only when a note's mtime or size
+changed, so a lookup costs one directory scan plus stat calls. Parsing
+reads only the frontmatter block, with libyaml's CSafeLoader when present.
+
+get_catalog() layers domain/state/needs_review indexes over the entries;
+they are rebuilt only when an entry changed, so filtered project lists
+need no file reads or YAML parsing while the notes are unchanged.
+
+The index is cached in memory per projects directory and persisted to
+<config dir>/project_index/<hash of projects dir>.json. obsidian_bases
+records its own writes through record_note() and forget_note(); any other
+change to a note is picked up by the mtime/size check.
+
+Key functions:
+- get_index(): Validated index entries for a projects directory
+- find_notes_with_tasks(): Project notes containing any of the given UUIDs
+- get_catalog(): ProjectCatalog with filtered lookups and invalid notes
+- list_indexed_projects(): ProjectInfo for every valid note, from the index
+- record_note(), forget_note(): Incremental updates after a write/delete
+"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import yaml
+
+from ..config import get_config_dir
+from ..core.types import ProjectInfo
+
+INDEX_VERSION = 2
+
+# Read size while looking for the end of the frontmatter block
+FRONTMATTER_CHUNK = 4096
+
+# libyaml-backed loader when PyYAML was built with it
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+REQUIRED_FIELDS = ("domain", "project_name", "full_path", "state")
+
+# Frontmatter fields copied into the index (ProjectInfo minus note_path)
+PROJECT_FIELDS = (
+    "domain",
+    "workstream",
+    "project_name",
+    "full_path",
+    "state",
+    "created_at",
+    "description",
+    "task_uuids",
+    "needs_review",
+    "tags",
+)
+
+_lock = threading.Lock()
+_indexes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+_generations: Dict[str, int] = {}  # Bumped whenever a directory's entries change
+_catalogs: Dict[str, "ProjectCatalog"] = {}
+
+
+def get_index_dir() -> Path:
+    """Directory holding the persisted indexes."""
+    return get_config_dir() / "project_index"
+
+
+def get_index_path(projects_dir: Path) -> Path:
+    """Persisted index file for one projects directory."""
+    key = hashlib.sha1(str(projects_dir.resolve()).encode()).hexdigest()[:16]
+    return get_index_dir() / f"{key}.json"
+
+
+def _entry_from_frontmatter(
+    frontmatter: Any, stat: os.stat_result, error: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build an index entry from parsed frontmatter (None/invalid → no project)."""
+    entry: Dict[str, Any] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "task_uuids": [],
+        "project": None,
+        "error": error,
+    }
+    if not isinstance(frontmatter, dict):
+        if entry["error"] is None:
+            entry["error"] = "Invalid frontmatter"
+        return entry
+
+    task_uuids = frontmatter.get("task_uuids")
+    if isinstance(task_uuids, list):
+        entry["task_uuids"] = [str(u) for u in task_uuids]
+
+    # Same required fields and defaults as obsidian_bases.parse_project_note
+    missing = [field for field in REQUIRED_FIELDS if field not in frontmatter]
+    if missing:
+        entry["error"] = repr(missing[0])
+        return entry
+
+    project = {field: frontmatter.get(field) for field in PROJECT_FIELDS}
+    project["created_at"] = frontmatter.get("created_at", datetime.now().isoformat())
+    project["task_uuids"] = entry["task_uuids"]
+    project["needs_review"] = bool(frontmatter.get("needs_review", False))
+    project["tags"] = frontmatter.get("tags") or []
+    entry["project"] = project
+    return entry
+
+
+def read_frontmatter_text(note_path: Path) -> Optional[str]:
+    """
+    Read just the YAML block between the first two '---' markers.
+
+    Stops reading once the closing marker is in the buffer, so long note
+    bodies are never loaded. Splits the same way as content.split("---", 2).
+
+    Args:
+        note_path: Markdown note
+
+    Returns:
+        Frontmatter text, or None if the note has no frontmatter block
+    """
+    with open(note_path) as f:
+        buffer = f.read(FRONTMATTER_CHUNK)
+        if not buffer.startswith("---"):
+            return None
+        while buffer.count("---") < 2:
+            chunk = f.read(FRONTMATTER_CHUNK)
+            if not chunk:
+                return None
+            buffer += chunk
+    return buffer.split("---", 2)[1]
+
+
+def _parse_note(note_path: Path, stat: os.stat_result) -> Dict[str, Any]:
+    """Read one project note's frontmatter into an index entry."""
+    try:
+        text = read_frontmatter_text(note_path)
+    except (OSError, UnicodeDecodeError) as e:
+        return _entry_from_frontmatter(None, stat, str(e))
+
+    if text is None:
+        return _entry_from_frontmatter(None, stat, f"Project note missing frontmatter: {note_path}")
+
+    try:
+        frontmatter = yaml.load(text, Loader=_Loader)
+    except yaml.YAMLError as e:
+        return _entry_from_frontmatter(None, stat, str(e))
+
+    return _entry_from_frontmatter(frontmatter, stat)
+
+
+def _load(projects_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """Entries from memory, else from disk, else empty."""
+    key = str(projects_dir.resolve())
+    entries = _indexes.get(key)
+    if entries is not None:
+        return entries
+
+    try:
+        data = json.loads(get_index_path(projects_dir).read_text())
+    except (OSError, ValueError):
+        data = None
+
+    if isinstance(data, dict) and data.get("version") == INDEX_VERSION and data.get("projects_dir") == key:
+        entries = data.get("notes") or {}
+    else:
+        entries = {}
+
+    _indexes[key] = entries
+    return entries
+
+
+def _touch(projects_dir: Path) -> None:
+    """Mark a directory's entries as changed (invalidates its catalog)."""
+    key = str(projects_dir.resolve())
+    _generations[key] = _generations.get(key, 0) + 1
+
+
+def _save(projects_dir: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+    """Persist entries atomically; a failed write only costs a re-parse later."""
+    path = get_index_path(projects_dir)
+    data = {"version": INDEX_VERSION, "projects_dir": str(projects_dir.resolve()), "notes": entries}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(data, default=str))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def get_index(projects_dir: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Get validated index entries for a projects directory.
+
+    Notes whose mtime_ns/size differ from their entry (or are new) are
+    re-parsed; entries for deleted notes are dropped. The index is saved
+    only if something changed.
+
+    Args:
+        projects_dir: vault/projects/ directory
+
+    Returns:
+        Dict of note filename → {mtime_ns, size, task_uuids, project}, where
+        project holds ProjectInfo fields (without note_path), or None if the
+        note isn't a valid project note. Entries must not be modified.
+    """
+    if not projects_dir.exists():
+        return {}
+
+    with _lock:
+        entries = _load(projects_dir)
+        changed = False
+        seen: Set[str] = set()
+
+        with os.scandir(projects_dir) as it:
+            for dirent in it:
+                if not dirent.name.endswith(".md") or not dirent.is_file():
+                    continue
+                seen.add(dirent.name)
+                stat = dirent.stat()
+                entry = entries.get(dirent.name)
+                if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                    continue
+                entries[dirent.name] = _parse_note(Path(dirent.path), stat)
+                changed = True
+
+        for name in [name for name in entries if name not in seen]:
+            del entries[name]
+            changed = True
+
+        if changed:
+            _touch(projects_dir)
+            _save(projects_dir, entries)
+
+        return dict(entries)
+
+
+def find_notes_with_tasks(projects_dir: Path, uuids: Iterable[str]) -> List[Path]:
+    """
+    Find project notes whose task_uuids contain any of the given UUIDs.
+
+    Args:
+        projects_dir: vault/projects/ directory
+        uuids: Task UUIDs
+
+    Returns:
+        Paths of matching notes, sorted by filename
+    """
+    wanted = set(uuids)
+    if not wanted:
+        return []
+
+    entries = get_index(projects_dir)
+    return [
+        projects_dir / name
+        for name, entry in sorted(entries.items())
+        if not wanted.isdisjoint(entry["task_uuids"])
+    ]
+
+
+class ProjectCatalog:
+    """Valid projects of one directory with domain/state/needs_review indexes."""
+
+    def __init__(self, projects_dir: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        self.projects: Dict[str, Dict[str, Any]] = {}
+        self.invalid: List[Tuple[str, str]] = []
+        self.by_domain: Dict[Any, List[str]] = {}
+        self.by_state: Dict[Any, List[str]] = {}
+        self.by_review: Dict[bool, List[str]] = {True: [], False: []}
+        self.generation = 0
+
+        for name, entry in sorted(entries.items()):
+            project = entry["project"]
+            if project is None:
+                self.invalid.append((name, entry.get("error") or "Invalid project note"))
+                continue
+            self.projects[name] = dict(project, note_path=str(projects_dir / name))
+            self.by_domain.setdefault(project["domain"], []).append(name)
+            self.by_state.setdefault(project["state"], []).append(name)
+            self.by_review[project["needs_review"]].append(name)
+
+    def select(
+        self,
+        domain: Optional[str] = None,
+        state: Optional[str] = None,
+        needs_review: Optional[bool] = None,
+    ) -> List[ProjectInfo]:
+        """
+        Projects matching all given filters, sorted by filename.
+
+        Returns copies, so callers may modify them freely.
+        """
+        names: Optional[Set[str]] = None
+        for index, value in (
+            (self.by_domain, domain),
+            (self.by_state, state),
+            (self.by_review, needs_review),
+        ):
+            if value is None:
+                continue
+            matches = set(index.get(value, ()))
+            names = matches if names is None else names & matches
+
+        return [
+            ProjectInfo(**self.projects[name])
+            for name in self.projects
+            if names is None or name in names
+        ]
+
+
+def get_catalog(projects_dir: Path) -> ProjectCatalog:
+    """
+    Get the project catalog for a directory, validated against the notes.
+
+    Args:
+        projects_dir: vault/projects/ directory
+
+    Returns:
+        ProjectCatalog, rebuilt only if an index entry changed since the last call
+    """
+    entries = get_index(projects_dir)
+    key = str(projects_dir.resolve())
+
+    with _lock:
+        generation = _generations.get(key, 0)
+        catalog = _catalogs.get(key)
+        if catalog is None or catalog.generation != generation:
+            catalog = ProjectCatalog(projects_dir, entries)
+            catalog.generation = generation
+            _catalogs[key] = catalog
+        return catalog
+
+
+def list_indexed_projects(projects_dir: Path) -> List[ProjectInfo]:
+    """
+    ProjectInfo for every valid project note, built from the index.
+
+    Args:
+        projects_dir: vault/projects/ directory
+
+    Returns:
+        List of ProjectInfo, sorted by filename
+    """
+    return get_catalog(projects_dir).select()
+
+
+def record_note(note_path: Path, frontmatter: Dict[str, Any]) -> None:
+    """
+    Update one note's entry right after it was written, so the next
+    get_index() doesn't have to re-parse it.
+
+    Args:
+        note_path: Project note that was written
+        frontmatter: The frontmatter that was written to it
+    """
+    projects_dir = note_path.parent
+    try:
+        stat = note_path.stat()
+    except OSError:
+        return
+
+    with _lock:
+        entries = _load(projects_dir)
+        entries[note_path.name] = _entry_from_frontmatter(frontmatter, stat)
+        _touch(projects_dir)
+        _save(projects_dir, entries)
+
+
+def forget_note(note_path: Path) -> None:
+    """Drop a deleted note's entry."""
+    projects_dir = note_path.parent
+    with _lock:
+        entries = _load(projects_dir)
+        if entries.pop(note_path.name, None) is not None:
+            _touch(projects_dir)
+            _save(projects_dir, entries)
+
+
+def clear_cache() -> None:
+    """Forget in-memory indexes and catalogs (persisted files are kept)."""
+    with _lock:
+        _indexes.clear()
+        _generations.clear()
+        _catalogs.clear()
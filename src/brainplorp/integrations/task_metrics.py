@@ -0,0 +1,288 @@
+# ABOUTME: Instrumentation for TaskWarrior subprocess calls - counts, latency percentiles, bytes
+# ABOUTME: Aggregates per subcommand in-process and optionally appends one JSONL record per call
+"""
+TaskWarrior Command Metrics
+
+Every 'task' invocation made through taskwarrior.py / taskwarrior_async.py is
+recorded here with its subcommand (export, add, modify, done, annotate,
+sync, ...), wall time, exit code and stdout size.
+
+- In-process: get_command_stats() returns per-subcommand call counts,
+  error counts, p50/p95/p99 latency and bytes. The MCP server exposes this
+  through the plorp_get_perf_stats tool.
+- Across runs: with BRAINPLORP_PERF_LOG=1, each call is also appended to
+  <config dir>/perf.jsonl tagged with a run id and workflow name (CLI
+  command or MCP tool). 'brainplorp doctor --perf' summarizes recent runs
+  from that file.
+
+Key functions:
+- record_command(): Record one finished command (called by the integration layer)
+- start_run(): Begin a new workflow run (CLI command / MCP tool call)
+- get_command_stats(), reset_command_stats(): In-process aggregates
+- read_perf_runs(): Per-run summaries from perf.jsonl
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterable, List, Optional
+
+from brainplorp.config import get_config_dir
+
+PERF_LOG_ENV = "BRAINPLORP_PERF_LOG"
+PERF_LOG_FILENAME = "perf.jsonl"
+
+# TaskWarrior commands we report separately; anything else is "other"
+SUBCOMMANDS = frozenset(
+    {
+        "export", "add", "modify", "done", "annotate", "denotate", "sync", "import",
+        "delete", "count", "start", "stop", "undo", "info", "_get", "--version",
+    }
+)
+
+# Latency samples kept per subcommand for percentiles (most recent N)
+MAX_SAMPLES = 10_000
+
+
+def classify_command(args: List[str]) -> str:
+    """
+    Determine the TaskWarrior subcommand from command arguments.
+
+    Skips rc overrides and filter terms (UUIDs, status:pending, ...).
+
+    Args:
+        args: Arguments after 'task'
+
+    Returns:
+        Subcommand name, or "other"
+
+    Example:
+        classify_command(["rc.bulk=0", "abc-123", "done"]) -> "done"
+    """
+    for arg in args:
+        if arg in SUBCOMMANDS:
+            return arg
+    return "other"
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already-sorted list (0.0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values) + 0.5 - 1e-9)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(durations_ms: Iterable[float]) -> Dict[str, float]:
+    """p50/p95/p99/max/total for a set of latencies in milliseconds."""
+    values = sorted(durations_ms)
+    return {
+        "p50_ms": round(percentile(values, 50), 2),
+        "p95_ms": round(percentile(values, 95), 2),
+        "p99_ms": round(percentile(values, 99), 2),
+        "max_ms": round(values[-1], 2) if values else 0.0,
+        "total_ms": round(sum(values), 2),
+    }
+
+
+class _SubcommandStats:
+    __slots__ = ("count", "errors", "timeouts", "bytes", "samples")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.bytes = 0
+        self.samples: Deque[float] = deque(maxlen=MAX_SAMPLES)
+
+
+class TaskCommandMetrics:
+    """Thread-safe per-subcommand aggregates for the current process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _SubcommandStats] = {}
+        self.run_id = uuid.uuid4().hex[:12]
+        self.workflow: Optional[str] = None
+
+    def record(
+        self, subcommand: str, duration_ms: float, returncode: int, stdout_bytes: int,
+        timed_out: bool = False,
+    ) -> None:
+        with self._lock:
+            stats = self._stats.get(subcommand)
+            if stats is None:
+                stats = self._stats[subcommand] = _SubcommandStats()
+            stats.count += 1
+            stats.bytes += stdout_bytes
+            stats.samples.append(duration_ms)
+            if timed_out:
+                stats.timeouts += 1
+            elif returncode != 0:
+                stats.errors += 1
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {
+                name: {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "timeouts": stats.timeouts,
+                    "bytes": stats.bytes,
+                    **summarize(stats.samples),
+                }
+                for name, stats in sorted(self._stats.items())
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+
+_metrics = TaskCommandMetrics()
+
+
+def start_run(workflow: Optional[str]) -> str:
+    """
+    Begin a new workflow run; subsequent commands are tagged with it.
+
+    Args:
+        workflow: CLI command or MCP tool name
+
+    Returns:
+        New run id
+    """
+    _metrics.run_id = uuid.uuid4().hex[:12]
+    _metrics.workflow = workflow
+    return _metrics.run_id
+
+
+def perf_log_enabled() -> bool:
+    """Check whether per-call JSONL logging is on (BRAINPLORP_PERF_LOG=1)."""
+    return os.environ.get(PERF_LOG_ENV, "").lower() in ("1", "true", "yes", "on")
+
+
+def get_perf_log_path() -> Path:
+    """Path of the JSONL performance log in the config directory."""
+    return get_config_dir() / PERF_LOG_FILENAME
+
+
+def record_command(
+    args: List[str],
+    duration_s: float,
+    returncode: int,
+    stdout_bytes: int,
+    timed_out: bool = False,
+) -> None:
+    """
+    Record one finished TaskWarrior command.
+
+    Args:
+        args: Arguments after 'task'
+        duration_s: Wall time in seconds
+        returncode: Process exit code
+        stdout_bytes: Size of stdout consumed
+        timed_out: Whether the command was killed for exceeding its timeout
+    """
+    subcommand = classify_command(args)
+    duration_ms = duration_s * 1000.0
+    _metrics.record(subcommand, duration_ms, returncode, stdout_bytes, timed_out)
+
+    if perf_log_enabled():
+        entry = {
+            "ts": round(time.time(), 3),
+            "run": _metrics.run_id,
+            "workflow": _metrics.workflow,
+            "pid": os.getpid(),
+            "cmd": subcommand,
+            "ms": round(duration_ms, 3),
+            "rc": returncode,
+            "bytes": stdout_bytes,
+            "timeout": timed_out,
+        }
+        try:
+            path = get_perf_log_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass  # Metrics must never break a workflow
+
+
+def get_command_stats() -> Dict[str, Dict[str, Any]]:
+    """
+    Get per-subcommand aggregates for this process.
+
+    Returns:
+        Dict of subcommand -> {count, errors, timeouts, bytes, p50_ms,
+        p95_ms, p99_ms, max_ms, total_ms}
+    """
+    return _metrics.report()
+
+
+def reset_command_stats() -> None:
+    """Clear in-process aggregates."""
+    _metrics.reset()
+
+
+def read_perf_runs(path: Optional[Path] = None, last: int = 5) -> List[Dict[str, Any]]:
+    """
+    Summarize the most recent workflow runs recorded in perf.jsonl.
+
+    Args:
+        path: Log path (defaults to get_perf_log_path())
+        last: Number of most recent runs to return
+
+    Returns:
+        List (oldest first) of {run, workflow, started, calls, total_ms,
+        commands: {subcommand: {count, errors, timeouts, bytes, p50_ms, ...}}}
+    """
+    if path is None:
+        path = get_perf_log_path()
+    if not path.exists():
+        return []
+
+    runs: Dict[str, Dict[str, Any]] = {}
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            run = runs.setdefault(
+                entry.get("run", "?"),
+                {"workflow": entry.get("workflow"), "started": entry.get("ts"), "entries": []},
+            )
+            run["entries"].append(entry)
+
+    summaries = []
+    for run_id, run in list(runs.items())[-last:]:
+        by_cmd: Dict[str, List[Dict[str, Any]]] = {}
+        for entry in run["entries"]:
+            by_cmd.setdefault(entry.get("cmd", "other"), []).append(entry)
+
+        commands = {
+            cmd: {
+                "count": len(entries),
+                "errors": sum(1 for e in entries if e.get("rc") and not e.get("timeout")),
+                "timeouts": sum(1 for e in entries if e.get("timeout")),
+                "bytes": sum(e.get("bytes", 0) for e in entries),
+                **summarize(e.get("ms", 0.0) for e in entries),
+            }
+            for cmd, entries in sorted(by_cmd.items())
+        }
+        summaries.append(
+            {
+                "run": run_id,
+                "workflow": run["workflow"],
+                "started": run["started"],
+                "calls": len(run["entries"]),
+                "total_ms": round(sum(c["total_ms"] for c in commands.values()), 2),
+                "commands": commands,
+            }
+        )
+
+    return summaries
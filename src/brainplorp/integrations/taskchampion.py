@@ -0,0 +1,312 @@
+# ABOUTME: Read-only access to TaskWarrior 3.x's TaskChampion SQLite database
+# ABOUTME: Locates taskchampion.sqlite3 and reads the operation log marker used to validate caches
+"""
+TaskChampion Database Access
+
+TaskWarrior 3.x stores its data in taskchampion.sqlite3. Writes must still go
+through the 'task' CLI, but reading the database directly is safe when the
+connection is opened read-only (SQLite handles concurrent WAL readers).
+
+Key functions:
+- get_taskchampion_db(): Path to taskchampion.sqlite3
+- connect_readonly(): Open a read-only connection
+- get_operations_marker(): Cheap change marker derived from the operations table
+- query_tasks(): Evaluate a subset of TaskWarrior filters against the tasks table
+
+Task rows are stored as a JSON map of string properties ("status",
+"due" as epoch seconds, "tag_<name>", "annotation_<epoch>", ...).
+decode_task() converts a row into the same shape 'task export' produces,
+minus computed fields such as urgency.
+"""
+
+import json
+import os
+import re
+import sqlite3
+from datetime import date, datetime, time, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Properties stored as epoch seconds, exported as YYYYMMDDTHHMMSSZ
+DATE_PROPERTIES = ("entry", "modified", "due", "end", "wait", "scheduled", "until", "start")
+
+UUID_PATTERN = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+def get_taskchampion_db() -> Path:
+    """
+    Get TaskWarrior SQLite database path.
+
+    Honors the TASKDATA environment variable, like the 'task' CLI does.
+
+    Returns:
+        Path to taskchampion.sqlite3 (may not exist)
+    """
+    data_dir = os.environ.get("TASKDATA")
+    if data_dir:
+        return Path(data_dir).expanduser() / "taskchampion.sqlite3"
+    return Path.home() / ".task" / "taskchampion.sqlite3"
+
+
+def connect_readonly(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a read-only connection to the TaskChampion database.
+
+    Args:
+        db_path: Path to taskchampion.sqlite3
+
+    Returns:
+        sqlite3.Connection opened with mode=ro
+
+    Raises:
+        sqlite3.Error: If the database cannot be opened
+    """
+    return sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=1.0)
+
+
+def get_operations_marker(db_path: Optional[Path] = None) -> Optional[Tuple[int, int, int]]:
+    """
+    Read a marker that changes whenever TaskWarrior writes.
+
+    Combines MAX(id) of the operations table (the same log that
+    scripts/reconcile_taskwarrior.py reads) with the modification time of the
+    write-ahead log, which also covers changes applied by 'task sync'.
+
+    Args:
+        db_path: Path to taskchampion.sqlite3 (defaults to get_taskchampion_db())
+
+    Returns:
+        (max_operation_id, operation_count, wal_mtime_ns) tuple, or None if the
+        database is missing or unreadable
+    """
+    if db_path is None:
+        db_path = get_taskchampion_db()
+
+    if not db_path.exists():
+        return None
+
+    try:
+        conn = connect_readonly(db_path)
+        try:
+            row = conn.execute("SELECT MAX(id), COUNT(*) FROM operations").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+    wal_path = db_path.with_name(db_path.name + "-wal")
+    try:
+        wal_mtime = wal_path.stat().st_mtime_ns
+    except OSError:
+        wal_mtime = db_path.stat().st_mtime_ns
+
+    return (row[0] or 0, row[1] or 0, wal_mtime)
+
+
+def _format_timestamp(value: str) -> Optional[str]:
+    """Convert stored epoch seconds to TaskWarrior's export date format."""
+    try:
+        dt = datetime.fromtimestamp(int(value), tz=timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+    return dt.strftime("%Y%m%dT%H%M%SZ")
+
+
+def decode_task(uuid: str, data: Dict[str, str], task_id: int = 0) -> Dict[str, Any]:
+    """
+    Convert a TaskChampion task row into 'task export' shape.
+
+    Args:
+        uuid: Task UUID
+        data: Decoded JSON property map from the tasks table
+        task_id: Working set ID (0 if not in the working set)
+
+    Returns:
+        Task dictionary with id, uuid, description, status, dates,
+        project, priority, tags, annotations, depends, and any other
+        plain properties (UDAs) passed through as strings
+    """
+    task: Dict[str, Any] = {"id": task_id, "uuid": uuid}
+    tags: List[str] = []
+    annotations: List[Dict[str, str]] = []
+    depends: List[str] = []
+
+    for key, value in data.items():
+        if key.startswith("tag_"):
+            tags.append(key[4:])
+        elif key.startswith("annotation_"):
+            entry = _format_timestamp(key[len("annotation_") :])
+            annotations.append({"entry": entry or "", "description": value})
+        elif key.startswith("dep_"):
+            depends.append(key[4:])
+        elif key in DATE_PROPERTIES:
+            formatted = _format_timestamp(value)
+            if formatted:
+                task[key] = formatted
+        else:
+            task[key] = value
+
+    if tags:
+        task["tags"] = sorted(tags)
+    if annotations:
+        task["annotations"] = sorted(annotations, key=lambda a: a["entry"])
+    if depends:
+        task["depends"] = sorted(depends)
+
+    return task
+
+
+def _local_day_start(value: str) -> Optional[int]:
+    """Resolve a named or ISO date to the epoch second its local day starts."""
+    today = date.today()
+    named = {
+        "today": today,
+        "tomorrow": today + timedelta(days=1),
+        "yesterday": today - timedelta(days=1),
+    }
+    if value in named:
+        day = named[value]
+    else:
+        try:
+            day = date.fromisoformat(value)
+        except ValueError:
+            return None
+    return int(datetime.combine(day, time.min).astimezone().timestamp())
+
+
+def _epoch(data: Dict[str, str], key: str) -> Optional[int]:
+    try:
+        return int(data[key])
+    except (KeyError, ValueError):
+        return None
+
+
+def compile_filters(
+    filters: List[str],
+) -> Optional[Tuple[Optional[str], List[str], Callable[[Dict[str, str]], bool]]]:
+    """
+    Compile TaskWarrior filter terms into a row predicate.
+
+    Terms are ANDed; bare UUID terms are ORed together (as 'task' does).
+
+    Args:
+        filters: TaskWarrior filter terms (e.g., ['status:pending', 'project:work'])
+
+    Returns:
+        (status, uuids, predicate) tuple, or None if any term is unsupported.
+        status and uuids are pushed down into SQL; predicate runs on the
+        decoded property map.
+    """
+    status: Optional[str] = None
+    uuids: List[str] = []
+    checks: List[Callable[[Dict[str, str]], bool]] = []
+
+    for term in filters:
+        if UUID_PATTERN.match(term):
+            uuids.append(term)
+            continue
+
+        name, sep, value = term.partition(":")
+        if not sep:
+            return None
+
+        if name == "status" and value in ("pending", "completed", "deleted", "recurring"):
+            if status is not None and status != value:
+                return None
+            status = value
+        elif name == "project" and value:
+            # TaskWarrior's '=' on strings is a left match (includes subprojects)
+            checks.append(lambda d, v=value: d.get("project", "").startswith(v))
+        elif name == "project.startswith" and value:
+            checks.append(lambda d, v=value: d.get("project", "").startswith(v))
+        elif name == "project.none" and not value:
+            checks.append(lambda d: not d.get("project"))
+        elif name == "priority" and value:
+            checks.append(lambda d, v=value: d.get("priority", "").startswith(v))
+        elif name == "recur.any" and not value:
+            checks.append(lambda d: bool(d.get("recur")))
+        elif name in ("due", "due.before"):
+            start = _local_day_start(value)
+            if start is None:
+                return None
+            if name == "due":
+                end = start + 86400
+                checks.append(
+                    lambda d, s=start, e=end: (t := _epoch(d, "due")) is not None and s <= t < e
+                )
+            else:
+                checks.append(lambda d, s=start: (t := _epoch(d, "due")) is not None and t < s)
+        else:
+            return None
+
+    def predicate(data: Dict[str, str]) -> bool:
+        return all(check(data) for check in checks)
+
+    return (status, uuids, predicate)
+
+
+def query_tasks(
+    filters: List[str], db_path: Optional[Path] = None
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Answer a 'task <filters> export' query directly from taskchampion.sqlite3.
+
+    Args:
+        filters: TaskWarrior filter terms. Supported: status:, project:,
+            project.startswith:, project.none:, due:<day>, due.before:<day>
+            (today/tomorrow/yesterday/YYYY-MM-DD), priority:, recur.any:,
+            and full UUIDs
+        db_path: Path to taskchampion.sqlite3 (defaults to get_taskchampion_db())
+
+    Returns:
+        List of task dicts in export shape (working-set tasks first, by ID),
+        or None if a filter is unsupported or the database is unreadable -
+        callers should then fall back to the 'task' CLI.
+    """
+    compiled = compile_filters(filters)
+    if compiled is None:
+        return None
+    status, uuids, predicate = compiled
+
+    if db_path is None:
+        db_path = get_taskchampion_db()
+    if not db_path.exists():
+        return None
+
+    sql = "SELECT uuid, data FROM tasks"
+    clauses: List[str] = []
+    params: List[str] = []
+    if status is not None:
+        clauses.append("json_extract(data, '$.status') = ?")
+        params.append(status)
+    if uuids:
+        clauses.append(f"uuid IN ({', '.join('?' * len(uuids))})")
+        params.extend(uuids)
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+
+    try:
+        conn = connect_readonly(db_path)
+        try:
+            working_set = dict(
+                (u, i) for i, u in conn.execute("SELECT id, uuid FROM working_set") if u
+            )
+            rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+
+    tasks: List[Dict[str, Any]] = []
+    for uuid, raw in rows:
+        try:
+            data = json.loads(raw)
+        except (TypeError, json.JSONDecodeError):
+            continue
+        if not predicate(data):
+            continue
+        task_id = working_set.get(uuid, 0) if data.get("status") in ("pending", "recurring") else 0
+        tasks.append(decode_task(uuid, data, task_id))
+
+    tasks.sort(key=lambda t: (t["id"] == 0, t["id"], t.get("entry", "")))
+    return tasks
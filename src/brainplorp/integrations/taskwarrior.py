@@ -8,20 +8,37 @@ All write operations use the 'task' CLI to ensure proper transaction handling.
 
 Key functions:
 - run_task_command(): Low-level subprocess wrapper
-- get_tasks(): Query tasks with filters
+- get_tasks(): Query tasks with filters (optionally read straight from
+  taskchampion.sqlite3 with BRAINPLORP_TASK_BACKEND=sqlite)
+- iter_tasks(), count_tasks(): Stream export results one task at a time (bounded memory)
 - get_task_info(): Get single task by UUID
+- get_tasks_by_uuid(): Resolve many UUIDs with one export per chunk
+- TaskSnapshot / get_snapshot_stats(): In-process read cache keyed on the TaskChampion op log
 - create_task(): Create new task and return UUID
+- create_tasks(): Create many tasks with one 'task import' (client-assigned UUIDs)
 - mark_done(), defer_task(), set_priority(), delete_task(): Task modifications
 - add_annotation(), get_task_annotations(): Task annotations for note linking
+- bulk_modify(), bulk_annotate(), bulk_mark_done(): One launch per chunk of UUIDs
+
+Every command is timed and recorded in task_metrics (per-subcommand latency
+and bytes; see get_command_stats() and "brainplorp doctor --perf").
 """
+import codecs
+import os
 import subprocess
 import json
 import sys
 import re
+import threading
 import time
-from typing import List, Dict, Any, Optional
+import uuid as uuid_lib
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from subprocess import CompletedProcess
 
+from brainplorp.integrations.taskchampion import get_operations_marker, query_tasks
+from brainplorp.integrations.task_metrics import record_command
+
 
 class TaskWarriorError(Exception):
     """Raised when TaskWarrior operations fail."""
@@ -33,7 +50,12 @@ class TaskWarriorTimeoutError(TaskWarriorError):
     pass
 
 
-def run_task_command(args: List[str], capture: bool = True, timeout: int = 10) -> CompletedProcess:
+def run_task_command(
+    args: List[str],
+    capture: bool = True,
+    timeout: int = 10,
+    input: Optional[str] = None,
+) -> CompletedProcess:
     """
     Run a TaskWarrior command via subprocess with timeout.
 
@@ -45,6 +67,7 @@ def run_task_command(args: List[str], capture: bool = True, timeout: int = 10) -
                  - Count/export: 10s
                  - Large exports: 30s
                  - Sync operations: 60s
+        input: Text written to the command's stdin (e.g., JSON for 'task import')
 
     Returns:
         CompletedProcess object with returncode, stdout, stderr
@@ -57,18 +80,28 @@ def run_task_command(args: List[str], capture: bool = True, timeout: int = 10) -
         run_task_command(['export']) -> runs 'task export'
         run_task_command(['1', 'done'], capture=False) -> runs 'task 1 done' interactively
         run_task_command(['sync'], timeout=60) -> runs 'task sync' with 60s timeout
+        run_task_command(['import'], input='[...]') -> pipes JSON into 'task import'
     """
     cmd = ["task"] + args
+    started = time.perf_counter()
 
     try:
-        if capture:
+        if input is not None:
+            result = subprocess.run(
+                cmd, capture_output=True, text=True, timeout=timeout, input=input
+            )
+        elif capture:
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
         else:
             result = subprocess.run(cmd, timeout=timeout)
 
+        record_command(
+            args, time.perf_counter() - started, result.returncode, len(result.stdout or "")
+        )
         return result
 
     except subprocess.TimeoutExpired:
+        record_command(args, time.perf_counter() - started, -1, 0, timed_out=True)
         raise TaskWarriorTimeoutError(
             f"TaskWarrior command timed out after {timeout}s: {' '.join(args)}\n"
             f"This may indicate TaskWarrior is hanging.\n"
@@ -80,6 +113,9 @@ def get_tasks(filters: List[str]) -> List[Dict[str, Any]]:
     """
     Get tasks matching filter criteria.
 
+    A bare ['status:pending'] query is served from the task snapshot when
+    it can be validated against the TaskChampion operation log.
+
     Args:
         filters: List of TaskWarrior filter terms (e.g., ['status:pending', 'due:today'])
 
@@ -89,19 +125,338 @@ def get_tasks(filters: List[str]) -> List[Dict[str, Any]]:
     Example:
         get_tasks(['status:pending', 'project:plorp'])
     """
+    if filters == ["status:pending"]:
+        pending = _snapshot.pending()
+        if pending is not None:
+            return pending
+
+    return _export(filters) or []
+
+
+def _sqlite_reads_enabled() -> bool:
+    """Check whether reads should try the TaskChampion SQLite backend first."""
+    return os.environ.get("BRAINPLORP_TASK_BACKEND", "cli").lower() == "sqlite"
+
+
+def _export(filters: List[str]) -> Optional[List[Dict[str, Any]]]:
+    """
+    Run 'task <filters> export' and parse the JSON output.
+
+    With BRAINPLORP_TASK_BACKEND=sqlite, filters the SQLite backend
+    understands are answered from taskchampion.sqlite3 instead; anything
+    else still goes through the CLI.
+
+    Args:
+        filters: List of TaskWarrior filter terms
+
+    Returns:
+        List of task dictionaries, or None on error
+    """
+    if _sqlite_reads_enabled():
+        tasks = query_tasks(filters)
+        if tasks is not None:
+            return tasks
+
     args = filters + ["export"]
     result = run_task_command(args, capture=True)
 
     if result.returncode != 0:
         print(f"Error getting tasks: {result.stderr}", file=sys.stderr)
-        return []
+        return None
 
     try:
         tasks = json.loads(result.stdout)
         return tasks
     except json.JSONDecodeError as e:
         print(f"Error parsing task JSON: {e}", file=sys.stderr)
-        return []
+        return None
+
+
+# Characters read from the export pipe per chunk in iter_tasks()
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+# Separators between objects in 'task export' output ("[", ",", "]", newlines)
+_EXPORT_SEPARATORS = " \t\r\n,[]"
+
+
+def iter_tasks(filters: List[str], timeout: int = 60) -> Iterator[Dict[str, Any]]:
+    """
+    Stream tasks matching filter criteria, one dict at a time.
+
+    Reads 'task <filters> export' incrementally from the pipe and decodes
+    each task object as soon as it is complete, so memory stays bounded by
+    one chunk plus one task instead of the whole export. Stopping iteration
+    early kills the 'task' process.
+
+    Uses the SQLite read backend when enabled and the filters allow it.
+
+    Args:
+        filters: List of TaskWarrior filter terms
+        timeout: Seconds before the export is killed (default: 60)
+
+    Yields:
+        Task dictionaries in export order. Errors are printed to stderr and
+        end the stream early, matching get_tasks() returning [].
+
+    Raises:
+        TaskWarriorTimeoutError: If the export takes longer than timeout
+
+    Example:
+        completed = sum(1 for _ in iter_tasks(['status:completed']))
+    """
+    if _sqlite_reads_enabled():
+        tasks = query_tasks(filters)
+        if tasks is not None:
+            yield from tasks
+            return
+
+    args = filters + ["export"]
+    started = time.perf_counter()
+    stdout_bytes = 0
+    proc = subprocess.Popen(["task"] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    timed_out = threading.Event()
+
+    def _expire() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, _expire)
+    timer.daemon = True
+    timer.start()
+
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    try:
+        while True:
+            # read1: return whatever the pipe has (up to the chunk size) without
+            # waiting for a full chunk, so the first tasks arrive immediately
+            chunk = proc.stdout.read1(EXPORT_CHUNK_SIZE)
+            stdout_bytes += len(chunk)
+            buffer += utf8.decode(chunk, final=not chunk)
+
+            pos = 0
+            while True:
+                while pos < len(buffer) and buffer[pos] in _EXPORT_SEPARATORS:
+                    pos += 1
+                if pos >= len(buffer):
+                    break
+                try:
+                    task, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    break  # Object continues in the next chunk
+                yield task
+            buffer = buffer[pos:]
+
+            if not chunk:
+                break
+
+        proc.wait()
+        record_command(
+            args, time.perf_counter() - started, proc.returncode, stdout_bytes,
+            timed_out=timed_out.is_set(),
+        )
+        if timed_out.is_set():
+            raise TaskWarriorTimeoutError(
+                f"TaskWarrior command timed out after {timeout}s: {' '.join(args)}\n"
+                f"This may indicate TaskWarrior is hanging.\n"
+                f"Try: brainplorp doctor"
+            )
+        if proc.returncode != 0:
+            stderr = proc.stderr.read().decode(errors="replace")
+            print(f"Error getting tasks: {stderr}", file=sys.stderr)
+        elif buffer.strip():
+            print(f"Error parsing task JSON: trailing data {buffer[:80]!r}", file=sys.stderr)
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+        proc.stdout.close()
+        proc.stderr.close()
+
+
+def count_tasks(filters: List[str]) -> int:
+    """
+    Count tasks matching filter criteria without materializing the export.
+
+    Args:
+        filters: List of TaskWarrior filter terms
+
+    Returns:
+        Number of matching tasks (0 on error)
+    """
+    return sum(1 for _ in iter_tasks(filters))
+
+
+# ============================================================================
+# Task Snapshot (in-process read cache)
+# ============================================================================
+
+
+class TaskSnapshot:
+    """
+    In-process index of exported tasks, keyed by UUID.
+
+    Pending tasks are loaded with one 'status:pending' export; completed and
+    deleted tasks are loaded on demand the first time a lookup misses. The
+    whole snapshot is dropped whenever the TaskChampion operation log marker
+    changes (or after any write made through this module). When the marker
+    cannot be read (no local taskchampion.sqlite3), the snapshot is disabled
+    and callers fall back to direct exports.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+        self._loaded: set = set()
+        self._marker: Optional[Tuple[int, int, int]] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.exports = 0
+
+    def invalidate(self) -> None:
+        """Drop all cached tasks (counters are kept)."""
+        with self._lock:
+            self._clear()
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/export counters."""
+        self.hits = 0
+        self.misses = 0
+        self.exports = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with hits, misses, exports, hit_rate, indexed_tasks, loaded_statuses
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "exports": self.exports,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "indexed_tasks": len(self._tasks),
+            "loaded_statuses": sorted(self._loaded),
+        }
+
+    def pending(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get all pending tasks.
+
+        Returns:
+            List of pending task dicts (copies), or None if the snapshot is unavailable
+        """
+        with self._lock:
+            if not self._validate():
+                return None
+
+            if "pending" in self._loaded:
+                self.hits += 1
+            else:
+                self.misses += 1
+                if not self._load("pending"):
+                    return None
+
+            return [dict(t) for t in self._tasks.values() if t.get("status") == "pending"]
+
+    def lookup(self, uuid: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """
+        Look up a task by full UUID.
+
+        Args:
+            uuid: Task UUID
+
+        Returns:
+            Tuple of (answered, task). answered is False when the snapshot
+            cannot answer (disabled, export failed, or short UUID), in which
+            case the caller should query TaskWarrior directly.
+        """
+        with self._lock:
+            if len(uuid) != 36 or not self._validate():
+                return (False, None)
+
+            if uuid in self._tasks:
+                self.hits += 1
+                return (True, dict(self._tasks[uuid]))
+
+            self.misses += 1
+            for status in ("pending", "completed", "deleted"):
+                if status in self._loaded:
+                    continue
+                if not self._load(status):
+                    return (False, None)
+                if uuid in self._tasks:
+                    return (True, dict(self._tasks[uuid]))
+
+            return (True, None)
+
+    def _validate(self) -> bool:
+        """Drop stale data; return False if the snapshot can't be validated."""
+        marker = get_operations_marker()
+        if marker is None:
+            self._clear()
+            return False
+
+        if marker != self._marker:
+            self._clear()
+            self._marker = marker
+        return True
+
+    def _load(self, status: str) -> bool:
+        """Export one status into the index; return False on export failure."""
+        tasks = _export([f"status:{status}"])
+        self.exports += 1
+        if tasks is None:
+            return False
+
+        for task in tasks:
+            self._tasks[task["uuid"]] = task
+        self._loaded.add(status)
+        return True
+
+    def _clear(self) -> None:
+        self._tasks = {}
+        self._loaded = set()
+        self._marker = None
+
+
+_snapshot = TaskSnapshot()
+
+
+def get_snapshot_stats() -> Dict[str, Any]:
+    """
+    Get hit/miss counters for the task snapshot.
+
+    Returns:
+        Dict with hits, misses, exports, hit_rate, indexed_tasks, loaded_statuses
+    """
+    return _snapshot.stats()
+
+
+def reset_snapshot_stats() -> None:
+    """Reset the task snapshot's hit/miss/export counters."""
+    _snapshot.reset_stats()
+
+
+def invalidate_snapshot() -> None:
+    """Drop the task snapshot (next read re-exports)."""
+    _snapshot.invalidate()
+
+
+def _due_local_date(task: Dict[str, Any]) -> Optional[date]:
+    """Convert a task's UTC due timestamp to a local calendar date."""
+    due = task.get("due")
+    if not due:
+        return None
+    try:
+        due_utc = datetime.strptime(due, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    except ValueError:
+        return None
+    return due_utc.astimezone().date()
 
 
 def get_overdue_tasks() -> List[Dict[str, Any]]:
@@ -111,7 +466,12 @@ def get_overdue_tasks() -> List[Dict[str, Any]]:
     Returns:
         List of overdue task dictionaries
     """
-    return get_tasks(["status:pending", "due.before:today"])
+    pending = _snapshot.pending()
+    if pending is None:
+        return get_tasks(["status:pending", "due.before:today"])
+
+    today = date.today()
+    return [t for t in pending if (d := _due_local_date(t)) is not None and d < today]
 
 
 def get_due_today() -> List[Dict[str, Any]]:
@@ -121,7 +481,12 @@ def get_due_today() -> List[Dict[str, Any]]:
     Returns:
         List of tasks due today
     """
-    return get_tasks(["status:pending", "due:today"])
+    pending = _snapshot.pending()
+    if pending is None:
+        return get_tasks(["status:pending", "due:today"])
+
+    today = date.today()
+    return [t for t in pending if _due_local_date(t) == today]
 
 
 def get_recurring_today() -> List[Dict[str, Any]]:
@@ -131,13 +496,21 @@ def get_recurring_today() -> List[Dict[str, Any]]:
     Returns:
         List of recurring tasks due today
     """
-    return get_tasks(["status:pending", "recur.any:", "due:today"])
+    pending = _snapshot.pending()
+    if pending is None:
+        return get_tasks(["status:pending", "recur.any:", "due:today"])
+
+    today = date.today()
+    return [t for t in pending if t.get("recur") and _due_local_date(t) == today]
 
 
 def get_task_info(uuid: str) -> Optional[Dict[str, Any]]:
     """
     Get detailed information about a specific task.
 
+    Served from the task snapshot when available; otherwise runs
+    'task <uuid> export'.
+
     Args:
         uuid: Task UUID
 
@@ -147,6 +520,10 @@ def get_task_info(uuid: str) -> Optional[Dict[str, Any]]:
     Example:
         task = get_task_info('a1b2c3d4-e5f6-7890-1234-567890abcdef')
     """
+    answered, task = _snapshot.lookup(uuid)
+    if answered:
+        return task
+
     tasks = get_tasks([uuid])
 
     if tasks:
@@ -154,6 +531,50 @@ def get_task_info(uuid: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+def get_tasks_by_uuid(uuids: List[str]) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Resolve many task UUIDs at once.
+
+    UUIDs the task snapshot can answer cost nothing; the rest are fetched
+    with one 'task <uuid> <uuid> ... export' per argument-size chunk
+    (bare UUIDs in a filter are ORed), instead of one export per task.
+
+    Args:
+        uuids: Full or short (8-char prefix) task UUIDs; duplicates are fine
+
+    Returns:
+        (tasks, exports): tasks maps each requested UUID that exists - in any
+        status, including completed and deleted - to its task dict; UUIDs
+        TaskWarrior doesn't know are absent. exports is the number of
+        'task export' processes the lookup needed.
+
+    Example:
+        tasks, exports = get_tasks_by_uuid(['abc-123', 'def-456'])
+    """
+    found: Dict[str, Dict[str, Any]] = {}
+    unresolved: List[str] = []
+    exports_before = _snapshot.exports
+
+    for uuid in dict.fromkeys(uuids):
+        answered, task = _snapshot.lookup(uuid)
+        if not answered:
+            unresolved.append(uuid)
+        elif task is not None:
+            found[uuid] = task
+
+    exports = _snapshot.exports - exports_before
+    for chunk in _chunk_uuids(unresolved) if unresolved else []:
+        tasks = _export(chunk) or []
+        exports += 1
+        for uuid in chunk:
+            for task in tasks:
+                if task.get("uuid", "").startswith(uuid):
+                    found[uuid] = task
+                    break
+
+    return found, exports
+
+
 def create_task(
     description: str,
     project: Optional[str] = None,
@@ -164,6 +585,8 @@ def create_task(
     """
     Create a new task in TaskWarrior.
 
+    Thin wrapper around create_tasks() for a single task.
+
     Args:
         description: Task description
         project: Project name (optional)
@@ -177,56 +600,151 @@ def create_task(
     Example:
         uuid = create_task("Write tests", project="plorp", due="friday", tags=["dev"])
     """
-    args = ["add", description]
+    created = create_tasks(
+        [
+            {
+                "description": description,
+                "project": project,
+                "due": due,
+                "priority": priority,
+                "tags": tags,
+            }
+        ]
+    )
+
+    if not created:
+        return None
+    return created[0]["uuid"]
 
-    if project:
-        args.append(f"project:{project}")
-    if due:
-        args.append(f"due:{due}")
-    if priority:
-        args.append(f"priority:{priority}")
-    if tags:
-        for tag in tags:
-            args.append(f"+{tag}")
 
-    result = run_task_command(args, capture=True)
+def create_tasks(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create several tasks with a single 'task import' invocation.
+
+    UUIDs are generated locally, so there is no ID -> UUID lookup after
+    creation. Due dates in ISO form (YYYY-MM-DD, YYYY-MM-DDTHH:MM[:SS] or
+    TaskWarrior's YYYYMMDDTHHMMSSZ) are converted here; anything else
+    (e.g. 'friday', 'eow') is applied afterwards with 'task <uuid> modify due:...'
+    so TaskWarrior still evaluates the expression.
+
+    Args:
+        specs: List of task specs. Keys:
+            - description (required)
+            - project, due, priority (optional)
+            - tags: list of tags (optional)
+            - annotations: list of annotation strings (optional)
+            - status: "pending" (default) or "completed"
+
+    Returns:
+        List of created task dicts (TaskWarrior export format) in the same
+        order as specs, or [] if the import failed
+
+    Example:
+        tasks = create_tasks([
+            {"description": "Write tests", "project": "plorp", "due": "2025-10-15"},
+            {"description": "Ship it", "priority": "H", "status": "completed"},
+        ])
+    """
+    if not specs:
+        return []
+
+    now = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    records = []
+    deferred_due = []  # (uuid, due expression) pairs TaskWarrior must evaluate
+
+    for spec in specs:
+        record, unresolved_due = _build_task_record(spec, now)
+        records.append(record)
+        if unresolved_due:
+            deferred_due.append((record["uuid"], unresolved_due))
+
+    result = run_task_command(["import"], timeout=30, input=json.dumps(records))
+    _snapshot.invalidate()
 
     if result.returncode != 0:
-        print(f"Error creating task: {result.stderr}", file=sys.stderr)
-        return None
+        print(f"Error importing tasks: {result.stderr}", file=sys.stderr)
+        return []
 
-    # Parse "Created task N." from stdout
-    match = re.search(r"Created task (\d+)\.", result.stdout)
-    if not match:
-        print(f"Error: Could not parse task ID from output: {result.stdout}", file=sys.stderr)
-        return None
+    for task_uuid, due_expr in deferred_due:
+        if not modify_task(task_uuid, due=due_expr):
+            print(
+                f"Warning: Could not set due '{due_expr}' on task {task_uuid}",
+                file=sys.stderr,
+            )
 
-    task_id = match.group(1)
+    return records
 
-    # Query by ID to get UUID with retry logic to handle race conditions
-    # TaskWarrior 3.x SQLite may not have committed immediately after task creation
-    max_attempts = 3
-    delay = 0.05  # 50ms
 
-    for attempt in range(max_attempts):
-        export_result = run_task_command([task_id, "export"], capture=True)
+def _build_task_record(spec: Dict[str, Any], now: str) -> tuple[Dict[str, Any], Optional[str]]:
+    """
+    Build a 'task import' JSON record from a create_tasks() spec.
 
-        if export_result.returncode == 0:
-            try:
-                tasks = json.loads(export_result.stdout)
-                if tasks:
-                    return tasks[0]["uuid"]
-            except json.JSONDecodeError:
-                pass
+    Args:
+        spec: Task spec (see create_tasks)
+        now: Current UTC timestamp in TaskWarrior format
+
+    Returns:
+        Tuple of (record, due expression that could not be converted locally)
+    """
+    status = spec.get("status") or "pending"
+    record: Dict[str, Any] = {
+        "uuid": str(uuid_lib.uuid4()),
+        "description": spec["description"],
+        "status": status,
+        "entry": now,
+        "modified": now,
+    }
+
+    if status == "completed":
+        record["end"] = now
+    if spec.get("project"):
+        record["project"] = spec["project"]
+    if spec.get("priority"):
+        record["priority"] = spec["priority"]
+    if spec.get("tags"):
+        record["tags"] = list(spec["tags"])
+    if spec.get("annotations"):
+        record["annotations"] = [
+            {"entry": now, "description": text} for text in spec["annotations"]
+        ]
+
+    unresolved_due = None
+    if spec.get("due"):
+        due = _to_taskwarrior_date(spec["due"])
+        if due:
+            record["due"] = due
+        else:
+            unresolved_due = spec["due"]
 
-        # Retry with exponential backoff
-        if attempt < max_attempts - 1:
-            time.sleep(delay)
-            delay *= 2  # Exponential backoff: 50ms, 100ms
+    return record, unresolved_due
 
-    # Final fallback after all retries
-    print(f"Error: Could not retrieve UUID for task {task_id} after {max_attempts} attempts", file=sys.stderr)
-    return None
+
+def _to_taskwarrior_date(value: str) -> Optional[str]:
+    """
+    Convert an ISO date/datetime (local time) to TaskWarrior's UTC format.
+
+    Matches what 'task add due:2025-10-15' stores: local midnight in UTC.
+
+    Args:
+        value: Date string (YYYY-MM-DD, YYYY-MM-DDTHH:MM[:SS], or YYYYMMDDTHHMMSSZ)
+
+    Returns:
+        Date in YYYYMMDDTHHMMSSZ format, or None if value is not an ISO date
+        (e.g. a TaskWarrior expression like 'friday')
+
+    Example:
+        _to_taskwarrior_date("20251015T000000Z") -> "20251015T000000Z"
+        _to_taskwarrior_date("friday") -> None
+    """
+    if re.fullmatch(r"\d{8}T\d{6}Z", value):
+        return value
+
+    try:
+        local_dt = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+    return local_dt.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
 
 
 def mark_done(uuid: str) -> bool:
@@ -240,6 +758,7 @@ def mark_done(uuid: str) -> bool:
         True on success, False on failure
     """
     result = run_task_command([uuid, "done"], capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error marking task done: {result.stderr}", file=sys.stderr)
@@ -260,6 +779,7 @@ def defer_task(uuid: str, new_due: str) -> bool:
         True on success, False on failure
     """
     result = run_task_command([uuid, "modify", f"due:{new_due}"], capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error deferring task: {result.stderr}", file=sys.stderr)
@@ -280,6 +800,7 @@ def set_priority(uuid: str, priority: str) -> bool:
         True on success, False on failure
     """
     result = run_task_command([uuid, "modify", f"priority:{priority}"], capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error setting priority: {result.stderr}", file=sys.stderr)
@@ -299,6 +820,7 @@ def delete_task(uuid: str) -> bool:
         True on success, False on failure
     """
     result = run_task_command([uuid, "delete"], capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error deleting task: {result.stderr}", file=sys.stderr)
@@ -331,6 +853,7 @@ def modify_task(uuid: str, **kwargs) -> bool:
         args.append(f"{key}:{value}")
 
     result = run_task_command(args, capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error modifying task: {result.stderr}", file=sys.stderr)
@@ -351,6 +874,7 @@ def add_annotation(uuid: str, annotation: str) -> bool:
         True on success, False on failure
     """
     result = run_task_command([uuid, "annotate", annotation], capture=True)
+    _snapshot.invalidate()
 
     if result.returncode != 0:
         print(f"Error adding annotation: {result.stderr}", file=sys.stderr)
@@ -376,3 +900,157 @@ def get_task_annotations(uuid: str) -> List[str]:
 
     annotations = task.get("annotations", [])
     return [ann["description"] for ann in annotations]
+
+
+# ============================================================================
+# Bulk Operations (one 'task' launch per chunk of UUIDs)
+# ============================================================================
+
+# Byte budget for the UUID portion of a single command line. Far below
+# ARG_MAX (typically 256KB-2MB including the environment) so that large
+# environments and long modification values still fit.
+BULK_ARG_BYTES = 64 * 1024
+
+BULK_RC = ["rc.bulk=0", "rc.confirmation=off"]
+
+_BULK_FEEDBACK_RE = re.compile(r"^(?:Modified|Completed|Annotated) (\d+) tasks?\.", re.MULTILINE)
+
+
+def _chunk_uuids(uuids: List[str], budget: int = BULK_ARG_BYTES) -> List[List[str]]:
+    """Split UUIDs into chunks whose joined length stays under budget bytes."""
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    size = 0
+
+    for uuid in uuids:
+        cost = len(uuid.encode()) + 1
+        if current and size + cost > budget:
+            chunks.append(current)
+            current, size = [], 0
+        current.append(uuid)
+        size += cost
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _run_bulk(
+    uuids: List[str],
+    action: List[str],
+    verify: Callable[[Dict[str, Any]], bool],
+) -> Dict[str, bool]:
+    """
+    Run 'task rc.bulk=0 rc.confirmation=off <uuids...> <action>' per chunk.
+
+    When TaskWarrior reports acting on every UUID in a chunk, all of them
+    succeeded. Otherwise (non-zero exit, missing tasks, partial failure) the
+    chunk is re-read with one export and verify(task) decides per UUID.
+
+    Args:
+        uuids: Task UUIDs (duplicates are collapsed)
+        action: Command and arguments after the filter (e.g., ['done'])
+        verify: Callable taking a task dict, True if the action took effect
+
+    Returns:
+        Dict mapping each UUID to True (succeeded) or False (failed)
+    """
+    unique = list(dict.fromkeys(uuids))
+    results: Dict[str, bool] = {}
+
+    for chunk in _chunk_uuids(unique):
+        result = run_task_command(BULK_RC + chunk + action, capture=True, timeout=60)
+        _snapshot.invalidate()
+
+        reported = [int(n) for n in _BULK_FEEDBACK_RE.findall(result.stdout or "")]
+        if result.returncode == 0 and reported and sum(reported) == len(chunk):
+            results.update((uuid, True) for uuid in chunk)
+            continue
+
+        tasks = _export(chunk) or []
+        by_uuid = {t.get("uuid"): t for t in tasks}
+        for uuid in chunk:
+            task = by_uuid.get(uuid)
+            results[uuid] = bool(task) and verify(task)
+
+        failed = [uuid for uuid in chunk if not results[uuid]]
+        if failed:
+            print(
+                f"Error running 'task {' '.join(action[:1])}' on {len(failed)} task(s): "
+                f"{result.stderr.strip()}",
+                file=sys.stderr,
+            )
+
+    return results
+
+
+def bulk_modify(uuids: List[str], **kwargs) -> Dict[str, bool]:
+    """
+    Modify many tasks with one 'task ... modify' per chunk of UUIDs.
+
+    Args:
+        uuids: Task UUIDs
+        **kwargs: Task properties to modify (same as modify_task)
+
+    Returns:
+        Dict mapping each UUID to True on success, False on failure
+
+    Example:
+        bulk_modify(project_uuids, project="work.engineering.api")
+    """
+    if not uuids:
+        return {}
+
+    changes = {k: v for k, v in kwargs.items() if v is not None}
+    action = ["modify"] + [f"{key}:{value}" for key, value in changes.items()]
+
+    # String fields can be checked exactly; dates are normalized by TaskWarrior
+    checkable = {
+        k: str(v) for k, v in changes.items() if k in ("project", "priority", "description")
+    }
+
+    def verify(task: Dict[str, Any]) -> bool:
+        return all(task.get(key) == value for key, value in checkable.items())
+
+    return _run_bulk(uuids, action, verify)
+
+
+def bulk_annotate(uuids: List[str], annotation: str) -> Dict[str, bool]:
+    """
+    Add the same annotation to many tasks with one 'task ... annotate' per chunk.
+
+    Args:
+        uuids: Task UUIDs
+        annotation: Annotation text
+
+    Returns:
+        Dict mapping each UUID to True on success, False on failure
+    """
+    if not uuids:
+        return {}
+
+    def verify(task: Dict[str, Any]) -> bool:
+        return any(a.get("description") == annotation for a in task.get("annotations", []))
+
+    return _run_bulk(uuids, ["annotate", annotation], verify)
+
+
+def bulk_mark_done(uuids: List[str]) -> Dict[str, bool]:
+    """
+    Mark many tasks done with one 'task ... done' per chunk of UUIDs.
+
+    Tasks that were already completed count as successes.
+
+    Args:
+        uuids: Task UUIDs
+
+    Returns:
+        Dict mapping each UUID to True on success, False on failure
+    """
+    if not uuids:
+        return {}
+
+    def verify(task: Dict[str, Any]) -> bool:
+        return task.get("status") == "completed"
+
+    return _run_bulk(uuids, ["done"], verify)
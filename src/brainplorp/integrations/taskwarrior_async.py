@@ -0,0 +1,318 @@
+# ABOUTME: Non-blocking asyncio counterpart of the TaskWarrior integration layer
+# ABOUTME: Runs 'task' with create_subprocess_exec behind a semaphore, with timeouts and kill-on-cancel
+"""
+Async TaskWarrior Integration Module
+
+Used by the MCP server so that a slow 'task export' doesn't stall the stdio
+event loop. Mirrors the read/write helpers in taskwarrior.py and shares
+their record building, filter backend and snapshot invalidation.
+
+Concurrency:
+- At most MAX_CONCURRENT_COMMANDS 'task' processes run at once
+- Each call has its own timeout; on timeout the child is killed and
+  TaskWarriorTimeoutError is raised
+- Cancelling the awaiting coroutine kills the child before re-raising
+- Every finished command is recorded in task_metrics
+
+Key functions:
+- run_task_command_async(): Low-level subprocess wrapper
+- get_tasks_async(), get_task_info_async(): Queries
+- create_task_async(), create_tasks_async(): Creation via 'task import'
+- mark_done_async(), defer_task_async(), set_priority_async(),
+  delete_task_async(), modify_task_async(), add_annotation_async(): Modifications
+"""
+import asyncio
+import json
+import sys
+import time
+from datetime import datetime, timezone
+from subprocess import CompletedProcess
+from typing import Any, Dict, List, Optional
+
+from brainplorp.integrations import taskwarrior
+from brainplorp.integrations.task_metrics import record_command
+from brainplorp.integrations.taskchampion import query_tasks
+from brainplorp.integrations.taskwarrior import TaskWarriorTimeoutError
+
+MAX_CONCURRENT_COMMANDS = 4
+
+_semaphore: Optional[asyncio.Semaphore] = None
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    """Create the command semaphore lazily (inside the running event loop)."""
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+    return _semaphore
+
+
+async def _kill(proc: asyncio.subprocess.Process) -> None:
+    """Kill a child process and reap it."""
+    if proc.returncode is None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+
+async def run_task_command_async(
+    args: List[str],
+    timeout: float = 10,
+    input: Optional[str] = None,
+) -> CompletedProcess:
+    """
+    Run a TaskWarrior command without blocking the event loop.
+
+    Args:
+        args: Command arguments (without 'task' prefix)
+        timeout: Timeout in seconds (default: 10), measured once the command starts
+        input: Text written to the command's stdin (e.g., JSON for 'task import')
+
+    Returns:
+        CompletedProcess object with returncode, stdout, stderr (text)
+
+    Raises:
+        TaskWarriorTimeoutError: If command times out (the child is killed)
+        asyncio.CancelledError: If the caller is cancelled (the child is killed)
+    """
+    cmd = ["task"] + args
+
+    async with _get_semaphore():
+        started = time.perf_counter()
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input.encode() if input is not None else None),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            await _kill(proc)
+            record_command(args, time.perf_counter() - started, -1, 0, timed_out=True)
+            raise TaskWarriorTimeoutError(
+                f"TaskWarrior command timed out after {timeout}s: {' '.join(args)}\n"
+                f"This may indicate TaskWarrior is hanging.\n"
+                f"Try: brainplorp doctor"
+            )
+        except asyncio.CancelledError:
+            await _kill(proc)
+            raise
+
+        record_command(args, time.perf_counter() - started, proc.returncode, len(stdout))
+
+    return CompletedProcess(
+        cmd,
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+async def _write(
+    args: List[str], error: str, timeout: float = 10, input: Optional[str] = None
+) -> bool:
+    """Run a write command, drop the read snapshot, report success."""
+    result = await run_task_command_async(args, timeout=timeout, input=input)
+    taskwarrior.invalidate_snapshot()
+
+    if result.returncode != 0:
+        print(f"{error}: {result.stderr}", file=sys.stderr)
+        return False
+
+    return True
+
+
+# ============================================================================
+# Queries
+# ============================================================================
+
+
+async def get_tasks_async(filters: List[str]) -> List[Dict[str, Any]]:
+    """
+    Get tasks matching filter criteria.
+
+    Honors BRAINPLORP_TASK_BACKEND=sqlite like get_tasks(); the SQLite read
+    runs in a worker thread.
+
+    Args:
+        filters: List of TaskWarrior filter terms
+
+    Returns:
+        List of task dictionaries, or [] on error
+    """
+    if taskwarrior._sqlite_reads_enabled():
+        tasks = await asyncio.to_thread(query_tasks, filters)
+        if tasks is not None:
+            return tasks
+
+    result = await run_task_command_async(filters + ["export"])
+
+    if result.returncode != 0:
+        print(f"Error getting tasks: {result.stderr}", file=sys.stderr)
+        return []
+
+    try:
+        return json.loads(result.stdout)
+    except json.JSONDecodeError as e:
+        print(f"Error parsing task JSON: {e}", file=sys.stderr)
+        return []
+
+
+async def get_task_info_async(uuid: str) -> Optional[Dict[str, Any]]:
+    """
+    Get detailed information about a specific task.
+
+    Args:
+        uuid: Task UUID
+
+    Returns:
+        Task dictionary or None if not found
+    """
+    tasks = await get_tasks_async([uuid])
+
+    if tasks:
+        return tasks[0]
+    return None
+
+
+# ============================================================================
+# Creation
+# ============================================================================
+
+
+async def create_tasks_async(specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Create many tasks with a single 'task import'.
+
+    Same spec format and return value as taskwarrior.create_tasks().
+
+    Args:
+        specs: List of task specs (description, project, due, priority, tags,
+               annotations, status)
+
+    Returns:
+        List of imported task records (each with 'uuid'), or [] on failure
+    """
+    if not specs:
+        return []
+
+    now = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    records = []
+    deferred_due = []  # (uuid, due expression) pairs TaskWarrior must evaluate
+
+    for spec in specs:
+        record, unresolved_due = taskwarrior._build_task_record(spec, now)
+        records.append(record)
+        if unresolved_due:
+            deferred_due.append((record["uuid"], unresolved_due))
+
+    imported = await _write(
+        ["import"], "Error importing tasks", timeout=30, input=json.dumps(records)
+    )
+    if not imported:
+        return []
+
+    for task_uuid, due_expr in deferred_due:
+        if not await modify_task_async(task_uuid, due=due_expr):
+            print(
+                f"Warning: Could not set due '{due_expr}' on task {task_uuid}",
+                file=sys.stderr,
+            )
+
+    return records
+
+
+async def create_task_async(
+    description: str,
+    project: Optional[str] = None,
+    due: Optional[str] = None,
+    priority: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+) -> Optional[str]:
+    """
+    Create a new task in TaskWarrior.
+
+    Args:
+        description: Task description
+        project: Project name (optional)
+        due: Due date in TaskWarrior format (optional)
+        priority: Priority level (optional, H/M/L)
+        tags: List of tags (optional)
+
+    Returns:
+        UUID of created task, or None on failure
+    """
+    created = await create_tasks_async(
+        [
+            {
+                "description": description,
+                "project": project,
+                "due": due,
+                "priority": priority,
+                "tags": tags,
+            }
+        ]
+    )
+
+    if not created:
+        return None
+    return created[0]["uuid"]
+
+
+# ============================================================================
+# Modifications
+# ============================================================================
+
+
+async def mark_done_async(uuid: str) -> bool:
+    """Mark a task as done. Returns True on success."""
+    return await _write([uuid, "done"], "Error marking task done")
+
+
+async def defer_task_async(uuid: str, new_due: str) -> bool:
+    """Set a task's due date (e.g., 'tomorrow', '2025-10-15'). Returns True on success."""
+    return await _write([uuid, "modify", f"due:{new_due}"], "Error deferring task")
+
+
+async def set_priority_async(uuid: str, priority: str) -> bool:
+    """Set task priority (H/M/L, or '' to clear). Returns True on success."""
+    return await _write([uuid, "modify", f"priority:{priority}"], "Error setting priority")
+
+
+async def delete_task_async(uuid: str) -> bool:
+    """Delete a task. Returns True on success."""
+    return await _write(
+        ["rc.confirmation=off", uuid, "delete"], "Error deleting task"
+    )
+
+
+async def modify_task_async(uuid: str, **kwargs) -> bool:
+    """
+    Modify task properties (same keyword arguments as modify_task()).
+
+    Args:
+        uuid: Task UUID
+        **kwargs: Task properties to modify; None values are skipped
+
+    Returns:
+        True on success, False on failure
+    """
+    args = [uuid, "modify"]
+    for key, value in kwargs.items():
+        if value is None:
+            continue
+        args.append(f"{key}:{value}")
+
+    return await _write(args, "Error modifying task")
+
+
+async def add_annotation_async(uuid: str, annotation: str) -> bool:
+    """Add an annotation to a task. Returns True on success."""
+    return await _write([uuid, "annotate", annotation], "Error adding annotation")
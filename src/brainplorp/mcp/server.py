@@ -2,12 +2,15 @@
 plorp MCP Server.
 
 Model Context Protocol server exposing plorp workflows to Claude Desktop.
-All tools are async wrappers around synchronous core functions.
+All tools are async. TaskWarrior task operations await the asyncio client
+(integrations/taskwarrior_async.py); other workflows that shell out to
+TaskWarrior run in a worker thread so the stdio event loop stays responsive.
 
 Q19: Config loaded once on startup, cached for all tool calls.
 Q25: Errors logged to ~/.config/plorp/mcp.log for debugging.
 """
 
+import asyncio
 import logging
 from datetime import date, datetime
 from pathlib import Path
@@ -21,12 +24,15 @@ from brainplorp.config import load_config
 from brainplorp.core import (
     # Workflows
     start_day,
+    refresh_day,
+    start_days,
     get_review_tasks,
+    get_review_backlog,
     add_review_notes,
-    mark_completed,
-    defer_task,
-    drop_task,
-    set_priority,
+    mark_completed_async as mark_completed,
+    defer_task_async as defer_task,
+    drop_task_async as drop_task,
+    set_priority_async as set_priority,
     get_inbox_items,
     create_task_from_inbox,
     create_note_from_inbox,
@@ -38,7 +44,11 @@ from brainplorp.core import (
     # Exceptions
     PlorpError,
 )
-from brainplorp.core.process import process_daily_note_step1, process_daily_note_step2
+from brainplorp.core.process import (
+    process_all_daily_notes,
+    process_daily_note_step1,
+    process_daily_note_step2,
+)
 from brainplorp.core.projects import (
     # Project management (Sprint 8)
     create_project,
@@ -60,8 +70,10 @@ from brainplorp.core.note_operations import (
     append_to_note,
     update_note_section,
     search_notes_by_metadata,
+    search_notes,
     create_note_in_folder,
     list_vault_folders,
+    load_parsed_note,
 )
 from brainplorp.parsers.note_structure import (
     # Pattern matching (Sprint 9 Phase 2)
@@ -70,7 +82,15 @@ from brainplorp.parsers.note_structure import (
     detect_project_headers,
     extract_bullet_points,
 )
-from brainplorp.integrations.taskwarrior import get_task_info as tw_get_task_info
+from brainplorp.integrations.task_metrics import (
+    get_command_stats,
+    reset_command_stats,
+    start_run,
+)
+from brainplorp.integrations.note_cache import get_note_cache_stats, reset_note_cache_stats
+from brainplorp.integrations.taskwarrior import get_snapshot_stats, reset_snapshot_stats
+from brainplorp.integrations.taskwarrior_async import get_task_info_async as tw_get_task_info
+from brainplorp.utils.files import get_write_stats, reset_write_stats
 
 
 logger = logging.getLogger("plorp.mcp")
@@ -107,8 +127,34 @@ async def list_tools() -> list[Tool]:
                     "date": {
                         "type": "string",
                         "description": "Date for daily note in YYYY-MM-DD format (defaults to today)",
-                    }
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "If the note exists, update its task sections in place instead of failing: adds new tasks, drops completed ones, keeps user text, and skips the write when nothing changed (default: false)",
+                    },
+                },
+            },
+        ),
+        Tool(
+            name="plorp_start_days",
+            description="Generate daily notes for a range of dates (e.g. planning a week) from a single TaskWarrior export. Returns per-day summaries; existing notes are skipped, or refreshed in place when refresh is true.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "start_date": {
+                        "type": "string",
+                        "description": "First date in YYYY-MM-DD format",
+                    },
+                    "end_date": {
+                        "type": "string",
+                        "description": "Last date (inclusive) in YYYY-MM-DD format",
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Refresh existing notes in place instead of skipping them (default: false)",
+                    },
                 },
+                "required": ["start_date", "end_date"],
             },
         ),
         Tool(
@@ -125,6 +171,24 @@ async def list_tools() -> list[Tool]:
                 "required": [],
             },
         ),
+        Tool(
+            name="plorp_get_review_backlog",
+            description="Get one merged review queue across every daily note in a date range (e.g. after skipping reviews for a week). Each task appears once and lists the days it was left unchecked; tasks already completed or deleted are left out.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "since": {
+                        "type": "string",
+                        "description": "First date to include in YYYY-MM-DD format",
+                    },
+                    "until": {
+                        "type": "string",
+                        "description": "Last date to include in YYYY-MM-DD format (defaults to today)",
+                    },
+                },
+                "required": ["since"],
+            },
+        ),
         Tool(
             name="plorp_add_review_notes",
             description="Add reflection notes to daily note after review. Appends review section with reflections on what went well, what could improve, and notes for tomorrow.",
@@ -428,6 +492,11 @@ async def list_tools() -> list[Tool]:
                 },
             },
         ),
+        Tool(
+            name="plorp_process_all_daily_notes",
+            description="Run Step 1 of plorp_process_daily_note across every daily note: scan for informal tasks and add a TBD Processing section to each note with new proposals. Notes that already have a TBD section, or are unchanged since the last vault-wide scan, are skipped. Approve with [Y]/[N] and run plorp_process_daily_note per date for Step 2.",
+            inputSchema={"type": "object", "properties": {}},
+        ),
         # ====================================================================
         # Project Management Tools (Sprint 8)
         # ====================================================================
@@ -628,7 +697,7 @@ async def list_tools() -> list[Tool]:
         ),
         Tool(
             name="plorp_read_folder",
-            description="Read all notes in folder with filtering. Returns list of notes with metadata. Useful for exploring vault structure or finding notes in specific locations.",
+            description="Read all notes in folder with filtering. Returns one page of notes with metadata plus next_cursor for the following page. Useful for exploring vault structure or finding notes in specific locations.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -654,6 +723,15 @@ async def list_tools() -> list[Tool]:
                         "description": "Content mode for each note (default: metadata)",
                         "enum": ["full", "preview", "metadata", "structure"],
                     },
+                    "sort": {
+                        "type": "string",
+                        "description": "Order: name (A-Z, default) or mtime (newest first)",
+                        "enum": ["name", "mtime"],
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "next_cursor from the previous page to continue listing",
+                    },
                 },
                 "required": ["path"],
             },
@@ -716,9 +794,31 @@ async def list_tools() -> list[Tool]:
                 "required": ["tag"],
             },
         ),
+        Tool(
+            name="plorp_search_notes",
+            description="Full-text search across note titles, headers, bodies and frontmatter in allowed folders. Returns best matches first (BM25) with a snippet of the matching text, so you can find notes without reading folders note by note.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Search terms; all must match. End a term with * for prefix matching (e.g. 'launch plan*')",
+                    },
+                    "folder": {
+                        "type": "string",
+                        "description": "Only search this folder (e.g. 'notes' or 'projects/work')",
+                    },
+                    "limit": {
+                        "type": "number",
+                        "description": "Max results (default: 20)",
+                    },
+                },
+                "required": ["query"],
+            },
+        ),
         Tool(
             name="plorp_search_notes_by_field",
-            description="Find notes by frontmatter field value. Returns list of matching notes. Useful for finding notes with specific metadata (status, category, etc).",
+            description="Find notes by frontmatter field value. Returns list of matching notes. Useful for finding notes with specific metadata (status, category, etc). Supports exact, prefix and range matches (e.g. due dates before a given date) with sorting.",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -730,6 +830,20 @@ async def list_tools() -> list[Tool]:
                         "type": "string",
                         "description": "Value to match",
                     },
+                    "op": {
+                        "type": "string",
+                        "enum": ["eq", "prefix", "gt", "gte", "lt", "lte"],
+                        "description": "Comparison (default: eq; list fields match any element)",
+                    },
+                    "sort": {
+                        "type": "string",
+                        "enum": ["path", "title", "word_count", "created", "modified"],
+                        "description": "Sort order (default: path)",
+                    },
+                    "descending": {
+                        "type": "boolean",
+                        "description": "Reverse the sort order (default: false)",
+                    },
                     "limit": {
                         "type": "number",
                         "description": "Max results (default: 20)",
@@ -783,14 +897,18 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "content": {
                         "type": "string",
-                        "description": "Markdown content to parse",
+                        "description": "Markdown content to parse (or give path instead)",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Relative path to a vault note to parse instead of content (cached, so repeated calls on one note are cheap)",
                     },
                     "level": {
                         "type": "number",
                         "description": "Filter by header level (1-6), omit for all levels",
                     },
                 },
-                "required": ["content"],
+                "required": [],
             },
         ),
         Tool(
@@ -801,14 +919,18 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "content": {
                         "type": "string",
-                        "description": "Markdown content to parse",
+                        "description": "Markdown content to parse (or give path instead)",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Relative path to a vault note to parse instead of content (cached, so repeated calls on one note are cheap)",
                     },
                     "header": {
                         "type": "string",
                         "description": "Header text to find (without # prefix)",
                     },
                 },
-                "required": ["content", "header"],
+                "required": ["header"],
             },
         ),
         Tool(
@@ -819,10 +941,14 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "content": {
                         "type": "string",
-                        "description": "Markdown content to analyze (typically from daily note)",
+                        "description": "Markdown content to analyze (typically from daily note) (or give path instead)",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Relative path to a vault note to parse instead of content (cached, so repeated calls on one note are cheap)",
                     },
                 },
-                "required": ["content"],
+                "required": [],
             },
         ),
         Tool(
@@ -833,14 +959,31 @@ async def list_tools() -> list[Tool]:
                 "properties": {
                     "content": {
                         "type": "string",
-                        "description": "Markdown content to parse",
+                        "description": "Markdown content to parse (or give path instead)",
+                    },
+                    "path": {
+                        "type": "string",
+                        "description": "Relative path to a vault note to parse instead of content (cached, so repeated calls on one note are cheap)",
                     },
                     "section": {
                         "type": "string",
                         "description": "Header name to extract bullets from (optional, omit for all bullets)",
                     },
                 },
-                "required": ["content"],
+                "required": [],
+            },
+        ),
+        Tool(
+            name="plorp_get_perf_stats",
+            description="Get TaskWarrior performance stats for this server process: call counts, errors, p50/p95/p99 latency and bytes per subcommand (export, add, modify, done, annotate, sync, ...), plus task snapshot cache hit rates, vault writes performed vs. skipped as unchanged, and parsed-note cache hit rate and size.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "reset": {
+                        "type": "boolean",
+                        "description": "Clear the counters after reading them (default: false)",
+                    },
+                },
             },
         ),
     ]
@@ -854,11 +997,16 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
     All tools return JSON-serialized results wrapped in TextContent.
     Exceptions are caught and converted to ValueError per Q3 decision.
     """
+    start_run(name)
     try:
         if name == "plorp_start_day":
             return await _plorp_start_day(arguments)
+        elif name == "plorp_start_days":
+            return await _plorp_start_days(arguments)
         elif name == "plorp_get_review_tasks":
             return await _plorp_get_review_tasks(arguments)
+        elif name == "plorp_get_review_backlog":
+            return await _plorp_get_review_backlog(arguments)
         elif name == "plorp_add_review_notes":
             return await _plorp_add_review_notes(arguments)
         elif name == "plorp_mark_task_completed":
@@ -889,6 +1037,8 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
             return await _plorp_get_task_info(arguments)
         elif name == "plorp_process_daily_note":
             return await _plorp_process_daily_note(arguments)
+        elif name == "plorp_process_all_daily_notes":
+            return await _plorp_process_all_daily_notes(arguments)
         # Project management tools (Sprint 8)
         elif name == "plorp_create_project":
             return await _plorp_create_project(arguments)
@@ -922,6 +1072,8 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
             return await _plorp_update_note_section(arguments)
         elif name == "plorp_search_notes_by_tag":
             return await _plorp_search_notes_by_tag(arguments)
+        elif name == "plorp_search_notes":
+            return await _plorp_search_notes(arguments)
         elif name == "plorp_search_notes_by_field":
             return await _plorp_search_notes_by_field(arguments)
         elif name == "plorp_create_note_in_folder":
@@ -937,6 +1089,8 @@ async def call_tool(name: str, arguments: Dict[str, Any]) -> list[TextContent]:
             return await _plorp_detect_projects_in_note(arguments)
         elif name == "plorp_extract_bullets":
             return await _plorp_extract_bullets(arguments)
+        elif name == "plorp_get_perf_stats":
+            return await _plorp_get_perf_stats(arguments)
         else:
             raise ValueError(f"Unknown tool: {name}")
 
@@ -960,7 +1114,24 @@ async def _plorp_start_day(args: Dict[str, Any]) -> list[TextContent]:
     target_date = date.fromisoformat(args["date"]) if "date" in args else date.today()
     vault = _get_vault_path()
 
-    result = start_day(target_date, vault)
+    if args.get("refresh", False):
+        result = await asyncio.to_thread(refresh_day, target_date, vault)
+    else:
+        result = await asyncio.to_thread(start_day, target_date, vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_start_days(args: Dict[str, Any]) -> list[TextContent]:
+    """Generate daily notes for a date range."""
+    start_date = date.fromisoformat(args["start_date"])
+    end_date = date.fromisoformat(args["end_date"])
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(
+        start_days, start_date, end_date, vault, args.get("refresh", False)
+    )
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -971,7 +1142,19 @@ async def _plorp_get_review_tasks(args: Dict[str, Any]) -> list[TextContent]:
     target_date = date.fromisoformat(args["date"]) if "date" in args else date.today()
     vault = _get_vault_path()
 
-    result = get_review_tasks(target_date, vault)
+    result = await asyncio.to_thread(get_review_tasks, target_date, vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_get_review_backlog(args: Dict[str, Any]) -> list[TextContent]:
+    """Get merged review queue across daily notes."""
+    since = date.fromisoformat(args["since"])
+    until = date.fromisoformat(args["until"]) if "until" in args else None
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(get_review_backlog, since, vault, until)
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -998,7 +1181,7 @@ async def _plorp_mark_task_completed(args: Dict[str, Any]) -> list[TextContent]:
     """Mark task completed."""
     # Sprint 8.5: Pass vault_path for State Sync
     vault = _get_vault_path()
-    result = mark_completed(args["uuid"], vault_path=vault)
+    result = await mark_completed(args["uuid"], vault_path=vault)
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -1007,7 +1190,7 @@ async def _plorp_mark_task_completed(args: Dict[str, Any]) -> list[TextContent]:
 async def _plorp_defer_task(args: Dict[str, Any]) -> list[TextContent]:
     """Defer task."""
     new_due = date.fromisoformat(args["new_due"])
-    result = defer_task(args["uuid"], new_due)
+    result = await defer_task(args["uuid"], new_due)
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -1017,7 +1200,7 @@ async def _plorp_drop_task(args: Dict[str, Any]) -> list[TextContent]:
     """Drop task."""
     # Sprint 8.5: Pass vault_path for State Sync
     vault = _get_vault_path()
-    result = drop_task(args["uuid"], vault_path=vault)
+    result = await drop_task(args["uuid"], vault_path=vault)
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -1025,7 +1208,7 @@ async def _plorp_drop_task(args: Dict[str, Any]) -> list[TextContent]:
 
 async def _plorp_set_task_priority(args: Dict[str, Any]) -> list[TextContent]:
     """Set task priority."""
-    result = set_priority(args["uuid"], args["priority"])
+    result = await set_priority(args["uuid"], args["priority"])
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -1046,7 +1229,8 @@ async def _plorp_create_task_from_inbox(args: Dict[str, Any]) -> list[TextConten
     """Create task from inbox."""
     vault = _get_vault_path()
 
-    result = create_task_from_inbox(
+    result = await asyncio.to_thread(
+        create_task_from_inbox,
         vault,
         args["item_text"],
         args["description"],
@@ -1079,7 +1263,8 @@ async def _plorp_create_both_from_inbox(args: Dict[str, Any]) -> list[TextConten
     """Create both task and note from inbox."""
     vault = _get_vault_path()
 
-    result = create_both_from_inbox(
+    result = await asyncio.to_thread(
+        create_both_from_inbox,
         vault,
         args["item_text"],
         args["task_description"],
@@ -1123,7 +1308,8 @@ async def _plorp_create_note_with_task(args: Dict[str, Any]) -> list[TextContent
     """Create note linked to task."""
     vault = _get_vault_path()
 
-    result = create_note_linked_to_task(
+    result = await asyncio.to_thread(
+        create_note_linked_to_task,
         vault,
         args["title"],
         args["task_uuid"],
@@ -1144,7 +1330,7 @@ async def _plorp_link_note_to_task(args: Dict[str, Any]) -> list[TextContent]:
     if not note_path.is_absolute():
         note_path = vault / note_path
 
-    result = link_note_to_task(vault, note_path, args["task_uuid"])
+    result = await asyncio.to_thread(link_note_to_task, vault, note_path, args["task_uuid"])
 
     import json
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
@@ -1152,7 +1338,7 @@ async def _plorp_link_note_to_task(args: Dict[str, Any]) -> list[TextContent]:
 
 async def _plorp_get_task_info(args: Dict[str, Any]) -> list[TextContent]:
     """Get task info."""
-    task = tw_get_task_info(args["uuid"])
+    task = await tw_get_task_info(args["uuid"])
 
     if not task:
         raise ValueError(f"Task not found: {args['uuid']}")
@@ -1187,7 +1373,7 @@ async def _plorp_process_daily_note(args: Dict[str, Any]) -> list[TextContent]:
     if has_tbd_section:
         # Step 2: Create tasks from approvals
         # Sprint 8.5: Pass vault for State Sync
-        result = process_daily_note_step2(note_path, target_date, vault)
+        result = await asyncio.to_thread(process_daily_note_step2, note_path, target_date, vault)
 
         # Build response message
         response = {
@@ -1202,7 +1388,7 @@ async def _plorp_process_daily_note(args: Dict[str, Any]) -> list[TextContent]:
         }
     else:
         # Step 1: Generate proposals
-        result = process_daily_note_step1(note_path, target_date)
+        result = await asyncio.to_thread(process_daily_note_step1, note_path, target_date)
 
         # Build response message
         response = {
@@ -1218,11 +1404,443 @@ async def _plorp_process_daily_note(args: Dict[str, Any]) -> list[TextContent]:
     return [TextContent(type="text", text=json.dumps(response, indent=2))]
 
 
+async def _plorp_process_all_daily_notes(args: Dict[str, Any]) -> list[TextContent]:
+    """Generate proposals for informal tasks across every daily note."""
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(process_all_daily_notes, vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 # ============================================================================
-# Server Entry Point
+# Project Management Tool Implementations (Sprint 8)
 # ============================================================================
 
 
+async def _plorp_create_project(args: Dict[str, Any]) -> list[TextContent]:
+    """Create project."""
+    project = create_project(
+        name=args["name"],
+        domain=args["domain"],
+        workstream=args.get("workstream"),
+        state=args.get("state", "active"),
+        description=args.get("description")
+    )
+
+    import json
+    return [TextContent(type="text", text=json.dumps(project, indent=2))]
+
+
+async def _plorp_list_projects(args: Dict[str, Any]) -> list[TextContent]:
+    """List projects with optional filters."""
+    result = list_projects(
+        domain=args.get("domain"),
+        state=args.get("state")
+    )
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_get_project_info(args: Dict[str, Any]) -> list[TextContent]:
+    """Get project info."""
+    project = get_project_info(args["full_path"])
+
+    if not project:
+        raise ValueError(f"Project not found: {args['full_path']}")
+
+    import json
+    return [TextContent(type="text", text=json.dumps(project, indent=2))]
+
+
+async def _plorp_update_project_state(args: Dict[str, Any]) -> list[TextContent]:
+    """Update project state."""
+    project = update_project_state(
+        full_path=args["full_path"],
+        state=args["state"]
+    )
+
+    import json
+    return [TextContent(type="text", text=json.dumps(project, indent=2))]
+
+
+async def _plorp_delete_project(args: Dict[str, Any]) -> list[TextContent]:
+    """Delete project."""
+    deleted = delete_project(args["full_path"])
+
+    result = {
+        "deleted": deleted,
+        "full_path": args["full_path"]
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_create_task_in_project(args: Dict[str, Any]) -> list[TextContent]:
+    """Create task in project with bidirectional linking."""
+    task_uuid = await asyncio.to_thread(
+        create_task_in_project,
+        description=args["description"],
+        project_full_path=args["project_full_path"],
+        due=args.get("due"),
+        priority=args.get("priority")
+    )
+
+    result = {
+        "task_uuid": task_uuid,
+        "project": args["project_full_path"]
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_list_project_tasks(args: Dict[str, Any]) -> list[TextContent]:
+    """List tasks for a project."""
+    tasks = await asyncio.to_thread(list_project_tasks, args["project_full_path"])
+
+    result = {
+        "tasks": tasks,
+        "count": len(tasks),
+        "project": args["project_full_path"]
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_set_focused_domain(args: Dict[str, Any]) -> list[TextContent]:
+    """Set focused domain for MCP conversation."""
+    domain = args["domain"]
+    set_focused_domain_mcp(domain)
+
+    result = {
+        "focused_domain": domain,
+        "message": f"Focused on domain: {domain}. All commands will default to this domain."
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_get_focused_domain(args: Dict[str, Any]) -> list[TextContent]:
+    """Get current focused domain."""
+    domain = get_focused_domain_mcp()
+
+    result = {
+        "focused_domain": domain,
+        "is_default": domain == "home"
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+# ============================================================================
+# Sprint 8.6: State Synchronization Tool Implementations
+# ============================================================================
+
+
+async def _plorp_sync_all_projects(args: Dict[str, Any]) -> list[TextContent]:
+    """
+    Sync all project note bodies with frontmatter.
+
+    Sprint 8.6: Bulk reconciliation after external TaskWarrior changes.
+    Updates Tasks section in all project notes to match task_uuids.
+    """
+    vault = _get_vault_path()
+    stats = await asyncio.to_thread(sync_all_projects, vault)
+
+    result = {
+        "synced_count": stats["synced"],
+        "changed_count": stats["changed"],
+        "unchanged_count": stats["unchanged"],
+        "timing_ms": stats["timing_ms"],
+        "errors_count": len(stats["errors"]),
+        "errors": [
+            {"project": project, "error": error}
+            for project, error in stats["errors"]
+        ]
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+# ============================================================================
+# Sprint 9: Note Management Tool Implementations
+# ============================================================================
+
+
+async def _plorp_read_note(args: Dict[str, Any]) -> list[TextContent]:
+    """Read note."""
+    vault = _get_vault_path()
+    mode = args.get("mode", "full")
+
+    result = read_note(vault, args["path"], mode)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_read_folder(args: Dict[str, Any]) -> list[TextContent]:
+    """Read folder."""
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(
+        read_folder,
+        vault,
+        args["path"],
+        recursive=args.get("recursive", False),
+        exclude=args.get("exclude"),
+        limit=args.get("limit", 10),
+        mode=args.get("mode", "metadata"),
+        sort=args.get("sort", "name"),
+        cursor=args.get("cursor"),
+    )
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_append_to_note(args: Dict[str, Any]) -> list[TextContent]:
+    """Append to note."""
+    vault = _get_vault_path()
+
+    append_to_note(vault, args["path"], args["content"])
+
+    result = {
+        "path": args["path"],
+        "action": "appended",
+        "message": f"Content appended to {args['path']}"
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_update_note_section(args: Dict[str, Any]) -> list[TextContent]:
+    """Update note section."""
+    vault = _get_vault_path()
+
+    update_note_section(vault, args["path"], args["header"], args["content"])
+
+    result = {
+        "path": args["path"],
+        "header": args["header"],
+        "action": "updated",
+        "message": f"Section '{args['header']}' updated in {args['path']}"
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_search_notes_by_tag(args: Dict[str, Any]) -> list[TextContent]:
+    """Search notes by tag."""
+    vault = _get_vault_path()
+    limit = args.get("limit", 20)
+
+    results = search_notes_by_metadata(vault, "tags", args["tag"], limit)
+
+    result = {
+        "tag": args["tag"],
+        "count": len(results),
+        "notes": results
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_search_notes(args: Dict[str, Any]) -> list[TextContent]:
+    """Full-text search of notes."""
+    vault = _get_vault_path()
+    limit = args.get("limit", 20)
+
+    results = await asyncio.to_thread(
+        search_notes, vault, args["query"], args.get("folder"), limit
+    )
+
+    result = {
+        "query": args["query"],
+        "count": len(results),
+        "notes": results,
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_search_notes_by_field(args: Dict[str, Any]) -> list[TextContent]:
+    """Search notes by field."""
+    vault = _get_vault_path()
+    limit = args.get("limit", 20)
+
+    results = await asyncio.to_thread(
+        search_notes_by_metadata,
+        vault,
+        args["field"],
+        args["value"],
+        limit,
+        op=args.get("op", "eq"),
+        sort=args.get("sort", "path"),
+        descending=args.get("descending", False),
+    )
+
+    result = {
+        "field": args["field"],
+        "value": args["value"],
+        "count": len(results),
+        "notes": results
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_create_note_in_folder(args: Dict[str, Any]) -> list[TextContent]:
+    """Create note in folder."""
+    vault = _get_vault_path()
+
+    note_path = create_note_in_folder(
+        vault,
+        args["folder"],
+        args["title"],
+        content=args.get("content", ""),
+        metadata=args.get("metadata"),
+    )
+
+    result = {
+        "path": str(note_path),
+        "folder": args["folder"],
+        "title": args["title"],
+        "action": "created",
+        "message": f"Note created at {note_path}"
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_list_vault_folders(args: Dict[str, Any]) -> list[TextContent]:
+    """List vault folders."""
+    vault = _get_vault_path()
+
+    result = list_vault_folders(vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+# ============================================================================
+# Sprint 9 Phase 2: Pattern Matching Tool Implementations
+# ============================================================================
+
+
+async def _load_note_arg(args: Dict[str, Any]):
+    """ParsedNote for a "path" argument (None when content was given instead)."""
+    if args.get("path") is None:
+        if args.get("content") is None:
+            raise ValueError("Either content or path is required")
+        return None
+
+    vault = _get_vault_path()
+    return await asyncio.to_thread(load_parsed_note, vault, args["path"])
+
+
+async def _plorp_extract_headers(args: Dict[str, Any]) -> list[TextContent]:
+    """Extract headers from content."""
+    note = await _load_note_arg(args)
+    if note is not None:
+        headers = note.headers(args.get("level"))
+    else:
+        headers = extract_headers(
+            content=args["content"],
+            level=args.get("level")
+        )
+
+    result = {
+        "headers": headers,
+        "count": len(headers)
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_get_section_content(args: Dict[str, Any]) -> list[TextContent]:
+    """Get section content by header."""
+    note = await _load_note_arg(args)
+    if note is not None:
+        section_content = note.section(args["header"])
+    else:
+        section_content = find_header_content(
+            content=args["content"],
+            header=args["header"]
+        )
+
+    result = {
+        "header": args["header"],
+        "content": section_content,
+        "found": bool(section_content)
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_detect_projects_in_note(args: Dict[str, Any]) -> list[TextContent]:
+    """Detect project headers in note."""
+    note = await _load_note_arg(args)
+    if note is not None:
+        projects = note.projects()
+    else:
+        projects = detect_project_headers(args["content"])
+
+    result = {
+        "projects": projects,
+        "count": len(projects)
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_extract_bullets(args: Dict[str, Any]) -> list[TextContent]:
+    """Extract bullet points from content."""
+    note = await _load_note_arg(args)
+    if note is not None:
+        bullets = note.bullets(args.get("section"))
+    else:
+        bullets = extract_bullet_points(
+            content=args["content"],
+            section=args.get("section")
+        )
+
+    result = {
+        "bullets": bullets,
+        "count": len(bullets),
+        "section": args.get("section")
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_process_all_daily_notes(args: Dict[str, Any]) -> list[TextContent]:
+    """Generate proposals for informal tasks across every daily note."""
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(process_all_daily_notes, vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 # ============================================================================
 # Project Management Tool Implementations (Sprint 8)
 # ============================================================================
@@ -1290,7 +1908,8 @@ async def _plorp_delete_project(args: Dict[str, Any]) -> list[TextContent]:
 
 async def _plorp_create_task_in_project(args: Dict[str, Any]) -> list[TextContent]:
     """Create task in project with bidirectional linking."""
-    task_uuid = create_task_in_project(
+    task_uuid = await asyncio.to_thread(
+        create_task_in_project,
         description=args["description"],
         project_full_path=args["project_full_path"],
         due=args.get("due"),
@@ -1308,7 +1927,7 @@ async def _plorp_create_task_in_project(args: Dict[str, Any]) -> list[TextConten
 
 async def _plorp_list_project_tasks(args: Dict[str, Any]) -> list[TextContent]:
     """List tasks for a project."""
-    tasks = list_project_tasks(args["project_full_path"])
+    tasks = await asyncio.to_thread(list_project_tasks, args["project_full_path"])
 
     result = {
         "tasks": tasks,
@@ -1360,10 +1979,13 @@ async def _plorp_sync_all_projects(args: Dict[str, Any]) -> list[TextContent]:
     Updates Tasks section in all project notes to match task_uuids.
     """
     vault = _get_vault_path()
-    stats = sync_all_projects(vault)
+    stats = await asyncio.to_thread(sync_all_projects, vault)
 
     result = {
         "synced_count": stats["synced"],
+        "changed_count": stats["changed"],
+        "unchanged_count": stats["unchanged"],
+        "timing_ms": stats["timing_ms"],
         "errors_count": len(stats["errors"]),
         "errors": [
             {"project": project, "error": error}
@@ -1395,13 +2017,16 @@ async def _plorp_read_folder(args: Dict[str, Any]) -> list[TextContent]:
     """Read folder."""
     vault = _get_vault_path()
 
-    result = read_folder(
+    result = await asyncio.to_thread(
+        read_folder,
         vault,
         args["path"],
         recursive=args.get("recursive", False),
         exclude=args.get("exclude"),
         limit=args.get("limit", 10),
         mode=args.get("mode", "metadata"),
+        sort=args.get("sort", "name"),
+        cursor=args.get("cursor"),
     )
 
     import json
@@ -1458,12 +2083,40 @@ async def _plorp_search_notes_by_tag(args: Dict[str, Any]) -> list[TextContent]:
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
+async def _plorp_search_notes(args: Dict[str, Any]) -> list[TextContent]:
+    """Full-text search of notes."""
+    vault = _get_vault_path()
+    limit = args.get("limit", 20)
+
+    results = await asyncio.to_thread(
+        search_notes, vault, args["query"], args.get("folder"), limit
+    )
+
+    result = {
+        "query": args["query"],
+        "count": len(results),
+        "notes": results,
+    }
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 async def _plorp_search_notes_by_field(args: Dict[str, Any]) -> list[TextContent]:
     """Search notes by field."""
     vault = _get_vault_path()
     limit = args.get("limit", 20)
 
-    results = search_notes_by_metadata(vault, args["field"], args["value"], limit)
+    results = await asyncio.to_thread(
+        search_notes_by_metadata,
+        vault,
+        args["field"],
+        args["value"],
+        limit,
+        op=args.get("op", "eq"),
+        sort=args.get("sort", "path"),
+        descending=args.get("descending", False),
+    )
 
     result = {
         "field": args["field"],
@@ -1578,6 +2231,35 @@ async def _plorp_extract_bullets(args: Dict[str, Any]) -> list[TextContent]:
     return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
 
+async def _plorp_process_all_daily_notes(args: Dict[str, Any]) -> list[TextContent]:
+    """Generate proposals for informal tasks across every daily note."""
+    vault = _get_vault_path()
+
+    result = await asyncio.to_thread(process_all_daily_notes, vault)
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
+async def _plorp_get_perf_stats(args: Dict[str, Any]) -> list[TextContent]:
+    """Report TaskWarrior command, snapshot cache, vault write and note cache stats."""
+    result = {
+        "commands": get_command_stats(),
+        "snapshot": get_snapshot_stats(),
+        "vault_writes": get_write_stats(),
+        "note_cache": get_note_cache_stats(),
+    }
+
+    if args.get("reset", False):
+        reset_command_stats()
+        reset_snapshot_stats()
+        reset_write_stats()
+        reset_note_cache_stats()
+
+    import json
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 # ============================================================================
 # Server Entry Point
 # ============================================================================
@@ -4,12 +4,234 @@
 NLP Parser for Task Processing (Sprint 7).
 
 Provides natural language parsing for:
-- Due dates (today, tomorrow, weekday names)
+- Due dates (today, tomorrow, weekday names, ISO dates, "in N days/weeks",
+  month-day like "Oct 15", "end of week")
 - Priority keywords (urgent, important, etc.)
 - Clean description extraction
+
+parse_task_text() does all three in one scan with a single precompiled
+pattern; parse_due_date() and parse_priority_keywords() are views of it.
 """
 import re
 from datetime import date, timedelta
+from typing import Optional, TypedDict
+
+
+class ParsedTaskText(TypedDict):
+    """Result of parse_task_text()."""
+
+    due: Optional[str]  # YYYY-MM-DD, or None
+    due_ok: bool  # False if an unparseable date was detected (NEEDS_REVIEW)
+    date_phrase: Optional[str]  # Text the due date was parsed from (e.g., "next Monday")
+    priority: str  # "H", "M" or "L"
+    priority_keyword: Optional[str]  # Keyword that set the priority (lowercase)
+    description: str  # Text with the parsed date phrase and priority keywords removed
+
+
+WEEKDAYS = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
+
+PRIORITY_KEYWORDS = {"urgent": "H", "critical": "H", "asap": "H", "important": "M"}
+
+_PRIORITY_RANK = {"L": 0, "M": 1, "H": 2}
+
+_WEEKDAY = "|".join(WEEKDAYS)
+_MONTH = (
+    r"jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+
+# One alternation for every token the parser cares about. Date rules are
+# ranked by _DATE_RANK; priority keywords and the date-preposition fallback
+# are picked up in the same pass. The preposition only looks ahead so that
+# "on Friday" still yields the weekday token.
+_TOKENS = re.compile(
+    rf"""
+    \b(?:
+        (?P<today>today)\b
+      | (?P<tomorrow>tomorrow)\b
+      | next\s+(?P<next_weekday>{_WEEKDAY})\b
+      | (?P<weekday>{_WEEKDAY})\b
+      | (?P<iso>\d{{4}}-\d{{2}}-\d{{2}})\b
+      | (?P<in_n>in\s+(\d{{1,3}})\s+(days?|weeks?))\b
+      | (?P<month_day>({_MONTH})\.?\s+(\d{{1,2}})(?:st|nd|rd|th)?)\b
+      | (?P<end_of_week>end\s+of\s+(?:the\s+)?week)\b
+      | (?P<priority>urgent|critical|asap|important)\b
+      | (?P<preposition>on|by|at)(?=\s+\S)
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE,
+)
+
+# Lower rank wins; ties go to the earliest match in the text
+_DATE_RANK = {
+    "today": 0,
+    "tomorrow": 1,
+    "next_weekday": 2,
+    "weekday": 3,
+    "iso": 4,
+    "month_day": 5,
+    "in_n": 6,
+    "end_of_week": 7,
+}
+
+_PRIORITY_WORDS = re.compile(r"\b(?:urgent|critical|asap|important)\b", re.IGNORECASE)
+_CONNECTORS = frozenset({"on", "at", "by", "for"})
+
+
+def _days_until(reference_date: date, weekday: int) -> date:
+    """Next occurrence of a weekday, skipping the reference date itself (Q12)."""
+    days_ahead = (weekday - reference_date.weekday()) % 7
+    return reference_date + timedelta(days=days_ahead or 7)
+
+
+def _resolve_date(rule: str, phrase: str, reference_date: date) -> Optional[date]:
+    """Turn a matched date token into a date (None if it names no real date)."""
+    if rule == "today":
+        return reference_date
+    if rule == "tomorrow":
+        return reference_date + timedelta(days=1)
+    if rule in ("next_weekday", "weekday"):
+        return _days_until(reference_date, WEEKDAYS[phrase.split()[-1].lower()])
+    if rule == "iso":
+        try:
+            return date.fromisoformat(phrase)
+        except ValueError:
+            return None
+    if rule == "in_n":
+        _, count, unit = phrase.lower().split()
+        days = int(count) * (7 if unit.startswith("week") else 1)
+        return reference_date + timedelta(days=days)
+    if rule == "month_day":
+        month_name, day = phrase.split()
+        month = MONTHS[month_name[:3].lower()]
+        day = int(day.rstrip("stndrh"))
+        for year in (reference_date.year, reference_date.year + 1):
+            try:
+                candidate = date(year, month, day)
+            except ValueError:
+                return None
+            # Month-day without a year means the next one on or after today
+            if candidate >= reference_date:
+                return candidate
+        return None
+    if rule == "end_of_week":
+        # Friday of this week (today if it is Friday); weekends roll to next Friday
+        return reference_date + timedelta(days=(4 - reference_date.weekday()) % 7)
+    return None
+
+
+def parse_task_text(text: str, reference_date: date) -> ParsedTaskText:
+    """
+    Extract due date, priority and clean description in one scan.
+
+    Args:
+        text: Task text to parse
+        reference_date: Reference date for relative parsing (usually today)
+
+    Returns:
+        ParsedTaskText with due (YYYY-MM-DD or None), due_ok, date_phrase,
+        priority, priority_keyword and description
+
+    Date precedence when several phrases appear: today, tomorrow,
+    "next <weekday>", <weekday>, ISO date, month-day, "in N days/weeks",
+    "end of week"; the earliest occurrence wins within a rule. A date
+    preposition (on/by/at) followed by anything unrecognized marks the
+    date as unparseable when no date was found. A recognized phrase that
+    names an impossible date (e.g., "2025-02-30", "Feb 30") is also
+    unparseable.
+
+    Example:
+        >>> parse_task_text("urgent send report in 2 weeks", date(2025, 10, 6))
+        {"due": "2025-10-20", "due_ok": True, "date_phrase": "in 2 weeks",
+         "priority": "H", "priority_keyword": "urgent",
+         "description": "send report"}
+    """
+    if not text:
+        return {
+            "due": None,
+            "due_ok": True,
+            "date_phrase": None,
+            "priority": "L",
+            "priority_keyword": None,
+            "description": "",
+        }
+
+    best_rule: Optional[str] = None
+    best_rank = len(_DATE_RANK)
+    best_span = (0, 0)
+    priority = "L"
+    priority_keyword: Optional[str] = None
+    priority_spans = []
+    saw_preposition = False
+
+    for match in _TOKENS.finditer(text):
+        # Inner unnamed groups don't change lastgroup: it is always the rule
+        rule = match.lastgroup
+        if rule == "priority":
+            keyword = match.group(rule).lower()
+            level = PRIORITY_KEYWORDS[keyword]
+            if _PRIORITY_RANK[level] > _PRIORITY_RANK[priority]:
+                priority, priority_keyword = level, keyword
+            priority_spans.append(match.span())
+        elif rule == "preposition":
+            saw_preposition = True
+        elif _DATE_RANK[rule] < best_rank:
+            best_rule, best_rank, best_span = rule, _DATE_RANK[rule], match.span()
+
+    due: Optional[date] = None
+    date_phrase: Optional[str] = None
+    removed = priority_spans
+    if best_rule is not None:
+        date_phrase = text[best_span[0] : best_span[1]]
+        due = _resolve_date(best_rule, date_phrase, reference_date)
+        if due is not None:
+            # Spans never overlap: each comes from the same finditer pass
+            removed = sorted(priority_spans + [best_span])
+
+    due_ok = due is not None if best_rule is not None else not saw_preposition
+
+    return {
+        "due": due.isoformat() if due else None,
+        "due_ok": due_ok,
+        "date_phrase": date_phrase,
+        "priority": priority,
+        "priority_keyword": priority_keyword,
+        "description": _clean(_cut(text, removed)),
+    }
+
+
+def _cut(text: str, spans: list) -> str:
+    """Remove sorted, non-overlapping (start, end) spans from text."""
+    if not spans:
+        return text
+    pieces = []
+    position = 0
+    for start, end in spans:
+        pieces.append(text[position:start])
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
+
+
+def _clean(text: str) -> str:
+    """Drop a dangling connector and collapse whitespace."""
+    words = text.split()
+    if words and words[-1].lower() in _CONNECTORS:
+        words.pop()
+    return " ".join(words)
 
 
 def parse_due_date(text: str, reference_date: date) -> tuple[str | None, bool]:
@@ -30,6 +252,10 @@ def parse_due_date(text: str, reference_date: date) -> tuple[str | None, bool]:
         - "tomorrow" → reference_date + 1 day
         - "Friday", "Monday", etc. → next occurrence (skip today per Q12)
         - "next Monday" → next occurrence of Monday
+        - "2025-11-03" → that date
+        - "Nov 3", "November 3rd" → next Nov 3 on or after reference_date
+        - "in 3 days", "in 2 weeks" → reference_date + N days/weeks
+        - "end of week" → Friday of the reference week
 
     Examples:
         >>> parse_due_date("call mom today", date(2025, 10, 7))
@@ -41,69 +267,8 @@ def parse_due_date(text: str, reference_date: date) -> tuple[str | None, bool]:
         >>> parse_due_date("buy groceries", date(2025, 10, 7))
         (None, True)  # No date found, not an error
     """
-    if not text:
-        return (None, True)
-
-    text_lower = text.lower()
-
-    # Pattern 1: "today"
-    if "today" in text_lower:
-        return (reference_date.strftime("%Y-%m-%d"), True)
-
-    # Pattern 2: "tomorrow"
-    if "tomorrow" in text_lower:
-        tomorrow = reference_date + timedelta(days=1)
-        return (tomorrow.strftime("%Y-%m-%d"), True)
-
-    # Pattern 3: Weekday names (Monday, Tuesday, etc.)
-    weekdays = {
-        "monday": 0,
-        "tuesday": 1,
-        "wednesday": 2,
-        "thursday": 3,
-        "friday": 4,
-        "saturday": 5,
-        "sunday": 6,
-    }
-
-    # Check for "next [weekday]" pattern
-    next_pattern_found = False
-    for weekday_name in weekdays.keys():
-        if f"next {weekday_name}" in text_lower:
-            # "next Monday" always means next occurrence (7 days if today is Monday)
-            target_weekday = weekdays[weekday_name]
-            current_weekday = reference_date.weekday()
-            days_ahead = (target_weekday - current_weekday) % 7
-            if days_ahead == 0:
-                days_ahead = 7  # Skip today, go to next week (Q12)
-            target_date = reference_date + timedelta(days=days_ahead)
-            return (target_date.strftime("%Y-%m-%d"), True)
-
-    # Check for standalone weekday names
-    for weekday_name, weekday_num in weekdays.items():
-        # Use word boundaries to avoid matching partial words
-        if re.search(rf"\b{weekday_name}\b", text_lower):
-            current_weekday = reference_date.weekday()
-            days_ahead = (weekday_num - current_weekday) % 7
-
-            # Q12: If same weekday, skip to next occurrence
-            if days_ahead == 0:
-                days_ahead = 7
-
-            target_date = reference_date + timedelta(days=days_ahead)
-            return (target_date.strftime("%Y-%m-%d"), True)
-
-    # Check for unparseable date patterns
-    # If there's text after date prepositions that we couldn't parse, mark as error
-    date_preposition_pattern = r"\b(on|by|at)\s+(\S+)"
-    preposition_match = re.search(date_preposition_pattern, text_lower)
-    if preposition_match:
-        # Found a date preposition, but didn't match any known patterns
-        # This suggests an unparseable date (e.g., "on Invalid-Date")
-        return (None, False)
-
-    # No date pattern found - this is OK, not an error
-    return (None, True)
+    parsed = parse_task_text(text, reference_date)
+    return (parsed["due"], parsed["due_ok"])
 
 
 def parse_priority_keywords(text: str) -> str:
@@ -134,18 +299,14 @@ def parse_priority_keywords(text: str) -> str:
     if not text:
         return "L"
 
-    text_lower = text.lower()
-
-    # High priority keywords (word boundaries to avoid false positives like "urgently")
-    if re.search(r"\b(urgent|critical|asap)\b", text_lower):
-        return "H"
+    priority = "L"
+    for match in _PRIORITY_WORDS.finditer(text):
+        level = PRIORITY_KEYWORDS[match.group(0).lower()]
+        if level == "H":
+            return "H"
+        priority = level
 
-    # Medium priority keywords
-    if re.search(r"\b(important)\b", text_lower):
-        return "M"
-
-    # Default priority
-    return "L"
+    return priority
 
 
 def extract_clean_description(text: str, parsed_date_keyword: str | None) -> str:
@@ -188,18 +349,11 @@ def extract_clean_description(text: str, parsed_date_keyword: str | None) -> str
         cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
 
     # Remove priority keywords (always remove these)
-    priority_keywords = ["urgent", "critical", "asap", "important"]
-    for keyword in priority_keywords:
-        pattern = rf"\b{keyword}\b"
-        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE)
+    cleaned = _PRIORITY_WORDS.sub("", cleaned)
 
     # Remove common connecting words that may be left over
     # e.g., "call mom on today" → "call mom on" → "call mom"
-    cleaned = re.sub(r"\b(on|at|by|for)\s*$", "", cleaned, flags=re.IGNORECASE)
-
-    # Clean up extra whitespace
-    cleaned = re.sub(r"\s+", " ", cleaned)  # Multiple spaces → single space
-    cleaned = cleaned.strip()  # Remove leading/trailing spaces
+    cleaned = _clean(cleaned)
 
     return cleaned
 
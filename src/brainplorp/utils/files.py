@@ -4,9 +4,21 @@
 File I/O utilities.
 
 Helper functions for reading and writing files in the Obsidian vault.
+
+Vault writes go through write_file(), which skips writes whose bytes match
+what is already on disk and otherwise writes a temp file in the same
+directory and os.replace()s it over the target. A no-op write therefore
+leaves the note's mtime untouched, so sync tools (Self-hosted LiveSync,
+iCloud, ...) don't replicate a new revision, and readers never see a
+half-written note. get_write_stats() reports performed vs. skipped writes.
 """
+import os
+import threading
 from pathlib import Path
-from typing import Union
+from typing import Dict, Union
+
+_stats_lock = threading.Lock()
+_write_stats = {"written": 0, "skipped": 0, "bytes_written": 0}
 
 
 def read_file(path: Union[str, Path]) -> str:
@@ -31,14 +43,17 @@ def read_file(path: Union[str, Path]) -> str:
     return path.read_text(encoding="utf-8")
 
 
-def write_file(path: Union[str, Path], content: str) -> None:
+def write_file(path: Union[str, Path], content: str) -> bool:
     """
-    Write content to file, overwriting if exists.
+    Write content to file atomically, skipping the write if unchanged.
 
     Args:
         path: Path to file to write
         content: Content to write
 
+    Returns:
+        True if the file was written, False if it already held this content
+
     Raises:
         IOError: If file can't be written
 
@@ -46,7 +61,64 @@ def write_file(path: Union[str, Path], content: str) -> None:
         >>> write_file('vault/daily/2025-10-06.md', '# Daily Note\\n\\n...')
     """
     path = Path(path)
-    path.write_text(content, encoding="utf-8")
+    data = content.encode("utf-8")
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        stat = None
+
+    # Size check first: most real edits change the length, so the old
+    # content only has to be read when the sizes match
+    if stat is not None and stat.st_size == len(data):
+        try:
+            unchanged = path.read_bytes() == data
+        except OSError:
+            unchanged = False
+        if unchanged:
+            _count("skipped")
+            return False
+
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+        if stat is not None:
+            os.chmod(tmp, stat.st_mode & 0o7777)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+    _count("written", len(data))
+    return True
+
+
+def _count(outcome: str, size: int = 0) -> None:
+    with _stats_lock:
+        _write_stats[outcome] += 1
+        _write_stats["bytes_written"] += size
+
+
+def get_write_stats() -> Dict[str, int]:
+    """
+    Get vault write counters for this process.
+
+    Returns:
+        Dict with written, skipped (identical content) and bytes_written
+    """
+    with _stats_lock:
+        return dict(_write_stats)
+
+
+def reset_write_stats() -> None:
+    """Clear vault write counters."""
+    with _stats_lock:
+        for key in _write_stats:
+            _write_stats[key] = 0
 
 
 def ensure_directory(path: Union[str, Path]) -> None:
@@ -8,6 +8,58 @@ from pathlib import Path
 import json
 
 
+@pytest.fixture(autouse=True)
+def isolated_task_snapshot(monkeypatch):
+    """
+    Keep tests hermetic from any local TaskWarrior database.
+
+    Disables the TaskChampion-backed snapshot (marker unavailable) and the
+    SQLite read backend, keeps the perf log off, and clears the snapshot around each test. Tests exercising the snapshot patch
+    get_operations_marker themselves.
+    """
+    from brainplorp.integrations import taskwarrior
+
+    monkeypatch.setattr(taskwarrior, "get_operations_marker", lambda *a, **kw: None)
+    monkeypatch.delenv("BRAINPLORP_TASK_BACKEND", raising=False)
+    monkeypatch.delenv("BRAINPLORP_PERF_LOG", raising=False)
+    taskwarrior._snapshot.invalidate()
+    taskwarrior._snapshot.reset_stats()
+    yield
+    taskwarrior._snapshot.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def isolated_project_index(monkeypatch, tmp_path_factory):
+    """Keep the persisted project index out of the real config directory."""
+    from brainplorp.integrations import project_index
+
+    index_dir = tmp_path_factory.mktemp("project_index")
+    monkeypatch.setattr(project_index, "get_index_dir", lambda: index_dir)
+    project_index.clear_cache()
+    yield
+    project_index.clear_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_note_index(monkeypatch, tmp_path_factory):
+    """Keep the SQLite note index out of the real config directory."""
+    from brainplorp.integrations import note_index
+
+    index_dir = tmp_path_factory.mktemp("note_index")
+    monkeypatch.setattr(note_index, "get_index_dir", lambda: index_dir)
+
+
+@pytest.fixture(autouse=True)
+def isolated_note_cache():
+    """Start each test with an empty parsed-note cache."""
+    from brainplorp.integrations import note_cache
+
+    note_cache.clear_note_cache()
+    note_cache.reset_note_cache_stats()
+    yield
+    note_cache.clear_note_cache()
+
+
 @pytest.fixture
 def fixture_dir():
     """Return path to test fixtures directory."""
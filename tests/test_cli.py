@@ -3,6 +3,8 @@
 """
 CLI smoke tests.
 """
+import json
+from datetime import date
 from unittest.mock import patch
 from click.testing import CliRunner
 from brainplorp.cli import cli
@@ -80,9 +82,197 @@ def test_start_command_file_exists_error():
             assert "already exists" in result.output.lower()
 
 
+def test_start_command_refresh():
+    """Test start --refresh calls refresh_day and reports an unchanged note."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        with patch("brainplorp.cli.refresh_day") as mock_refresh_day:
+            mock_load_config.return_value = {"vault_path": "/tmp/vault"}
+            mock_refresh_day.return_value = {
+                "note_path": "/tmp/vault/daily/2025-10-06.md",
+                "changed": False,
+                "added": 0,
+                "removed": 0,
+                "summary": {},
+            }
+
+            result = runner.invoke(cli, ["start", "--refresh"])
+
+            assert result.exit_code == 0
+            mock_refresh_day.assert_called_once()
+            assert "up to date" in result.output
+
+
+def test_start_command_range():
+    """Test start --range calls start_days with both dates."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        with patch("brainplorp.cli.start_days") as mock_start_days:
+            mock_load_config.return_value = {"vault_path": "/tmp/vault"}
+            mock_start_days.return_value = {
+                "start_date": "2026-10-19",
+                "end_date": "2026-10-20",
+                "days": [
+                    {
+                        "date": "2026-10-19",
+                        "status": "created",
+                        "summary": {
+                            "overdue_count": 1,
+                            "due_today_count": 2,
+                            "recurring_count": 0,
+                            "total_count": 3,
+                        },
+                    }
+                ],
+                "created_count": 1,
+                "refreshed_count": 0,
+                "unchanged_count": 0,
+                "skipped_count": 0,
+            }
+
+            result = runner.invoke(cli, ["start", "--range", "2026-10-19..2026-10-20"])
+
+            assert result.exit_code == 0
+            args, kwargs = mock_start_days.call_args
+            assert args[:2] == (date(2026, 10, 19), date(2026, 10, 20))
+            assert kwargs == {"refresh": False}
+            assert "2026-10-19" in result.output
+
+
+def test_start_command_invalid_range():
+    """Test start --range rejects malformed ranges."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        mock_load_config.return_value = {"vault_path": "/tmp/vault"}
+
+        result = runner.invoke(cli, ["start", "--range", "next week"])
+
+        assert result.exit_code != 0
+        assert "Invalid range" in result.output
+
+
+def test_process_command_all(tmp_path):
+    """Test process --all runs the vault-wide scan and lists updated notes."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        with patch("brainplorp.cli.process_all_daily_notes") as mock_all:
+            mock_load_config.return_value = {"vault_path": str(tmp_path)}
+            mock_all.return_value = {
+                "notes_total": 4,
+                "notes_scanned": 2,
+                "notes_unchanged": 1,
+                "notes_pending_review": 1,
+                "updated_notes": [
+                    {
+                        "note_path": str(tmp_path / "daily" / "2025-10-07.md"),
+                        "proposals_count": 3,
+                        "needs_review_count": 1,
+                    }
+                ],
+                "proposals_count": 3,
+                "needs_review_count": 1,
+            }
+
+            result = runner.invoke(cli, ["process", "--all"])
+
+            assert result.exit_code == 0
+            mock_all.assert_called_once_with(tmp_path.resolve())
+            assert "Scanned 2 of 4" in result.output
+            assert "2025-10-07" in result.output
+            assert "Added 3 proposal(s)" in result.output
+
+
+def test_search_command(tmp_path):
+    """Test search prints ranked hits with bold matches, or JSON."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+    hit = {
+        "path": "notes/launch.md",
+        "title": "Launch",
+        "score": -3.2,
+        "snippet": "the **launch** [plan]",
+        "word_count": 12,
+        "modified": "2025-10-07T09:00:00",
+    }
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        with patch("brainplorp.cli.search_notes", return_value=[hit]) as mock_search:
+            mock_load_config.return_value = {"vault_path": str(tmp_path)}
+
+            result = runner.invoke(cli, ["search", "launch", "plan", "--folder", "notes"])
+
+            assert result.exit_code == 0
+            mock_search.assert_called_once_with(
+                tmp_path.resolve(), "launch plan", folder="notes", limit=20
+            )
+            assert "notes/launch.md" in result.output
+            assert "[plan]" in result.output
+
+            result = runner.invoke(cli, ["search", "launch", "--format", "json"])
+            assert json.loads(result.output) == [hit]
+
+
+def test_process_command_all_rejects_date():
+    """Test process --all can't be combined with --date."""
+    from unittest.mock import patch
+
+    runner = CliRunner()
+
+    with patch("brainplorp.cli.load_config") as mock_load_config:
+        mock_load_config.return_value = {"vault_path": "/tmp/vault"}
+
+        result = runner.invoke(cli, ["process", "--all", "--date", "2025-10-07"])
+
+        assert result.exit_code != 0
+        assert "can't be combined" in result.output
+
+
 # Sprint 3: Review command tests
 
 
+@patch("brainplorp.cli.load_config")
+@patch("brainplorp.cli.get_review_backlog")
+@patch("brainplorp.cli.prompt")
+def test_review_command_since(mock_prompt, mock_backlog, mock_load_config, tmp_path):
+    """Test review --since walks the merged backlog queue."""
+    mock_load_config.return_value = {"vault_path": str(tmp_path)}
+    mock_backlog.return_value = {
+        "notes_scanned": ["2025-10-06", "2025-10-07"],
+        "tasks": [
+            {
+                "uuid": "abc-123",
+                "description": "Carried over",
+                "status": "pending",
+                "days": ["2025-10-06", "2025-10-07"],
+            }
+        ],
+        "task_count": 1,
+        "resolved_count": 0,
+    }
+    mock_prompt.return_value = "s"
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["review", "--since", "2025-10-06", "--date", "2025-10-07"])
+
+    assert result.exit_code == 0
+    assert "Seen on: 2025-10-06, 2025-10-07" in result.output
+    assert mock_backlog.call_args[0][0] == date(2025, 10, 6)
+    assert mock_backlog.call_args[0][2] == date(2025, 10, 7)
+
+
 @patch("brainplorp.cli.load_config")
 @patch("brainplorp.cli.get_review_tasks")
 @patch("brainplorp.cli.add_review_notes")
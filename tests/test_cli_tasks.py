@@ -117,11 +117,11 @@ def test_tasks_overdue(mock_get_tasks, mock_load_config, sample_tasks):
 
 
 @patch('brainplorp.cli.load_config')
-@patch('brainplorp.cli.get_tasks')
-def test_tasks_json_format(mock_get_tasks, mock_load_config, sample_tasks):
+@patch('brainplorp.cli.iter_tasks')
+def test_tasks_json_format(mock_iter_tasks, mock_load_config, sample_tasks):
     """Test tasks --format json outputs JSON."""
     mock_load_config.return_value = {'vault_path': '/tmp/vault'}
-    mock_get_tasks.return_value = sample_tasks
+    mock_iter_tasks.return_value = iter(sample_tasks)
 
     runner = CliRunner()
     result = runner.invoke(cli, ['tasks', '--format', 'json'])
@@ -131,6 +131,42 @@ def test_tasks_json_format(mock_get_tasks, mock_load_config, sample_tasks):
     output = json.loads(result.output)
     assert len(output) == 3
     assert output[0]['description'] == 'Fix bug'
+    # Streamed output is byte-identical to dumping the whole list
+    assert result.output == json.dumps(sample_tasks, indent=2) + "\n"
+
+
+@patch('brainplorp.cli.load_config')
+@patch('brainplorp.cli.iter_tasks')
+def test_tasks_json_format_streams_with_limit(mock_iter_tasks, mock_load_config, sample_tasks):
+    """Test tasks --format json stops consuming the stream at --limit."""
+    mock_load_config.return_value = {'vault_path': '/tmp/vault'}
+    consumed = []
+
+    def stream(filters):
+        for task in sample_tasks:
+            consumed.append(task['uuid'])
+            yield task
+
+    mock_iter_tasks.side_effect = stream
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ['tasks', '--format', 'json', '--limit', '1'])
+
+    import json
+    assert [t['uuid'] for t in json.loads(result.output)] == ['abc-123']
+    assert consumed == ['abc-123']
+
+
+@patch('brainplorp.cli.load_config')
+@patch('brainplorp.cli.iter_tasks')
+def test_tasks_json_format_empty(mock_iter_tasks, mock_load_config):
+    """Test tasks --format json with no matches prints an empty array."""
+    mock_load_config.return_value = {'vault_path': '/tmp/vault'}
+    mock_iter_tasks.return_value = iter([])
+
+    result = CliRunner().invoke(cli, ['tasks', '--format', 'json'])
+
+    assert result.output == "[]\n"
 
 
 @patch('brainplorp.cli.load_config')
@@ -189,3 +189,33 @@ def test_load_config_handles_invalid_yaml(tmp_path, monkeypatch):
 
     # Should fall back to defaults
     assert config == DEFAULT_CONFIG
+
+
+def test_get_vault_path_cached_until_config_changes(tmp_path, monkeypatch):
+    """get_vault_path re-reads config.yaml only when it changed."""
+    import os
+    from brainplorp import config as config_module
+
+    config_file = tmp_path / "plorp" / "config.yaml"
+    config_file.parent.mkdir()
+    config_file.write_text(f"vault_path: {tmp_path / 'vault_a'}\n")
+    monkeypatch.setattr("brainplorp.config.get_config_path", lambda: config_file)
+
+    loads = []
+    original = config_module.load_config
+
+    def counting():
+        loads.append(1)
+        return original()
+
+    monkeypatch.setattr("brainplorp.config.load_config", counting)
+
+    assert config_module.get_vault_path() == tmp_path / "vault_a"
+    assert config_module.get_vault_path() == tmp_path / "vault_a"
+    assert len(loads) == 1
+
+    config_file.write_text(f"vault_path: {tmp_path / 'vault_bb'}\n")
+    os.utime(config_file, ns=(1, 1))
+
+    assert config_module.get_vault_path() == tmp_path / "vault_bb"
+    assert len(loads) == 2
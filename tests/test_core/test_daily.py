@@ -11,6 +11,8 @@ from unittest.mock import patch, MagicMock
 
 from brainplorp.core.daily import (
     start_day,
+    refresh_day,
+    start_days,
     _normalize_task,
     _is_overdue,
     _is_due_today,
@@ -156,6 +158,169 @@ def test_start_day_recurring_only_when_due(tmp_path):
         assert result["summary"]["total_count"] == 0
 
 
+def _pending(uuid, due, **fields):
+    task = {"uuid": uuid, "description": f"Task {uuid}", "status": "pending", "due": due}
+    task.update(fields)
+    return task
+
+
+def test_refresh_day_creates_missing_note(tmp_path):
+    """Refreshing a date with no note creates it like start_day."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+
+    with patch("brainplorp.core.daily.get_tasks") as mock_tasks:
+        mock_tasks.return_value = [_pending("t-1", "20251006T000000Z")]
+
+        result = refresh_day(date(2025, 10, 6), vault)
+
+    assert result["changed"] is True
+    assert result["added"] == 1
+    assert "uuid: t-1" in Path(result["note_path"]).read_text()
+
+
+def test_refresh_day_updates_task_lines_and_keeps_user_text(tmp_path):
+    """New tasks are added, completed ones dropped, checked lines and notes kept."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    target = date(2025, 10, 6)
+
+    with patch("brainplorp.core.daily.get_tasks") as mock_tasks:
+        mock_tasks.return_value = [
+            _pending("old-1", "20251001T000000Z"),
+            _pending("gone-1", "20251006T000000Z"),
+            _pending("done-1", "20251006T000000Z"),
+        ]
+        result = start_day(target, vault)
+
+    note_path = Path(result["note_path"])
+    content = note_path.read_text()
+    content = content.replace("- [ ] Task done-1", "- [x] Task done-1")
+    content = content.replace("## 📝 Notes\n", "## 📝 Notes\n\nCall the dentist.\n")
+    note_path.write_text(content)
+
+    with patch("brainplorp.core.daily.get_tasks") as mock_tasks:
+        mock_tasks.return_value = [
+            _pending("old-1", "20251001T000000Z", priority="H"),
+            _pending("done-1", "20251006T000000Z"),
+            _pending("new-1", "20251006T000000Z"),
+            _pending("recur-1", "20251006T000000Z", recur="daily"),
+        ]
+        result = refresh_day(target, vault)
+
+    content = note_path.read_text()
+    assert result["changed"] is True
+    assert result["added"] == 2
+    assert result["removed"] == 1
+    assert result["summary"]["total_count"] == 4
+    assert "uuid: gone-1" not in content
+    assert "- [ ] Task old-1 (due: 2025-10-01, priority: H, uuid: old-1)" in content
+    assert "- [x] Task done-1" in content
+    assert "uuid: new-1" in content
+    assert "## 🔄 Recurring Tasks" in content
+    assert content.index("uuid: new-1") < content.index("## 🔄 Recurring Tasks")
+    assert content.index("## 🔄 Recurring Tasks") < content.index("## 📝 Notes")
+    assert "Call the dentist." in content
+
+
+def test_refresh_day_matches_fresh_note(tmp_path):
+    """An untouched note refreshed to a new task set equals a freshly generated one."""
+    first = [_pending("a", "20251001T000000Z"), _pending("b", "20251006T000000Z")]
+    second = [_pending("a", "20251001T000000Z"), _pending("c", "20251006T000000Z", recur="daily")]
+    target = date(2025, 10, 6)
+
+    refreshed_vault = tmp_path / "refreshed"
+    fresh_vault = tmp_path / "fresh"
+    refreshed_vault.mkdir()
+    fresh_vault.mkdir()
+
+    with patch("brainplorp.core.daily.get_tasks", return_value=first):
+        start_day(target, refreshed_vault)
+    with patch("brainplorp.core.daily.get_tasks", return_value=second):
+        refreshed = refresh_day(target, refreshed_vault)
+        fresh = start_day(target, fresh_vault)
+
+    assert Path(refreshed["note_path"]).read_text() == Path(fresh["note_path"]).read_text()
+
+    # And back to no tasks at all: the placeholder section returns
+    with patch("brainplorp.core.daily.get_tasks", return_value=[]):
+        refresh_day(target, refreshed_vault)
+    assert "No tasks scheduled for today" in Path(refreshed["note_path"]).read_text()
+
+
+def test_refresh_day_skips_write_when_unchanged(tmp_path):
+    """No write happens when the note already matches."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    tasks = [_pending("t-1", "20251006T000000Z")]
+
+    with patch("brainplorp.core.daily.get_tasks", return_value=tasks):
+        start_day(date(2025, 10, 6), vault)
+        with patch("brainplorp.core.daily.write_file") as mock_write:
+            result = refresh_day(date(2025, 10, 6), vault)
+
+    assert result["changed"] is False
+    assert result["added"] == 0
+    assert result["removed"] == 0
+    mock_write.assert_not_called()
+
+
+def test_start_days_matches_per_day_notes(tmp_path):
+    """A range run exports once and writes the same notes as start_day per date."""
+    tasks = [
+        _pending("late", "20251001T000000Z"),
+        _pending("tue", "20251007T120000Z"),
+        _pending("daily", "20251006T000000Z", recur="daily"),
+        _pending("thu", "20251009T000000Z"),
+        _pending("later", "20251020T000000Z"),
+    ]
+    ranged = tmp_path / "ranged"
+    single = tmp_path / "single"
+    ranged.mkdir()
+    single.mkdir()
+
+    with patch("brainplorp.core.daily.get_tasks", return_value=tasks) as mock_tasks:
+        result = start_days(date(2025, 10, 6), date(2025, 10, 12), ranged)
+        assert mock_tasks.call_count == 1
+
+        for day in result["days"]:
+            start_day(date.fromisoformat(day["date"]), single)
+
+    assert result["created_count"] == 7
+    assert [d["summary"]["total_count"] for d in result["days"]] == [2, 3, 3, 4, 4, 4, 4]
+    for day in result["days"]:
+        name = f"{day['date']}.md"
+        assert (ranged / "daily" / name).read_text() == (single / "daily" / name).read_text()
+
+
+def test_start_days_skips_or_refreshes_existing(tmp_path):
+    """Existing notes are skipped by default and refreshed on request."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    tasks = [_pending("t-1", "20251006T000000Z")]
+
+    with patch("brainplorp.core.daily.get_tasks", return_value=tasks):
+        start_day(date(2025, 10, 6), vault)
+
+        result = start_days(date(2025, 10, 6), date(2025, 10, 7), vault)
+        assert [d["status"] for d in result["days"]] == ["skipped", "created"]
+
+        result = start_days(date(2025, 10, 6), date(2025, 10, 7), vault, refresh=True)
+        assert [d["status"] for d in result["days"]] == ["unchanged", "unchanged"]
+        assert result["unchanged_count"] == 2
+
+
+def test_start_days_rejects_bad_ranges(tmp_path):
+    """Reversed or oversized ranges raise ValueError."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+
+    with pytest.raises(ValueError):
+        start_days(date(2025, 10, 7), date(2025, 10, 6), vault)
+    with pytest.raises(ValueError):
+        start_days(date(2025, 1, 1), date(2027, 1, 1), vault)
+
+
 def test_normalize_task():
     """Test _normalize_task helper."""
     task_data = {
@@ -110,9 +110,9 @@ def test_create_task_from_inbox(tmp_path):
 """
     )
 
-    with patch("brainplorp.core.inbox.create_task") as mock_create_task:
+    with patch("brainplorp.core.inbox.create_tasks") as mock_create_task:
         with patch("brainplorp.core.inbox.mark_item_processed") as mock_mark:
-            mock_create_task.return_value = "abc-123"
+            mock_create_task.return_value = [{"uuid": "abc-123"}]
 
             result = create_task_from_inbox(
                 vault,
@@ -130,10 +130,14 @@ def test_create_task_from_inbox(tmp_path):
             assert result["item_text"] == "Buy groceries"
 
             mock_create_task.assert_called_once_with(
-                description="Buy groceries and supplies",
-                project="home",
-                due="2025-10-10",
-                priority="H",
+                [
+                    {
+                        "description": "Buy groceries and supplies",
+                        "project": "home",
+                        "due": "2025-10-10",
+                        "priority": "H",
+                    }
+                ]
             )
             mock_mark.assert_called_once()
 
@@ -194,11 +198,11 @@ def test_create_both_from_inbox(tmp_path):
 """
     )
 
-    with patch("brainplorp.core.inbox.create_task") as mock_create_task:
+    with patch("brainplorp.core.inbox.create_tasks") as mock_create_task:
         # Patch where it's imported (in the notes module)
         with patch("brainplorp.core.notes.create_note_linked_to_task") as mock_create_note:
             with patch("brainplorp.core.inbox.mark_item_processed") as mock_mark:
-                mock_create_task.return_value = "abc-123"
+                mock_create_task.return_value = [{"uuid": "abc-123"}]
                 mock_create_note.return_value = {
                     "note_path": "/vault/notes/meeting.md",
                     "created_at": "2025-10-06T10:00:00",
@@ -264,8 +268,8 @@ def test_create_task_from_inbox_failure(tmp_path):
     inbox_path = inbox_dir / "2025-10.md"
     inbox_path.write_text("## Unprocessed\n\n- [ ] Test\n")
 
-    with patch("brainplorp.core.inbox.create_task") as mock_create_task:
-        mock_create_task.return_value = None  # Failure
+    with patch("brainplorp.core.inbox.create_tasks") as mock_create_task:
+        mock_create_task.return_value = []  # Import failed
 
         with pytest.raises(RuntimeError, match="Failed to create task"):
             create_task_from_inbox(
@@ -285,8 +289,8 @@ def test_create_both_from_inbox_failure(tmp_path):
     inbox_path = inbox_dir / "2025-10.md"
     inbox_path.write_text("## Unprocessed\n\n- [ ] Test\n")
 
-    with patch("brainplorp.core.inbox.create_task") as mock_create_task:
-        mock_create_task.return_value = None  # Failure
+    with patch("brainplorp.core.inbox.create_tasks") as mock_create_task:
+        mock_create_task.return_value = []  # Import failed
 
         with pytest.raises(RuntimeError, match="Failed to create task"):
             create_both_from_inbox(
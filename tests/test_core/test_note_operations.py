@@ -14,6 +14,7 @@ from brainplorp.core.note_operations import (
     append_to_note,
     update_note_section,
     search_notes_by_metadata,
+    search_notes,
     create_note_in_folder,
     list_vault_folders,
     _validate_note_access,
@@ -198,6 +199,20 @@ def test_search_notes_by_metadata(test_vault_with_config):
     assert any(r["title"] == "Test" for r in results)
 
 
+def test_search_notes_respects_allowed_folders(test_vault_with_config):
+    """Full-text search only returns notes from allowed folders."""
+    (test_vault_with_config / "forbidden" / "plan.md").write_text("# Plan\n\nContent")
+
+    results = search_notes(test_vault_with_config, "content")
+
+    assert [r["path"] for r in results] == ["notes/test.md"]
+    assert "**Content**" in results[0]["snippet"]
+    assert search_notes(test_vault_with_config, "secret") == []
+
+    with pytest.raises(PermissionError):
+        search_notes(test_vault_with_config, "secret", folder="forbidden")
+
+
 # ============================================================================
 # Test Update Operations
 # ============================================================================
@@ -13,8 +13,11 @@ from brainplorp.core.process import (
     generate_proposal,
     process_daily_note_step1,
     process_daily_note_step2,
+    process_all_daily_notes,
+    reorganize_note,
 )
 from brainplorp.core.types import InformalTask, TaskProposal
+from brainplorp.utils.files import write_file
 
 
 # ============================================================================
@@ -353,29 +356,85 @@ def test_process_step2_creates_tasks_from_approvals(tmp_path):
     # Mock TaskWarrior integration
     from unittest.mock import patch, MagicMock
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create_task:
-        # Mock successful task creation
-        mock_create_task.return_value = "abc-123-uuid"
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create_tasks:
+        # Mock successful import (create_tasks returns the imported records)
+        mock_create_tasks.return_value = [{
+            "uuid": "abc-123-uuid",
+            "description": "call mom",
+            "status": "pending",
+            "due": "20251007T000000Z",
+            "priority": "M",
+            "project": None,
+            "tags": []
+        }]
 
-        # Mock get_task_info to return task details
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get_task_info:
-            mock_get_task_info.return_value = {
-                "uuid": "abc-123-uuid",
-                "description": "call mom",
-                "status": "pending",
-                "due": "20251007T000000Z",
-                "priority": "M",
-                "project": None,
-                "tags": []
-            }
+        result = process_daily_note_step2(note_path, date(2025, 10, 7))
+
+        # Should create 1 task (the [Y] approval) with a single import
+        assert result["approved_count"] == 1
+        assert result["rejected_count"] == 1
+        assert len(result["created_tasks"]) == 1
+        assert result["created_tasks"][0]["uuid"] == "abc-123-uuid"
+        mock_create_tasks.assert_called_once()
+        specs = mock_create_tasks.call_args[0][0]
+        assert specs[0]["description"] == "call mom"
+        assert specs[0]["due"] == "2025-10-07"
+        assert specs[0]["status"] == "pending"
+
+
+def test_process_step2_imports_checked_informal_task_as_completed(tmp_path):
+    """Test checked informal tasks are imported as completed (Q19), no mark_done call."""
+    from brainplorp.core.process import create_tasks_batch, generate_proposal
+    from unittest.mock import patch
+
+    informal = {
+        "text": "sent the invoice",
+        "line_number": 3,
+        "section": "Notes",
+        "checkbox_state": "[x]",
+        "original_line": "- [x] sent the invoice",
+    }
+    proposal = generate_proposal(informal, date(2025, 10, 7))
+
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create_tasks, \
+         patch('brainplorp.integrations.taskwarrior.mark_done') as mock_mark_done:
+        mock_create_tasks.return_value = [
+            {"uuid": "u-1", "description": "sent the invoice", "status": "completed"}
+        ]
+
+        created, errors = create_tasks_batch([proposal], date(2025, 10, 7))
 
-            result = process_daily_note_step2(note_path, date(2025, 10, 7))
+    assert errors == []
+    assert created[0]["status"] == "completed"
+    assert mock_create_tasks.call_args[0][0][0]["status"] == "completed"
+    mock_mark_done.assert_not_called()
 
-            # Should create 1 task (the [Y] approval)
-            assert result["approved_count"] == 1
-            assert result["rejected_count"] == 1
-            assert len(result["created_tasks"]) == 1
-            assert result["created_tasks"][0]["uuid"] == "abc-123-uuid"
+
+def test_create_tasks_batch_import_failure_reports_each_proposal(tmp_path):
+    """Test a failed import turns every pending proposal into an error."""
+    from brainplorp.core.process import create_tasks_batch, generate_proposal
+    from unittest.mock import patch
+
+    proposals = [
+        generate_proposal(
+            {
+                "text": f"task {i}",
+                "line_number": i,
+                "section": "Notes",
+                "checkbox_state": "[ ]",
+                "original_line": f"- [ ] task {i}",
+            },
+            date(2025, 10, 7),
+        )
+        for i in range(3)
+    ]
+
+    with patch('brainplorp.integrations.taskwarrior.create_tasks', return_value=[]):
+        created, errors = create_tasks_batch(proposals, date(2025, 10, 7))
+
+    assert created == []
+    assert len(errors) == 3
+    assert all(e["needs_review"] for e in errors)
 
 
 def test_process_step2_preserves_rejected_tasks(tmp_path):
@@ -400,35 +459,33 @@ def test_process_step2_preserves_rejected_tasks(tmp_path):
 
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create:
-        mock_create.return_value = "uuid-1"
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-            mock_get.return_value = {
-                "uuid": "uuid-1",
-                "description": "task 1",
-                "status": "pending",
-                "due": None,
-                "priority": "L",
-                "project": None,
-                "tags": []
-            }
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
+        mock_create.return_value = [{
+            "uuid": "uuid-1",
+            "description": "task 1",
+            "status": "pending",
+            "due": None,
+            "priority": "L",
+            "project": None,
+            "tags": []
+        }]
 
-            process_daily_note_step2(note_path, date(2025, 10, 7))
+        process_daily_note_step2(note_path, date(2025, 10, 7))
 
-            # Read note and verify rejected task is still there
-            updated_content = note_path.read_text()
-            print("\n=== UPDATED CONTENT ===")
-            print(updated_content)
-            print("=== END ===\n")
+        # Read note and verify rejected task is still there
+        updated_content = note_path.read_text()
+        print("\n=== UPDATED CONTENT ===")
+        print(updated_content)
+        print("=== END ===\n")
 
-            # Extract Notes section to verify approved task removed from original location
-            import re
-            notes_section_match = re.search(r'## Notes\n(.*?)(?=\n##|\Z)', updated_content, re.DOTALL)
-            assert notes_section_match is not None
-            notes_content = notes_section_match.group(1)
+        # Extract Notes section to verify approved task removed from original location
+        import re
+        notes_section_match = re.search(r'## Notes\n(.*?)(?=\n##|\Z)', updated_content, re.DOTALL)
+        assert notes_section_match is not None
+        notes_content = notes_section_match.group(1)
 
-            assert "- [ ] task 2" in notes_content  # Rejected task stays
-            assert "- [ ] task 1" not in notes_content  # Approved task removed from original location
+        assert "- [ ] task 2" in notes_content  # Rejected task stays
+        assert "- [ ] task 1" not in notes_content  # Approved task removed from original location
 
 
 def test_process_step2_removes_tbd_section_on_success(tmp_path):
@@ -448,27 +505,25 @@ def test_process_step2_removes_tbd_section_on_success(tmp_path):
 
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create:
-        mock_create.return_value = "uuid-1"
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-            mock_get.return_value = {
-                "uuid": "uuid-1",
-                "description": "task 1",
-                "status": "pending",
-                "due": None,
-                "priority": "L",
-                "project": None,
-                "tags": []
-            }
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
+        mock_create.return_value = [{
+            "uuid": "uuid-1",
+            "description": "task 1",
+            "status": "pending",
+            "due": None,
+            "priority": "L",
+            "project": None,
+            "tags": []
+        }]
 
-            result = process_daily_note_step2(note_path, date(2025, 10, 7))
+        result = process_daily_note_step2(note_path, date(2025, 10, 7))
 
-            # Should have no errors
-            assert result["needs_review_remaining"] is False
+        # Should have no errors
+        assert result["needs_review_remaining"] is False
 
-            # TBD section should be removed
-            updated_content = note_path.read_text()
-            assert "## TBD Processing" not in updated_content
+        # TBD section should be removed
+        updated_content = note_path.read_text()
+        assert "## TBD Processing" not in updated_content
 
 
 def test_process_step2_keeps_tbd_on_errors(tmp_path):
@@ -523,40 +578,36 @@ def test_full_workflow_success(tmp_path):
     # Step 2: Create tasks from approvals
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create:
-        # Return different UUIDs for each task
-        mock_create.side_effect = ["uuid-1", "uuid-2"]
-
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-            def get_task_side_effect(uuid):
-                if uuid == "uuid-1":
-                    return {
-                        "uuid": "uuid-1",
-                        "description": "call mom",
-                        "status": "pending",
-                        "due": "20251007T000000Z",
-                        "priority": "L",
-                        "project": None,
-                        "tags": []
-                    }
-                elif uuid == "uuid-2":
-                    return {
-                        "uuid": "uuid-2",
-                        "description": "buy groceries",
-                        "status": "pending",
-                        "due": None,
-                        "priority": "L",
-                        "project": None,
-                        "tags": []
-                    }
-            mock_get.side_effect = get_task_side_effect
-
-            result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
-
-            assert result2["approved_count"] == 2
-            assert result2["rejected_count"] == 0
-            assert len(result2["created_tasks"]) == 2
-            assert result2["needs_review_remaining"] is False
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
+        # One import creates both tasks
+        mock_create.return_value = [
+            {
+                "uuid": "uuid-1",
+                "description": "call mom",
+                "status": "pending",
+                "due": "20251007T000000Z",
+                "priority": "L",
+                "project": None,
+                "tags": []
+            },
+            {
+                "uuid": "uuid-2",
+                "description": "buy groceries",
+                "status": "pending",
+                "due": None,
+                "priority": "L",
+                "project": None,
+                "tags": []
+            },
+        ]
+
+        result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
+
+        assert result2["approved_count"] == 2
+        assert result2["rejected_count"] == 0
+        assert len(result2["created_tasks"]) == 2
+        assert result2["needs_review_remaining"] is False
+        mock_create.assert_called_once()
 
 
 def test_full_workflow_with_rejections(tmp_path):
@@ -595,28 +646,26 @@ def test_full_workflow_with_rejections(tmp_path):
     # Step 2
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create:
-        mock_create.return_value = "uuid-1"
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-            mock_get.return_value = {
-                "uuid": "uuid-1",
-                "description": "task 1",
-                "status": "pending",
-                "due": None,
-                "priority": "L",
-                "project": None,
-                "tags": []
-            }
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
+        mock_create.return_value = [{
+            "uuid": "uuid-1",
+            "description": "task 1",
+            "status": "pending",
+            "due": None,
+            "priority": "L",
+            "project": None,
+            "tags": []
+        }]
 
-            result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
+        result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
 
-            # 1 approved, 1 rejected, 1 skipped
-            assert result2["approved_count"] == 1
-            assert result2["rejected_count"] >= 1  # At least the explicit [N]
+        # 1 approved, 1 rejected, 1 skipped
+        assert result2["approved_count"] == 1
+        assert result2["rejected_count"] >= 1  # At least the explicit [N]
 
-            # Verify rejected task still in original location
-            final_content = note_path.read_text()
-            assert "- [ ] task 2" in final_content
+        # Verify rejected task still in original location
+        final_content = note_path.read_text()
+        assert "- [ ] task 2" in final_content
 
 
 def test_full_workflow_with_errors(tmp_path):
@@ -645,35 +694,33 @@ def test_full_workflow_with_errors(tmp_path):
     # Step 2: Create tasks from approvals
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create:
-        mock_create.return_value = "uuid-1"
-        with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-            mock_get.return_value = {
-                "uuid": "uuid-1",
-                "description": "buy groceries",
-                "status": "pending",
-                "due": "20251007T000000Z",
-                "priority": "L",
-                "project": None,
-                "tags": []
-            }
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
+        mock_create.return_value = [{
+            "uuid": "uuid-1",
+            "description": "buy groceries",
+            "status": "pending",
+            "due": "20251007T000000Z",
+            "priority": "L",
+            "project": None,
+            "tags": []
+        }]
 
-            result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
+        result2 = process_daily_note_step2(note_path, date(2025, 10, 7))
 
-            # Only 1 task should be created (the valid one)
-            assert result2["approved_count"] == 2  # Both were approved by user
-            assert len(result2["created_tasks"]) == 1  # But only 1 succeeded
-            assert len(result2["errors"]) == 1  # 1 NEEDS_REVIEW error
-            assert result2["needs_review_remaining"] is True
+        # Only 1 task should be created (the valid one)
+        assert result2["approved_count"] == 2  # Both were approved by user
+        assert len(result2["created_tasks"]) == 1  # But only 1 succeeded
+        assert len(result2["errors"]) == 1  # 1 NEEDS_REVIEW error
+        assert result2["needs_review_remaining"] is True
 
-            # Verify TBD section is kept because of NEEDS_REVIEW
-            final_content = note_path.read_text()
-            assert "## TBD Processing" in final_content
-            assert "*NEEDS_REVIEW:" in final_content
+        # Verify TBD section is kept because of NEEDS_REVIEW
+        final_content = note_path.read_text()
+        assert "## TBD Processing" in final_content
+        assert "*NEEDS_REVIEW:" in final_content
 
-            # Verify the successful task was created
-            assert "## Created Tasks" in final_content
-            assert "buy groceries" in final_content
+        # Verify the successful task was created
+        assert "## Created Tasks" in final_content
+        assert "buy groceries" in final_content
 
 
 # ============================================================================
@@ -705,19 +752,15 @@ def test_process_step2_task_without_due_date(tmp_path):
     # Mock TaskWarrior integration
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create, \
-         patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-
-        mock_create.return_value = "uuid-123"
-
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
         # Real TaskWarrior omits 'due' key when not set (not None, ABSENT)
-        mock_get.return_value = {
+        mock_create.return_value = [{
             "uuid": "uuid-123",
             "description": "buy groceries",
             "status": "pending",
             "priority": "L",
             # NO 'due' key - this is what triggers the bug
-        }
+        }]
 
         # Should not raise KeyError
         result = process_daily_note_step2(note_path, date(2025, 10, 7))
@@ -757,19 +800,15 @@ def test_process_step2_task_without_priority(tmp_path):
 
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create, \
-         patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-
-        mock_create.return_value = "uuid-456"
-
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
         # Real TaskWarrior omits 'priority' key when not set
-        mock_get.return_value = {
+        mock_create.return_value = [{
             "uuid": "uuid-456",
             "description": "call dentist",
             "status": "pending",
             "due": "20251010T000000Z",
             # NO 'priority' key
-        }
+        }]
 
         result = process_daily_note_step2(note_path, date(2025, 10, 7))
 
@@ -807,18 +846,14 @@ def test_process_step2_task_minimal_fields(tmp_path):
 
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.create_task') as mock_create, \
-         patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get:
-
-        mock_create.return_value = "uuid-789"
-
+    with patch('brainplorp.integrations.taskwarrior.create_tasks') as mock_create:
         # Minimal TaskWarrior response (only required fields)
-        mock_get.return_value = {
+        mock_create.return_value = [{
             "uuid": "uuid-789",
             "description": "read book",
             "status": "pending",
             # NO 'due' or 'priority' keys
-        }
+        }]
 
         result = process_daily_note_step2(note_path, date(2025, 10, 7))
 
@@ -835,6 +870,126 @@ def test_process_step2_task_minimal_fields(tmp_path):
     assert "(uuid: uuid-789)" in final_content
 
 
+def test_generate_proposal_benchmark_10k_tasks():
+    """Proposal generation over 10k informal tasks stays well under a second."""
+    import time
+
+    texts = [
+        "call mom today",
+        "urgent fix login bug friday",
+        "buy groceries",
+        "review next monday important",
+        "meeting on Invalid-Date",
+        "asap send report tomorrow",
+        "renew passport in 3 days",
+        "water plants end of week",
+        "critical deploy 2025-11-03",
+        "dentist Oct 20",
+    ]
+    tasks = [
+        {
+            "text": f"{texts[i % len(texts)]} {i}",
+            "line_number": i,
+            "section": "Notes",
+            "checkbox_state": "[ ]",
+            "original_line": "",
+        }
+        for i in range(10_000)
+    ]
+
+    started = time.perf_counter()
+    proposals = [generate_proposal(task, date(2025, 10, 6)) for task in tasks]
+    elapsed = time.perf_counter() - started
+
+    assert len(proposals) == 10_000
+    assert proposals[1]["proposed_priority"] == "H"
+    assert proposals[8]["proposed_due"] == "2025-11-03"
+    assert elapsed < 1.0
+
+
+# ============================================================================
+# process_all_daily_notes: vault-wide Step 1
+# ============================================================================
+
+
+def _write_daily(vault, day, body):
+    daily = vault / "daily"
+    daily.mkdir(parents=True, exist_ok=True)
+    path = daily / f"{day}.md"
+    path.write_text(f"# {day}\n\n## Notes\n{body}\n")
+    return path
+
+
+def test_process_all_writes_tbd_only_where_there_are_proposals(tmp_path):
+    """Notes with informal tasks get a TBD section; others and pending ones are untouched."""
+    state = tmp_path / "state.json"
+    with_tasks = _write_daily(tmp_path, "2025-10-06", "- [ ] call mom tomorrow\n- [ ] urgent fix bug")
+    no_tasks = _write_daily(tmp_path, "2025-10-07", "just notes")
+    pending = _write_daily(tmp_path, "2025-10-08", "- [ ] buy milk")
+    pending.write_text(pending.read_text() + "\n## TBD Processing\n\n- [ ] approve me\n")
+    pending_before = pending.read_text()
+    no_tasks_before = no_tasks.read_text()
+
+    result = process_all_daily_notes(tmp_path, state_path=state)
+
+    assert result["notes_total"] == 3
+    assert result["notes_scanned"] == 2
+    assert result["notes_pending_review"] == 1
+    assert result["proposals_count"] == 2
+    assert [n["note_path"] for n in result["updated_notes"]] == [str(with_tasks)]
+
+    content = with_tasks.read_text()
+    assert "## TBD Processing" in content
+    # Relative dates resolve against the note's own date
+    assert "due: 2025-10-07" in content
+    assert no_tasks.read_text() == no_tasks_before
+    assert pending.read_text() == pending_before
+
+
+def test_process_all_skips_unchanged_notes(tmp_path):
+    """A second scan skips notes whose content hash matches the last scan."""
+    state = tmp_path / "state.json"
+    note = _write_daily(tmp_path, "2025-10-07", "nothing yet")
+
+    first = process_all_daily_notes(tmp_path, state_path=state)
+    second = process_all_daily_notes(tmp_path, state_path=state)
+
+    assert first["notes_scanned"] == 1
+    assert second["notes_scanned"] == 0
+    assert second["notes_unchanged"] == 1
+
+    # Editing the note makes it eligible again
+    note.write_text(note.read_text() + "- [ ] water plants\n")
+    third = process_all_daily_notes(tmp_path, state_path=state)
+
+    assert third["notes_scanned"] == 1
+    assert third["proposals_count"] == 1
+
+
+def test_process_all_process_pool_matches_in_process(tmp_path):
+    """Scanning in a process pool writes the same notes as scanning in-process."""
+    pooled, serial = tmp_path / "pooled", tmp_path / "serial"
+    for vault in (pooled, serial):
+        for day in range(1, 13):
+            _write_daily(vault, f"2025-10-{day:02d}", f"- [ ] task {day} friday\n- [ ] note {day}")
+
+    pooled_result = process_all_daily_notes(pooled, workers=2, state_path=tmp_path / "p.json")
+    serial_result = process_all_daily_notes(serial, workers=1, state_path=tmp_path / "s.json")
+
+    assert pooled_result["proposals_count"] == serial_result["proposals_count"] == 24
+    for day in range(1, 13):
+        name = f"daily/2025-10-{day:02d}.md"
+        assert (pooled / name).read_text() == (serial / name).read_text()
+
+
+def test_process_all_missing_vault(tmp_path):
+    """A missing vault raises VaultNotFoundError."""
+    from brainplorp.core.exceptions import VaultNotFoundError
+
+    with pytest.raises(VaultNotFoundError):
+        process_all_daily_notes(tmp_path / "nope", state_path=tmp_path / "state.json")
+
+
 # ============================================================================
 # Sprint 8.5: Checkbox Sync Tests (Item 1)
 # ============================================================================
@@ -861,21 +1016,24 @@ Some notes here
     # Mock TaskWarrior integration
     from unittest.mock import patch, MagicMock
 
-    with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get_info, \
-         patch('brainplorp.integrations.taskwarrior.mark_done') as mock_mark_done:
+    with patch('brainplorp.integrations.taskwarrior.get_tasks_by_uuid') as mock_lookup, \
+         patch('brainplorp.integrations.taskwarrior.bulk_mark_done') as mock_mark_done:
 
         # Mock task exists
-        mock_get_info.return_value = {
-            "uuid": "task-abc-123",
-            "description": "Buy groceries",
-            "status": "pending"
-        }
+        mock_lookup.return_value = ({
+            "task-abc-123": {
+                "uuid": "task-abc-123",
+                "description": "Buy groceries",
+                "status": "pending"
+            }
+        }, 1)
 
         # Mock vault_path for State Sync (no projects to update in this test)
         result = process_daily_note_step2(note_path, date(2025, 10, 7), tmp_path)
 
-        # Assert: mark_done was called for the checked task
-        mock_mark_done.assert_called_once_with("task-abc-123")
+        # Assert: only the checked task was looked up and marked done
+        mock_lookup.assert_called_once_with(["task-abc-123"])
+        mock_mark_done.assert_called_once_with(["task-abc-123"])
 
 
 def test_process_step2_removes_from_projects_when_done(tmp_path, monkeypatch):
@@ -908,23 +1066,195 @@ Some notes
     # Mock TaskWarrior integration
     from unittest.mock import patch
 
-    with patch('brainplorp.integrations.taskwarrior.get_task_info') as mock_get_info, \
-         patch('brainplorp.integrations.taskwarrior.mark_done') as mock_mark_done:
+    with patch('brainplorp.integrations.taskwarrior.get_tasks_by_uuid') as mock_lookup, \
+         patch('brainplorp.integrations.taskwarrior.bulk_mark_done') as mock_mark_done:
 
-        mock_get_info.return_value = {
-            "uuid": "task-xyz-789",
-            "description": "Buy milk",
-            "status": "pending"
-        }
+        mock_lookup.return_value = ({
+            "task-xyz-789": {
+                "uuid": "task-xyz-789",
+                "description": "Buy milk",
+                "status": "pending"
+            }
+        }, 1)
 
         # Run Step 2 with vault_path for State Sync
         result = process_daily_note_step2(note_path, date(2025, 10, 7), tmp_path)
 
         # Assert: Task was marked done
-        mock_mark_done.assert_called_once_with("task-xyz-789")
+        mock_mark_done.assert_called_once_with(["task-xyz-789"])
 
         # Assert: UUID was removed from project frontmatter
         from brainplorp.core.projects import get_project_info
         project = get_project_info("home.chores.groceries")
         assert project is not None
         assert "task-xyz-789" not in project["task_uuids"]
+
+
+def test_process_step2_syncs_checked_tasks_in_one_batch(tmp_path, monkeypatch):
+    """All checked tasks share one lookup, one bulk done, and one project rewrite."""
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+
+    from brainplorp.core.projects import create_project, get_project_info
+    from brainplorp.integrations.obsidian_bases import add_task_to_project
+
+    create_project(name="groceries", domain="home", workstream="chores")
+    for uuid in ("task-1", "task-2", "task-3", "task-4"):
+        add_task_to_project("home.chores.groceries", uuid)
+
+    content = """# 2025-10-07 Monday
+
+## Tasks
+- [x] Buy milk (uuid: task-1)
+- [X] Buy eggs (uuid: task-2)
+- [x] Buy bread (uuid: task-3)
+- [ ] Buy butter (uuid: task-4)
+- [x] Unknown task (uuid: task-gone)
+- [x] Buy milk again (uuid: task-1)
+"""
+    note_path = create_test_daily_note(tmp_path, content)
+
+    tasks = {
+        "task-1": {"uuid": "task-1", "description": "Buy milk", "status": "pending"},
+        "task-2": {"uuid": "task-2", "description": "Buy eggs", "status": "pending"},
+        "task-3": {"uuid": "task-3", "description": "Buy bread", "status": "completed"},
+        "task-4": {"uuid": "task-4", "description": "Buy butter", "status": "pending"},
+    }
+
+    def lookup(uuids):
+        return {u: tasks[u] for u in uuids if u in tasks}, 1
+
+    from unittest.mock import patch
+
+    with patch("brainplorp.integrations.taskwarrior.get_tasks_by_uuid", side_effect=lookup) as mock_lookup, \
+         patch("brainplorp.integrations.taskwarrior.bulk_mark_done") as mock_mark_done, \
+         patch("brainplorp.core.projects.write_file", side_effect=write_file) as mock_write:
+
+        process_daily_note_step2(note_path, date(2025, 10, 7), tmp_path)
+
+    # One lookup for the checked UUIDs, one for the remaining project tasks
+    assert mock_lookup.call_args_list[0].args == (["task-1", "task-2", "task-3", "task-gone"],)
+    assert mock_lookup.call_args_list[1].args == (["task-4"],)
+
+    # Completed task-3 is not re-done; unknown task-gone is skipped
+    mock_mark_done.assert_called_once_with(["task-1", "task-2"])
+
+    # Project note rewritten once with only task-4 left
+    project_file = tmp_path / "projects" / "home.chores.groceries.md"
+    assert [c.args[0] for c in mock_write.call_args_list].count(project_file) == 1
+    assert get_project_info("home.chores.groceries")["task_uuids"] == ["task-4"]
+    assert "## Tasks (1)" in project_file.read_text()
+
+
+# ============================================================================
+# reorganize_note: line-indexed rewriter
+# ============================================================================
+
+
+def _approval(description: str, line_number: int) -> TaskProposal:
+    return {
+        "informal_task": {
+            "text": description,
+            "line_number": line_number,
+            "section": "Notes",
+            "checkbox_state": "[ ]",
+            "original_line": "",
+        },
+        "proposed_description": description,
+        "proposed_due": None,
+        "proposed_priority": "L",
+        "proposed_project": None,
+        "proposed_tags": [],
+        "priority_reason": None,
+        "needs_review": False,
+        "review_reason": None,
+    }
+
+
+def test_reorganize_note_removes_by_line_number():
+    """The indexed line is removed even when an identical line exists elsewhere."""
+    content = "# Day\n\n## Notes\n- [ ] call mom\n- [ ] call mom\n"
+
+    result = reorganize_note(content, [], [_approval("call mom", 4)], [], False, date(2025, 10, 7))
+
+    assert result == "# Day\n\n## Notes\n- [ ] call mom\n"
+
+
+def test_reorganize_note_falls_back_to_text_when_line_moved():
+    """If the line at line_number is no longer the task, it is found by text."""
+    content = "# Day\n\nNew paragraph added later\n## Notes\n- [ ] buy milk tomorrow\n- [ ] other\n"
+
+    result = reorganize_note(content, [], [_approval("buy milk", 3)], [], False, date(2025, 10, 7))
+
+    assert "buy milk" not in result
+    assert "New paragraph added later" in result
+    assert "- [ ] other" in result
+
+
+def test_reorganize_note_never_removes_formal_tasks():
+    """Lines with a UUID are never treated as the informal task."""
+    content = "## Notes\n- [ ] buy milk (uuid: abc-123)\n"
+
+    result = reorganize_note(content, [], [_approval("buy milk", 1)], [], False, date(2025, 10, 7))
+
+    assert result == content
+
+
+def test_reorganize_note_sections():
+    """Created Tasks is appended, TODAY/URGENT go under ## Tasks, TBD is dropped."""
+    content = (
+        "# Day\n\n## Tasks\n- [ ] existing (uuid: e-1)\n\n## Notes\n- [ ] ship it\n\n"
+        "## TBD Processing\n\n- [Y] **[Y/N]** ship it\n"
+    )
+    created = [
+        {"uuid": "u-1", "description": "ship it", "status": "pending", "priority": "H", "due": None}
+    ]
+
+    result = reorganize_note(
+        content, created, [_approval("ship it", 6)], [], False, date(2025, 10, 7)
+    )
+
+    assert result == (
+        "# Day\n\n## Tasks\n- [ ] ship it (priority: H, uuid: u-1)\n"
+        "- [ ] existing (uuid: e-1)\n\n## Notes\n\n## Created Tasks\n\n"
+        "- [ ] ship it (priority: H, uuid: u-1)\n"
+    )
+
+
+def test_reorganize_note_benchmark_5000_lines_500_approvals():
+    """
+    Benchmark: 5,000-line note, 500 approvals, a few moved lines.
+
+    The previous per-line x per-approval regex scan took ~0.5s here; the
+    indexed rewriter is linear and takes a few milliseconds.
+    """
+    import time
+
+    lines = ["# Daily Note - 2025-10-07", "", "## Tasks", ""]
+    approvals = []
+    while len(lines) < 5000:
+        if len(lines) % 10 == 5 and len(approvals) < 500:
+            description = f"informal task {len(approvals)}"
+            approvals.append(_approval(description, len(lines)))
+            lines.append(f"- [ ] {description} tomorrow")
+        else:
+            lines.append(f"Some journal text on line {len(lines)} (uuid-free)")
+    # Simulate edits after step 1 for a handful of approvals
+    for proposal in approvals[::100]:
+        proposal["informal_task"]["line_number"] += 3
+
+    content = "\n".join(lines)
+    created = [
+        {"uuid": f"u-{i}", "description": p["proposed_description"], "status": "pending",
+         "priority": "L", "due": None}
+        for i, p in enumerate(approvals)
+    ]
+
+    start = time.perf_counter()
+    result = reorganize_note(content, created, approvals, [], False, date(2025, 10, 7))
+    elapsed = time.perf_counter() - start
+
+    remaining = result.split("## Created Tasks")[0]
+    assert "informal task" not in remaining
+    assert result.count("uuid: u-") == 500
+    assert len(result.split("\n")) == 5000 - 500 + 3 + 500 + 1
+    assert elapsed < 0.1, f"reorganize_note took {elapsed:.3f}s"
@@ -62,9 +62,9 @@ def test_create_task_in_project_success(tmp_path, monkeypatch):
     )
 
     # Mock TaskWarrior integration
-    with patch("brainplorp.core.projects.create_task") as mock_create:
-        with patch("brainplorp.core.projects.add_annotation") as mock_annotate:
-            mock_create.return_value = "abc-123"  # Mock UUID
+    with patch("brainplorp.core.projects.create_tasks") as mock_create:
+        with patch("brainplorp.core.projects._sync_project_task_section"):
+            mock_create.return_value = [{"uuid": "abc-123"}]  # Mock import
 
             # Test: Create task in project
             task_uuid = create_task_in_project(
@@ -74,20 +74,17 @@ def test_create_task_in_project_success(tmp_path, monkeypatch):
                 priority="H"
             )
 
-            # Assert: Task created with correct parameters
-            mock_create.assert_called_once_with(
-                description="Design homepage",
-                project="work.marketing.website",
-                due="friday",
-                priority="H",
-                tags=None
-            )
-
-            # Assert: Task annotated
-            mock_annotate.assert_called_once_with(
-                "abc-123",
-                "plorp-project:work.marketing.website"
-            )
+            # Assert: Task created (and annotated) in a single import
+            mock_create.assert_called_once_with([
+                {
+                    "description": "Design homepage",
+                    "project": "work.marketing.website",
+                    "due": "friday",
+                    "priority": "H",
+                    "tags": None,
+                    "annotations": ["plorp-project:work.marketing.website"],
+                }
+            ])
 
             # Assert: UUID returned
             assert task_uuid == "abc-123"
@@ -117,7 +114,7 @@ def test_create_task_in_project_taskwarrior_fails(tmp_path, monkeypatch):
     create_project(name="website", domain="work", workstream="marketing")
 
     # Mock TaskWarrior to return None (failure)
-    with patch("brainplorp.core.projects.create_task", return_value=None):
+    with patch("brainplorp.core.projects.create_tasks", return_value=[]):
         # Should raise RuntimeError
         with pytest.raises(RuntimeError, match="Failed to create task"):
             create_task_in_project(
@@ -130,7 +127,7 @@ def test_list_project_tasks(tmp_path, monkeypatch):
     """Test listing tasks for a project."""
     monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
 
-    # Mock TaskWarrior get_tasks
+    # Mock TaskWarrior iter_tasks
     mock_tasks = [
         {
             "uuid": "abc-123",
@@ -153,7 +150,7 @@ def test_list_project_tasks(tmp_path, monkeypatch):
         }
     ]
 
-    with patch("brainplorp.core.projects.get_tasks", return_value=mock_tasks):
+    with patch("brainplorp.core.projects.iter_tasks", return_value=iter(mock_tasks)):
         # Test: List tasks
         tasks = list_project_tasks("work.marketing.website")
 
@@ -169,7 +166,7 @@ def test_list_tasks_by_domain(tmp_path, monkeypatch):
     """Test listing all tasks in a domain."""
     monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
 
-    # Mock TaskWarrior get_tasks
+    # Mock TaskWarrior iter_tasks
     mock_tasks = [
         {
             "uuid": "abc-123",
@@ -189,7 +186,7 @@ def test_list_tasks_by_domain(tmp_path, monkeypatch):
         }
     ]
 
-    with patch("brainplorp.core.projects.get_tasks", return_value=mock_tasks) as mock_get:
+    with patch("brainplorp.core.projects.iter_tasks", return_value=iter(mock_tasks)) as mock_get:
         # Test: List tasks in domain
         tasks = list_tasks_by_domain("work")
 
@@ -203,7 +200,7 @@ def test_list_tasks_by_domain(tmp_path, monkeypatch):
 
 def test_list_orphaned_tasks():
     """Test listing tasks with no project."""
-    # Mock TaskWarrior get_tasks
+    # Mock TaskWarrior iter_tasks
     mock_tasks = [
         {
             "uuid": "abc-123",
@@ -214,7 +211,7 @@ def test_list_orphaned_tasks():
         }
     ]
 
-    with patch("brainplorp.core.projects.get_tasks", return_value=mock_tasks) as mock_get:
+    with patch("brainplorp.core.projects.iter_tasks", return_value=iter(mock_tasks)) as mock_get:
         # Test: List orphaned tasks
         tasks = list_orphaned_tasks()
 
@@ -252,7 +249,7 @@ def test_list_project_tasks_with_orphan_warning(tmp_path, monkeypatch, capsys):
         }
     ]
 
-    with patch("brainplorp.core.projects.get_tasks", return_value=mock_tasks):
+    with patch("brainplorp.core.projects.iter_tasks", return_value=iter(mock_tasks)):
         # Test: List project tasks
         tasks = list_project_tasks("work.marketing.website")
 
@@ -282,9 +279,9 @@ def test_integration_create_project_and_tasks(tmp_path, monkeypatch):
     assert project["full_path"] == "work.engineering.api-rewrite"
 
     # Mock TaskWarrior for task creation
-    with patch("brainplorp.core.projects.create_task") as mock_create:
-        with patch("brainplorp.core.projects.add_annotation"):
-            mock_create.side_effect = ["task-1", "task-2", "task-3"]
+    with patch("brainplorp.core.projects.create_tasks") as mock_create:
+        with patch("brainplorp.core.projects._sync_project_task_section"):
+            mock_create.side_effect = [[{"uuid": "task-1"}], [{"uuid": "task-2"}], [{"uuid": "task-3"}]]
 
             # Add multiple tasks
             uuid1 = create_task_in_project("Setup project", "work.engineering.api-rewrite")
@@ -471,11 +468,11 @@ def test_create_task_in_project_returns_uuid(tmp_path, monkeypatch):
     create_project(name="test-project", domain="work", workstream="test")
 
     # Mock TaskWarrior to return UUID
-    with patch("brainplorp.core.projects.create_task") as mock_create:
-        with patch("brainplorp.core.projects.add_annotation"):
+    with patch("brainplorp.core.projects.create_tasks") as mock_create:
+        with patch("brainplorp.core.projects._sync_project_task_section"):
             # Simulate successful task creation with valid UUID
             test_uuid = "a1b2c3d4-e5f6-7890-1234-567890abcdef"
-            mock_create.return_value = test_uuid
+            mock_create.return_value = [{"uuid": test_uuid}]
 
             from brainplorp.core.projects import create_task_in_project
 
@@ -696,10 +693,11 @@ def test_rename_project_preserves_task_uuids(tmp_path, monkeypatch):
     add_task_to_project("work.api", "task-1")
     add_task_to_project("work.api", "task-2")
 
-    # Mock TaskWarrior modify and annotate
+    # Mock TaskWarrior bulk modify and annotate
     from unittest.mock import patch
-    with patch("brainplorp.integrations.taskwarrior.modify_task") as mock_modify, \
-         patch("brainplorp.integrations.taskwarrior.add_annotation") as mock_annotate:
+    with patch("brainplorp.integrations.taskwarrior.bulk_modify") as mock_modify, \
+         patch("brainplorp.integrations.taskwarrior.bulk_annotate") as mock_annotate:
+        mock_modify.return_value = {"task-1": True, "task-2": True}
 
         # Test: Rename project
         result = rename_project(tmp_path, "work.api", "work.engineering.api")
@@ -709,9 +707,33 @@ def test_rename_project_preserves_task_uuids(tmp_path, monkeypatch):
         assert "task-1" in result["task_uuids"]
         assert "task-2" in result["task_uuids"]
 
-        # Assert: TaskWarrior updated for both tasks (State Sync per Q8)
-        assert mock_modify.call_count == 2
-        assert mock_annotate.call_count == 2
+        # Assert: TaskWarrior updated for both tasks in one call each (State Sync per Q8)
+        mock_modify.assert_called_once_with(["task-1", "task-2"], project="work.engineering.api")
+        mock_annotate.assert_called_once_with(
+            ["task-1", "task-2"], "plorp-project:work.engineering.api"
+        )
+
+
+def test_rename_project_warns_on_partial_failure(tmp_path, monkeypatch, capsys):
+    """Test rename reports tasks the bulk modify could not update."""
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+    from brainplorp.core.projects import rename_project
+
+    create_project("api", "work")
+    from brainplorp.integrations.obsidian_bases import add_task_to_project
+    add_task_to_project("work.api", "task-1")
+    add_task_to_project("work.api", "task-2")
+
+    from unittest.mock import patch
+    with patch("brainplorp.integrations.taskwarrior.bulk_modify") as mock_modify, \
+         patch("brainplorp.integrations.taskwarrior.bulk_annotate"):
+        mock_modify.return_value = {"task-1": True, "task-2": False}
+
+        rename_project(tmp_path, "work.api", "work.engineering.api")
+
+    output = capsys.readouterr().out
+    assert "task-2" in output
+    assert "task-1" not in output
 
 
 # ============================================================================
@@ -990,12 +1012,15 @@ def test_process_project_note_marks_tasks_done(tmp_path, monkeypatch):
     note_path.write_text(content)
 
     # Mock TaskWarrior
-    with patch("brainplorp.integrations.taskwarrior.mark_done") as mock_done:
+    with patch("brainplorp.integrations.taskwarrior.bulk_mark_done") as mock_done:
+        mock_done.return_value = {"task-1": True}
+
         # Test: Process project note
-        process_project_note(tmp_path, "work.marketing.website")
+        count = process_project_note(tmp_path, "work.marketing.website")
 
         # Assert: Task marked done in TaskWarrior
-        mock_done.assert_called_once_with("task-1")
+        mock_done.assert_called_once_with(["task-1"])
+        assert count == 1
 
 
 def test_process_project_note_syncs_after_marking_done(tmp_path, monkeypatch):
@@ -1015,8 +1040,9 @@ def test_process_project_note_syncs_after_marking_done(tmp_path, monkeypatch):
     note_path.write_text(content)
 
     # Mock TaskWarrior
-    with patch("brainplorp.integrations.taskwarrior.mark_done") as mock_done, \
+    with patch("brainplorp.integrations.taskwarrior.bulk_mark_done") as mock_done, \
          patch("brainplorp.integrations.taskwarrior.get_task_info") as mock_get:
+        mock_done.return_value = {"task-1": True}
 
         # After marking done, task status changes to completed
         mock_get.return_value = {
@@ -1053,7 +1079,7 @@ def test_process_project_note_removes_from_frontmatter(tmp_path, monkeypatch):
     note_path.write_text(content)
 
     # Mock TaskWarrior
-    with patch("brainplorp.integrations.taskwarrior.mark_done"):
+    with patch("brainplorp.integrations.taskwarrior.bulk_mark_done", return_value={}):
         # Test: Process
         process_project_note(tmp_path, "work.marketing.website")
 
@@ -1079,9 +1105,115 @@ def test_process_project_note_handles_no_checkboxes(tmp_path, monkeypatch):
     note_path.write_text(content)
 
     # Mock TaskWarrior
-    with patch("brainplorp.integrations.taskwarrior.mark_done") as mock_done:
+    with patch("brainplorp.integrations.taskwarrior.bulk_mark_done") as mock_done:
         # Test: Process
         process_project_note(tmp_path, "work.marketing.website")
 
-        # Assert: mark_done not called (no checked tasks)
+        # Assert: bulk_mark_done not called (no checked tasks)
         mock_done.assert_not_called()
+
+
+def test_remove_tasks_from_all_projects_rewrites_each_note_once(tmp_path, monkeypatch):
+    """Many UUIDs are removed in one pass with one task lookup."""
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+
+    create_project(name="website", domain="work", workstream="marketing")
+    create_project(name="api", domain="work", workstream="engineering")
+    create_project(name="garden", domain="home", workstream="maintenance")
+
+    from brainplorp.integrations.obsidian_bases import add_task_to_project
+    for uuid in ("task-1", "task-2", "task-3"):
+        add_task_to_project("work.marketing.website", uuid)
+    add_task_to_project("work.engineering.api", "task-2")
+    add_task_to_project("home.maintenance.garden", "task-9")
+
+    lookups = []
+
+    def lookup(uuids):
+        lookups.append(list(uuids))
+        return {"task-3": {"uuid": "task-3", "description": "Launch", "status": "pending"}}, 1
+
+    monkeypatch.setattr("brainplorp.integrations.taskwarrior.get_tasks_by_uuid", lookup)
+
+    from brainplorp.core.projects import remove_tasks_from_all_projects
+    rewritten = remove_tasks_from_all_projects(tmp_path, ["task-1", "task-2"])
+
+    assert sorted(rewritten) == ["work.engineering.api", "work.marketing.website"]
+    assert lookups == [["task-3"]]
+    assert get_project_info("work.marketing.website")["task_uuids"] == ["task-3"]
+    assert get_project_info("work.engineering.api")["task_uuids"] == []
+    assert get_project_info("home.maintenance.garden")["task_uuids"] == ["task-9"]
+
+    body = (tmp_path / "projects" / "work.marketing.website.md").read_text()
+    assert "## Tasks (1)" in body
+    assert "- [ ] Launch (uuid: task-3)" in body
+
+
+def test_sync_all_projects_one_query_and_write_if_changed(tmp_path, monkeypatch):
+    """Bulk sync fetches tasks once and rewrites only notes that differ."""
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+    from brainplorp.core.projects import sync_all_projects
+    from brainplorp.integrations.obsidian_bases import add_task_to_project
+
+    create_project("website", "work", "marketing")
+    create_project("api", "work", "engineering")
+    create_project("garden", "home", "maintenance")
+    add_task_to_project("work.marketing.website", "task-1")
+    add_task_to_project("work.marketing.website", "task-done")
+    add_task_to_project("work.engineering.api", "task-2")
+
+    pending = [
+        {"uuid": "task-1", "description": "Design homepage", "status": "pending", "priority": "H"},
+        {"uuid": "task-2", "description": "Write spec", "status": "pending"},
+        {"uuid": "task-other", "description": "Unlinked", "status": "pending"},
+    ]
+
+    with patch("brainplorp.integrations.taskwarrior.get_tasks", return_value=pending) as mock_get:
+        first = sync_all_projects(tmp_path)
+        second = sync_all_projects(tmp_path)
+
+    assert mock_get.call_count == 2
+    mock_get.assert_called_with(["status:pending"])
+
+    assert first["synced"] == 3
+    assert first["changed"] == 3
+    assert first["errors"] == []
+    assert set(first["timing_ms"]) == {"read", "fetch", "render_write", "total"}
+
+    # Nothing changed in TaskWarrior: no note is written again
+    assert second["synced"] == 3
+    assert second["changed"] == 0
+    assert second["unchanged"] == 3
+
+    website = (tmp_path / "projects" / "work.marketing.website.md").read_text()
+    assert "## Tasks (1)" in website
+    assert "- [ ] Design homepage (priority: H, uuid: task-1)" in website
+    assert "task-done" not in website.split("---", 2)[2]
+    api = (tmp_path / "projects" / "work.engineering.api.md").read_text()
+    assert "- [ ] Write spec (uuid: task-2)" in api
+
+
+def test_sync_all_projects_reports_errors_and_continues(tmp_path, monkeypatch):
+    """A note that fails to render is reported; the others still sync."""
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+    from brainplorp.core.projects import sync_all_projects
+
+    create_project("website", "work", "marketing")
+    create_project("api", "work", "engineering")
+
+    import brainplorp.core.projects as projects_module
+
+    original = projects_module._render_tasks_section
+
+    def render(body, tasks):
+        if "Api" in body:
+            raise RuntimeError("boom")
+        return original(body, tasks)
+
+    monkeypatch.setattr(projects_module, "_render_tasks_section", render)
+
+    with patch("brainplorp.integrations.taskwarrior.get_tasks", return_value=[]):
+        stats = sync_all_projects(tmp_path)
+
+    assert stats["synced"] == 1
+    assert stats["errors"] == [("work.engineering.api", "RuntimeError: boom")]
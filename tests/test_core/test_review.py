@@ -9,7 +9,12 @@ from datetime import date
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
-from brainplorp.core.review import get_review_tasks, add_review_notes, _normalize_task
+from brainplorp.core.review import (
+    get_review_tasks,
+    get_review_backlog,
+    add_review_notes,
+    _normalize_task,
+)
 from brainplorp.core.exceptions import VaultNotFoundError, DailyNoteNotFoundError
 
 
@@ -32,8 +37,8 @@ def test_get_review_tasks_returns_uncompleted(tmp_path):
 """
     )
 
-    with patch("brainplorp.core.review.get_task_info") as mock_get_task:
-        mock_get_task.side_effect = lambda uuid: {
+    with patch("brainplorp.core.review.get_tasks_by_uuid") as mock_get_tasks:
+        mock_get_tasks.return_value = ({
             "abc-123": {
                 "uuid": "abc-123",
                 "description": "Uncompleted task 1",
@@ -52,10 +57,12 @@ def test_get_review_tasks_returns_uncompleted(tmp_path):
                 "project": None,
                 "tags": [],
             },
-        }.get(uuid)
+        }, 1)
 
         result = get_review_tasks(date(2025, 10, 6), vault)
 
+        mock_get_tasks.assert_called_once_with(["abc-123", "ghi-789"])
+        assert result["subprocesses_avoided"] == 1
         assert result["date"] == "2025-10-06"
         assert result["uncompleted_count"] == 2
         assert result["total_tasks"] == 2
@@ -80,20 +87,21 @@ def test_get_review_tasks_handles_missing_tasks(tmp_path):
 """
     )
 
-    with patch("brainplorp.core.review.get_task_info") as mock_get_task:
-        # First task returns None (deleted), second exists
-        mock_get_task.side_effect = lambda uuid: (
-            None
-            if uuid == "deleted-123"
-            else {
-                "uuid": "exists-456",
-                "description": "Task still exists",
-                "status": "pending",
-                "due": None,
-                "priority": "",
-                "project": None,
-                "tags": [],
-            }
+    with patch("brainplorp.core.review.get_tasks_by_uuid") as mock_get_tasks:
+        # First task is unknown to TaskWarrior (deleted), second exists
+        mock_get_tasks.return_value = (
+            {
+                "exists-456": {
+                    "uuid": "exists-456",
+                    "description": "Task still exists",
+                    "status": "pending",
+                    "due": None,
+                    "priority": "",
+                    "project": None,
+                    "tags": [],
+                }
+            },
+            1,
         )
 
         result = get_review_tasks(date(2025, 10, 6), vault)
@@ -107,6 +115,53 @@ def test_get_review_tasks_handles_missing_tasks(tmp_path):
         assert result["uncompleted_tasks"][1]["status"] == "pending"
 
 
+def test_get_review_backlog_merges_days(tmp_path):
+    """Tasks unchecked on several days appear once, with every day listed."""
+    vault = tmp_path / "vault"
+    daily_dir = vault / "daily"
+    daily_dir.mkdir(parents=True)
+
+    (daily_dir / "2025-10-06.md").write_text(
+        "- [ ] Write report (uuid: aaa-1)\n- [ ] Old chore (uuid: done-2)\n"
+    )
+    (daily_dir / "2025-10-08.md").write_text(
+        "- [ ] Write report (uuid: aaa-1)\n"
+        "- [x] Finished (uuid: fin-3)\n"
+        "- [ ] Vanished (uuid: gone-4)\n"
+    )
+    (daily_dir / "2025-10-12.md").write_text("- [ ] Outside range (uuid: late-5)\n")
+
+    with patch("brainplorp.core.review.get_tasks_by_uuid") as mock_get_tasks:
+        mock_get_tasks.return_value = (
+            {
+                "aaa-1": {"uuid": "aaa-1", "description": "Write report", "status": "pending"},
+                "done-2": {"uuid": "done-2", "description": "Old chore", "status": "completed"},
+            },
+            1,
+        )
+
+        backlog = get_review_backlog(date(2025, 10, 6), vault, date(2025, 10, 9))
+
+    mock_get_tasks.assert_called_once_with(["aaa-1", "done-2", "gone-4"])
+    assert backlog["notes_scanned"] == ["2025-10-06", "2025-10-08"]
+    assert [t["uuid"] for t in backlog["tasks"]] == ["aaa-1", "gone-4"]
+    assert backlog["tasks"][0]["days"] == ["2025-10-06", "2025-10-08"]
+    assert backlog["tasks"][1]["status"] == "missing"
+    assert backlog["tasks"][1]["description"] == "Vanished"
+    assert backlog["task_count"] == 2
+    assert backlog["resolved_count"] == 1
+    assert backlog["subprocesses_avoided"] == 3
+
+
+def test_get_review_backlog_rejects_reversed_range(tmp_path):
+    """until before since raises ValueError."""
+    vault = tmp_path / "vault"
+    vault.mkdir()
+
+    with pytest.raises(ValueError):
+        get_review_backlog(date(2025, 10, 9), vault, date(2025, 10, 6))
+
+
 def test_get_review_tasks_raises_on_missing_vault(tmp_path):
     """Test that get_review_tasks raises if vault doesn't exist."""
     missing_vault = tmp_path / "nonexistent"
@@ -0,0 +1,122 @@
+"""
+Tests for plorp.core.task_table module.
+
+Tests columnar storage, predicates and lazy TaskInfo views.
+"""
+
+from datetime import date
+
+from brainplorp.core.task_table import NO_DUE, TaskTable, parse_due, to_task_info
+
+
+def _table():
+    return TaskTable.from_tasks(
+        [
+            {
+                "uuid": "a",
+                "description": "Overdue",
+                "status": "pending",
+                "due": "20251001T000000Z",
+                "priority": "H",
+                "project": "work.api",
+            },
+            {
+                "uuid": "b",
+                "description": "Today",
+                "status": "pending",
+                "due": "20251006T150000Z",
+                "priority": "L",
+                "project": "workshop",
+            },
+            {
+                "uuid": "c",
+                "description": "Recurring today",
+                "status": "pending",
+                "due": "20251006T080000Z",
+                "recur": "daily",
+                "project": "work",
+            },
+            {"uuid": "d", "description": "Someday", "status": "pending", "priority": "M"},
+            {
+                "uuid": "e",
+                "description": "Done",
+                "status": "completed",
+                "due": "20251010T000000Z",
+                "project": "work.api",
+            },
+        ]
+    )
+
+
+def _uuids(table, rows):
+    return [table.raw(i)["uuid"] for i in rows]
+
+
+def test_parse_due_formats():
+    """Export format, bare dates and garbage."""
+    assert parse_due("20251006T000000Z") == 1759708800
+    assert parse_due("20251006") == 1759708800
+    assert parse_due("not a date") == NO_DUE
+    assert parse_due(None) == NO_DUE
+
+
+def test_columns_are_compact():
+    """Projects are interned once; codes are small ints."""
+    table = _table()
+
+    assert len(table) == 5
+    assert table.projects == ["work.api", "workshop", "work"]
+    assert list(table.project) == [0, 1, 2, -1, 0]
+    assert list(table.priority) == [3, 1, 0, 2, 0]
+    assert table.due[3] == NO_DUE
+
+
+def test_due_predicates():
+    """overdue/due_on compare against the UTC day, like the daily note always has."""
+    table = _table()
+    today = date(2025, 10, 6)
+
+    assert _uuids(table, table.overdue(today)) == ["a"]
+    assert _uuids(table, table.due_on(today)) == ["b", "c"]
+    assert _uuids(table, table.is_recurring(table.due_on(today))) == ["c"]
+
+
+def test_due_by_day_buckets_a_range():
+    """One scan splits rows into before-range and per-day buckets."""
+    table = _table()
+
+    before, by_day = table.due_by_day(date(2025, 10, 6), 5)
+
+    assert _uuids(table, before) == ["a"]
+    assert [_uuids(table, rows) for rows in by_day] == [["b", "c"], [], [], [], ["e"]]
+    assert table.due_by_day(date(2025, 10, 6), 4)[1][-1] == []
+
+
+def test_in_domain_excludes_sibling_prefixes():
+    """'work' matches work and work.*, not workshop."""
+    table = _table()
+
+    assert _uuids(table, table.in_domain("work")) == ["a", "c", "e"]
+    assert _uuids(table, table.without_project()) == ["d"]
+
+
+def test_priority_and_status():
+    """priority_at_least is ordered H > M > L; predicates compose via rows."""
+    table = _table()
+
+    assert _uuids(table, table.priority_at_least("M")) == ["a", "d"]
+    pending = table.with_status("pending")
+    assert _uuids(table, table.in_domain("work", rows=pending)) == ["a", "c"]
+
+
+def test_infos_are_lazy_and_cached():
+    """TaskInfo views are built on first access only."""
+    table = _table()
+
+    assert table._infos == {}
+    first = table.info(1)
+    assert table.info(1) is first
+    assert list(table._infos) == [1]
+    assert first == to_task_info(table.raw(1))
+    assert first["priority"] == "L"
+    assert table.info(4)["priority"] == ""
@@ -235,3 +235,32 @@ def test_set_priority_valid_values():
             for priority in valid_priorities:
                 result = set_priority("abc-123", priority)
                 assert result["priority"] == (priority if priority else None)
+
+
+# Async variants (MCP server)
+@pytest.mark.asyncio
+async def test_mark_completed_async_success(tmp_path):
+    """Async completion awaits TaskWarrior and runs State Sync."""
+    from brainplorp.core.tasks import mark_completed_async
+
+    with patch("brainplorp.core.tasks.get_task_info_async") as mock_get_task, \
+         patch("brainplorp.core.tasks.mark_done_async") as mock_mark_done, \
+         patch("brainplorp.core.projects.remove_task_from_all_projects") as mock_sync:
+        mock_get_task.return_value = {"uuid": "abc-123", "description": "Test task"}
+        mock_mark_done.return_value = True
+
+        result = await mark_completed_async("abc-123", vault_path=tmp_path)
+
+        assert result["description"] == "Test task"
+        mock_mark_done.assert_awaited_once_with("abc-123")
+        mock_sync.assert_called_once_with(tmp_path, "abc-123")
+
+
+@pytest.mark.asyncio
+async def test_set_priority_async_task_not_found():
+    """Async variants raise the same errors as the sync ones."""
+    from brainplorp.core.tasks import set_priority_async
+
+    with patch("brainplorp.core.tasks.get_task_info_async", return_value=None):
+        with pytest.raises(TaskNotFoundError):
+            await set_priority_async("nonexistent-123", "H")
@@ -0,0 +1,118 @@
+# ABOUTME: Tests for the process-wide parsed-note LRU cache
+# ABOUTME: Covers mtime/size invalidation, byte-bounded eviction, memoized queries and stats
+import os
+
+import pytest
+
+from brainplorp.integrations.note_cache import NoteCache
+from brainplorp.parsers.note_structure import (
+    detect_project_headers,
+    extract_bullet_points,
+    extract_headers,
+    extract_tags,
+    find_header_content,
+)
+
+NOTE = """---
+title: Planning
+tags: [work]
+---
+
+# Planning #weekly
+
+## Tasks
+
+- Ship the #launch post
+- Review metrics
+
+### Project: Website Redesign
+
+- Draft copy
+"""
+
+
+@pytest.fixture
+def note(tmp_path):
+    path = tmp_path / "planning.md"
+    path.write_text(NOTE)
+    return path
+
+
+def test_hits_until_the_note_changes(note):
+    """Unchanged notes are served from memory; an edit is picked up by mtime/size."""
+    cache = NoteCache()
+
+    first = cache.get(note)
+    assert cache.get(note) is first
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+    note.write_text(NOTE.replace("Review metrics", "Review the metrics"))
+    stat = note.stat()
+    os.utime(note, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    second = cache.get(note)
+    assert second is not first
+    assert "Review the metrics" in second.bullets("Tasks")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+    assert stats["bytes"] == note.stat().st_size
+    assert stats["hit_rate"] == 0.333
+
+
+def test_memoized_queries_match_parsers(note):
+    """Every cached query returns what the note_structure function returns."""
+    parsed = NoteCache().get(note)
+
+    assert parsed.frontmatter == {"title": "Planning", "tags": ["work"]}
+    assert parsed.title == "Planning"
+    assert parsed.headers() == extract_headers(NOTE)
+    assert parsed.headers(2) == extract_headers(NOTE, 2)
+    assert parsed.section("Tasks") == find_header_content(NOTE, "Tasks")
+    assert parsed.bullets() == extract_bullet_points(NOTE)
+    assert parsed.bullets("Tasks") == extract_bullet_points(NOTE, "Tasks")
+    assert parsed.projects() == detect_project_headers(NOTE) == ["Website Redesign"]
+    assert parsed.tags() == extract_tags(NOTE)
+
+    # Results are copies: modifying one doesn't change the cached value
+    parsed.headers()[0]["text"] = "changed"
+    parsed.bullets().clear()
+    assert parsed.headers() == extract_headers(NOTE)
+    assert parsed.bullets() == extract_bullet_points(NOTE)
+
+
+def test_evicts_least_recently_used_by_bytes(tmp_path):
+    """Total cached bytes stay under the bound; the oldest-used note goes first."""
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.md"
+        path.write_text(f"# {name}\n" + "x" * 90)
+        paths.append(path)
+    a, b, c = paths
+
+    cache = NoteCache(max_bytes=250)
+    cache.get(a)
+    cache.get(b)
+    cache.get(a)  # b is now least recently used
+    cache.get(c)
+
+    stats = cache.stats()
+    assert stats["evictions"] == 1
+    assert stats["entries"] == 2
+    assert stats["bytes"] <= 250
+
+    cache.reset_stats()
+    cache.get(a)
+    cache.get(b)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_notes_larger_than_the_bound_are_not_kept(note):
+    """An oversized note is parsed and returned but never cached."""
+    cache = NoteCache(max_bytes=10)
+
+    assert cache.get(note).title == "Planning"
+    assert cache.stats()["entries"] == 0 and cache.stats()["bytes"] == 0
+
+    with pytest.raises(FileNotFoundError):
+        cache.get(note.with_name("missing.md"))
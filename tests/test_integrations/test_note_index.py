@@ -0,0 +1,170 @@
+# ABOUTME: Tests for the SQLite frontmatter index behind search_notes_by_metadata
+# ABOUTME: Covers field queries, BM25 full-text search, and incremental refresh by mtime/size
+import os
+from pathlib import Path
+
+import time
+
+import pytest
+
+from brainplorp.integrations.note_index import fts_query, query_notes, refresh_index, search_text
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "notes").mkdir(parents=True)
+    (vault / "projects").mkdir()
+    (vault / ".trash").mkdir()
+
+    (vault / "notes" / "alpha.md").write_text(
+        "---\ntitle: Alpha\ntags: [seo, marketing]\nstatus: active\npriority: 3\n"
+        "due: 2025-10-06\nauthor:\n  name: Sam\n---\n\n# Alpha\n\none two three\n"
+    )
+    (vault / "notes" / "beta.md").write_text(
+        "---\ntags: seo\nstatus: archived\npriority: 1\ndue: 2025-12-01\n---\n\n"
+        "# Beta\n\none\n"
+    )
+    (vault / "projects" / "gamma.md").write_text(
+        "---\nstatus: active-ish\npriority: 2\n---\n\n# Gamma\n\none two\n"
+    )
+    (vault / "notes" / "plain.md").write_text("# Plain\n\nNo frontmatter here.\n")
+    (vault / ".trash" / "deleted.md").write_text("---\nstatus: active\n---\n")
+    return vault
+
+
+def _paths(results):
+    return [r["path"] for r in results]
+
+
+def test_equality_matches_scalars_and_list_elements(vault):
+    """eq matches scalar values and any element of list values."""
+    assert _paths(query_notes(vault, "tags", "seo")) == ["notes/alpha.md", "notes/beta.md"]
+    assert _paths(query_notes(vault, "tags", "marketing")) == ["notes/alpha.md"]
+    assert _paths(query_notes(vault, "priority", 2)) == ["projects/gamma.md"]
+    assert _paths(query_notes(vault, "author.name", "Sam")) == ["notes/alpha.md"]
+    assert _paths(query_notes(vault, "status", ["archived", "active-ish"], op="in")) == [
+        "notes/beta.md",
+        "projects/gamma.md",
+    ]
+
+    alpha = query_notes(vault, "status", "active")[0]
+    assert alpha["title"] == "Alpha"
+    assert alpha["word_count"] == 5
+    assert alpha["metadata"]["due"] == "2025-10-06"
+
+
+def test_prefix_range_sort_and_limit(vault):
+    """Prefix and range queries work on text, dates and numbers."""
+    assert _paths(query_notes(vault, "status", "active", op="prefix")) == [
+        "notes/alpha.md",
+        "projects/gamma.md",
+    ]
+    assert _paths(query_notes(vault, "due", "2025-11-01", op="lt")) == ["notes/alpha.md"]
+    assert _paths(query_notes(vault, "priority", 2, op="gte", sort="word_count")) == [
+        "projects/gamma.md",
+        "notes/alpha.md",
+    ]
+    assert _paths(
+        query_notes(vault, "priority", 0, op="gt", sort="title", descending=True, limit=2)
+    ) == ["projects/gamma.md", "notes/beta.md"]
+
+    with pytest.raises(ValueError):
+        query_notes(vault, "status", "active", op="like")
+
+
+def test_refresh_reads_only_changed_notes(vault, monkeypatch):
+    """Unchanged notes are answered from the index without being opened."""
+    assert refresh_index(vault) == {"total": 4, "indexed": 4, "removed": 0}
+
+    read = []
+    original = Path.read_text
+
+    def tracking(self, *args, **kwargs):
+        read.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking)
+
+    assert _paths(query_notes(vault, "tags", "seo")) == ["notes/alpha.md", "notes/beta.md"]
+    assert read == []
+
+    beta = vault / "notes" / "beta.md"
+    beta.write_text(beta.read_text().replace("tags: seo", "tags: [seo, launch]"))
+    os.remove(vault / "projects" / "gamma.md")
+    read.clear()
+
+    assert refresh_index(vault) == {"total": 3, "indexed": 1, "removed": 1}
+    assert read == ["beta.md"]
+    assert _paths(query_notes(vault, "tags", "launch")) == ["notes/beta.md"]
+    assert query_notes(vault, "priority", 2) == []
+
+
+def test_search_text_ranks_and_snippets(vault):
+    """Title/header matches outrank body matches; snippets mark the match."""
+    (vault / "notes" / "launch.md").write_text("# Launch\n\n## Launch checklist\n\nShip it.\n")
+    (vault / "notes" / "diary.md").write_text("# Diary\n\nThinking about the launch today.\n")
+
+    hits = search_text(vault, "launch")
+
+    assert [h["path"] for h in hits] == ["notes/launch.md", "notes/diary.md"]
+    assert hits[0]["score"] < hits[1]["score"]
+    assert "**launch**" in hits[1]["snippet"]
+
+    # Frontmatter values are searchable, prefixes need a trailing *
+    assert [h["path"] for h in search_text(vault, "marketing")] == ["notes/alpha.md"]
+    assert [h["path"] for h in search_text(vault, "arch*")] == ["notes/beta.md"]
+    # FTS5 syntax characters are matched literally, not parsed
+    assert search_text(vault, 'C++ "unbalanced OR') == []
+    assert fts_query('say "hi" plan*') == '"say" """hi""" "plan"*'
+
+
+def test_search_text_folder_filters(vault):
+    """Allowed folders, excluded folder names and path prefixes filter results."""
+    (vault / "notes" / "archive").mkdir()
+    (vault / "notes" / "archive" / "old.md").write_text("# Old\n\none more\n")
+    (vault / "root.md").write_text("# Root\n\none\n")
+
+    everything = {h["path"] for h in search_text(vault, "one")}
+    assert everything == {
+        "notes/alpha.md", "notes/beta.md", "notes/archive/old.md", "projects/gamma.md", "root.md",
+    }
+
+    allowed = search_text(vault, "one", allowed_folders=["notes"], excluded_folders=["archive"])
+    assert {h["path"] for h in allowed} == {"notes/alpha.md", "notes/beta.md"}
+
+    archived = search_text(vault, "one", allowed_folders=["notes"], path_prefix="notes/archive/")
+    assert [h["path"] for h in archived] == ["notes/archive/old.md"]
+
+
+def test_search_text_sees_edits_and_deletes(vault):
+    """Re-indexing picks up changed content and drops deleted notes."""
+    assert [h["path"] for h in search_text(vault, "gamma")] == ["projects/gamma.md"]
+
+    gamma = vault / "projects" / "gamma.md"
+    gamma.write_text("---\nstatus: active\n---\n\n# Delta\n\nrenamed\n")
+    assert search_text(vault, "gamma") == []
+    assert [h["path"] for h in search_text(vault, "delta")] == ["projects/gamma.md"]
+
+    os.remove(gamma)
+    assert search_text(vault, "delta") == []
+
+
+def test_index_build_benchmark(tmp_path):
+    """Cold indexing stays well within the 20k-notes-per-minute budget."""
+    vault = tmp_path / "big"
+    for folder in range(10):
+        (vault / f"f{folder}").mkdir(parents=True)
+        for i in range(200):
+            (vault / f"f{folder}" / f"n{i}.md").write_text(
+                f"---\ntags: [t{i % 20}, shared]\nstatus: s{i % 5}\n---\n\n"
+                f"# Note {folder}-{i}\n\n## Section\n\n" + "lorem ipsum dolor " * 100
+            )
+
+    started = time.perf_counter()
+    assert refresh_index(vault)["indexed"] == 2000
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 6.0  # 2k notes; 20k at this rate is under a minute
+    assert refresh_index(vault)["indexed"] == 0
+    assert len(search_text(vault, "t7", limit=500)) == 100
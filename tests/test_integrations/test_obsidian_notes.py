@@ -194,6 +194,65 @@ def test_read_folder_with_exclude(test_vault):
     assert not any("archive" in path for path in paths)
 
 
+def test_read_folder_cursor_pages_through_folder(test_vault):
+    """Pages chained by next_cursor cover the folder once, in name order."""
+    for i in range(5):
+        (test_vault / "projects" / f"p{i}.md").write_text(f"---\nn: {i}\n---\n\n# P{i}\n\none two\n")
+
+    seen, cursor = [], None
+    while True:
+        result = _read_folder(test_vault, "projects", False, None, 2, "metadata", cursor=cursor)
+        seen.extend(note["path"] for note in result["notes"])
+        cursor = result["next_cursor"]
+        assert result["has_more"] is (cursor is not None)
+        if cursor is None:
+            break
+
+    assert seen == [f"projects/p{i}.md" for i in range(5)]
+    assert result["total_count"] == 5
+
+    page = _read_folder(test_vault, "projects", False, None, 1, "metadata")
+    first = page["notes"][0]
+    assert first["title"] == "P0"
+    assert first["metadata"] == {"n": 0}
+    assert first["word_count"] == 4  # Same count as read_note: "# P0 one two"
+
+    # Cursors are tied to their sort order
+    for bad in (page["next_cursor"], "not-a-cursor"):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            _read_folder(test_vault, "projects", False, None, 2, "metadata", sort="mtime", cursor=bad)
+
+
+def test_read_folder_sorts_by_mtime_and_skips_unchanged_reads(test_vault, monkeypatch):
+    """mtime sort is newest first; unchanged notes are served without opening them."""
+    import os
+
+    for i in range(3):
+        note = test_vault / "projects" / f"p{i}.md"
+        note.write_text(f"# P{i}\n")
+        os.utime(note, ns=(i * 10**9, i * 10**9))
+
+    result = _read_folder(test_vault, "projects", False, None, 2, "metadata", sort="mtime")
+    assert [n["path"] for n in result["notes"]] == ["projects/p2.md", "projects/p1.md"]
+
+    read = []
+    original = Path.read_text
+    monkeypatch.setattr(
+        Path, "read_text", lambda self, *a, **kw: read.append(self.name) or original(self, *a, **kw)
+    )
+
+    rest = _read_folder(
+        test_vault, "projects", False, None, 2, "metadata", sort="mtime", cursor=result["next_cursor"]
+    )
+    assert [n["path"] for n in rest["notes"]] == ["projects/p0.md"]
+    assert rest["next_cursor"] is None
+    assert read == ["p0.md"]  # First listing of p0; p1/p2 weren't touched
+
+    read.clear()
+    _read_folder(test_vault, "projects", False, None, 50, "metadata", sort="mtime")
+    assert read == []
+
+
 def test_read_folder_not_found(test_vault):
     """Test reading non-existent folder raises FileNotFoundError."""
     with pytest.raises(FileNotFoundError, match="Folder not found"):
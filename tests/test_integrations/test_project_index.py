@@ -0,0 +1,184 @@
+# ABOUTME: Tests for the persistent task-UUID → project reverse index
+# ABOUTME: Covers mtime/size validation, persistence, incremental updates and index-driven State Sync
+
+import os
+
+import pytest
+
+from brainplorp.integrations import project_index
+from brainplorp.integrations.obsidian_bases import (
+    add_task_to_project,
+    create_project_note,
+    delete_project,
+    list_projects,
+    update_project_state,
+)
+from brainplorp.integrations.project_index import (
+    find_notes_with_tasks,
+    get_catalog,
+    get_index,
+    get_index_path,
+    list_indexed_projects,
+)
+
+
+@pytest.fixture
+def projects_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr("brainplorp.integrations.obsidian_bases.get_vault_path", lambda: tmp_path)
+    create_project_note("work", "marketing", "website")
+    create_project_note("work", "engineering", "api")
+    create_project_note("home", None, "garden")
+    add_task_to_project("work.marketing.website", "task-1")
+    add_task_to_project("work.marketing.website", "task-2")
+    add_task_to_project("work.engineering.api", "task-2")
+    return tmp_path / "projects"
+
+
+def _count_parses(monkeypatch):
+    parsed = []
+    original = project_index._parse_note
+
+    def counting(note_path, stat):
+        parsed.append(note_path.name)
+        return original(note_path, stat)
+
+    monkeypatch.setattr(project_index, "_parse_note", counting)
+    return parsed
+
+
+def test_find_notes_with_tasks(projects_dir):
+    """UUIDs map to the notes that list them."""
+    assert find_notes_with_tasks(projects_dir, ["task-1"]) == [
+        projects_dir / "work.marketing.website.md"
+    ]
+    assert find_notes_with_tasks(projects_dir, ["task-2", "nope"]) == [
+        projects_dir / "work.engineering.api.md",
+        projects_dir / "work.marketing.website.md",
+    ]
+    assert find_notes_with_tasks(projects_dir, ["nope"]) == []
+
+
+def test_writes_are_recorded_without_reparsing(projects_dir, monkeypatch):
+    """obsidian_bases writes update the index directly."""
+    parsed = _count_parses(monkeypatch)
+
+    get_index(projects_dir)
+    add_task_to_project("home.garden", "task-3")
+    delete_project("work.engineering.api")
+
+    assert find_notes_with_tasks(projects_dir, ["task-3"]) == [projects_dir / "home.garden.md"]
+    assert "work.engineering.api.md" not in get_index(projects_dir)
+    assert parsed == []
+
+
+def test_index_persists_and_revalidates_by_mtime_and_size(projects_dir, monkeypatch):
+    """A fresh process reuses the saved index and re-parses only changed notes."""
+    get_index(projects_dir)
+    assert get_index_path(projects_dir).exists()
+
+    project_index.clear_cache()
+    parsed = _count_parses(monkeypatch)
+
+    # External edit: same note, new content
+    note = projects_dir / "home.garden.md"
+    note.write_text(note.read_text().replace("task_uuids: []", "task_uuids:\n- task-9"))
+    # External delete
+    os.remove(projects_dir / "work.engineering.api.md")
+
+    assert find_notes_with_tasks(projects_dir, ["task-9", "task-2"]) == [
+        projects_dir / "home.garden.md",
+        projects_dir / "work.marketing.website.md",
+    ]
+    assert parsed == ["home.garden.md"]
+
+
+def test_list_indexed_projects_skips_invalid_notes(projects_dir):
+    """Notes without the required frontmatter aren't reported as projects."""
+    (projects_dir / "scratch.md").write_text("# Not a project\n")
+
+    projects = list_indexed_projects(projects_dir)
+
+    assert [p["full_path"] for p in projects] == [
+        "home.garden",
+        "work.engineering.api",
+        "work.marketing.website",
+    ]
+    garden = projects[0]
+    assert garden["needs_review"] is True
+    assert garden["note_path"] == str(projects_dir / "home.garden.md")
+
+
+def test_filtered_lists_do_not_touch_notes_when_unchanged(projects_dir, monkeypatch):
+    """Domain/state/needs_review filters are answered from the catalog indexes."""
+    update_project_state("work.engineering.api", "completed")
+    list_projects()
+
+    parsed = _count_parses(monkeypatch)
+    opened = []
+    monkeypatch.setattr(
+        "builtins.open", lambda path, *a, **kw: opened.append(path) or pytest.fail("opened")
+    )
+
+    work = list_projects(domain="work")
+    active_work = list_projects(domain="work", state="active")
+    reviews = list_projects(needs_review=True)
+
+    assert [p["full_path"] for p in work["projects"]] == [
+        "work.engineering.api",
+        "work.marketing.website",
+    ]
+    assert [p["full_path"] for p in active_work["projects"]] == ["work.marketing.website"]
+    assert [p["full_path"] for p in reviews["projects"]] == ["home.garden"]
+    assert list(work["grouped_by_domain"]) == ["work"]
+    assert parsed == [] and opened == []
+
+
+def test_catalog_reads_only_the_frontmatter(projects_dir):
+    """The note body isn't read: undecodable bytes past the frontmatter are harmless."""
+    note = projects_dir / "home.garden.md"
+    note.write_bytes(note.read_bytes() + b"x" * 20_000 + b"\xff\xfe" * 100_000)
+
+    catalog = get_catalog(projects_dir)
+
+    assert [p["full_path"] for p in catalog.select(domain="home")] == ["home.garden"]
+    assert catalog.invalid == []
+
+
+def test_catalog_reports_invalid_notes(projects_dir):
+    """Invalid notes are listed with the reason they were skipped."""
+    (projects_dir / "a-no-frontmatter.md").write_text("# Plain note\n")
+    (projects_dir / "b-missing-domain.md").write_text("---\nstate: active\n---\n")
+
+    catalog = get_catalog(projects_dir)
+
+    assert catalog.invalid[0][0] == "a-no-frontmatter.md"
+    assert "missing frontmatter" in catalog.invalid[0][1]
+    assert catalog.invalid[1] == ("b-missing-domain.md", "'domain'")
+    assert len(catalog.select()) == 3
+
+
+def test_remove_tasks_reads_only_notes_that_contain_them(projects_dir, monkeypatch):
+    """State Sync touches only notes the index lists for the UUID."""
+    from pathlib import Path
+    from brainplorp.core.projects import remove_tasks_from_all_projects
+
+    monkeypatch.setattr(
+        "brainplorp.integrations.taskwarrior.get_tasks_by_uuid", lambda uuids: ({}, 0)
+    )
+    get_index(projects_dir)
+
+    read = []
+    original = Path.read_text
+
+    def tracking(self, *args, **kwargs):
+        if self.parent == projects_dir:
+            read.append(self.name)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", tracking)
+
+    rewritten = remove_tasks_from_all_projects(projects_dir.parent, ["task-1"])
+
+    assert rewritten == ["work.marketing.website"]
+    assert read == ["work.marketing.website.md"]
+    assert find_notes_with_tasks(projects_dir, ["task-1"]) == []
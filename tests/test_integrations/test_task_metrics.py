@@ -0,0 +1,152 @@
+# ABOUTME: Tests for TaskWarrior command instrumentation - classification, percentiles, JSONL log
+# ABOUTME: Uses mocked subprocess calls; covers run_task_command hooks and doctor --perf output
+"""
+Tests for TaskWarrior command metrics.
+
+All tests use mocked subprocess calls - no actual TaskWarrior required.
+"""
+import json
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from brainplorp.integrations import task_metrics
+from brainplorp.integrations.task_metrics import (
+    classify_command,
+    get_command_stats,
+    percentile,
+    read_perf_runs,
+    record_command,
+    reset_command_stats,
+    start_run,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_metrics(tmp_path, monkeypatch):
+    """Fresh counters, and a perf log under tmp_path."""
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    reset_command_stats()
+    yield
+    reset_command_stats()
+
+
+def test_classify_command_skips_rc_and_filters():
+    """The subcommand is found after rc overrides and filter terms."""
+    assert classify_command(["status:pending", "export"]) == "export"
+    assert classify_command(["rc.bulk=0", "rc.confirmation=off", "abc", "def", "done"]) == "done"
+    assert classify_command(["abc-123", "modify", "project:work"]) == "modify"
+    assert classify_command(["sync"]) == "sync"
+    assert classify_command(["frobnicate"]) == "other"
+
+
+def test_percentile_nearest_rank():
+    """Nearest-rank percentiles on a sorted list."""
+    values = [float(i) for i in range(1, 101)]
+
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 95) == 95.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([7.0], 99) == 7.0
+    assert percentile([], 50) == 0.0
+
+
+def test_record_command_aggregates_per_subcommand():
+    """Counts, errors, timeouts and bytes are kept per subcommand."""
+    for ms in range(1, 101):
+        record_command(["status:pending", "export"], ms / 1000.0, 0, 1000)
+    record_command(["abc", "done"], 0.005, 1, 0)
+    record_command(["sync"], 60.0, -1, 0, timed_out=True)
+
+    stats = get_command_stats()
+
+    assert stats["export"]["count"] == 100
+    assert stats["export"]["bytes"] == 100_000
+    assert stats["export"]["p50_ms"] == pytest.approx(50.0)
+    assert stats["export"]["p99_ms"] == pytest.approx(99.0)
+    assert stats["done"]["errors"] == 1
+    assert stats["sync"]["timeouts"] == 1
+    assert stats["sync"]["errors"] == 0
+
+
+def test_run_task_command_is_recorded():
+    """run_task_command records duration, exit code and stdout size."""
+    from brainplorp.integrations.taskwarrior import run_task_command
+
+    with patch("subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="[]\n", stderr="")
+        run_task_command(["status:pending", "export"])
+
+    stats = get_command_stats()
+    assert stats["export"]["count"] == 1
+    assert stats["export"]["bytes"] == 3
+
+
+def test_run_task_command_timeout_is_recorded():
+    """Timeouts are counted even though the call raises."""
+    from brainplorp.integrations.taskwarrior import TaskWarriorTimeoutError, run_task_command
+
+    with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(["task"], 60)):
+        with pytest.raises(TaskWarriorTimeoutError):
+            run_task_command(["sync"], timeout=60)
+
+    assert get_command_stats()["sync"]["timeouts"] == 1
+
+
+def test_perf_log_disabled_by_default(tmp_path):
+    """Nothing is written unless BRAINPLORP_PERF_LOG is set."""
+    record_command(["export"], 0.01, 0, 10)
+
+    assert not task_metrics.get_perf_log_path().exists()
+
+
+def test_perf_log_groups_by_run(monkeypatch):
+    """With the log enabled, each call is tagged with its run and workflow."""
+    monkeypatch.setenv("BRAINPLORP_PERF_LOG", "1")
+
+    start_run("start")
+    record_command(["status:pending", "export"], 0.020, 0, 4096)
+    record_command(["status:completed", "export"], 0.040, 0, 1024)
+    start_run("review")
+    record_command(["abc", "done"], 0.010, 0, 0)
+
+    lines = task_metrics.get_perf_log_path().read_text().splitlines()
+    assert len(lines) == 3
+    assert json.loads(lines[0])["workflow"] == "start"
+
+    runs = read_perf_runs()
+    assert [r["workflow"] for r in runs] == ["start", "review"]
+    assert runs[0]["calls"] == 2
+    assert runs[0]["commands"]["export"]["bytes"] == 5120
+    assert runs[0]["commands"]["export"]["p95_ms"] == pytest.approx(40.0)
+    assert runs[1]["commands"]["done"]["count"] == 1
+
+    assert [r["workflow"] for r in read_perf_runs(last=1)] == ["review"]
+
+
+def test_doctor_perf_reports_runs(monkeypatch):
+    """'brainplorp doctor --perf' prints per-run command tables."""
+    from brainplorp.cli import cli
+
+    monkeypatch.setenv("BRAINPLORP_PERF_LOG", "1")
+    start_run("start")
+    record_command(["status:pending", "export"], 0.020, 0, 4096)
+
+    result = CliRunner().invoke(cli, ["doctor", "--perf"])
+
+    assert result.exit_code == 0
+    assert "start" in result.output
+    assert "export" in result.output
+    assert "4096" in result.output
+
+
+def test_doctor_perf_without_log_explains_how_to_enable():
+    """Without a log, --perf tells the user how to turn recording on."""
+    from brainplorp.cli import cli
+
+    result = CliRunner().invoke(cli, ["doctor", "--perf"])
+
+    assert result.exit_code == 0
+    assert "BRAINPLORP_PERF_LOG=1" in result.output
@@ -0,0 +1,236 @@
+# ABOUTME: Tests for read-only TaskChampion SQLite access
+# ABOUTME: Uses a temporary database with an operations table - no TaskWarrior required
+"""
+Tests for TaskChampion database access.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from brainplorp.integrations.taskchampion import (
+    get_operations_marker,
+    get_taskchampion_db,
+    query_tasks,
+)
+
+
+def _make_db(path):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE operations (id INTEGER PRIMARY KEY AUTOINCREMENT, data STRING)")
+    conn.commit()
+    return conn
+
+
+def test_get_taskchampion_db_honors_taskdata(monkeypatch, tmp_path):
+    """TASKDATA overrides the default ~/.task location."""
+    monkeypatch.setenv("TASKDATA", str(tmp_path))
+    assert get_taskchampion_db() == tmp_path / "taskchampion.sqlite3"
+
+
+def test_operations_marker_missing_db(tmp_path):
+    """Missing database disables the marker."""
+    assert get_operations_marker(tmp_path / "taskchampion.sqlite3") is None
+
+
+def test_operations_marker_not_taskchampion(tmp_path):
+    """A database without an operations table is treated as unreadable."""
+    db = tmp_path / "taskchampion.sqlite3"
+    sqlite3.connect(db).close()
+    assert get_operations_marker(db) is None
+
+
+def test_operations_marker_changes_on_new_operation(tmp_path):
+    """Appending an operation changes the marker."""
+    db = tmp_path / "taskchampion.sqlite3"
+    conn = _make_db(db)
+
+    empty = get_operations_marker(db)
+    assert empty[:2] == (0, 0)
+
+    conn.execute("INSERT INTO operations (data) VALUES ('{}')")
+    conn.commit()
+    first = get_operations_marker(db)
+    assert first[:2] == (1, 1)
+    assert get_operations_marker(db) == first
+
+    conn.execute("INSERT INTO operations (data) VALUES ('{}')")
+    conn.commit()
+    assert get_operations_marker(db)[:2] == (2, 2)
+    conn.close()
+
+
+# Tests for query_tasks() / decode_task()
+def _epoch(ts):
+    """YYYYMMDDTHHMMSSZ -> epoch seconds string."""
+    from datetime import datetime, timezone
+
+    dt = datetime.strptime(ts, "%Y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+    return str(int(dt.timestamp()))
+
+
+def _local_noon(day):
+    """Epoch seconds string for noon local time on the given date."""
+    from datetime import datetime, time
+
+    return str(int(datetime.combine(day, time(12, 0)).astimezone().timestamp()))
+
+
+def make_task_db(path, tasks, working_set=()):
+    """Create a TaskChampion-shaped database holding the given property maps."""
+    conn = _make_db(path)
+    conn.execute("CREATE TABLE tasks (uuid STRING PRIMARY KEY, data STRING)")
+    conn.execute("CREATE TABLE working_set (id INTEGER PRIMARY KEY, uuid STRING)")
+    for uuid, data in tasks.items():
+        conn.execute("INSERT INTO tasks (uuid, data) VALUES (?, ?)", (uuid, json.dumps(data)))
+    for i, uuid in enumerate(working_set, start=1):
+        conn.execute("INSERT INTO working_set (id, uuid) VALUES (?, ?)", (i, uuid))
+    conn.commit()
+    conn.close()
+    return path
+
+
+U1 = "11111111-1111-1111-1111-111111111111"
+U2 = "22222222-2222-2222-2222-222222222222"
+U3 = "33333333-3333-3333-3333-333333333333"
+U4 = "44444444-4444-4444-4444-444444444444"
+
+
+@pytest.fixture
+def task_db(tmp_path):
+    """Database with pending, completed, recurring and project-less tasks."""
+    from datetime import date, timedelta
+
+    today = date.today()
+    tasks = {
+        U1: {
+            "status": "pending",
+            "description": "Buy groceries",
+            "project": "home.errands",
+            "priority": "M",
+            "due": _local_noon(today),
+            "entry": _epoch("20251006T120000Z"),
+            "modified": _epoch("20251006T120000Z"),
+            "tag_shopping": "",
+            "tag_errands": "",
+            "annotation_" + _epoch("20251006T130000Z"): "plorp:daily:2025-10-06",
+        },
+        U2: {
+            "status": "pending",
+            "description": "Call dentist",
+            "project": "health",
+            "priority": "H",
+            "due": _local_noon(today - timedelta(days=3)),
+            "entry": _epoch("20251001T100000Z"),
+        },
+        U3: {
+            "status": "pending",
+            "description": "Morning meditation",
+            "recur": "daily",
+            "due": _local_noon(today),
+            "entry": _epoch("20250101T000000Z"),
+        },
+        U4: {
+            "status": "completed",
+            "description": "Old chore",
+            "project": "home",
+            "entry": _epoch("20240101T000000Z"),
+            "end": _epoch("20240102T000000Z"),
+        },
+    }
+    return make_task_db(tmp_path / "taskchampion.sqlite3", tasks, working_set=[U1, U2, U3])
+
+
+def _uuids(tasks):
+    return sorted(t["uuid"] for t in tasks)
+
+
+def test_decode_task_matches_export_shape(task_db):
+    """Rows decode into export-shaped dicts with dates, tags and annotations."""
+    tasks = {t["uuid"]: t for t in query_tasks([U1], db_path=task_db)}
+    task = tasks[U1]
+
+    assert task["id"] == 1
+    assert task["description"] == "Buy groceries"
+    assert task["status"] == "pending"
+    assert task["entry"] == "20251006T120000Z"
+    assert task["tags"] == ["errands", "shopping"]
+    assert task["annotations"] == [
+        {"entry": "20251006T130000Z", "description": "plorp:daily:2025-10-06"}
+    ]
+    assert "tag_shopping" not in task
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        (["status:pending"], [U1, U2, U3]),
+        (["status:completed"], [U4]),
+        (["project:home"], [U1, U4]),
+        (["status:pending", "project:home"], [U1]),
+        (["project.startswith:home.err"], [U1]),
+        (["project.none:"], [U3]),
+        (["status:pending", "due.before:today"], [U2]),
+        (["status:pending", "due:today"], [U1, U3]),
+        (["status:pending", "recur.any:", "due:today"], [U3]),
+        (["priority:H"], [U2]),
+        ([U2, U4], [U2, U4]),
+        ([U4, "status:pending"], []),
+        ([], [U1, U2, U3, U4]),
+    ],
+)
+def test_query_tasks_filters(task_db, filters, expected):
+    """Supported filters select the same tasks 'task export' would."""
+    assert _uuids(query_tasks(filters, db_path=task_db)) == expected
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [["+next"], ["due.before:eow"], ["status:waiting"], ["description.contains:x"], ["1"]],
+)
+def test_query_tasks_unsupported_filter_returns_none(task_db, filters):
+    """Unsupported terms signal a fallback to the CLI."""
+    assert query_tasks(filters, db_path=task_db) is None
+
+
+def test_query_tasks_completed_has_no_id(task_db):
+    """Only working-set tasks get an ID, as in 'task export'."""
+    (task,) = query_tasks([U4], db_path=task_db)
+    assert task["id"] == 0
+    assert task["end"] == "20240102T000000Z"
+
+
+def test_query_tasks_missing_db(tmp_path):
+    """Missing database falls back."""
+    assert query_tasks(["status:pending"], db_path=tmp_path / "nope.sqlite3") is None
+
+
+def test_get_tasks_uses_sqlite_backend_when_enabled(task_db, monkeypatch):
+    """BRAINPLORP_TASK_BACKEND=sqlite answers supported filters without 'task'."""
+    from unittest.mock import patch
+    from brainplorp.integrations.taskwarrior import get_tasks
+
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "sqlite")
+    monkeypatch.setenv("TASKDATA", str(task_db.parent))
+
+    with patch("brainplorp.integrations.taskwarrior.subprocess.run") as mock_run:
+        tasks = get_tasks(["status:pending", "project:health"])
+
+    assert _uuids(tasks) == [U2]
+    mock_run.assert_not_called()
+
+
+def test_get_tasks_sqlite_backend_falls_back_for_unsupported(task_db, monkeypatch):
+    """Unsupported filters still go through 'task export'."""
+    from unittest.mock import MagicMock, patch
+    from brainplorp.integrations.taskwarrior import get_tasks
+
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "sqlite")
+    monkeypatch.setenv("TASKDATA", str(task_db.parent))
+
+    with patch("brainplorp.integrations.taskwarrior.subprocess.run") as mock_run:
+        mock_run.return_value = MagicMock(returncode=0, stdout="[]", stderr="")
+        get_tasks(["status:pending", "due.before:eow"])
+
+    mock_run.assert_called_once()
@@ -0,0 +1,113 @@
+# ABOUTME: Parity tests comparing the TaskChampion SQLite read backend with 'task export'
+# ABOUTME: Requires a real TaskWarrior 3.x install; skipped when the 'task' binary is missing
+"""
+Parity tests for the SQLite read backend.
+
+Seeds a throwaway TASKDATA with 'task import', then runs every supported
+filter through both backends and compares the results field by field
+(urgency is computed by TaskWarrior and excluded).
+"""
+
+import shutil
+from datetime import date, datetime, time, timedelta, timezone
+
+import pytest
+
+pytestmark = [
+    pytest.mark.integration,
+    pytest.mark.skipif(shutil.which("task") is None, reason="TaskWarrior not installed"),
+]
+
+FILTER_CASES = [
+    ["status:pending"],
+    ["status:completed"],
+    ["status:deleted"],
+    ["project:home"],
+    ["status:pending", "project:home"],
+    ["project.startswith:home"],
+    ["project.none:"],
+    ["status:pending", "due.before:today"],
+    ["status:pending", "due:today"],
+    ["status:pending", "recur.any:", "due:today"],
+    ["status:pending", "priority:H"],
+]
+
+
+def _tw_date(day, hour=12):
+    local = datetime.combine(day, time(hour, 0)).astimezone()
+    return local.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+@pytest.fixture
+def taskdata(tmp_path, monkeypatch):
+    """Isolated TaskWarrior data dir seeded with a representative task mix."""
+    from brainplorp.integrations.taskwarrior import create_tasks, run_task_command
+
+    taskrc = tmp_path / "taskrc"
+    taskrc.write_text("confirmation=off\nnews.version=99.99.99\n")
+    monkeypatch.setenv("TASKRC", str(taskrc))
+    monkeypatch.setenv("TASKDATA", str(tmp_path))
+
+    today = date.today()
+    created = create_tasks(
+        [
+            {
+                "description": "Buy groceries",
+                "project": "home.errands",
+                "priority": "M",
+                "due": _tw_date(today),
+                "tags": ["shopping"],
+                "annotations": ["plorp:test"],
+            },
+            {
+                "description": "Call dentist",
+                "project": "health",
+                "priority": "H",
+                "due": _tw_date(today - timedelta(days=3)),
+            },
+            {"description": "Inbox zero"},
+            {"description": "Old chore", "project": "home", "status": "completed"},
+            {"description": "Homework", "project": "homework"},
+        ]
+    )
+    assert len(created) == 5
+    run_task_command(["rc.confirmation=off", created[2]["uuid"], "delete"])
+    run_task_command(["add", "Meditate", "recur:daily", f"due:{today.isoformat()}"])
+    return created
+
+
+def _normalize(tasks):
+    return sorted(
+        ({k: v for k, v in t.items() if k != "urgency"} for t in tasks),
+        key=lambda t: t["uuid"],
+    )
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES, ids=lambda f: " ".join(f))
+def test_sqlite_backend_matches_cli(taskdata, monkeypatch, filters):
+    """Both backends return the same tasks with the same fields."""
+    from brainplorp.integrations.taskwarrior import get_tasks, invalidate_snapshot
+
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "cli")
+    invalidate_snapshot()
+    via_cli = get_tasks(filters)
+
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "sqlite")
+    invalidate_snapshot()
+    via_sqlite = get_tasks(filters)
+
+    assert _normalize(via_sqlite) == _normalize(via_cli)
+
+
+def test_sqlite_backend_matches_cli_uuid_list(taskdata, monkeypatch):
+    """UUID list lookups match, including completed and deleted tasks."""
+    from brainplorp.integrations.taskwarrior import get_tasks
+
+    uuids = [t["uuid"] for t in taskdata]
+
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "cli")
+    via_cli = get_tasks(uuids)
+    monkeypatch.setenv("BRAINPLORP_TASK_BACKEND", "sqlite")
+    via_sqlite = get_tasks(uuids)
+
+    assert _normalize(via_sqlite) == _normalize(via_cli)
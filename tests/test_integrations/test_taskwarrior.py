@@ -191,55 +191,51 @@ def test_get_task_info_not_found(mock_subprocess):
     assert task is None
 
 
-# Tests for create_task()
-def test_create_task_minimal(mock_subprocess, sample_task_data):
-    """Test creating task with just description."""
-    # Mock task add command
-    add_result = MagicMock(returncode=0, stdout="Created task 1.\n", stderr="")
+# Tests for create_task() / create_tasks()
+def _imported_records(mock_subprocess, call_index=0):
+    """Return the JSON records piped to 'task import' on the given call."""
+    return json.loads(mock_subprocess.call_args_list[call_index][1]["input"])
 
-    # Mock task N export command
-    export_result = MagicMock(returncode=0, stdout=json.dumps([sample_task_data[0]]), stderr="")
 
-    mock_subprocess.side_effect = [add_result, export_result]
+def test_create_task_minimal(mock_subprocess):
+    """Test creating task with just description."""
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="Imported 1 tasks.\n", stderr="")
 
     from brainplorp.integrations.taskwarrior import create_task
 
     uuid = create_task("Test task")
 
-    assert uuid == "a1b2c3d4-e5f6-7890-1234-567890abcdef"
+    # Single 'task import' call, UUID generated locally
+    assert mock_subprocess.call_count == 1
+    assert mock_subprocess.call_args[0][0] == ["task", "import"]
 
-    # Verify commands
-    assert mock_subprocess.call_count == 2
-    first_call_args = mock_subprocess.call_args_list[0][0][0]
-    assert first_call_args[0] == "task"
-    assert first_call_args[1] == "add"
-    assert first_call_args[2] == "Test task"
+    records = _imported_records(mock_subprocess)
+    assert len(records) == 1
+    assert records[0]["description"] == "Test task"
+    assert records[0]["status"] == "pending"
+    assert records[0]["uuid"] == uuid
+    assert len(uuid) == 36
 
 
-def test_create_task_with_metadata(mock_subprocess, sample_task_data):
+def test_create_task_with_metadata(mock_subprocess):
     """Test creating task with project, due, priority, tags."""
-    add_result = MagicMock(returncode=0, stdout="Created task 1.\n", stderr="")
-
-    export_result = MagicMock(returncode=0, stdout=json.dumps([sample_task_data[0]]), stderr="")
-
-    mock_subprocess.side_effect = [add_result, export_result]
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
     from brainplorp.integrations.taskwarrior import create_task
 
-    uuid = create_task(
+    create_task(
         "Complete sprint",
         project="plorp",
-        due="friday",
+        due="20251010T000000Z",
         priority="H",
         tags=["development", "urgent"],
     )
 
-    first_call_args = mock_subprocess.call_args_list[0][0][0]
-    assert "project:plorp" in first_call_args
-    assert "due:friday" in first_call_args
-    assert "priority:H" in first_call_args
-    assert "+development" in first_call_args
-    assert "+urgent" in first_call_args
+    record = _imported_records(mock_subprocess)[0]
+    assert record["project"] == "plorp"
+    assert record["due"] == "20251010T000000Z"
+    assert record["priority"] == "H"
+    assert record["tags"] == ["development", "urgent"]
 
 
 def test_create_task_failure(mock_subprocess):
@@ -253,58 +249,83 @@ def test_create_task_failure(mock_subprocess):
     assert uuid is None
 
 
-def test_create_task_parse_failure(mock_subprocess):
-    """Test create_task handles failure to parse task ID from output."""
-    add_result = MagicMock(returncode=0, stdout="No task ID here", stderr="")
-    mock_subprocess.return_value = add_result
+def test_create_task_due_expression_applied_with_modify(mock_subprocess):
+    """Test non-ISO due expressions are left for TaskWarrior to evaluate."""
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
     from brainplorp.integrations.taskwarrior import create_task
 
-    uuid = create_task("Test task")
+    uuid = create_task("Test task", due="friday")
 
-    assert uuid is None
+    assert mock_subprocess.call_count == 2
+    assert "due" not in _imported_records(mock_subprocess)[0]
+    modify_args = mock_subprocess.call_args_list[1][0][0]
+    assert modify_args == ["task", uuid, "modify", "due:friday"]
 
 
-def test_create_task_export_failure(mock_subprocess):
-    """Test create_task handles failure to export newly created task."""
-    add_result = MagicMock(returncode=0, stdout="Created task 1.\n", stderr="")
-    export_result = MagicMock(returncode=1, stdout="", stderr="Export error")
-    # With retry logic: 1 add + 3 export attempts
-    mock_subprocess.side_effect = [add_result, export_result, export_result, export_result]
+def test_create_tasks_single_import(mock_subprocess):
+    """Test create_tasks writes every task with one 'task import'."""
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-    from brainplorp.integrations.taskwarrior import create_task
+    from brainplorp.integrations.taskwarrior import create_tasks
 
-    uuid = create_task("Test task")
+    specs = [{"description": f"Task {i}", "priority": "M"} for i in range(40)]
+    created = create_tasks(specs)
 
-    assert uuid is None
+    assert mock_subprocess.call_count == 1
+    assert [t["description"] for t in created] == [f"Task {i}" for i in range(40)]
+    assert len({t["uuid"] for t in created}) == 40
+    assert _imported_records(mock_subprocess) == created
 
 
-def test_create_task_export_empty(mock_subprocess):
-    """Test create_task handles empty export result."""
-    add_result = MagicMock(returncode=0, stdout="Created task 1.\n", stderr="")
-    export_result = MagicMock(returncode=0, stdout="[]", stderr="")
-    # With retry logic: 1 add + 3 export attempts (all return empty)
-    mock_subprocess.side_effect = [add_result, export_result, export_result, export_result]
+def test_create_tasks_completed_and_annotations(mock_subprocess):
+    """Test create_tasks imports completed status and annotations directly."""
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-    from brainplorp.integrations.taskwarrior import create_task
+    from brainplorp.integrations.taskwarrior import create_tasks
 
-    uuid = create_task("Test task")
+    created = create_tasks([
+        {
+            "description": "Done already",
+            "status": "completed",
+            "annotations": ["plorp-project:work.api"],
+        }
+    ])
 
-    assert uuid is None
+    record = created[0]
+    assert record["status"] == "completed"
+    assert "end" in record
+    assert record["annotations"][0]["description"] == "plorp-project:work.api"
 
 
-def test_create_task_export_json_error(mock_subprocess):
-    """Test create_task handles JSON parse error in export."""
-    add_result = MagicMock(returncode=0, stdout="Created task 1.\n", stderr="")
-    export_result = MagicMock(returncode=0, stdout="not json", stderr="")
-    # With retry logic: 1 add + 3 export attempts (all return invalid JSON)
-    mock_subprocess.side_effect = [add_result, export_result, export_result, export_result]
+def test_create_tasks_iso_date_converted(mock_subprocess):
+    """Test YYYY-MM-DD due dates are converted to TaskWarrior UTC format."""
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-    from brainplorp.integrations.taskwarrior import create_task
+    from datetime import datetime, timezone
+    from brainplorp.integrations.taskwarrior import create_tasks
 
-    uuid = create_task("Test task")
+    created = create_tasks([{"description": "Dated", "due": "2025-10-15"}])
 
-    assert uuid is None
+    expected = datetime(2025, 10, 15).astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    assert created[0]["due"] == expected
+
+
+def test_create_tasks_empty(mock_subprocess):
+    """Test create_tasks with no specs does not call TaskWarrior."""
+    from brainplorp.integrations.taskwarrior import create_tasks
+
+    assert create_tasks([]) == []
+    mock_subprocess.assert_not_called()
+
+
+def test_create_tasks_import_failure(mock_subprocess):
+    """Test create_tasks returns [] when the import fails."""
+    mock_subprocess.return_value = MagicMock(returncode=1, stdout="", stderr="Import error")
+
+    from brainplorp.integrations.taskwarrior import create_tasks
+
+    assert create_tasks([{"description": "A"}, {"description": "B"}]) == []
 
 
 # Tests for modification functions
@@ -484,63 +505,433 @@ def test_get_task_annotations_task_not_found():
 def test_create_task_returns_uuid_reliably(mock_subprocess):
     """Ensure create_task returns UUID even with rapid calls.
 
-    Regression test for Bug #1: Race condition where task export fails
-    immediately after creation. The retry logic should handle this.
+    Regression test for Bug #1: UUIDs are now assigned locally, so there is
+    no post-creation export that can race with the SQLite commit.
     """
     from brainplorp.integrations.taskwarrior import create_task
 
-    uuids = []
-    for i in range(10):
-        # Simulate race condition: first export fails (empty), retry succeeds
-        add_result = MagicMock(returncode=0, stdout=f"Created task {i+1}.\n", stderr="")
-        export_fail = MagicMock(returncode=0, stdout="[]", stderr="")  # Empty result (race condition)
-        export_success = MagicMock(
-            returncode=0,
-            stdout=json.dumps([{"uuid": f"uuid-{i:03d}", "description": f"Task {i}"}]),
-            stderr=""
-        )
-
-        # First call: task add, second: export (fails), third: export retry (succeeds)
-        mock_subprocess.side_effect = [add_result, export_fail, export_success]
-
-        uuid = create_task(f"Task {i}")
-        assert uuid is not None, f"Task {i} returned None"
-        uuids.append(uuid)
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-        # Reset for next iteration
-        mock_subprocess.reset_mock()
+    uuids = [create_task(f"Task {i}") for i in range(10)]
 
-    # Verify all UUIDs are unique and valid
+    assert all(uuid is not None for uuid in uuids)
     assert len(set(uuids)) == 10, "Duplicate UUIDs returned"
-    assert all(uuid.startswith("uuid-") for uuid in uuids)
+    # One import per task, no export retries
+    assert mock_subprocess.call_count == 10
+    assert all(c[0][0] == ["task", "import"] for c in mock_subprocess.call_args_list)
 
 
 def test_concurrent_task_creation(mock_subprocess):
     """Test creating multiple tasks concurrently.
 
-    Regression test for Bug #1: Ensures retry logic works correctly
-    under concurrent load.
+    Regression test for Bug #1: Ensures unique UUIDs under concurrent load.
     """
     from brainplorp.integrations.taskwarrior import create_task
 
-    def create_test_task(i):
-        # Each thread gets its own mock responses
-        add_result = MagicMock(returncode=0, stdout=f"Created task {i}.\n", stderr="")
-        export_result = MagicMock(
-            returncode=0,
-            stdout=json.dumps([{"uuid": f"concurrent-uuid-{i:03d}", "description": f"Concurrent task {i}"}]),
-            stderr=""
-        )
-
-        # Mock will return these in sequence for this specific call
-        mock_subprocess.side_effect = [add_result, export_result]
-
-        return create_task(f"Concurrent task {i}")
+    mock_subprocess.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
     with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-        futures = [executor.submit(create_test_task, i) for i in range(20)]
+        futures = [executor.submit(create_task, f"Concurrent task {i}") for i in range(20)]
         uuids = [f.result() for f in futures]
 
     # All should succeed
     assert all(uuid is not None for uuid in uuids), "Some tasks returned None"
     assert len(set(uuids)) == 20, f"Expected 20 unique UUIDs, got {len(set(uuids))}"
+
+
+# Tests for the task snapshot
+UUID_A = "aaaaaaaa-0000-0000-0000-000000000001"
+UUID_B = "bbbbbbbb-0000-0000-0000-000000000002"
+
+
+@pytest.fixture
+def snapshot_marker(monkeypatch):
+    """Enable the snapshot with a controllable operation log marker."""
+    marker = {"value": (10, 10, 1)}
+    monkeypatch.setattr(
+        "brainplorp.integrations.taskwarrior.get_operations_marker",
+        lambda *a, **kw: marker["value"],
+    )
+    return marker
+
+
+def _export_by_status(pending, completed=(), deleted=()):
+    """subprocess.run side effect answering 'task status:<x> export'."""
+    by_status = {"pending": pending, "completed": list(completed), "deleted": list(deleted)}
+
+    def run(cmd, **kwargs):
+        status = cmd[1].split(":", 1)[1]
+        return MagicMock(returncode=0, stdout=json.dumps(by_status[status]), stderr="")
+
+    return run
+
+
+def test_snapshot_serves_repeated_lookups_from_one_export(mock_subprocess, snapshot_marker):
+    """Repeated get_task_info calls hit the snapshot instead of spawning task."""
+    from brainplorp.integrations.taskwarrior import get_task_info, get_snapshot_stats
+
+    mock_subprocess.side_effect = _export_by_status(
+        [{"uuid": UUID_A, "status": "pending", "description": "A"}]
+    )
+
+    for _ in range(5):
+        assert get_task_info(UUID_A)["description"] == "A"
+
+    assert mock_subprocess.call_count == 1
+    stats = get_snapshot_stats()
+    assert stats["hits"] == 4
+    assert stats["misses"] == 1
+    assert stats["exports"] == 1
+
+
+def test_snapshot_loads_completed_on_miss(mock_subprocess, snapshot_marker):
+    """A UUID absent from pending triggers completed/deleted loads, then None."""
+    from brainplorp.integrations.taskwarrior import get_task_info
+
+    mock_subprocess.side_effect = _export_by_status(
+        [], completed=[{"uuid": UUID_B, "status": "completed", "description": "B"}]
+    )
+
+    assert get_task_info(UUID_B)["status"] == "completed"
+    assert get_task_info("cccccccc-0000-0000-0000-000000000003") is None
+    # pending + completed for the first lookup, deleted for the second
+    assert mock_subprocess.call_count == 3
+
+
+def test_snapshot_invalidated_when_marker_changes(mock_subprocess, snapshot_marker):
+    """A new operation in TaskChampion forces a re-export."""
+    from brainplorp.integrations.taskwarrior import get_tasks
+
+    mock_subprocess.side_effect = _export_by_status(
+        [{"uuid": UUID_A, "status": "pending", "description": "A"}]
+    )
+
+    get_tasks(["status:pending"])
+    get_tasks(["status:pending"])
+    assert mock_subprocess.call_count == 1
+
+    snapshot_marker["value"] = (11, 11, 2)
+    get_tasks(["status:pending"])
+    assert mock_subprocess.call_count == 2
+
+
+def test_snapshot_invalidated_by_writes(mock_subprocess, snapshot_marker):
+    """Writes through this module drop the snapshot even if the marker lags."""
+    from brainplorp.integrations.taskwarrior import get_tasks, mark_done
+
+    exports = _export_by_status([{"uuid": UUID_A, "status": "pending", "description": "A"}])
+
+    def run(cmd, **kwargs):
+        if cmd[-1] == "export":
+            return exports(cmd)
+        return MagicMock(returncode=0, stdout="", stderr="")
+
+    mock_subprocess.side_effect = run
+
+    get_tasks(["status:pending"])
+    mark_done(UUID_A)
+    get_tasks(["status:pending"])
+
+    export_calls = [c for c in mock_subprocess.call_args_list if c[0][0][-1] == "export"]
+    assert len(export_calls) == 2
+
+
+def test_snapshot_returns_copies(mock_subprocess, snapshot_marker):
+    """Callers mutating results don't corrupt the snapshot."""
+    from brainplorp.integrations.taskwarrior import get_task_info
+
+    mock_subprocess.side_effect = _export_by_status(
+        [{"uuid": UUID_A, "status": "pending", "description": "A"}]
+    )
+
+    get_task_info(UUID_A)["description"] = "mutated"
+    assert get_task_info(UUID_A)["description"] == "A"
+
+
+def test_snapshot_due_helpers_filter_in_python(mock_subprocess, snapshot_marker):
+    """Overdue/today/recurring are computed from the pending snapshot."""
+    from datetime import date, datetime, time, timedelta, timezone
+    from brainplorp.integrations.taskwarrior import (
+        get_overdue_tasks,
+        get_due_today,
+        get_recurring_today,
+    )
+
+    def tw(d):
+        local_noon = datetime.combine(d, time(12, 0)).astimezone()
+        return local_noon.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    today = date.today()
+    mock_subprocess.side_effect = _export_by_status(
+        [
+            {"uuid": UUID_A, "status": "pending", "due": tw(today - timedelta(days=2))},
+            {"uuid": UUID_B, "status": "pending", "due": tw(today), "recur": "daily"},
+            {"uuid": "c" * 36, "status": "pending", "due": tw(today)},
+            {"uuid": "d" * 36, "status": "pending"},
+        ]
+    )
+
+    assert [t["uuid"] for t in get_overdue_tasks()] == [UUID_A]
+    assert {t["uuid"] for t in get_due_today()} == {UUID_B, "c" * 36}
+    assert [t["uuid"] for t in get_recurring_today()] == [UUID_B]
+    assert mock_subprocess.call_count == 1
+
+
+def test_snapshot_disabled_without_marker(mock_subprocess):
+    """Without a TaskChampion database every read goes to task export."""
+    from brainplorp.integrations.taskwarrior import get_task_info, get_snapshot_stats
+
+    mock_subprocess.return_value = MagicMock(
+        returncode=0, stdout=json.dumps([{"uuid": UUID_A}]), stderr=""
+    )
+
+    get_task_info(UUID_A)
+    get_task_info(UUID_A)
+
+    assert mock_subprocess.call_count == 2
+    assert get_snapshot_stats()["hits"] == 0
+
+
+# Tests for bulk operations
+def test_get_tasks_by_uuid_single_export(mock_subprocess):
+    """Many UUIDs resolve with one export; unknown UUIDs are absent."""
+    from brainplorp.integrations.taskwarrior import get_tasks_by_uuid
+
+    missing = "cccccccc-0000-0000-0000-000000000003"
+    mock_subprocess.return_value = MagicMock(
+        returncode=0,
+        stdout=json.dumps(
+            [
+                {"uuid": UUID_A, "status": "pending", "description": "A"},
+                {"uuid": UUID_B, "status": "deleted", "description": "B"},
+            ]
+        ),
+        stderr="",
+    )
+
+    tasks, exports = get_tasks_by_uuid([UUID_A, UUID_B, missing, UUID_A])
+
+    assert exports == 1
+    assert set(tasks) == {UUID_A, UUID_B}
+    assert tasks[UUID_B]["status"] == "deleted"
+    mock_subprocess.assert_called_once()
+    assert mock_subprocess.call_args[0][0] == ["task", UUID_A, UUID_B, missing, "export"]
+
+
+def test_get_tasks_by_uuid_uses_snapshot(mock_subprocess, snapshot_marker):
+    """With a valid snapshot, pending UUIDs cost no extra exports."""
+    from brainplorp.integrations.taskwarrior import get_tasks_by_uuid
+
+    mock_subprocess.side_effect = _export_by_status(
+        [
+            {"uuid": UUID_A, "status": "pending", "description": "A"},
+            {"uuid": UUID_B, "status": "pending", "description": "B"},
+        ]
+    )
+
+    tasks, exports = get_tasks_by_uuid([UUID_A, UUID_B])
+    assert set(tasks) == {UUID_A, UUID_B}
+    assert exports == 1
+
+    tasks, exports = get_tasks_by_uuid([UUID_A, UUID_B])
+    assert exports == 0
+    assert mock_subprocess.call_count == 1
+
+
+def test_bulk_mark_done_single_launch(mock_subprocess):
+    """All UUIDs go into one 'task ... done' with bulk confirmation disabled."""
+    from brainplorp.integrations.taskwarrior import bulk_mark_done
+
+    mock_subprocess.return_value = MagicMock(
+        returncode=0, stdout="Completed 2 tasks.\n", stderr=""
+    )
+
+    results = bulk_mark_done([UUID_A, UUID_B])
+
+    assert results == {UUID_A: True, UUID_B: True}
+    mock_subprocess.assert_called_once()
+    cmd = mock_subprocess.call_args[0][0]
+    assert cmd == ["task", "rc.bulk=0", "rc.confirmation=off", UUID_A, UUID_B, "done"]
+
+
+def test_bulk_mark_done_partial_failure_verified_by_export(mock_subprocess):
+    """When fewer tasks are reported than requested, one export decides per UUID."""
+    from brainplorp.integrations.taskwarrior import bulk_mark_done
+
+    mock_subprocess.side_effect = [
+        MagicMock(returncode=1, stdout="Completed 1 task.\n", stderr="Task not found"),
+        MagicMock(
+            returncode=0,
+            stdout=json.dumps([{"uuid": UUID_A, "status": "completed"}]),
+            stderr="",
+        ),
+    ]
+
+    results = bulk_mark_done([UUID_A, UUID_B])
+
+    assert results == {UUID_A: True, UUID_B: False}
+    assert mock_subprocess.call_args_list[1][0][0] == ["task", UUID_A, UUID_B, "export"]
+
+
+def test_bulk_modify_builds_one_command(mock_subprocess):
+    """bulk_modify passes modifications once for the whole UUID list."""
+    from brainplorp.integrations.taskwarrior import bulk_modify
+
+    mock_subprocess.return_value = MagicMock(
+        returncode=0, stdout="Modified 2 tasks.\n", stderr=""
+    )
+
+    results = bulk_modify([UUID_A, UUID_B], project="work.api", due=None)
+
+    assert results == {UUID_A: True, UUID_B: True}
+    cmd = mock_subprocess.call_args[0][0]
+    assert cmd[-2:] == ["modify", "project:work.api"]
+
+
+def test_bulk_modify_unchanged_task_counts_as_success(mock_subprocess):
+    """A task already holding the new value verifies as success."""
+    from brainplorp.integrations.taskwarrior import bulk_modify
+
+    mock_subprocess.side_effect = [
+        MagicMock(returncode=0, stdout="Modified 0 tasks.\n", stderr=""),
+        MagicMock(
+            returncode=0,
+            stdout=json.dumps([{"uuid": UUID_A, "project": "work.api"}]),
+            stderr="",
+        ),
+    ]
+
+    assert bulk_modify([UUID_A], project="work.api") == {UUID_A: True}
+
+
+def test_bulk_annotate(mock_subprocess):
+    """bulk_annotate sends the annotation text once."""
+    from brainplorp.integrations.taskwarrior import bulk_annotate
+
+    mock_subprocess.return_value = MagicMock(
+        returncode=0, stdout="Annotated 2 tasks.\n", stderr=""
+    )
+
+    results = bulk_annotate([UUID_A, UUID_B, UUID_A], "plorp-project:work.api")
+
+    assert results == {UUID_A: True, UUID_B: True}
+    cmd = mock_subprocess.call_args[0][0]
+    assert cmd[-2:] == ["annotate", "plorp-project:work.api"]
+    assert cmd.count(UUID_A) == 1
+
+
+def test_bulk_operations_chunk_large_uuid_lists(mock_subprocess):
+    """Large UUID lists are split so each command line stays under the byte budget."""
+    from brainplorp.integrations.taskwarrior import bulk_mark_done, BULK_ARG_BYTES
+
+    uuids = [f"{i:08x}-0000-0000-0000-000000000000" for i in range(4000)]
+
+    def run(cmd, **kwargs):
+        chunk = [a for a in cmd if a in uuid_set]
+        assert sum(len(u) + 1 for u in chunk) <= BULK_ARG_BYTES
+        return MagicMock(returncode=0, stdout=f"Completed {len(chunk)} tasks.\n", stderr="")
+
+    uuid_set = set(uuids)
+    mock_subprocess.side_effect = run
+
+    results = bulk_mark_done(uuids)
+
+    assert len(results) == 4000 and all(results.values())
+    assert 1 < mock_subprocess.call_count < 5
+
+
+def test_bulk_operations_empty_list(mock_subprocess):
+    """Empty UUID lists don't launch TaskWarrior."""
+    from brainplorp.integrations.taskwarrior import bulk_mark_done, bulk_modify, bulk_annotate
+
+    assert bulk_mark_done([]) == {}
+    assert bulk_modify([], project="x") == {}
+    assert bulk_annotate([], "note") == {}
+    mock_subprocess.assert_not_called()
+
+
+# Tests for iter_tasks() / count_tasks()
+@pytest.fixture
+def fake_task_bin(tmp_path, monkeypatch):
+    """Put a scripted 'task' executable first on PATH; returns a setter for its body."""
+    import os
+    import stat
+
+    script = tmp_path / "task"
+
+    def install(body):
+        script.write_text(f"#!{sys.executable}\nimport sys, time, json\n{body}\n")
+        script.chmod(script.stat().st_mode | stat.S_IEXEC)
+
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    return install
+
+
+def test_iter_tasks_streams_across_chunk_boundaries(fake_task_bin, monkeypatch):
+    """Objects split across small reads are reassembled in order."""
+    from brainplorp.integrations import taskwarrior
+
+    monkeypatch.setattr(taskwarrior, "EXPORT_CHUNK_SIZE", 7)
+    fake_task_bin(
+        "tasks = [{'uuid': str(i), 'description': 'task, with [brackets] ' + str(i)}"
+        " for i in range(50)]\n"
+        "sys.stdout.write('[\\n' + ',\\n'.join(json.dumps(t) for t in tasks) + '\\n]\\n')"
+    )
+
+    tasks = list(taskwarrior.iter_tasks(["status:pending"]))
+
+    assert [t["uuid"] for t in tasks] == [str(i) for i in range(50)]
+    assert tasks[3]["description"] == "task, with [brackets] 3"
+
+
+def test_iter_tasks_is_lazy_and_stops_child(fake_task_bin):
+    """Consumers can stop early on an export that never ends."""
+    import itertools
+    import time
+    from brainplorp.integrations.taskwarrior import iter_tasks
+
+    fake_task_bin(
+        "sys.stdout.write('[')\n"
+        "i = 0\n"
+        "while True:\n"
+        "    sys.stdout.write(json.dumps({'uuid': str(i)}) + ',\\n'); sys.stdout.flush()\n"
+        "    i += 1\n"
+        "    time.sleep(0.001)"
+    )
+
+    started = time.monotonic()
+    stream = iter_tasks([])
+    first = list(itertools.islice(stream, 3))
+    stream.close()
+
+    assert [t["uuid"] for t in first] == ["0", "1", "2"]
+    assert time.monotonic() - started < 5
+
+
+def test_iter_tasks_command_failure(fake_task_bin, capsys):
+    """A failing export yields nothing and reports stderr."""
+    from brainplorp.integrations.taskwarrior import iter_tasks
+
+    fake_task_bin("sys.stderr.write('bad filter'); sys.exit(2)")
+
+    assert list(iter_tasks(["bogus"])) == []
+    assert "bad filter" in capsys.readouterr().err
+
+
+def test_iter_tasks_timeout(fake_task_bin):
+    """A hung export is killed and raises TaskWarriorTimeoutError."""
+    from brainplorp.integrations.taskwarrior import iter_tasks, TaskWarriorTimeoutError
+
+    fake_task_bin("time.sleep(30)")
+
+    with pytest.raises(TaskWarriorTimeoutError):
+        list(iter_tasks([], timeout=0.2))
+
+
+def test_count_tasks(fake_task_bin):
+    """count_tasks aggregates the stream."""
+    from brainplorp.integrations.taskwarrior import count_tasks
+
+    fake_task_bin("print(json.dumps([{'uuid': str(i)} for i in range(1000)]))")
+
+    assert count_tasks(["status:completed"]) == 1000
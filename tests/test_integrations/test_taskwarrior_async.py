@@ -0,0 +1,174 @@
+# ABOUTME: Tests for the asyncio TaskWarrior client used by the MCP server
+# ABOUTME: Fakes asyncio.create_subprocess_exec - covers timeouts, cancellation and the concurrency cap
+"""
+Tests for async TaskWarrior integration.
+
+All tests use a fake subprocess - no actual TaskWarrior required.
+"""
+import asyncio
+import json
+from unittest.mock import patch
+
+import pytest
+
+from brainplorp.integrations import taskwarrior_async
+from brainplorp.integrations.taskwarrior import TaskWarriorTimeoutError
+
+
+class FakeProcess:
+    """Stand-in for asyncio.subprocess.Process."""
+
+    def __init__(self, stdout="", stderr="", returncode=0, delay=0.0):
+        self._stdout = stdout
+        self._stderr = stderr
+        self._final_returncode = returncode
+        self._delay = delay
+        self.returncode = None
+        self.killed = False
+        self.stdin_data = None
+
+    async def communicate(self, input=None):
+        self.stdin_data = input
+        await asyncio.sleep(self._delay)
+        self.returncode = self._final_returncode
+        return self._stdout.encode(), self._stderr.encode()
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+
+    async def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def fake_exec(monkeypatch):
+    """Patch create_subprocess_exec; returns (calls, processes) for assertions."""
+    calls = []
+    processes = []
+    factory = {"make": lambda cmd: FakeProcess()}
+
+    async def create_subprocess_exec(*cmd, **kwargs):
+        calls.append(list(cmd))
+        proc = factory["make"](list(cmd))
+        processes.append(proc)
+        return proc
+
+    monkeypatch.setattr(
+        taskwarrior_async.asyncio, "create_subprocess_exec", create_subprocess_exec
+    )
+    monkeypatch.setattr(taskwarrior_async, "_semaphore", None)
+    return calls, processes, factory
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_async_parses_export(fake_exec):
+    """Exports are parsed like the sync client."""
+    calls, _, factory = fake_exec
+    factory["make"] = lambda cmd: FakeProcess(stdout=json.dumps([{"uuid": "abc"}]))
+
+    tasks = await taskwarrior_async.get_tasks_async(["status:pending"])
+
+    assert tasks == [{"uuid": "abc"}]
+    assert calls == [["task", "status:pending", "export"]]
+
+
+@pytest.mark.asyncio
+async def test_get_task_info_async_not_found(fake_exec):
+    """Empty export means not found."""
+    _, _, factory = fake_exec
+    factory["make"] = lambda cmd: FakeProcess(stdout="[]")
+
+    assert await taskwarrior_async.get_task_info_async("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_async_command_failure(fake_exec):
+    """Non-zero exit returns []."""
+    _, _, factory = fake_exec
+    factory["make"] = lambda cmd: FakeProcess(returncode=1, stderr="boom")
+
+    assert await taskwarrior_async.get_tasks_async(["status:pending"]) == []
+
+
+@pytest.mark.asyncio
+async def test_create_task_async_pipes_import(fake_exec):
+    """create_task_async imports a client-assigned UUID via stdin."""
+    calls, processes, _ = fake_exec
+
+    uuid = await taskwarrior_async.create_task_async("Write tests", project="plorp")
+
+    assert calls == [["task", "import"]]
+    (record,) = json.loads(processes[0].stdin_data)
+    assert record["uuid"] == uuid
+    assert record["project"] == "plorp"
+
+
+@pytest.mark.asyncio
+async def test_modify_task_async_builds_args(fake_exec):
+    """None values are skipped."""
+    calls, _, _ = fake_exec
+
+    assert await taskwarrior_async.modify_task_async("abc", project="work", due=None)
+    assert calls == [["task", "abc", "modify", "project:work"]]
+
+
+@pytest.mark.asyncio
+async def test_timeout_kills_child(fake_exec):
+    """A hung command is killed and surfaces TaskWarriorTimeoutError."""
+    _, processes, factory = fake_exec
+    factory["make"] = lambda cmd: FakeProcess(delay=5)
+
+    with pytest.raises(TaskWarriorTimeoutError):
+        await taskwarrior_async.run_task_command_async(["export"], timeout=0.05)
+
+    assert processes[0].killed
+
+
+@pytest.mark.asyncio
+async def test_cancellation_kills_child(fake_exec):
+    """Cancelling the caller kills the child before propagating."""
+    _, processes, factory = fake_exec
+    factory["make"] = lambda cmd: FakeProcess(delay=5)
+
+    call = asyncio.create_task(taskwarrior_async.run_task_command_async(["export"]))
+    await asyncio.sleep(0.01)
+    call.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert processes[0].killed
+
+
+@pytest.mark.asyncio
+async def test_semaphore_bounds_concurrency(fake_exec, monkeypatch):
+    """No more than MAX_CONCURRENT_COMMANDS children run at once."""
+    _, _, factory = fake_exec
+    monkeypatch.setattr(taskwarrior_async, "MAX_CONCURRENT_COMMANDS", 2)
+
+    running = {"now": 0, "peak": 0}
+
+    class TrackingProcess(FakeProcess):
+        async def communicate(self, input=None):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            try:
+                return await super().communicate(input)
+            finally:
+                running["now"] -= 1
+
+    factory["make"] = lambda cmd: TrackingProcess(stdout="[]", delay=0.01)
+
+    await asyncio.gather(*(taskwarrior_async.get_tasks_async([]) for _ in range(8)))
+
+    assert running["peak"] == 2
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_snapshot(fake_exec):
+    """Async writes drop the sync client's read snapshot."""
+    with patch("brainplorp.integrations.taskwarrior.invalidate_snapshot") as mock_invalidate:
+        await taskwarrior_async.mark_done_async("abc")
+
+    mock_invalidate.assert_called_once()
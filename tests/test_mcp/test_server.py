@@ -57,6 +57,32 @@ async def test_plorp_start_day():
             assert data["summary"]["total_count"] == 1
 
 
+@pytest.mark.asyncio
+async def test_plorp_start_day_refresh():
+    """Test plorp_start_day with refresh updates the existing note."""
+    with patch("brainplorp.mcp.server.refresh_day") as mock_refresh:
+        with patch("brainplorp.mcp.server.start_day") as mock_start:
+            with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+                mock_vault.return_value = Path("/vault")
+                mock_refresh.return_value = {
+                    "note_path": "/vault/daily/2025-10-06.md",
+                    "date": "2025-10-06",
+                    "summary": {"total_count": 2},
+                    "tasks": [],
+                    "created_at": "2025-10-06T09:00:00",
+                    "changed": False,
+                    "added": 0,
+                    "removed": 0,
+                }
+
+                result = await _plorp_start_day({"date": "2025-10-06", "refresh": True})
+
+                data = json.loads(result[0].text)
+                assert data["changed"] is False
+                mock_refresh.assert_called_once_with(date(2025, 10, 6), Path("/vault"))
+                mock_start.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_plorp_get_review_tasks():
     """Test plorp_get_review_tasks tool."""
@@ -357,6 +383,36 @@ async def test_plorp_get_task_info():
         assert data["description"] == "Test task"
 
 
+@pytest.mark.asyncio
+async def test_plorp_start_day_does_not_block_event_loop():
+    """Blocking workflows run in a worker thread, so other tool calls proceed."""
+    import asyncio
+    import threading
+    import time
+
+    loop_thread = threading.current_thread()
+    ran_in = {}
+
+    def slow_start_day(target_date, vault):
+        ran_in["thread"] = threading.current_thread()
+        time.sleep(0.2)
+        return {"date": str(target_date)}
+
+    async def quick_tool():
+        await asyncio.sleep(0.01)
+        return time.monotonic()
+
+    with patch("brainplorp.mcp.server.start_day", side_effect=slow_start_day):
+        with patch("brainplorp.mcp.server._get_vault_path", return_value=Path("/vault")):
+            started = time.monotonic()
+            _, quick_done = await asyncio.gather(
+                _plorp_start_day({"date": "2025-10-06"}), quick_tool()
+            )
+
+    assert ran_in["thread"] is not loop_thread
+    assert quick_done - started < 0.15
+
+
 @pytest.mark.asyncio
 async def test_plorp_get_task_info_not_found():
     """Test plorp_get_task_info with non-existent task."""
@@ -487,3 +543,155 @@ async def test_plorp_process_daily_note_no_daily_note():
         with patch("pathlib.Path.exists", return_value=False):
             with pytest.raises(ValueError, match="Daily note not found"):
                 await _plorp_process_daily_note({"date": "2025-10-07"})
+
+
+@pytest.mark.asyncio
+async def test_plorp_process_all_daily_notes():
+    """Test plorp_process_all_daily_notes returns the vault-wide scan result."""
+    from brainplorp.mcp.server import _plorp_process_all_daily_notes
+
+    with patch("brainplorp.mcp.server.process_all_daily_notes") as mock_all:
+        with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+            mock_vault.return_value = Path("/vault")
+            mock_all.return_value = {
+                "notes_total": 3,
+                "notes_scanned": 1,
+                "notes_unchanged": 1,
+                "notes_pending_review": 1,
+                "updated_notes": [
+                    {"note_path": "/vault/daily/2025-10-07.md", "proposals_count": 2, "needs_review_count": 0}
+                ],
+                "proposals_count": 2,
+                "needs_review_count": 0,
+            }
+
+            result = await _plorp_process_all_daily_notes({})
+
+            mock_all.assert_called_once_with(Path("/vault"))
+            data = json.loads(result[0].text)
+            assert data["proposals_count"] == 2
+            assert data["updated_notes"][0]["note_path"].endswith("2025-10-07.md")
+
+
+@pytest.mark.asyncio
+async def test_plorp_search_notes():
+    """Test plorp_search_notes passes query, folder and limit to search_notes."""
+    from brainplorp.mcp.server import _plorp_search_notes
+
+    with patch("brainplorp.mcp.server.search_notes") as mock_search:
+        with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+            mock_vault.return_value = Path("/vault")
+            mock_search.return_value = [
+                {"path": "notes/a.md", "title": "A", "score": -1.5, "snippet": "**seo** plan",
+                 "word_count": 3, "modified": "2025-10-07T09:00:00"}
+            ]
+
+            result = await _plorp_search_notes({"query": "seo", "folder": "notes", "limit": 5})
+
+            mock_search.assert_called_once_with(Path("/vault"), "seo", "notes", 5)
+            data = json.loads(result[0].text)
+            assert data["count"] == 1
+            assert data["notes"][0]["snippet"] == "**seo** plan"
+
+
+@pytest.mark.asyncio
+async def test_pattern_tools_accept_note_path(tmp_path):
+    """Pattern tools parse a vault note by path through the note cache."""
+    from brainplorp.integrations.note_cache import get_parsed_note
+    from brainplorp.mcp.server import _plorp_extract_bullets, _plorp_extract_headers
+
+    note = tmp_path / "daily.md"
+    note.write_text("# Day\n\n## Tasks\n\n- Buy milk\n- Call Bob\n")
+
+    with patch("brainplorp.mcp.server.load_parsed_note") as mock_load:
+        with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+            mock_vault.return_value = tmp_path
+            mock_load.side_effect = lambda vault, path: get_parsed_note(vault / path)
+
+            headers = await _plorp_extract_headers({"path": "daily.md", "level": 2})
+            bullets = await _plorp_extract_bullets({"path": "daily.md", "section": "Tasks"})
+
+            mock_load.assert_called_with(tmp_path, "daily.md")
+
+    assert [h["text"] for h in json.loads(headers[0].text)["headers"]] == ["Tasks"]
+    assert json.loads(bullets[0].text)["bullets"] == ["Buy milk", "Call Bob"]
+
+    with pytest.raises(ValueError, match="content or path"):
+        await _plorp_extract_headers({})
+
+
+@pytest.mark.asyncio
+async def test_plorp_get_perf_stats():
+    """Perf stats report per-subcommand timings and snapshot counters."""
+    from brainplorp.integrations.task_metrics import record_command, reset_command_stats
+    from brainplorp.mcp.server import _plorp_get_perf_stats
+
+    reset_command_stats()
+    record_command(["status:pending", "export"], 0.015, 0, 2048)
+
+    result = await _plorp_get_perf_stats({"reset": True})
+
+    data = json.loads(result[0].text)
+    assert data["commands"]["export"]["count"] == 1
+    assert data["commands"]["export"]["bytes"] == 2048
+    assert "hit_rate" in data["snapshot"]
+    assert set(data["vault_writes"]) == {"written", "skipped", "bytes_written"}
+    assert "hit_rate" in data["note_cache"]
+
+    result = await _plorp_get_perf_stats({})
+    assert json.loads(result[0].text)["commands"] == {}
+
+
+@pytest.mark.asyncio
+async def test_plorp_start_days():
+    """Test plorp_start_days passes the range through to start_days."""
+    from brainplorp.mcp.server import _plorp_start_days
+
+    with patch("brainplorp.mcp.server.start_days") as mock_start_days:
+        with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+            mock_vault.return_value = Path("/vault")
+            mock_start_days.return_value = {
+                "start_date": "2026-10-19",
+                "end_date": "2026-10-25",
+                "days": [],
+                "created_count": 7,
+                "refreshed_count": 0,
+                "unchanged_count": 0,
+                "skipped_count": 0,
+            }
+
+            result = await _plorp_start_days(
+                {"start_date": "2026-10-19", "end_date": "2026-10-25", "refresh": True}
+            )
+
+            data = json.loads(result[0].text)
+            assert data["created_count"] == 7
+            mock_start_days.assert_called_once_with(
+                date(2026, 10, 19), date(2026, 10, 25), Path("/vault"), True
+            )
+
+
+@pytest.mark.asyncio
+async def test_plorp_get_review_backlog():
+    """Test plorp_get_review_backlog passes the range to get_review_backlog."""
+    from brainplorp.mcp.server import _plorp_get_review_backlog
+
+    with patch("brainplorp.mcp.server.get_review_backlog") as mock_backlog:
+        with patch("brainplorp.mcp.server._get_vault_path") as mock_vault:
+            mock_vault.return_value = Path("/vault")
+            mock_backlog.return_value = {
+                "since": "2026-10-10",
+                "until": "2026-10-17",
+                "notes_scanned": ["2026-10-10"],
+                "tasks": [{"uuid": "abc-123", "days": ["2026-10-10"]}],
+                "task_count": 1,
+                "resolved_count": 0,
+                "lookup_exports": 1,
+                "subprocesses_avoided": 0,
+            }
+
+            result = await _plorp_get_review_backlog({"since": "2026-10-10"})
+
+            data = json.loads(result[0].text)
+            assert data["tasks"][0]["days"] == ["2026-10-10"]
+            mock_backlog.assert_called_once_with(date(2026, 10, 10), Path("/vault"), None)
@@ -11,6 +11,7 @@ from brainplorp.parsers.nlp import (
     parse_due_date,
     parse_priority_keywords,
     extract_clean_description,
+    parse_task_text,
 )
 
 
@@ -146,6 +147,69 @@ def test_parse_due_date_with_punctuation():
     assert ok is True
 
 
+def test_parse_due_date_iso():
+    """Test ISO dates, including impossible ones (NEEDS_REVIEW)."""
+    reference = date(2025, 10, 6)
+    assert parse_due_date("ship release 2025-11-03", reference) == ("2025-11-03", True)
+    assert parse_due_date("ship release 2025-02-30", reference) == (None, False)
+
+
+def test_parse_due_date_in_n_days_and_weeks():
+    """Test 'in N days' / 'in N weeks'."""
+    reference = date(2025, 10, 6)
+    assert parse_due_date("renew passport in 3 days", reference) == ("2025-10-09", True)
+    assert parse_due_date("renew passport in 1 day", reference) == ("2025-10-07", True)
+    assert parse_due_date("follow up In 2 Weeks", reference) == ("2025-10-20", True)
+
+
+def test_parse_due_date_month_day():
+    """Test month-day: next occurrence on or after the reference date."""
+    reference = date(2025, 10, 6)
+    assert parse_due_date("party Dec 25th", reference) == ("2025-12-25", True)
+    assert parse_due_date("dentist on October 6", reference) == ("2025-10-06", True)
+    assert parse_due_date("taxes apr. 15", reference) == ("2026-04-15", True)
+    assert parse_due_date("call Feb 30", reference) == (None, False)
+
+
+def test_parse_due_date_end_of_week():
+    """Test 'end of week' → Friday of the reference week."""
+    assert parse_due_date("wrap up by end of week", date(2025, 10, 6)) == ("2025-10-10", True)
+    assert parse_due_date("wrap up end of the week", date(2025, 10, 10)) == ("2025-10-10", True)
+    assert parse_due_date("wrap up end of week", date(2025, 10, 11)) == ("2025-10-17", True)
+
+
+def test_parse_due_date_precedence():
+    """Test the earlier-ranked rule wins regardless of position."""
+    reference = date(2025, 10, 6)
+    assert parse_due_date("Friday prep, present today", reference) == ("2025-10-06", True)
+    assert parse_due_date("2025-12-01 launch, sync in 2 days", reference) == ("2025-12-01", True)
+
+
+def test_parse_task_text_single_scan():
+    """Test due date, priority and description come back together."""
+    parsed = parse_task_text("urgent send report in 2 weeks", date(2025, 10, 6))
+
+    assert parsed == {
+        "due": "2025-10-20",
+        "due_ok": True,
+        "date_phrase": "in 2 weeks",
+        "priority": "H",
+        "priority_keyword": "urgent",
+        "description": "send report",
+    }
+
+
+def test_parse_task_text_removes_whole_date_phrase():
+    """Test multi-word phrases are removed, other date words are kept."""
+    reference = date(2025, 10, 6)
+    assert parse_task_text("review next Monday", reference)["description"] == "review"
+    assert parse_task_text("ship 2025-11-03 before Dec 1 freeze", reference)["description"] == (
+        "ship before Dec 1 freeze"
+    )
+    # Unparseable phrases stay in the description for review
+    assert parse_task_text("call Feb 30", reference)["description"] == "call Feb 30"
+
+
 # ============================================================================
 # Priority Parsing Tests
 # ============================================================================
@@ -94,3 +94,41 @@ def test_ensure_directory_with_str_path(tmp_path):
     ensure_directory(str(new_dir))
 
     assert new_dir.exists()
+
+
+def test_write_file_skips_identical_content(tmp_path):
+    """Rewriting the same bytes leaves the file (and its mtime) untouched."""
+    import os
+    from brainplorp.utils.files import get_write_stats, reset_write_stats
+
+    reset_write_stats()
+    test_file = tmp_path / "note.md"
+
+    assert write_file(test_file, "# Note\n") is True
+    os.utime(test_file, ns=(1_000_000_000, 1_000_000_000))
+
+    assert write_file(test_file, "# Note\n") is False
+    assert test_file.stat().st_mtime_ns == 1_000_000_000
+
+    # Same size, different bytes is still written
+    assert write_file(test_file, "# Nope\n") is True
+    assert read_file(test_file) == "# Nope\n"
+
+    assert get_write_stats() == {"written": 2, "skipped": 1, "bytes_written": 14}
+
+
+def test_write_file_is_atomic_and_keeps_mode(tmp_path):
+    """Writes replace the file via a temp file, keep its permissions and leave no temp behind."""
+    import os
+
+    test_file = tmp_path / "note.md"
+    write_file(test_file, "old")
+    os.chmod(test_file, 0o640)
+    inode = test_file.stat().st_ino
+
+    write_file(test_file, "new content")
+
+    assert read_file(test_file) == "new content"
+    assert test_file.stat().st_mode & 0o777 == 0o640
+    assert test_file.stat().st_ino != inode
+    assert [p.name for p in tmp_path.iterdir()] == ["note.md"]